@@ -17,7 +17,7 @@ import unicodedata
 from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Sized
 
 import click
 
@@ -41,6 +41,18 @@ PROGRESS_INTERVAL_SECONDS = 5.0
 # no caller can open an unbounded number of connections.
 MAX_WORKERS = 64
 
+# Scans whose frames are listed with one `cyl_images` query. Each costs one scan_id in the
+# request URL, so 100 stays far below any proxy's URL limit while turning a 4,000-scan listing
+# into 40 round trips instead of 4,000.
+LIST_CHUNK_SCANS = 100
+
+# Rows per page of a cyl_scans_extended query, matching PostgREST's max-rows on Supabase.
+SCAN_PAGE_ROWS = 1000
+
+# Rows per page of a frame listing. PostgREST caps a response at its max-rows setting (1000 on
+# Supabase) without saying so, so a chunk is paged by id until a page comes back empty.
+LIST_PAGE_ROWS = 1000
+
 # scans.csv schema: (output column, source key in a cyl_scans_extended row).
 # Order matches the legacy CLI's predict-container contract; `genotype` is
 # inserted after `accession_id`, and `scan_path` is derived (relative).
@@ -111,13 +123,47 @@ def build_scan_row(scan: dict[str, Any], genotype: str | None) -> dict[str, Any]
     return row
 
 
-def write_scans_csv(rows: list[dict[str, Any]], path: Path) -> None:
-    """Write rows to scans.csv with the fixed column order."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+def write_scans_csv(rows: Iterable[dict[str, Any]], path: Path) -> int:
+    """Write rows to scans.csv with the fixed column order; return how many were written."""
+    sink = ScansCsv(path)
+    for _ in sink.pass_through((row, row) for row in rows):
+        pass
+    return sink.written
+
+
+class ScansCsv:
+    """scans.csv, written a row at a time as scans stream past on their way to be downloaded.
+
+    Rows go to a temp file beside it, which replaces scans.csv only once the last scan is in, so
+    an interrupted run leaves the previous scans.csv (or none) rather than a truncated one that
+    reads as a smaller experiment.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.written = 0
+
+    def pass_through(self, pairs: Iterable[tuple[Any, dict[str, Any]]]) -> Iterator[Any]:
+        """Write each ``(item, row)`` pair's row, then yield its item.
+
+        scans.csv is complete as soon as the input runs out, which during a download is when
+        listing ends rather than when the last frame arrives. Closing the generator early
+        discards the temp file.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.partial")
+        self.written = 0
+        try:
+            with tmp.open("w", newline="", encoding="utf-8") as fh:
+                writer = csv.DictWriter(fh, fieldnames=CSV_COLUMNS)
+                writer.writeheader()
+                for item, row in pairs:
+                    writer.writerow(row)
+                    self.written += 1
+                    yield item
+            os.replace(tmp, self.path)
+        finally:
+            tmp.unlink(missing_ok=True)
 
 
 # Records which experiment an output directory holds, so a later run into the same directory
@@ -217,14 +263,31 @@ def fetch_scans(
     plant_age_min: int = 0,
     plant_age_max: int = 1000,
     limit: int = 100000,
-) -> list[dict[str, Any]]:
-    """Query cyl_scans_extended for an experiment (legacy filter semantics)."""
-    query = client.table("cyl_scans_extended").select("*").eq("experiment_id", experiment_id)
-    if plant_qr_code:
-        query = query.eq("qr_code", plant_qr_code)
-    else:
-        query = query.gte("plant_age_days", plant_age_min).lte("plant_age_days", plant_age_max)
-    return query.limit(limit).execute().data or []
+    page_size: int = SCAN_PAGE_ROWS,
+) -> Iterator[dict[str, Any]]:
+    """Stream cyl_scans_extended rows for an experiment (legacy filter semantics), by scan_id.
+
+    Pages by scan_id keyset instead of one select: PostgREST cuts a response off at its
+    max-rows setting without saying so, which quietly dropped scans from large experiments.
+    Each page is only requested once the one before it has been consumed, so a caller can start
+    work on the first page and never holds more than one. ``limit`` caps the total yielded.
+    """
+    remaining = limit
+    last_scan_id = None
+    while remaining > 0:
+        query = client.table("cyl_scans_extended").select("*").eq("experiment_id", experiment_id)
+        if plant_qr_code:
+            query = query.eq("qr_code", plant_qr_code)
+        else:
+            query = query.gte("plant_age_days", plant_age_min).lte("plant_age_days", plant_age_max)
+        if last_scan_id is not None:
+            query = query.gt("scan_id", last_scan_id)
+        rows = query.order("scan_id").limit(min(page_size, remaining)).execute().data or []
+        if not rows:
+            return
+        yield from rows
+        remaining -= len(rows)
+        last_scan_id = rows[-1]["scan_id"]
 
 
 def search_experiments(client: Any, query: str, species: str | None = None) -> list[dict[str, Any]]:
@@ -263,6 +326,25 @@ def fetch_genotypes(client: Any, accession_ids: list[Any]) -> dict[Any, str]:
     return {row["id"]: row["name"] for row in rows}
 
 
+def scan_rows(
+    client: Any, scans: Iterable[dict[str, Any]], *, chunk_size: int = SCAN_PAGE_ROWS
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Pair each scan with its scans.csv row, looking genotypes up ``chunk_size`` scans at a time.
+
+    Accessions already looked up are remembered, so an experiment's handful of genotypes costs a
+    handful of lookups however many pages of scans it spans.
+    """
+    genotypes: dict[Any, str | None] = {}
+    remaining = iter(scans)
+    while chunk := list(itertools.islice(remaining, chunk_size)):
+        accession_ids = dict.fromkeys(scan.get("accession_id") for scan in chunk)
+        unseen = [accession_id for accession_id in accession_ids if accession_id not in genotypes]
+        found = fetch_genotypes(client, unseen) if unseen else {}
+        genotypes.update({accession_id: found.get(accession_id) for accession_id in unseen})
+        for scan in chunk:
+            yield scan, build_scan_row(scan, genotypes.get(scan.get("accession_id")))
+
+
 def fetch_images(client: Any, scan_id: Any) -> list[dict[str, Any]]:
     """Frames for a scan, ordered by frame_number."""
     return (
@@ -276,6 +358,42 @@ def fetch_images(client: Any, scan_id: Any) -> list[dict[str, Any]]:
     )
 
 
+def _frame_order(image: dict[str, Any]) -> tuple[bool, Any]:
+    """Sort key matching `fetch_images`' ``order("frame_number")``: nulls after numbers."""
+    frame_number = image.get("frame_number")
+    return (frame_number is None, frame_number if frame_number is not None else 0)
+
+
+def fetch_images_for_scans(
+    client: Any, scan_ids: list[Any], *, page_size: int = LIST_PAGE_ROWS
+) -> dict[Any, list[dict[str, Any]]]:
+    """Frames for many scans in one listing, grouped by scan_id and ordered by frame_number.
+
+    The rows are paged by id (the primary key, so the keyset is stable) until a page comes back
+    empty, rather than stopping at a short page: a server capping responses below ``page_size``
+    would otherwise end the listing early and lose frames without a word. Every requested
+    scan_id has an entry, empty if it has no frames.
+    """
+    wanted = list(dict.fromkeys(s for s in scan_ids if s is not None))
+    grouped: dict[Any, list[dict[str, Any]]] = {scan_id: [] for scan_id in scan_ids}
+    if not wanted:
+        return grouped
+    last_id = None
+    while True:
+        query = client.table("cyl_images").select("*").in_("scan_id", wanted)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        rows = query.order("id").limit(page_size).execute().data or []
+        if not rows:
+            break
+        for row in rows:
+            grouped.setdefault(row.get("scan_id"), []).append(row)
+        last_id = rows[-1]["id"]
+    for frames in grouped.values():
+        frames.sort(key=_frame_order)
+    return grouped
+
+
 @dataclass
 class FrameResult:
     """Outcome of one frame download."""
@@ -394,23 +512,26 @@ def download_frame(
 
 
 def _run_bounded(
-    work: list[Any],
-    run_one: Callable[[Any], FrameResult],
+    work: Iterable[Any],
+    run_one: Callable[[Any], Any],
     workers: int,
     *,
     window_factor: int = 4,
     on_done: Callable[[Any], None] | None = None,
-) -> list[FrameResult]:
+) -> list[Any]:
     """Run ``run_one`` over ``work`` across ``workers`` threads, a window at a time.
 
     Queueing every frame up front would cost hundreds of MB on a large experiment before the
     first byte arrives. Keeping a limited number in flight uses flat memory and still keeps
     every thread busy. Results are stored by position, so the order matches ``work``.
 
+    ``work`` is only drawn from as the window has room, so it can be a generator that is still
+    producing items (listing frames, say) while the first ones download.
+
     ``on_done`` receives each finished item. Completed work is collected here, on the
     calling thread, so it needs no locking of its own.
     """
-    results: list[Any] = [None] * len(work)
+    results: dict[int, Any] = {}
     window = max(workers * window_factor, workers)
     pending: dict[Future, int] = {}
     remaining = enumerate(work)
@@ -426,7 +547,7 @@ def _run_bounded(
                     on_done(outcome)
             for index, item in itertools.islice(remaining, len(done)):
                 pending[pool.submit(run_one, item)] = index
-    return results
+    return [results[index] for index in range(len(results))]
 
 
 def _list_scan_frames(
@@ -452,6 +573,24 @@ def _list_scan_frames(
         )
 
 
+def _list_frames_in_chunks(
+    client: Any, scans: Iterable[dict[str, Any]], *, chunk_size: int = LIST_CHUNK_SCANS
+) -> Iterator[list[tuple[dict[str, Any], list[dict[str, Any]], FrameResult | None]]]:
+    """List frames ``chunk_size`` scans per query, yielding ``(scan, images, failure)`` per chunk.
+
+    A chunk whose query fails is listed again one scan at a time, so a transient error or one
+    bad row costs only the scans that really can't be listed — not the hundred around them.
+    """
+    remaining = iter(scans)
+    while chunk := list(itertools.islice(remaining, chunk_size)):
+        try:
+            grouped = fetch_images_for_scans(client, [scan.get("scan_id") for scan in chunk])
+        except Exception:
+            yield [(scan, *_list_scan_frames(client, scan)) for scan in chunk]
+            continue
+        yield [(scan, grouped.get(scan.get("scan_id"), []), None) for scan in chunk]
+
+
 class CollidingFrames(ValueError):
     """Two or more frames would be written to the same file."""
 
@@ -487,7 +626,11 @@ def _path_key(path: Path, fold: bool) -> str:
 
 
 def find_frame_collisions(
-    out_dir: Path, work: list[tuple[dict[str, Any], dict[str, Any]]]
+    out_dir: Path,
+    work: list[tuple[dict[str, Any], dict[str, Any]]],
+    *,
+    fold: bool | None = None,
+    seen: dict[str, tuple[Any, Any, Path]] | None = None,
 ) -> list[str]:
     """Describe every pair of frames that would land on the same file.
 
@@ -500,9 +643,14 @@ def find_frame_collisions(
     names: on macOS `st0-001` and `ST0-001` are two database values but one file, so matching
     the raw strings would miss exactly the collisions that matter. On a case-sensitive
     filesystem they are genuinely different files and are left alone.
+
+    Passing the same ``seen`` across calls checks work that arrives in pieces against everything
+    before it; ``fold`` skips re-probing the filesystem for each piece.
     """
-    fold = filesystem_folds_case(Path(out_dir))
-    seen: dict[str, tuple[Any, Any, Path]] = {}
+    if fold is None:
+        fold = filesystem_folds_case(Path(out_dir))
+    if seen is None:
+        seen = {}
     clashes: list[str] = []
     for scan, image in work:
         try:
@@ -524,7 +672,7 @@ def find_frame_collisions(
 
 def download_images(
     client: Any,
-    scans: list[dict[str, Any]],
+    scans: Iterable[dict[str, Any]],
     out_dir: Path,
     *,
     workers: int = DEFAULT_WORKERS,
@@ -532,46 +680,75 @@ def download_images(
 ) -> DownloadResult:
     """Download every frame for every scan from Storage bucket `images`.
 
-    Frames are listed per scan, then fetched by up to ``workers`` threads at once, since the
-    per-frame requests are what make a large experiment slow. ``workers <= 1`` runs one at a
-    time. Results stay in scan and frame order, so the log reads the same way every run.
+    Frames are listed many scans per query, and fetched by up to ``workers`` threads at once
+    while later scans are still being listed, since the per-frame requests are what make a large
+    experiment slow. ``workers <= 1`` runs one at a time. Results stay in scan and frame order,
+    so the log reads the same way every run.
 
     A failing frame is recorded rather than raised, so one bad frame can't abort the run.
 
     Frames already written by an earlier run are skipped, which is what makes an interrupted
     download cheap to resume. To fetch an experiment afresh, download into a new directory.
 
+    Each chunk of listed frames is checked for collisions, against every frame listed before it,
+    before any of the chunk is queued. A clash with an earlier chunk is therefore found only
+    after that chunk's frames — the first frame of the pair among them — have been fetched:
+    `CollidingFrames` stops the run without ever fetching the later frame of the pair, so no
+    file is overwritten, but the frames queued before it are left on disk. A later run into the
+    same directory skips them like any other already-written frame.
+
+    ``scans`` can be a stream (`fetch_scans`), drawn on only as listing needs more.
+
     ``on_progress(phase, done, total, failed)`` is called as work completes, with ``phase``
-    of ``"listing"`` or ``"downloading"``. It is only ever called from this thread.
+    of ``"listing"`` or ``"downloading"``; while listing is still going, the downloading total
+    counts the frames listed so far, and a stream of scans has no listing total (None) until
+    it runs out. It is only ever called from this thread.
     """
     sweep_orphan_temps(Path(out_dir))
+    fold = filesystem_folds_case(Path(out_dir))
+    seen: dict[str, tuple[Any, Any, Path]] = {}
 
     # One entry per log line, in scan order: either a scan that couldn't be listed or a frame
     # to fetch. Building the list this way keeps unlisted scans next to the scans around them
     # rather than collected at the end of the log.
     slots: list[Any] = []
-    for listed, scan in enumerate(scans, start=1):
-        if on_progress is not None:
-            on_progress("listing", listed, len(scans), 0)
-        images, failure = _list_scan_frames(client, scan)
-        if failure is not None:
-            slots.append(failure)
-        elif not images:
-            # A scan can have no rows in cyl_images if its upload was interrupted. Note it in
-            # the log so it is visible, but don't fail the run: there is nothing to fetch, so
-            # failing would make every future run of this experiment fail too.
-            slots.append(
-                FrameResult(
-                    scan.get("scan_id"), None, "", ok=False, error="no frames", no_frames=True
-                )
-            )
-        slots.extend((scan, image) for image in images)
-
-    work = [slot for slot in slots if not isinstance(slot, FrameResult)]
-
-    clashes = find_frame_collisions(Path(out_dir), work)
-    if clashes:
-        raise CollidingFrames("; ".join(clashes))
+    queued = 0
+
+    def _work() -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+        nonlocal queued
+        listed = 0
+        expected = len(scans) if isinstance(scans, Sized) else None
+        for chunk in _list_frames_in_chunks(client, scans):
+            pairs: list[tuple[dict[str, Any], dict[str, Any]]] = []
+            for scan, images, failure in chunk:
+                listed += 1
+                if on_progress is not None:
+                    on_progress("listing", listed, expected, 0)
+                if failure is not None:
+                    slots.append(failure)
+                elif not images:
+                    # A scan can have no rows in cyl_images if its upload was interrupted. Note
+                    # it in the log so it is visible, but don't fail the run: there is nothing to
+                    # fetch, so failing would make every future run of this experiment fail too.
+                    slots.append(
+                        FrameResult(
+                            scan.get("scan_id"),
+                            None,
+                            "",
+                            ok=False,
+                            error="no frames",
+                            no_frames=True,
+                        )
+                    )
+                slots.extend((scan, image) for image in images)
+                pairs.extend((scan, image) for image in images)
+            clashes = find_frame_collisions(Path(out_dir), pairs, fold=fold, seen=seen)
+            if clashes:
+                raise CollidingFrames("; ".join(clashes))
+            queued += len(pairs)
+            yield from pairs
+        if on_progress is not None and expected is None and listed:
+            on_progress("listing", listed, listed, 0)
 
     stop = threading.Event()
 
@@ -579,7 +756,13 @@ def download_images(
         return download_frame(client, pair[0], pair[1], out_dir, stop=stop)
 
     # Never start more threads than there are frames, than were asked for, or than the limit.
-    n = min(workers, MAX_WORKERS, len(work)) if work else 0
+    # The frame count isn't known until listing ends, so list just enough to fill every thread:
+    # a run with fewer frames than that has finished listing and sizes the pool to fit.
+    n = min(workers, MAX_WORKERS)
+    work = _work()
+    first = list(itertools.islice(work, n))
+    n = min(n, len(first))
+    work = itertools.chain(first, work)
     done = failed = 0
 
     def _tick(result: FrameResult) -> None:
@@ -589,7 +772,7 @@ def download_images(
         if not result.ok:
             failed += 1
         if on_progress is not None:
-            on_progress("downloading", done, len(work), failed)
+            on_progress("downloading", done, queued, failed)
 
     if n <= 1:
         fetched = []
@@ -619,7 +802,7 @@ class ProgressReporter:
         self._last = 0.0
         self._phase = ""
 
-    def __call__(self, phase: str, done: int, total: int, failed: int = 0) -> None:
+    def __call__(self, phase: str, done: int, total: int | None, failed: int = 0) -> None:
         moment = self._now()
         # Always show the first and last of a phase, so short runs still say something and a
         # finished phase never sits at 97%.
@@ -631,17 +814,19 @@ class ProgressReporter:
         click.echo(f"  {format_progress(phase, done, total, failed)}", err=True)
 
 
-def format_progress(phase: str, done: int, total: int, failed: int = 0) -> str:
+def format_progress(phase: str, done: int, total: int | None, failed: int = 0) -> str:
     """One progress line, e.g. ``12,480/413,926 frames (3%), 12 failed``.
 
     Failures are named as soon as there are any: the count on its own says how much work has
-    been attempted, which on a run where everything is failing would read as healthy.
+    been attempted, which on a run where everything is failing would read as healthy. A total
+    of None (scans still streaming in) prints the count alone.
     """
     noun = "scans" if phase == "listing" else "frames"
     percent = f" ({done * 100 // total}%)" if total else ""
     prefix = "Listing frames: " if phase == "listing" else ""
     problem = f", {failed:,} failed" if failed else ""
-    return f"{prefix}{done:,}/{total:,} {noun}{percent}{problem}"
+    count = f"{done:,}" if total is None else f"{done:,}/{total:,}"
+    return f"{prefix}{count} {noun}{percent}{problem}"
 
 
 def _one_line(text: Any) -> str:
@@ -839,7 +1024,7 @@ def download(
         scan = fetch_scan(client, scan_id)
         if scan is None:
             raise click.ClickException(f"Scan {scan_id} not found.")
-        scans = [scan]
+        scans: Iterable[dict[str, Any]] = [scan]
     else:
         scans = fetch_scans(
             client,
@@ -849,14 +1034,15 @@ def download(
             plant_age_max=plant_age_max,
             limit=limit,
         )
-    genotypes = fetch_genotypes(client, [s.get("accession_id") for s in scans])
-    rows = [build_scan_row(s, genotypes.get(s.get("accession_id"))) for s in scans]
-
-    if not scans:
+    # Scans stream in a page at a time; only the first is needed to know there is anything.
+    rows = scan_rows(client, scans)
+    first = next(rows, None)
+    if first is None:
         raise click.ClickException(
             "No scans matched, so there is nothing to download. Check the experiment and any "
             "--plant-qr-code / --plant-age-min / --plant-age-max filters."
         )
+    rows = itertools.chain([first], rows)
 
     out = Path(out_dir)
     selector = download_selector(
@@ -882,22 +1068,29 @@ def download(
         )
 
     csv_path = out / "scans.csv"
-    write_scans_csv(rows, csv_path)
+    sink = ScansCsv(csv_path)
     write_manifest(out, selector)
-    click.echo(f"Wrote {len(rows)} scans -> {csv_path}")
 
     if meta_only:
+        for _ in sink.pass_through(rows):
+            pass
+        click.echo(f"Wrote {sink.written} scans -> {csv_path}")
         return
 
+    # scans.csv is written as the scans stream through to the download, and is in place once
+    # the last of them has been listed.
     try:
         result = download_images(
-            client, scans, out, workers=workers, on_progress=ProgressReporter()
+            client, sink.pass_through(rows), out, workers=workers, on_progress=ProgressReporter()
         )
     except CollidingFrames as exc:
         raise click.ClickException(
-            f"{exc}. Refusing to download, because one frame's image would overwrite or mask "
-            f"another's. Narrow the download (--scan-id / --plant-qr-code) or fix the rows."
+            f"{exc}. Refusing to download the rest, because one frame's image would overwrite "
+            f"or mask another's. Frames listed before the clash may already be in {out}; a "
+            f"later run skips them. Narrow the download (--scan-id / --plant-qr-code) or fix "
+            f"the rows."
         ) from exc
+    click.echo(f"Wrote {sink.written} scans -> {csv_path}")
 
     log_path = out / "download_log.txt"
     write_download_log(result, log_path)
@@ -14,19 +14,36 @@ import os
 import shutil
 import sys
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, Iterable, Iterator, TextIO
 
 import click
 
 from ..credentials import DEFAULT_PROFILE
 from ._batch import BatchResult, ScanResult, format_json, format_summary
 from ._storage import atomic_write_bytes, download_object
-from .download import DownloadResult, FrameResult, fetch_images, fetch_scan
+from .download import (
+    DEFAULT_WORKERS,
+    MAX_WORKERS,
+    DownloadResult,
+    FrameResult,
+    _run_bounded,
+    fetch_images,
+    fetch_scan,
+)
+
+# Scans staged at once by `batch-download-for-predict`, each with its own `--workers` frame
+# downloads in flight. 4 x 8 keeps the network busy without opening more connections than
+# `cyl download`'s own limit allows.
+DEFAULT_SCAN_CONCURRENCY = 4
 
 # Matches sleap_roots_predict.batch._IMAGE_EXTENSIONS — the exact set discover_scans
 # globs for, so clearing the stage directory removes anything predict would pick up.
 _IMAGE_EXTENSIONS = frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"})
 
+# Bytes read at a time when checksumming staged frames back off disk, so hashing a scan costs
+# one buffer of memory however large its frames are.
+CHECKSUM_CHUNK_BYTES = 1 << 20
+
 
 def scan_key_for(scan_id: Any) -> str:
     """The sidecar's scan_key — must equal the filename stem (predict validates this)."""
@@ -39,14 +56,34 @@ def frame_dest_for_predict(scan_dir: Path, image: dict[str, Any]) -> Path:
     return Path(scan_dir) / f"{image['frame_number']}{ext}"
 
 
-def compute_checksum(frame_bytes_list: list[bytes]) -> str:
-    """sha256 over frame bytes concatenated in the given (DB frame_number) order."""
+def compute_checksum(frame_bytes_list: Iterable[bytes]) -> str:
+    """sha256 over frame bytes concatenated in the given (DB frame_number) order.
+
+    Only the concatenation matters, so the input can be whole frames or any chunking of them —
+    `read_staged_frames` streams them back off disk a buffer at a time.
+    """
     digest = hashlib.sha256()
     for data in frame_bytes_list:
         digest.update(data)
     return f"sha256:{digest.hexdigest()}"
 
 
+def read_staged_frames(
+    scan_dir: Path, images: list[dict[str, Any]], *, chunk_size: int = CHECKSUM_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """The staged frames' bytes in ``images`` (DB frame_number) order, ``chunk_size`` at a time.
+
+    Hashing what was written, rather than holding every frame's bytes until the scan finishes,
+    keeps a staged scan's memory to one buffer — however many frames it has, and however many
+    scans are staging at once. Files just written are still in the page cache, so the re-read
+    is cheap.
+    """
+    for image in images:
+        with frame_dest_for_predict(scan_dir, image).open("rb") as fh:
+            while chunk := fh.read(chunk_size):
+                yield chunk
+
+
 def validate_frame_numbers(images: list[dict[str, Any]]) -> None:
     """Raise ValueError if any frame_number is null or duplicated across images.
 
@@ -80,7 +117,7 @@ def resolve_sidecar_params(scan: dict[str, Any]) -> dict[str, Any]:
 def build_sidecar(
     scan: dict[str, Any],
     images: list[dict[str, Any]],
-    frame_bytes_list: list[bytes],
+    frame_bytes_list: Iterable[bytes],
     params: dict[str, Any],
 ) -> dict[str, Any]:
     """Assemble the scan_metadata.json sidecar dict for one scan.
@@ -214,28 +251,39 @@ def scan_is_already_staged(scan_dir: Path, scan_key: str) -> bool:
 
 
 def download_frames_for_predict(
-    client: Any, scan: dict[str, Any], images: list[dict[str, Any]], scan_dir: Path
-) -> tuple[DownloadResult, list[bytes]]:
+    client: Any,
+    scan: dict[str, Any],
+    images: list[dict[str, Any]],
+    scan_dir: Path,
+    *,
+    workers: int = 1,
+) -> DownloadResult:
     """Download every frame for one scan into the nested predict layout.
 
-    Returns the aggregate result plus each successfully-downloaded frame's bytes
-    in DB frame_number order (for the checksum) — a failed frame contributes no
-    bytes entry, mirroring ``download.py``'s per-frame failure isolation.
+    A failed frame is recorded on the result rather than raised, mirroring
+    ``download.py``'s per-frame failure isolation. Frame bytes are not kept once written:
+    the checksum is taken back off disk by `read_staged_frames`.
+
+    Up to ``workers`` frames are fetched at once (``download.py``'s bounded window);
+    results are collected by position, so they stay in the order of ``images``
+    however the downloads finish.
     """
-    frames: list[FrameResult] = []
-    frame_bytes: list[bytes] = []
-    for image in images:
+
+    def _one(image: dict[str, Any]) -> FrameResult:
         object_path = image.get("object_path", "")
         result = FrameResult(scan.get("scan_id"), image.get("frame_number"), object_path, ok=False)
         try:
-            data = download_object(client, object_path)
-            atomic_write_bytes(frame_dest_for_predict(scan_dir, image), data)
+            atomic_write_bytes(
+                frame_dest_for_predict(scan_dir, image), download_object(client, object_path)
+            )
             result.ok = True
-            frame_bytes.append(data)
         except Exception as exc:  # per-frame: record and continue
             result.error = str(exc)
-        frames.append(result)
-    return DownloadResult(frames), frame_bytes
+        return result
+
+    n = min(workers, MAX_WORKERS, len(images))
+    frames = _run_bounded(images, _one, n) if n > 1 else [_one(image) for image in images]
+    return DownloadResult(frames)
 
 
 # --- command ----------------------------------------------------------------
@@ -251,7 +299,15 @@ def download_frames_for_predict(
     show_default=True,
     help="Credentials profile to use.",
 )
-def download_for_predict(scan_id: int, out_dir: Path, profile: str) -> None:
+@click.option(
+    "-n",
+    "--workers",
+    type=click.IntRange(min=1, max=MAX_WORKERS),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help=f"Concurrent frame downloads (I/O-bound, 1-{MAX_WORKERS}). 1 = sequential.",
+)
+def download_for_predict(scan_id: int, out_dir: Path, profile: str, workers: int) -> None:
     """Stage one cylinder scan (SCAN_ID) into OUT_DIR in the layout
     sleap_roots_predict.discover_scans expects — frames co-located with a
     scan_metadata.json sidecar. Distinct from `cyl download`'s scans.csv layout."""
@@ -278,7 +334,7 @@ def download_for_predict(scan_id: int, out_dir: Path, profile: str) -> None:
     if removed:
         click.echo(f"Cleared {len(removed)} existing file(s) from a previous run: {scan_dir}")
 
-    result, frame_bytes = download_frames_for_predict(client, scan, images, scan_dir)
+    result = download_frames_for_predict(client, scan, images, scan_dir, workers=workers)
 
     if result.failed:
         raise click.ClickException(
@@ -286,7 +342,7 @@ def download_for_predict(scan_id: int, out_dir: Path, profile: str) -> None:
             f"frames downloaded this run remain in {scan_dir}; no sidecar written."
         )
 
-    sidecar = build_sidecar(scan, images, frame_bytes, params)
+    sidecar = build_sidecar(scan, images, read_staged_frames(scan_dir, images), params)
     sidecar_path = scan_dir / f"{scan_key_for(scan_id)}.scan_metadata.json"
     write_sidecar(sidecar, sidecar_path)
     click.echo(f"Staged {result.ok}/{result.total} frames -> {scan_dir}  (sidecar: {sidecar_path})")
@@ -295,7 +351,7 @@ def download_for_predict(scan_id: int, out_dir: Path, profile: str) -> None:
 # --- batch: non-raising per-scan core ----------------------------------------
 
 
-def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
+def stage_one_scan(client: Any, scan_id: Any, out_dir: Path, *, workers: int = 1) -> ScanResult:
     """Stage one scan, isolating any failure into a `ScanResult` instead of raising.
 
     Sequences the same pure helpers `download_for_predict` (the single-scan command) calls, but
@@ -303,6 +359,9 @@ def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
     (``status="skipped"``) a scan already staged with a valid sidecar (see
     `scan_is_already_staged`); this command does not touch `download_for_predict`'s own
     unconditional clear-and-redownload behavior.
+
+    Safe to run for different scans on several threads at once: each writes only its own
+    ``scan_{id}/`` directory. ``workers`` is the frame concurrency within this scan.
     """
     scan_key = scan_key_for(scan_id)
     scan_dir = Path(out_dir) / scan_key
@@ -326,7 +385,7 @@ def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
             return ScanResult(scan_key, "failed", f"Scan {scan_id}: {exc}")
 
         clear_scan_dir(scan_dir)
-        result, frame_bytes = download_frames_for_predict(client, scan, images, scan_dir)
+        result = download_frames_for_predict(client, scan, images, scan_dir, workers=workers)
         if result.failed:
             return ScanResult(
                 scan_key,
@@ -334,7 +393,7 @@ def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
                 f"{result.failed} of {result.total} frames failed to download for scan {scan_id}.",
             )
 
-        sidecar = build_sidecar(scan, images, frame_bytes, params)
+        sidecar = build_sidecar(scan, images, read_staged_frames(scan_dir, images), params)
         sidecar_path = scan_dir / f"{scan_key}.scan_metadata.json"
         write_sidecar(sidecar, sidecar_path)
         return ScanResult(scan_key, "ok")
@@ -344,6 +403,40 @@ def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
         return ScanResult(scan_key, "failed", str(exc))
 
 
+def stage_scans(
+    client: Any,
+    scan_ids: list[Any],
+    out_dir: Path,
+    *,
+    scan_concurrency: int = 1,
+    workers: int = 1,
+) -> list[ScanResult]:
+    """Stage every scan, up to ``scan_concurrency`` at once; results come back in input order.
+
+    A scan_id listed twice is staged once. Two threads staging the same directory would clear
+    each other's frames, and run one after the other the second would only find the first's
+    sidecar and skip — so a repeat reports ``skipped`` after a success, or the same failure.
+    """
+    unique = list(dict.fromkeys(scan_ids))
+
+    def _one(scan_id: Any) -> ScanResult:
+        return stage_one_scan(client, scan_id, out_dir, workers=workers)
+
+    n = min(scan_concurrency, MAX_WORKERS, len(unique))
+    staged = _run_bounded(unique, _one, n) if n > 1 else [_one(scan_id) for scan_id in unique]
+
+    first = dict(zip(unique, staged))
+    results: list[ScanResult] = []
+    reported: set[Any] = set()
+    for scan_id in scan_ids:
+        outcome = first[scan_id]
+        if scan_id in reported and outcome.status != "failed":
+            outcome = ScanResult(outcome.scan_key, "skipped")
+        reported.add(scan_id)
+        results.append(outcome)
+    return results
+
+
 # --- batch: command -----------------------------------------------------------
 
 
@@ -374,6 +467,22 @@ def stage_one_scan(client: Any, scan_id: Any, out_dir: Path) -> ScanResult:
     is_flag=True,
     help="Emit the batch result as a JSON array on stdout.",
 )
+@click.option(
+    "--scan-concurrency",
+    "scan_concurrency",
+    type=click.IntRange(min=1, max=MAX_WORKERS),
+    default=DEFAULT_SCAN_CONCURRENCY,
+    show_default=True,
+    help=f"Scans staged at once (1-{MAX_WORKERS}). 1 = one scan at a time.",
+)
+@click.option(
+    "-n",
+    "--workers",
+    type=click.IntRange(min=1, max=MAX_WORKERS),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help=f"Concurrent frame downloads within each scan (1-{MAX_WORKERS}). 1 = sequential.",
+)
 @click.pass_context
 def batch_download_for_predict(
     ctx: click.Context,
@@ -382,11 +491,15 @@ def batch_download_for_predict(
     scan_ids_flag: str | None,
     profile: str,
     as_json: bool,
+    scan_concurrency: int,
+    workers: int,
 ) -> None:
     """Stage every scan_id (from --scan-ids-file, a JSON array file or - for stdin, or
     --scan-ids, a comma-separated list) into OUT_DIR, one nested {scan_key}/ directory per
     scan — the batch sibling of `download-for-predict`. Isolates per-scan failures (one bad
-    scan doesn't abort the batch); exits non-zero if any scan failed.
+    scan doesn't abort the batch); exits non-zero if any scan failed. Several scans are staged
+    at once (--scan-concurrency), each fetching several frames at once (--workers); results
+    are reported in input order regardless.
 
     NB: an early draft took the scan_ids source as a positional argument alongside OUT_DIR, but
     Click cannot disambiguate an omitted optional positional from a required one that follows
@@ -414,7 +527,9 @@ def batch_download_for_predict(
 
     client = _authed_client(profile)
 
-    result = BatchResult([stage_one_scan(client, scan_id, out_dir) for scan_id in scan_ids])
+    result = BatchResult(
+        stage_scans(client, scan_ids, out_dir, scan_concurrency=scan_concurrency, workers=workers)
+    )
 
     if as_json:
         click.echo(format_json(result))
@@ -14,7 +14,9 @@ from __future__ import annotations
 import hashlib
 import json
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -22,6 +24,12 @@ import click
 
 from ..credentials import DEFAULT_PROFILE
 from ._batch import BatchResult, ScanResult, format_json, format_summary
+from .download import MAX_WORKERS, _run_bounded
+
+INTERMEDIATES_BUCKET = "cyl-intermediates"
+HASH_CHUNK_BYTES = 1 << 20  # read .slp files this much at a time; some run to hundreds of MB
+DEFAULT_ENVELOPE_CONCURRENCY = 4
+DEFAULT_BLOB_WORKERS = 4
 
 
 class EnvelopeError(Exception):
@@ -181,6 +189,19 @@ def build_pending_blobs(
     return pending
 
 
+def sha256_file(path: str | Path, *, chunk_size: int = HASH_CHUNK_BYTES) -> str:
+    """sha256 hex digest of ``path``, read ``chunk_size`` bytes at a time.
+
+    Never holds the whole file: a batch's predictions can run to hundreds of MB each.
+    Lets ``OSError`` propagate for the caller to phrase.
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def verify_blob_checksum(path: str | Path, expected: str) -> None:
     """Recompute ``path``'s sha256 and compare to ``expected``.
 
@@ -190,10 +211,9 @@ def verify_blob_checksum(path: str | Path, expected: str) -> None:
     bytes it describes (partial write, manual edit, disk corruption).
     """
     try:
-        data = Path(path).read_bytes()
+        actual = sha256_file(path)
     except OSError as exc:
         raise BlobConstructionError(f"blob file not found: {path}") from exc
-    actual = hashlib.sha256(data).hexdigest()
     if actual != expected:
         raise BlobConstructionError(
             f"checksum mismatch for {path}: expected {expected}, got {actual}"
@@ -219,6 +239,42 @@ def blob_object_path(scan_key: str, idempotency_key: str, kind: str, root_type:
     return "/".join([scan_key, idempotency_key, f"{kind}.{root_type}.slp"])
 
 
+def _is_not_found(exc: Exception) -> bool:
+    # Only a genuine "not found" means no upload has happened yet. Any other
+    # status (permission denied, timeout, 5xx) must propagate -- silently
+    # treating it as "doesn't exist" would mask a real infra/permission
+    # problem as an ordinary first upload.
+    return str(getattr(exc, "status", "")) == "404"
+
+
+def stored_object_facts(bucket: Any, object_path: str) -> dict[str, Any] | None:
+    """What storage already knows about ``object_path``, without fetching its bytes.
+
+    Returns ``None`` if no object exists there, else ``{"size": ..., "sha256": ...}``
+    with either value ``None`` when storage doesn't record it. ``sha256`` is the
+    user metadata ``upload_blob`` attaches at upload time; objects written before
+    that was recorded have none. Reads both the flat ``info`` shape (``size`` +
+    user ``metadata``) and the older nested one (``metadata.size``).
+    """
+    from storage3.exceptions import StorageApiError
+
+    try:
+        info = bucket.info(object_path)
+    except StorageApiError as exc:
+        if not _is_not_found(exc):
+            raise
+        return None
+
+    info = info or {}
+    metadata = info.get("metadata") or {}
+    user_metadata = info.get("user_metadata") or metadata
+    size = info.get("size", metadata.get("size"))
+    return {
+        "size": int(size) if size is not None else None,
+        "sha256": user_metadata.get("sha256"),
+    }
+
+
 def upload_blob(
     client: Any, local_path: str | Path, object_path: str, expected_checksum: str
 ) -> tuple[str, bool]:
@@ -230,23 +286,26 @@ def upload_blob(
     (idempotent no-op) and ``skipped`` is ``True``. If an object exists there
     with a *different* checksum, raises :class:`BlobConstructionError` rather
     than overwriting it (a path collision between two different runs' bytes).
-    """
-    from storage3.exceptions import StorageApiError
 
-    bucket = client.storage.from_("cyl-intermediates")
-    try:
-        existing = bucket.download(object_path)
-    except StorageApiError as exc:
-        # Only a genuine "not found" means no upload has happened yet. Any
-        # other status (permission denied, timeout, 5xx) must propagate --
-        # silently treating it as "doesn't exist" would mask a real
-        # infra/permission problem as an ordinary first upload.
-        if str(getattr(exc, "status", "")) != "404":
-            raise
-        existing = None
+    The existence check reads the object's metadata, not its bytes: uploads
+    record their sha256 as user metadata, and a size that differs from the
+    local file's is a collision on its own. Only an object uploaded before the
+    checksum was recorded, with a matching size, is downloaded and hashed. The
+    upload itself streams from disk.
+    """
+    bucket = client.storage.from_(INTERMEDIATES_BUCKET)
+    local_size = Path(local_path).stat().st_size
+    stored = stored_object_facts(bucket, object_path)
 
-    if existing is not None:
-        existing_checksum = hashlib.sha256(existing).hexdigest()
+    if stored is not None:
+        existing_checksum = stored["sha256"]
+        if existing_checksum is None and stored["size"] not in (None, local_size):
+            raise BlobConstructionError(
+                f"object already exists at {object_path} with a different size "
+                f"(existing={stored['size']} bytes, new={local_size} bytes) — refusing to overwrite"
+            )
+        if existing_checksum is None:
+            existing_checksum = hashlib.sha256(bucket.download(object_path)).hexdigest()
         if existing_checksum == expected_checksum:
             return object_path, True
         raise BlobConstructionError(
@@ -254,8 +313,26 @@ def upload_blob(
             f"(existing={existing_checksum}, new={expected_checksum}) — refusing to overwrite"
         )
 
-    data = Path(local_path).read_bytes()
-    bucket.upload(object_path, data)
+    from storage3.exceptions import StorageApiError
+
+    metadata = {"sha256": expected_checksum, "size": local_size}
+    try:
+        with Path(local_path).open("rb") as fh:
+            bucket.upload(object_path, fh, {"metadata": metadata})
+    except StorageApiError as exc:
+        # Another envelope in the same batch (a re-delivered copy, same idempotency_key) can
+        # win the race between our existence check and this upload. Judge its object exactly
+        # as if it had been there first.
+        if str(getattr(exc, "status", "")) != "409":
+            raise
+        stored = stored_object_facts(bucket, object_path)
+        if stored is None or stored["sha256"] != expected_checksum:
+            raise BlobConstructionError(
+                f"object appeared at {object_path} during upload with a different checksum "
+                f"(existing={stored and stored['sha256']}, new={expected_checksum}) "
+                "— refusing to overwrite"
+            ) from exc
+        return object_path, True
     return object_path, False
 
 
@@ -268,6 +345,7 @@ class BlobUploadOutcome:
     skipped: bool = False
     location: str = ""
     error: str = ""
+    bytes_uploaded: int = 0
 
 
 @dataclass
@@ -286,7 +364,12 @@ class BlobUploadReport:
 
 
 def upload_pending_blobs(
-    client: Any, pending: list[PendingBlob], *, scan_key: str, idempotency_key: str
+    client: Any,
+    pending: list[PendingBlob],
+    *,
+    scan_key: str,
+    idempotency_key: str,
+    workers: int = 1,
 ) -> BlobUploadReport:
     """Verify + upload every pending blob, filling in ``s3_location`` on success.
 
@@ -295,10 +378,11 @@ def upload_pending_blobs(
     can't abort the batch — mirroring ``download_images``'s per-frame
     discipline. Whether the *command* proceeds to call the RPC is gated by
     the caller on ``report.all_ok`` (a single-shot RPC call must never see a
-    partially-populated ``blobs`` array).
+    partially-populated ``blobs`` array). Up to ``workers`` blobs are uploaded
+    at once; outcomes keep ``pending``'s order.
     """
-    outcomes: list[BlobUploadOutcome] = []
-    for p in pending:
+
+    def _one(p: PendingBlob) -> BlobUploadOutcome:
         # root_type is read inside the try (not before it) so a malformed
         # blob dict is recorded as a per-blob failure like everything else,
         # never an uncaught KeyError that kills the whole batch.
@@ -309,11 +393,18 @@ def upload_pending_blobs(
             object_path = blob_object_path(scan_key, idempotency_key, p.blob["kind"], root_type)
             location, skipped = upload_blob(client, p.local_path, object_path, p.blob["checksum"])
             p.blob["s3_location"] = location
-            outcomes.append(
-                BlobUploadOutcome(root_type=root_type, ok=True, skipped=skipped, location=location)
+            return BlobUploadOutcome(
+                root_type=root_type,
+                ok=True,
+                skipped=skipped,
+                location=location,
+                bytes_uploaded=0 if skipped else Path(p.local_path).stat().st_size,
             )
         except Exception as exc:  # per-blob: record and continue
-            outcomes.append(BlobUploadOutcome(root_type=root_type, ok=False, error=str(exc)))
+            return BlobUploadOutcome(root_type=root_type, ok=False, error=str(exc))
+
+    n = min(workers, MAX_WORKERS, len(pending))
+    outcomes = _run_bounded(pending, _one, n) if n > 1 else [_one(p) for p in pending]
     return BlobUploadReport(outcomes)
 
 
@@ -400,12 +491,53 @@ def call_insert_envelope(client: Any, envelope: dict[str, Any]) -> dict[str, Any
 # --- batch: non-raising per-envelope core ------------------------------------
 
 
+@dataclass
+class IngestStats:
+    """Throughput counters for a batch, shared by the threads ingesting its envelopes."""
+
+    bytes_uploaded: int = 0
+    rpc_seconds: list[float] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_uploads(self, report: BlobUploadReport) -> None:
+        with self._lock:
+            self.bytes_uploaded += sum(o.bytes_uploaded for o in report.outcomes)
+
+    def record_rpc(self, seconds: float) -> None:
+        with self._lock:
+            self.rpc_seconds.append(seconds)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile; ``values`` need not be sorted."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil(n * q / 100), at least the first
+    return ordered[int(rank) - 1]
+
+
+def format_throughput(stats: IngestStats, *, envelopes: int, elapsed: float) -> str:
+    """One line: envelope and upload rates over the whole run, and RPC latency percentiles."""
+    elapsed = max(elapsed, 1e-9)
+    mb = stats.bytes_uploaded / 1_000_000
+    line = (
+        f"{envelopes:,} envelope{'' if envelopes == 1 else 's'} in {elapsed:.1f}s "
+        f"({envelopes / elapsed:.1f}/s); uploaded {mb:,.1f} MB ({mb / elapsed:.1f} MB/s)"
+    )
+    if stats.rpc_seconds:
+        p50 = _percentile(stats.rpc_seconds, 50) * 1000
+        p95 = _percentile(stats.rpc_seconds, 95) * 1000
+        line += f"; RPC p50 {p50:.0f} ms, p95 {p95:.0f} ms"
+    return line
+
+
 def ingest_one_envelope(
     client: Any,
     envelope_path: str | Path,
     *,
     predictions_dir: str | Path | None = None,
     profile: str | None = None,
+    workers: int = 1,
+    stats: IngestStats | None = None,
 ) -> ScanResult:
     """Ingest one envelope file, isolating any failure into a `ScanResult` instead of raising.
 
@@ -415,7 +547,9 @@ def ingest_one_envelope(
     upload blobs, call the RPC — but never raises. When `predictions_dir` is given, it is expected
     to be predict's own nested batch output root; this looks up
     `predictions_dir/{scan_key}/{scan_key}.predictions.json` per envelope (reusing
-    `load_predictions_manifest`/`build_pending_blobs`/`upload_pending_blobs` unchanged).
+    `load_predictions_manifest`/`build_pending_blobs`/`upload_pending_blobs` unchanged), with up
+    to `workers` of the envelope's blobs uploading at once. `stats`, if given, accumulates the
+    bytes uploaded and the RPC's latency.
     """
     scan_key = envelope_path if isinstance(envelope_path, str) else envelope_path.name
     scan_key = Path(scan_key).name.removesuffix(".result.json")
@@ -469,8 +603,14 @@ def ingest_one_envelope(
                 return ScanResult(scan_key, "failed", str(exc))
 
             report = upload_pending_blobs(
-                client, pending, scan_key=scan_key, idempotency_key=idempotency_key
+                client,
+                pending,
+                scan_key=scan_key,
+                idempotency_key=idempotency_key,
+                workers=workers,
             )
+            if stats is not None:
+                stats.record_uploads(report)
             if not report.all_ok:
                 details = "; ".join(f"{o.root_type}: {o.error}" for o in report.failed)
                 return ScanResult(
@@ -483,6 +623,7 @@ def ingest_one_envelope(
 
         from postgrest import APIError
 
+        started = time.perf_counter()
         try:
             result = call_insert_envelope(client, data)
         except APIError as exc:
@@ -491,6 +632,9 @@ def ingest_one_envelope(
                 "failed",
                 map_rpc_error(getattr(exc, "message", None), profile=profile),
             )
+        finally:
+            if stats is not None:
+                stats.record_rpc(time.perf_counter() - started)
 
         if not isinstance(result, dict):
             return ScanResult(scan_key, "failed", f"unexpected RPC response shape: {result!r}")
@@ -504,6 +648,37 @@ def ingest_one_envelope(
         return ScanResult(scan_key, "failed", str(exc))
 
 
+def ingest_envelopes(
+    client: Any,
+    envelope_paths: list[Path],
+    *,
+    predictions_dir: str | Path | None = None,
+    profile: str | None = None,
+    concurrency: int = 1,
+    workers: int = 1,
+    stats: IngestStats | None = None,
+) -> list[ScanResult]:
+    """Ingest every envelope, up to ``concurrency`` at once; results come back in input order.
+
+    Each envelope still uploads all of its own blobs before its RPC fires, so the RPC never sees
+    a partially-populated ``blobs`` array — concurrency is only ever *between* envelopes, and
+    between the blobs inside one (``workers``).
+    """
+
+    def _one(path: Path) -> ScanResult:
+        return ingest_one_envelope(
+            client,
+            path,
+            predictions_dir=predictions_dir,
+            profile=profile,
+            workers=workers,
+            stats=stats,
+        )
+
+    n = min(concurrency, MAX_WORKERS, len(envelope_paths))
+    return _run_bounded(envelope_paths, _one, n) if n > 1 else [_one(p) for p in envelope_paths]
+
+
 # --- command ----------------------------------------------------------------
 
 
@@ -648,6 +823,22 @@ def ingest_result(
         "blobs unchanged (no upload)."
     ),
 )
+@click.option(
+    "--envelope-concurrency",
+    "envelope_concurrency",
+    type=click.IntRange(min=1, max=MAX_WORKERS),
+    default=DEFAULT_ENVELOPE_CONCURRENCY,
+    show_default=True,
+    help=f"Envelopes ingested at once (1-{MAX_WORKERS}). 1 = one envelope at a time.",
+)
+@click.option(
+    "-n",
+    "--workers",
+    type=click.IntRange(min=1, max=MAX_WORKERS),
+    default=DEFAULT_BLOB_WORKERS,
+    show_default=True,
+    help=f"Concurrent blob uploads within each envelope (1-{MAX_WORKERS}). 1 = sequential.",
+)
 @click.pass_context
 def batch_ingest_result(
     ctx: click.Context,
@@ -655,10 +846,14 @@ def batch_ingest_result(
     profile: str,
     as_json: bool,
     predictions_dir: Path | None,
+    envelope_concurrency: int,
+    workers: int,
 ) -> None:
     """Ingest every {scan_key}.result.json file directly under ENVELOPES_DIR — the batch
     sibling of `ingest-result`. Isolates per-envelope failures (one bad envelope doesn't abort
-    the batch); exits non-zero if any envelope failed."""
+    the batch); exits non-zero if any envelope failed. Several envelopes are ingested at once
+    (--envelope-concurrency), each uploading several blobs at once (--workers); an envelope's RPC
+    still waits for all of its own blobs. Throughput is reported on stderr."""
     try:
         envelope_paths = discover_envelopes(envelopes_dir)
     except EnvelopeError as exc:
@@ -672,12 +867,20 @@ def batch_ingest_result(
 
     client = _authed_client(profile)
 
+    stats = IngestStats()
+    started = time.perf_counter()
     batch_result = BatchResult(
-        [
-            ingest_one_envelope(client, path, predictions_dir=predictions_dir, profile=profile)
-            for path in envelope_paths
-        ]
+        ingest_envelopes(
+            client,
+            envelope_paths,
+            predictions_dir=predictions_dir,
+            profile=profile,
+            concurrency=envelope_concurrency,
+            workers=workers,
+            stats=stats,
+        )
     )
+    elapsed = time.perf_counter() - started
 
     if as_json:
         click.echo(format_json(batch_result))
@@ -687,6 +890,7 @@ def batch_ingest_result(
                 batch_result, verb="Ingested", noun="envelope", destination=str(envelopes_dir)
             )
         )
+    click.echo(format_throughput(stats, envelopes=len(envelope_paths), elapsed=elapsed), err=True)
 
     if not batch_result.ok:
         ctx.exit(1)
@@ -9,7 +9,10 @@ from __future__ import annotations
 import csv
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+# Rows per page of a cyl_scans_extended query, matching PostgREST's max-rows on Supabase.
+SCAN_PAGE_ROWS = 1000
 
 # scans.csv schema: (output column, source key in a cyl_scans_extended row).
 # Order matches the legacy CLI's predict-container contract; `genotype` is
@@ -60,8 +63,8 @@ def build_scan_row(scan: dict[str, Any], genotype: str | None) -> dict[str, Any]
     return row
 
 
-def write_scans_csv(rows: list[dict[str, Any]], path: Path) -> None:
-    """Write rows to scans.csv with the fixed column order."""
+def write_scans_csv(rows: Iterable[dict[str, Any]], path: Path) -> None:
+    """Write rows to scans.csv with the fixed column order, as they arrive."""
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as fh:
         writer = csv.DictWriter(fh, fieldnames=CSV_COLUMNS)
@@ -86,20 +89,38 @@ def fetch_scans(
     plant_age_min: int = 0,
     plant_age_max: int = 1000,
     limit: int = 100000,
-) -> list[dict[str, Any]]:
-    """Query cyl_scans_extended for an experiment (legacy filter semantics)."""
-    query = (
-        client.table("cyl_scans_extended")
-        .select("*")
-        .eq("experiment_id", experiment_id)
-    )
-    if plant_qr_code:
-        query = query.eq("qr_code", plant_qr_code)
-    else:
-        query = query.gte("plant_age_days", plant_age_min).lte(
-            "plant_age_days", plant_age_max
+    page_size: int = SCAN_PAGE_ROWS,
+) -> Iterator[dict[str, Any]]:
+    """Stream cyl_scans_extended rows for an experiment (legacy filter semantics).
+
+    Paged by scan_id keyset, since PostgREST silently truncates a single select at
+    its max-rows cap. ``limit`` caps the total yielded.
+    """
+    remaining = limit
+    last_scan_id = None
+    while remaining > 0:
+        query = (
+            client.table("cyl_scans_extended")
+            .select("*")
+            .eq("experiment_id", experiment_id)
+        )
+        if plant_qr_code:
+            query = query.eq("qr_code", plant_qr_code)
+        else:
+            query = query.gte("plant_age_days", plant_age_min).lte(
+                "plant_age_days", plant_age_max
+            )
+        if last_scan_id is not None:
+            query = query.gt("scan_id", last_scan_id)
+        rows = (
+            query.order("scan_id").limit(min(page_size, remaining)).execute().data
+            or []
         )
-    return query.limit(limit).execute().data or []
+        if not rows:
+            return
+        yield from rows
+        remaining -= len(rows)
+        last_scan_id = rows[-1]["scan_id"]
 
 
 def fetch_scan(client: Any, scan_id: Any) -> dict[str, Any] | None:
@@ -2,6 +2,8 @@
 
 import hashlib
 import json
+import threading
+import time
 
 import pytest
 import sleap_roots_contracts
@@ -1188,3 +1190,138 @@ def test_batch_cli_profile_option_passed_through(tmp_path, monkeypatch):
 def test_batch_cli_registration_shows_in_help():
     result = CliRunner().invoke(cli, ["cyl", "--help"])
     assert "batch-download-for-predict" in result.output
+
+
+# --- batch: concurrency -------------------------------------------------------
+
+
+class _SlowBucket:
+    """Finishes later frames first, so any order-by-completion bug shows up."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.live = 0
+        self.peak = 0
+
+    def download(self, object_path):
+        with self.lock:
+            self.live += 1
+            self.peak = max(self.peak, self.live)
+        try:
+            index = int(object_path.rsplit("-", 1)[-1].split(".")[0])
+            time.sleep(0.002 * (20 - index))
+            return f"bytes::{object_path}".encode()
+        finally:
+            with self.lock:
+                self.live -= 1
+
+
+def _many_images(count):
+    return [
+        {"id": 2000 + i, "frame_number": i, "object_path": f"cyl-images/f-{i}.png"}
+        for i in range(count)
+    ]
+
+
+def test_parallel_frames_keep_the_checksum_in_frame_number_order(tmp_path):
+    images = _many_images(12)
+    client = _FakeClient()
+    client.storage._bucket = _SlowBucket()
+
+    result = dfp.download_frames_for_predict(client, SCAN, images, tmp_path / "scan_1", workers=6)
+
+    assert result.ok == 12
+    assert [f.frame_number for f in result.frames] == list(range(12))
+    expected = [f"bytes::{i['object_path']}".encode() for i in images]
+    staged = dfp.read_staged_frames(tmp_path / "scan_1", images)
+    assert dfp.compute_checksum(staged) == dfp.compute_checksum(expected)
+    assert client.storage._bucket.peak > 1, "frames were never in flight together"
+
+
+def test_stage_scans_returns_results_in_input_order(tmp_path, monkeypatch):
+    _patch_batch(monkeypatch, scan_id_to_images={2: []})
+    client = auth.make_authed_client(None)
+    order: list[int] = []
+    real_stage = dfp.stage_one_scan
+
+    def _stage(client, scan_id, out_dir, **kwargs):
+        time.sleep(0.01 * (5 - scan_id))  # the last scan finishes first
+        order.append(scan_id)
+        return real_stage(client, scan_id, out_dir, **kwargs)
+
+    monkeypatch.setattr(dfp, "stage_one_scan", _stage)
+
+    results = dfp.stage_scans(client, [1, 2, 3, 4], tmp_path, scan_concurrency=4, workers=2)
+
+    assert [r.scan_key for r in results] == ["scan_1", "scan_2", "scan_3", "scan_4"]
+    assert [r.status for r in results] == ["ok", "failed", "ok", "ok"]
+    assert order != [1, 2, 3, 4], "scans were staged one after another"
+
+
+def test_stage_scans_stages_a_repeated_scan_id_once(tmp_path, monkeypatch):
+    _patch_batch(monkeypatch)
+    client = auth.make_authed_client(None)
+    staged: list[int] = []
+    real_stage = dfp.stage_one_scan
+
+    def _stage(client, scan_id, out_dir, **kwargs):
+        staged.append(scan_id)
+        return real_stage(client, scan_id, out_dir, **kwargs)
+
+    monkeypatch.setattr(dfp, "stage_one_scan", _stage)
+
+    results = dfp.stage_scans(client, [1, 2, 1], tmp_path, scan_concurrency=3)
+
+    assert sorted(staged) == [1, 2]
+    assert [r.status for r in results] == ["ok", "ok", "skipped"]
+
+
+def test_batch_cli_concurrency_flags_reach_staging(tmp_path, monkeypatch):
+    _patch_batch(monkeypatch)
+    seen: dict = {}
+
+    def _stage_scans(client, scan_ids, out_dir, **kwargs):
+        seen.update(kwargs)
+        return [dfp.ScanResult(dfp.scan_key_for(s), "ok") for s in scan_ids]
+
+    monkeypatch.setattr(dfp, "stage_scans", _stage_scans)
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "cyl", "batch-download-for-predict", str(tmp_path / "out"), "--scan-ids", "1,2",
+            "--scan-concurrency", "3", "--workers", "5",
+        ],
+    )  # fmt: skip
+
+    assert result.exit_code == 0, result.output
+    assert seen == {"scan_concurrency": 3, "workers": 5}
+
+
+# --- checksum memory -----------------------------------------------------------
+
+
+def test_staged_frames_stream_back_a_chunk_at_a_time(tmp_path):
+    """Hashing a scan must not hold its frames: no chunk is larger than the buffer."""
+    scan_dir = tmp_path / "scan_1"
+    scan_dir.mkdir()
+    frames = [bytes([i]) * 2500 for i in range(len(IMAGES))]
+    for image, data in zip(IMAGES, frames):
+        dfp.frame_dest_for_predict(scan_dir, image).write_bytes(data)
+
+    chunks = list(dfp.read_staged_frames(scan_dir, IMAGES, chunk_size=1024))
+
+    assert max(len(c) for c in chunks) == 1024
+    assert dfp.compute_checksum(chunks) == dfp.compute_checksum(frames)
+
+
+def test_sidecar_checksum_matches_the_frames_on_disk(tmp_path, monkeypatch):
+    _patch_batch(monkeypatch)
+    client = auth.make_authed_client(None)
+
+    assert dfp.stage_one_scan(client, 1, tmp_path, workers=2).status == "ok"
+
+    sidecar = json.loads((tmp_path / "scan_1" / "scan_1.scan_metadata.json").read_text())
+    on_disk = [dfp.frame_dest_for_predict(tmp_path / "scan_1", i).read_bytes() for i in IMAGES]
+    assert sidecar["images_checksum"] == dfp.compute_checksum(on_disk)
+    assert on_disk == [f"bytes::{i['object_path']}".encode() for i in IMAGES]
@@ -3,6 +3,8 @@
 import io
 import json
 import re
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -566,14 +568,21 @@ class _NotFoundBucket:
 
     def __init__(self):
         self.uploaded = {}
+        self.metadata = {}
+
+    def info(self, object_path):
+        from storage3.exceptions import StorageApiError
+
+        raise StorageApiError("Object not found", "404", 404)
 
     def download(self, object_path):
         from storage3.exceptions import StorageApiError
 
         raise StorageApiError("Object not found", "404", 404)
 
-    def upload(self, object_path, data):
-        self.uploaded[object_path] = data
+    def upload(self, object_path, data, file_options=None):
+        self.uploaded[object_path] = data.read() if hasattr(data, "read") else data
+        self.metadata[object_path] = (file_options or {}).get("metadata")
 
 
 class _NotFoundStorage:
@@ -602,31 +611,43 @@ def test_upload_blob_first_upload():
 
 
 class _ExistingBucket:
-    """An object already exists at `object_path` with `existing_bytes`."""
+    """An object already exists at `object_path` with `existing_bytes`, uploaded before its
+    checksum was recorded (so `info` knows only its size)."""
 
-    def __init__(self, object_path, existing_bytes):
+    def __init__(self, object_path, existing_bytes, *, user_metadata=None):
         self.object_path = object_path
         self.existing_bytes = existing_bytes
+        self.user_metadata = user_metadata or {}
         self.upload_called = False
+        self.download_called = False
+
+    def info(self, object_path):
+        if object_path == self.object_path:
+            return {"size": len(self.existing_bytes), "metadata": self.user_metadata}
+        from storage3.exceptions import StorageApiError
+
+        raise StorageApiError("Object not found", "404", 404)
 
     def download(self, object_path):
+        self.download_called = True
         if object_path == self.object_path:
             return self.existing_bytes
         from storage3.exceptions import StorageApiError
 
         raise StorageApiError("Object not found", "404", 404)
 
-    def upload(self, object_path, data):
+    def upload(self, object_path, data, file_options=None):
         self.upload_called = True
 
 
-def test_upload_blob_skips_when_existing_checksum_matches():
+def test_upload_blob_skips_when_existing_checksum_matches(tmp_path):
     data = b"already uploaded bytes"
     checksum = __import__("hashlib").sha256(data).hexdigest()
+    local = tmp_path / "a.slp"
+    local.write_bytes(data)  # verify_blob_checksum has already held it to `checksum`
     bucket = _ExistingBucket("some/path.slp", data)
     client = type("C", (), {"storage": type("S", (), {"from_": lambda self, n: bucket})()})()
-    # local file content doesn't matter for a skip -- only the checksum comparison does
-    location, skipped = ing.upload_blob(client, PREDICTIONS_DIR / "scan0K9E8BI.modelrice-primary.rootprimary.slp", "some/path.slp", checksum)
+    location, skipped = ing.upload_blob(client, local, "some/path.slp", checksum)
     assert skipped is True
     assert location == "some/path.slp"
     assert bucket.upload_called is False
@@ -641,6 +662,95 @@ def test_upload_blob_raises_on_path_collision():
     assert bucket.upload_called is False
 
 
+def _client_for(bucket):
+    return type("C", (), {"storage": type("S", (), {"from_": lambda self, n: bucket})()})()
+
+
+def test_upload_blob_streams_from_an_open_file():
+    # storage3 passes a file object to httpx as a multipart field, which is read in
+    # fixed-size chunks; bytes would put the whole .slp in memory first.
+    client = _NotFoundClient()
+    seen = []
+    real_upload = client.bucket.upload
+
+    def _upload(object_path, data, file_options=None):
+        seen.append(hasattr(data, "read"))
+        real_upload(object_path, data, file_options)
+
+    client.bucket.upload = _upload
+    slp = PREDICTIONS_DIR / "scan0K9E8BI.modelrice-primary.rootprimary.slp"
+    ing.upload_blob(client, slp, "some/path.slp", "irrelevant")
+    assert seen == [True]
+
+
+def test_upload_blob_records_its_checksum_for_the_next_run():
+    client = _NotFoundClient()
+    slp = PREDICTIONS_DIR / "scan0K9E8BI.modelrice-primary.rootprimary.slp"
+    checksum = __import__("hashlib").sha256(slp.read_bytes()).hexdigest()
+    ing.upload_blob(client, slp, "some/path.slp", checksum)
+    assert client.bucket.metadata["some/path.slp"] == {
+        "sha256": checksum,
+        "size": slp.stat().st_size,
+    }
+
+
+def test_upload_blob_skips_on_recorded_checksum_without_downloading(tmp_path):
+    """Re-ingesting a batch must not re-pull every .slp just to hash it."""
+    data = b"already uploaded bytes"
+    checksum = __import__("hashlib").sha256(data).hexdigest()
+    local = tmp_path / "a.slp"
+    local.write_bytes(data)
+    bucket = _ExistingBucket("some/path.slp", data, user_metadata={"sha256": checksum})
+    location, skipped = ing.upload_blob(_client_for(bucket), local, "some/path.slp", checksum)
+    assert skipped is True
+    assert bucket.download_called is False
+
+
+def test_upload_blob_refuses_a_recorded_checksum_that_differs(tmp_path):
+    data = b"same size, other bytes"
+    local = tmp_path / "a.slp"
+    local.write_bytes(data)
+    bucket = _ExistingBucket("some/path.slp", data, user_metadata={"sha256": "0" * 64})
+    with pytest.raises(ing.BlobConstructionError, match="different checksum"):
+        ing.upload_blob(
+            _client_for(bucket), local, "some/path.slp", __import__("hashlib").sha256(data).hexdigest()
+        )
+    assert bucket.download_called is False
+    assert bucket.upload_called is False
+
+
+def test_upload_blob_refuses_a_different_size_without_downloading(tmp_path):
+    local = tmp_path / "a.slp"
+    local.write_bytes(b"new")
+    bucket = _ExistingBucket("some/path.slp", b"a much longer object from another run")
+    with pytest.raises(ing.BlobConstructionError, match="different size"):
+        ing.upload_blob(_client_for(bucket), local, "some/path.slp", "irrelevant")
+    assert bucket.download_called is False
+    assert bucket.upload_called is False
+
+
+def test_upload_blob_reads_the_older_nested_info_shape(tmp_path):
+    data = b"already uploaded bytes"
+    local = tmp_path / "a.slp"
+    local.write_bytes(b"xx")
+    bucket = _ExistingBucket("some/path.slp", data)
+    bucket.info = lambda object_path: {"metadata": {"size": len(data)}}
+    with pytest.raises(ing.BlobConstructionError, match="different size"):
+        ing.upload_blob(_client_for(bucket), local, "some/path.slp", "irrelevant")
+
+
+def test_sha256_file_hashes_in_chunks(tmp_path, monkeypatch):
+    import hashlib
+
+    data = bytes(range(256)) * 100
+    p = tmp_path / "a.slp"
+    p.write_bytes(data)
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("read the whole file"))
+
+    assert ing.sha256_file(p, chunk_size=1000) == hashlib.sha256(data).hexdigest()
+    ing.verify_blob_checksum(p, hashlib.sha256(data).hexdigest())  # must not raise
+
+
 def test_upload_pending_blobs_all_succeed():
     manifest = ing.load_predictions_manifest(PREDICTIONS_DIR, SCAN_KEY)
     pending = ing.build_pending_blobs(manifest, PREDICTIONS_DIR, existing_blobs=[])
@@ -711,7 +821,7 @@ def test_cli_predictions_dir_constructs_and_uploads_blobs(monkeypatch):
         captured["env"] = env
         return RESULT_OK
 
-    def fake_upload(client, pending, *, scan_key, idempotency_key):
+    def fake_upload(client, pending, *, scan_key, idempotency_key, workers=1):
         for p in pending:
             p.blob["s3_location"] = f"s3://x/{p.blob['root_type']}.slp"
         return ing.BlobUploadReport(
@@ -743,7 +853,7 @@ def test_cli_predictions_dir_upload_failure_makes_no_rpc_call(monkeypatch):
     _patch_authed(monkeypatch)
     monkeypatch.setattr(ing, "call_insert_envelope", mark_rpc)
 
-    def failing_upload(client, pending, *, scan_key, idempotency_key):
+    def failing_upload(client, pending, *, scan_key, idempotency_key, workers=1):
         return ing.BlobUploadReport(
             [
                 ing.BlobUploadOutcome(root_type="primary", ok=False, error="boom"),
@@ -872,10 +982,13 @@ def test_upload_blob_reraises_non_404_storage_errors():
     from storage3.exceptions import StorageApiError
 
     class _ForbiddenBucket:
+        def info(self, object_path):
+            raise StorageApiError("permission denied", "403", 403)
+
         def download(self, object_path):
             raise StorageApiError("permission denied", "403", 403)
 
-        def upload(self, object_path, data):
+        def upload(self, object_path, data, file_options=None):
             raise AssertionError("must not attempt upload after a non-404 existence-check error")
 
     client = type("C", (), {"storage": type("S", (), {"from_": lambda self, n: _ForbiddenBucket()})()})()
@@ -1056,7 +1169,7 @@ def test_batch_ingest_cli_isolates_unexpected_network_error_among_several(monkey
     result = CliRunner().invoke(cli, ["cyl", "batch-ingest-result", str(tmp_path), "--json"])
 
     assert result.exit_code != 0
-    payload = {entry["scan_key"]: entry for entry in json.loads(result.output)}
+    payload = {entry["scan_key"]: entry for entry in json.loads(result.stdout)}
     assert payload["scan_1"]["status"] == "ok"
     assert payload["scan_2"]["status"] == "failed"
     assert "simulated network timeout" in payload["scan_2"]["error"]
@@ -1156,7 +1269,7 @@ def test_ingest_one_envelope_predictions_dir_uploads_blobs(tmp_path, monkeypatch
         captured["env"] = env
         return RESULT_OK
 
-    def fake_upload(client, pending, *, scan_key, idempotency_key):
+    def fake_upload(client, pending, *, scan_key, idempotency_key, workers=1):
         for p in pending:
             p.blob["s3_location"] = f"s3://x/{p.blob['root_type']}.slp"
         return ing.BlobUploadReport(
@@ -1182,7 +1295,7 @@ def test_ingest_one_envelope_predictions_dir_upload_failure(tmp_path, monkeypatc
         called["rpc"] = True
         return RESULT_OK
 
-    def failing_upload(client, pending, *, scan_key, idempotency_key):
+    def failing_upload(client, pending, *, scan_key, idempotency_key, workers=1):
         return ing.BlobUploadReport(
             [ing.BlobUploadOutcome(root_type="primary", ok=False, error="boom")]
         )
@@ -1223,7 +1336,7 @@ def test_batch_ingest_cli_json_all_ok(monkeypatch, tmp_path):
     result = CliRunner().invoke(cli, ["cyl", "batch-ingest-result", str(tmp_path), "--json"])
 
     assert result.exit_code == 0, result.output
-    payload = json.loads(result.output)
+    payload = json.loads(result.stdout)
     assert len(payload) == 2
     assert all(entry["status"] == "ok" for entry in payload)
 
@@ -1249,7 +1362,7 @@ def test_batch_ingest_cli_mixed_statuses_json_output(monkeypatch, tmp_path):
     result = CliRunner().invoke(cli, ["cyl", "batch-ingest-result", str(tmp_path), "--json"])
 
     assert result.exit_code != 0
-    payload = {entry["scan_key"]: entry for entry in json.loads(result.output)}
+    payload = {entry["scan_key"]: entry for entry in json.loads(result.stdout)}
     assert payload["scan_1"]["status"] == "ok"
     assert payload["scan_2"]["status"] == "skipped"
     assert payload["scan_3"]["status"] == "failed"
@@ -1361,7 +1474,7 @@ def test_batch_ingest_cli_noop_reported_as_skipped(monkeypatch, tmp_path):
     result = CliRunner().invoke(cli, ["cyl", "batch-ingest-result", str(tmp_path), "--json"])
 
     assert result.exit_code == 0, result.output
-    payload = json.loads(result.output)
+    payload = json.loads(result.stdout)
     assert payload[0]["status"] == "skipped"
 
 
@@ -1369,7 +1482,7 @@ def test_batch_ingest_cli_predictions_dir_uploads_blobs(monkeypatch, tmp_path):
     _patch_batch_authed(monkeypatch)
     monkeypatch.setattr(ing, "call_insert_envelope", lambda client, env: RESULT_OK)
 
-    def fake_upload(client, pending, *, scan_key, idempotency_key):
+    def fake_upload(client, pending, *, scan_key, idempotency_key, workers=1):
         for p in pending:
             p.blob["s3_location"] = f"s3://x/{p.blob['root_type']}.slp"
         return ing.BlobUploadReport(
@@ -1449,3 +1562,169 @@ def test_batch_ingest_cli_profile_option_passed_through(monkeypatch, tmp_path):
 def test_batch_ingest_cli_registration_shows_in_help():
     result = CliRunner().invoke(cli, ["cyl", "--help"])
     assert "batch-ingest-result" in result.output
+
+
+# --- batch: concurrency ---------------------------------------------------------
+
+
+def test_ingest_envelopes_runs_envelopes_together_but_reports_in_order(monkeypatch, tmp_path):
+    _skip_contract_validation(monkeypatch)
+    lock = threading.Lock()
+    live = {"now": 0, "peak": 0}
+
+    def _slow_call(client, env):
+        with lock:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+        time.sleep(0.01 * (5 - int(env["provenance"]["scan_key"][-1])))  # last finishes first
+        with lock:
+            live["now"] -= 1
+        return RESULT_OK
+
+    monkeypatch.setattr(ing, "call_insert_envelope", _slow_call)
+    paths = [_write_envelope(tmp_path, f"scan_{i}") for i in range(1, 5)]
+
+    results = ing.ingest_envelopes(object(), paths, concurrency=4)
+
+    assert [r.scan_key for r in results] == ["scan_1", "scan_2", "scan_3", "scan_4"]
+    assert all(r.status == "ok" for r in results)
+    assert live["peak"] > 1, "envelopes were ingested one after another"
+
+
+def test_concurrent_blob_uploads_still_finish_before_the_rpc(tmp_path, monkeypatch):
+    path = tmp_path / f"{SCAN_KEY}.result.json"
+    path.write_text(FIXTURE.read_text(encoding="utf-8"), encoding="utf-8")
+    predictions_root = tmp_path / "predictions"
+    _nested_predictions_dir(predictions_root, SCAN_KEY)
+    events: list[str] = []
+    real_upload_blob = ing.upload_blob
+
+    def _slow_upload(client, local_path, object_path, expected_checksum):
+        time.sleep(0.02)
+        outcome = real_upload_blob(client, local_path, object_path, expected_checksum)
+        events.append("upload")
+        return outcome
+
+    def _rpc(client, env):
+        events.append("rpc")
+        assert all(b["s3_location"] for b in env["blobs"])
+        return RESULT_OK
+
+    monkeypatch.setattr(ing, "upload_blob", _slow_upload)
+    monkeypatch.setattr(ing, "call_insert_envelope", _rpc)
+    stats = ing.IngestStats()
+
+    result = ing.ingest_one_envelope(
+        _NotFoundClient(), path, predictions_dir=predictions_root, workers=4, stats=stats
+    )
+
+    assert result.status == "ok"
+    assert events == ["upload", "upload", "rpc"]
+    assert stats.bytes_uploaded == sum(
+        f.stat().st_size for f in (predictions_root / SCAN_KEY).glob("*.slp")
+    )
+    assert len(stats.rpc_seconds) == 1
+
+
+def test_upload_pending_blobs_keeps_outcomes_in_pending_order():
+    manifest = ing.load_predictions_manifest(PREDICTIONS_DIR, SCAN_KEY)
+    pending = ing.build_pending_blobs(manifest, PREDICTIONS_DIR, existing_blobs=[])
+
+    report = ing.upload_pending_blobs(
+        _NotFoundClient(), pending, scan_key=SCAN_KEY, idempotency_key="idem123", workers=4
+    )
+
+    assert [o.root_type for o in report.outcomes] == [p.blob["root_type"] for p in pending]
+    for outcome, p in zip(report.outcomes, pending):
+        assert outcome.bytes_uploaded == p.local_path.stat().st_size
+
+
+def test_a_skipped_blob_counts_no_bytes(tmp_path):
+    data = b"already uploaded bytes"
+    checksum = __import__("hashlib").sha256(data).hexdigest()
+    local = tmp_path / "a.slp"
+    local.write_bytes(data)
+    pending = [
+        ing.PendingBlob(
+            blob={"kind": "predictions_slp", "root_type": "primary", "checksum": checksum},
+            local_path=local,
+        )
+    ]
+    bucket = _ExistingBucket(
+        f"{SCAN_KEY}/idem123/predictions_slp.primary.slp", data, user_metadata={"sha256": checksum}
+    )
+
+    report = ing.upload_pending_blobs(
+        _client_for(bucket), pending, scan_key=SCAN_KEY, idempotency_key="idem123"
+    )
+
+    assert report.outcomes[0].skipped and report.outcomes[0].bytes_uploaded == 0
+
+
+def test_upload_blob_accepts_a_twin_that_won_the_upload_race(tmp_path):
+    """Two copies of one envelope in a batch derive the same object path; one must not fail."""
+    from storage3.exceptions import StorageApiError
+
+    data = b"same bytes from a re-delivered envelope"
+    checksum = __import__("hashlib").sha256(data).hexdigest()
+    local = tmp_path / "a.slp"
+    local.write_bytes(data)
+
+    class _RacedBucket(_ExistingBucket):
+        def __init__(self):
+            super().__init__("some/path.slp", data, user_metadata={"sha256": checksum})
+            self.landed = False
+
+        def info(self, object_path):
+            if not self.landed:
+                raise StorageApiError("Object not found", "404", 404)
+            return super().info(object_path)
+
+        def upload(self, object_path, data, file_options=None):
+            self.landed = True  # the twin's upload got there first
+            raise StorageApiError("The resource already exists", "Duplicate", 409)
+
+    client = _client_for(_RacedBucket())
+    location, skipped = ing.upload_blob(client, local, "some/path.slp", checksum)
+
+    assert skipped is True and location == "some/path.slp"
+
+
+def test_throughput_line_reports_rates_and_rpc_percentiles():
+    stats = ing.IngestStats(bytes_uploaded=50_000_000, rpc_seconds=[0.1] * 18 + [0.5, 0.9])
+
+    line = ing.format_throughput(stats, envelopes=20, elapsed=10.0)
+
+    assert line == (
+        "20 envelopes in 10.0s (2.0/s); uploaded 50.0 MB (5.0 MB/s); RPC p50 100 ms, p95 500 ms"
+    )
+
+
+def test_throughput_line_without_rpcs_omits_latency():
+    line = ing.format_throughput(ing.IngestStats(), envelopes=1, elapsed=0.5)
+    assert line == "1 envelope in 0.5s (2.0/s); uploaded 0.0 MB (0.0 MB/s)"
+
+
+def test_batch_ingest_cli_reports_throughput_on_stderr(monkeypatch, tmp_path):
+    _patch_batch_authed(monkeypatch)
+    monkeypatch.setattr(ing, "call_insert_envelope", lambda client, env: RESULT_OK)
+    for key in ("scan_1", "scan_2"):
+        _write_envelope(tmp_path, key)
+
+    result = CliRunner().invoke(
+        cli,
+        ["cyl", "batch-ingest-result", str(tmp_path), "--json", "--envelope-concurrency", "2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    json.loads(result.stdout)  # stdout stays machine-readable
+    assert "2 envelopes in" in result.stderr
+    assert "RPC p50" in result.stderr
+
+
+def test_batch_ingest_cli_rejects_zero_concurrency(tmp_path):
+    result = CliRunner().invoke(
+        cli, ["cyl", "batch-ingest-result", str(tmp_path), "--envelope-concurrency", "0"]
+    )
+    assert result.exit_code != 0
+    assert "not in the range" in result.output
@@ -0,0 +1,189 @@
+"""`cyl download` lists frames many scans per query, and starts downloading before it's done.
+
+Listing one scan per request made a 4,000-scan experiment spend minutes in round trips before
+a single frame was fetched.
+"""
+
+from __future__ import annotations
+
+import pytest
+from test_download_metadata import SCAN
+from test_download_session_resume import _Client
+
+import bloomctl.cyl.download as dl
+
+
+def _scan(scan_id: int) -> dict:
+    return {**SCAN, "scan_id": scan_id, "qr_code": f"QR-{scan_id}"}
+
+
+class _Query:
+    """Just enough of a PostgREST builder for `fetch_images_for_scans`."""
+
+    def __init__(self, table: _Table):
+        self.table = table
+        self.scan_ids: list = []
+        self.after = None
+        self.limit_to = None
+
+    def select(self, _columns):
+        return self
+
+    def in_(self, column, values):
+        assert column == "scan_id"
+        self.scan_ids = list(values)
+        return self
+
+    def gt(self, column, value):
+        assert column == "id"
+        self.after = value
+        return self
+
+    def order(self, column):
+        assert column == "id"
+        return self
+
+    def limit(self, n):
+        self.limit_to = n
+        return self
+
+    def execute(self):
+        self.table.queries.append(self.scan_ids)
+        if self.table.fail_when is not None and self.table.fail_when(self.scan_ids):
+            raise RuntimeError("PostgREST 500")
+        rows = [
+            row
+            for row in self.table.rows
+            if row["scan_id"] in self.scan_ids and (self.after is None or row["id"] > self.after)
+        ]
+        cap = min(self.limit_to, self.table.max_rows)  # the server caps without saying so
+        return type("R", (), {"data": rows[:cap]})()
+
+
+class _Table:
+    def __init__(self, rows, *, max_rows=1000, fail_when=None):
+        self.rows = sorted(rows, key=lambda row: row["id"])
+        self.max_rows = max_rows
+        self.fail_when = fail_when
+        self.queries: list[list] = []
+
+
+class _ListingClient(_Client):
+    def __init__(self, rows, **kwargs):
+        super().__init__()
+        self.images = _Table(rows, **kwargs)
+
+    def table(self, name):
+        assert name == "cyl_images"
+        return _Query(self.images)
+
+
+def _rows(scan_ids, frames: int) -> list[dict]:
+    rows = []
+    for scan_id in scan_ids:
+        # Inserted in reverse, so id order is not frame order.
+        for frame_number in reversed(range(frames)):
+            rows.append(
+                {
+                    "id": len(rows) + 1,
+                    "scan_id": scan_id,
+                    "frame_number": frame_number,
+                    "object_path": f"cyl-images/{scan_id}-{frame_number}.png",
+                }
+            )
+    return rows
+
+
+def test_frames_are_grouped_per_scan_in_frame_order():
+    client = _ListingClient(_rows([1, 2], 3))
+
+    grouped = dl.fetch_images_for_scans(client, [1, 2, 3])
+
+    assert [i["frame_number"] for i in grouped[1]] == [0, 1, 2]
+    assert [i["frame_number"] for i in grouped[2]] == [0, 1, 2]
+    assert grouped[3] == []  # asked for, nothing recorded
+
+
+def test_a_server_row_cap_does_not_truncate_the_listing():
+    """A short page isn't the end: the cap may be smaller than the page asked for."""
+    client = _ListingClient(_rows([1, 2], 72), max_rows=50)
+
+    grouped = dl.fetch_images_for_scans(client, [1, 2], page_size=100)
+
+    assert len(grouped[1]) == 72 and len(grouped[2]) == 72
+
+
+def test_many_scans_are_listed_in_a_few_queries(tmp_path):
+    scans = [_scan(i) for i in range(1, 251)]
+    client = _ListingClient(_rows(range(1, 251), 2))
+
+    result = dl.download_images(client, scans, tmp_path, workers=4)
+
+    assert result.ok == 500 and result.failed == 0
+    # 3 chunks of up to 100 scans, each paged until an empty page.
+    assert len(client.images.queries) == 6
+    assert max(len(ids) for ids in client.images.queries) == dl.LIST_CHUNK_SCANS
+
+
+def test_a_scan_with_no_rows_is_noted_not_failed(tmp_path):
+    client = _ListingClient(_rows([1], 2))
+
+    result = dl.download_images(client, [_scan(1), _scan(2)], tmp_path, workers=1)
+
+    assert result.ok == 2 and result.scans_without_frames == 1
+    assert not result.incomplete
+
+
+def test_a_failing_chunk_is_retried_per_scan_so_only_the_bad_scan_is_unlisted(
+    tmp_path, monkeypatch
+):
+    client = _ListingClient(_rows([1, 2, 3], 2), fail_when=lambda ids: len(ids) > 1)
+
+    def _fetch_images(c, scan_id):
+        if scan_id == 2:
+            raise RuntimeError("PostgREST 500")
+        return [row for row in client.images.rows if row["scan_id"] == scan_id]
+
+    monkeypatch.setattr(dl, "fetch_images", _fetch_images)
+
+    result = dl.download_images(client, [_scan(1), _scan(2), _scan(3)], tmp_path, workers=1)
+
+    assert result.scans_unlisted == 1
+    assert [f.scan_id for f in result.frames if f.unlisted] == [2]
+    assert result.ok == 4  # scans 1 and 3 still arrived
+
+
+def test_downloading_starts_before_listing_finishes(tmp_path):
+    """The first chunk's frames are fetched while later chunks are still being listed."""
+    scans = [_scan(i) for i in range(1, 301)]
+    client = _ListingClient(_rows(range(1, 301), 1))
+    events: list[str] = []
+    real_download = client.bucket.download
+    real_table = client.table
+
+    def _download(object_path):
+        events.append("download")
+        return real_download(object_path)
+
+    def _table(name):
+        events.append("list")
+        return real_table(name)
+
+    client.bucket.download = _download
+    client.table = _table
+
+    dl.download_images(client, scans, tmp_path, workers=2)
+
+    first_download = events.index("download")
+    assert "list" in events[first_download:], "every chunk was listed before any download"
+
+
+def test_a_collision_in_a_later_chunk_never_fetches_the_clashing_frame(tmp_path):
+    scans = [_scan(i) for i in range(1, 101)] + [{**_scan(101), "qr_code": "QR-1"}]
+    client = _ListingClient(_rows(range(1, 102), 1))
+
+    with pytest.raises(dl.CollidingFrames, match="are the same file"):
+        dl.download_images(client, scans, tmp_path, workers=1)
+
+    frame = tmp_path / "images/Wave2/Day14_2026-05-11/QR-1/0.png"
+    assert frame.read_bytes() == b"bytes::cyl-images/1-0.png"  # scan 1's, not its twin's
@@ -0,0 +1,159 @@
+"""`cyl download` pages through an experiment's scans instead of one capped select.
+
+A single `.limit(100000)` select was silently cut off at PostgREST's max-rows cap, and held
+every row in memory before the first frame was listed.
+"""
+
+from __future__ import annotations
+
+import csv
+
+import pytest
+from test_download_metadata import SCAN
+
+import bloomctl.cyl.download as dl
+
+
+class _ScanQuery:
+    """Just enough of a PostgREST builder for `fetch_scans`."""
+
+    def __init__(self, view: _View):
+        self.view = view
+        self.after = None
+        self.limit_to = None
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, _column, _value):
+        return self
+
+    def gte(self, _column, _value):
+        return self
+
+    def lte(self, _column, _value):
+        return self
+
+    def gt(self, column, value):
+        assert column == "scan_id"
+        self.after = value
+        return self
+
+    def order(self, column):
+        assert column == "scan_id"
+        return self
+
+    def limit(self, n):
+        self.limit_to = n
+        return self
+
+    def execute(self):
+        self.view.pages += 1
+        rows = [r for r in self.view.rows if self.after is None or r["scan_id"] > self.after]
+        cap = min(self.limit_to, self.view.max_rows)  # the server caps without saying so
+        return type("R", (), {"data": rows[:cap]})()
+
+
+class _View:
+    def __init__(self, count: int, *, max_rows: int = 1000):
+        self.rows = [{**SCAN, "scan_id": i, "qr_code": f"QR-{i}"} for i in range(1, count + 1)]
+        self.max_rows = max_rows
+        self.pages = 0
+
+
+class _Client:
+    def __init__(self, view: _View):
+        self.view = view
+
+    def table(self, name):
+        assert name == "cyl_scans_extended"
+        return _ScanQuery(self.view)
+
+
+def test_every_scan_arrives_past_the_server_row_cap():
+    view = _View(2500, max_rows=1000)
+
+    scans = list(dl.fetch_scans(_Client(view), 17957))
+
+    assert [s["scan_id"] for s in scans] == list(range(1, 2501))
+
+
+def test_limit_caps_the_total_not_each_page():
+    view = _View(2500)
+
+    scans = list(dl.fetch_scans(_Client(view), 17957, limit=1200, page_size=500))
+
+    assert len(scans) == 1200
+
+
+def test_pages_are_requested_only_as_they_are_consumed():
+    view = _View(2500)
+    stream = dl.fetch_scans(_Client(view), 17957, page_size=1000)
+
+    next(stream)
+
+    assert view.pages == 1, "the first scan must not wait for the whole experiment"
+
+
+def test_genotypes_are_looked_up_once_per_accession(monkeypatch):
+    asked: list[list] = []
+
+    def _fetch_genotypes(client, ids):
+        asked.append(list(ids))
+        return {42: "Spring-32"}
+
+    monkeypatch.setattr(dl, "fetch_genotypes", _fetch_genotypes)
+    scans = [{**SCAN, "scan_id": i} for i in range(5)]
+
+    rows = [row for _, row in dl.scan_rows(object(), scans, chunk_size=2)]
+
+    assert [row["genotype"] for row in rows] == ["Spring-32"] * 5
+    assert asked == [[42]]
+
+
+def test_scans_csv_is_written_as_scans_pass_through(tmp_path):
+    path = tmp_path / "scans.csv"
+    sink = dl.ScansCsv(path)
+    scans = [{**SCAN, "scan_id": i} for i in range(3)]
+
+    passed = list(sink.pass_through((s, dl.build_scan_row(s, None)) for s in scans))
+
+    assert passed == scans and sink.written == 3
+    with path.open() as fh:
+        assert [row["scan_id"] for row in csv.DictReader(fh)] == ["0", "1", "2"]
+
+
+def test_an_interrupted_stream_leaves_the_previous_scans_csv(tmp_path):
+    """A truncated scans.csv would read as a smaller experiment."""
+    path = tmp_path / "scans.csv"
+    dl.write_scans_csv([dl.build_scan_row(SCAN, None)], path)
+    before = path.read_text()
+
+    def _rows():
+        yield SCAN, dl.build_scan_row(SCAN, None)
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        list(dl.ScansCsv(path).pass_through(_rows()))
+
+    assert path.read_text() == before
+    assert list(tmp_path.iterdir()) == [path], "the partial file is cleaned up"
+
+
+def test_a_streamed_download_reports_listing_without_a_total(tmp_path, monkeypatch):
+    from test_download_session_resume import _Client as _StorageClient
+    from test_download_session_resume import _images
+
+    monkeypatch.setattr(dl, "fetch_images", lambda c, scan_id: _images(1))
+    seen: list[tuple] = []
+
+    dl.download_images(
+        _StorageClient(), iter([SCAN]), tmp_path, workers=1, on_progress=lambda *a: seen.append(a)
+    )
+
+    assert ("listing", 1, None, 0) in seen
+    assert ("listing", 1, 1, 0) in seen  # the last line, once the stream has run out
+
+
+def test_progress_without_a_total_is_just_the_count():
+    assert dl.format_progress("listing", 1200, None) == "Listing frames: 1,200 scans"
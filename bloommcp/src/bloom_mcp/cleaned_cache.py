@@ -0,0 +1,283 @@
+"""Bounded on-disk + in-memory cache of resolved cleaned-CSV versions.
+
+`experiment_utils._resolve_one_class` used to download the cleaned CSV into a
+fresh, never-deleted ``NamedTemporaryFile`` on every call, and every caller then
+re-parsed it with ``pd.read_csv`` — an agent running five analysis tools in a row
+on one experiment paid the full download + parse five times.
+
+A committed version's cleaned CSV is immutable and its manifest entry records the
+sha256 of its exact bytes (``VersionEntry.output_sha256``), so the cache is keyed
+by ``(stem, tool_class, version id, sha256)``. The manifest itself is still read
+on every resolution — it is the only thing that says which version ``latest``
+names — so when ``latest`` moves the key changes and the stale entry is simply
+never asked for again (it ages out of the LRU). Nothing is invalidated by hand.
+
+Only content-verified files are reused: a download is hashed before it is
+installed under its content-addressed name, and an entry with no recorded
+sha256 (pre-v3 manifests) is fetched fresh into a per-call file under
+``_unverified/`` that no later call will ever match. Those files live inside the
+cache root and count against its byte limit, so they are evicted like everything
+else instead of leaking into the OS tmp dir.
+
+Two bounds, both LRU:
+  - disk: total bytes under the cache root (``BLOOM_CLEANED_CACHE_MAX_BYTES``),
+    recency tracked by file mtime so it survives a process restart;
+  - memory: parsed frames, by count and by ``DataFrame.memory_usage(deep=True)``.
+Callers always get a copy of a cached frame, so mutating it (every tool does)
+cannot leak into the next call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DISK_BYTES = 2 * 1024**3
+DEFAULT_MAX_FRAMES = 16
+DEFAULT_MAX_FRAME_BYTES = 512 * 1024**2
+
+_UNVERIFIED_DIR = "_unverified"
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+class CleanedKey(NamedTuple):
+    """Identity of one committed cleaned CSV, as recorded by its manifest entry."""
+
+    stem: str
+    tool_class: str
+    version_id: str
+    sha256: str
+
+
+def _cache_root() -> Path:
+    explicit = os.environ.get("BLOOM_CLEANED_CACHE_DIR")
+    if explicit:
+        return Path(explicit)
+    return Path(tempfile.gettempdir()) / "bloommcp_cleaned_cache"
+
+
+def _max_disk_bytes() -> int:
+    raw = os.environ.get("BLOOM_CLEANED_CACHE_MAX_BYTES")
+    if not raw:
+        return DEFAULT_MAX_DISK_BYTES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "ignoring non-integer BLOOM_CLEANED_CACHE_MAX_BYTES=%r; using %d",
+            raw,
+            DEFAULT_MAX_DISK_BYTES,
+        )
+        return DEFAULT_MAX_DISK_BYTES
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CleanedCsvCache:
+    """The cache itself; the module keeps one per process (see `get_cache`)."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        max_frames: int = DEFAULT_MAX_FRAMES,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+    ):
+        self.root = Path(root)
+        self.max_disk_bytes = max_disk_bytes
+        self.max_frames = max_frames
+        self.max_frame_bytes = max_frame_bytes
+        self._lock = threading.Lock()
+        self._frames: OrderedDict[Path, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._frame_bytes = 0
+
+    # --- files -------------------------------------------------------------
+
+    def path_for(self, key: CleanedKey, suffix: str = ".csv") -> Path:
+        """Content-addressed location of ``key``'s file under the cache root."""
+        return (
+            self.root
+            / f"{key.tool_class}_{key.stem}"
+            / f"{key.version_id}_{key.sha256}{suffix}"
+        )
+
+    def fetch(
+        self,
+        key: CleanedKey | None,
+        download: Callable[[Path], None],
+        *,
+        suffix: str = ".csv",
+    ) -> Path:
+        """Return a local path holding ``key``'s bytes, downloading on a miss.
+
+        ``download(dest)`` writes the object to ``dest``; any exception it raises
+        propagates after the partial file is removed. ``key=None`` (no recorded
+        sha256) always downloads, to a per-call file that is never reused. A
+        download whose bytes don't match ``key.sha256`` is likewise kept out of
+        the content-addressed slot and served from a per-call file, with a
+        warning — the manifest and storage disagree, and the caller still gets
+        exactly what storage holds today, as it did before this cache existed.
+        """
+        if key is not None:
+            cached = self.path_for(key, suffix)
+            if cached.exists():
+                self._touch(cached)
+                return cached
+
+        staging_dir = self.root / _UNVERIFIED_DIR
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        staged = staging_dir / f"{uuid.uuid4().hex}{suffix}"
+        try:
+            download(staged)
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+
+        result = staged
+        if key is not None:
+            actual = _sha256_file(staged)
+            if actual == key.sha256:
+                cached = self.path_for(key, suffix)
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staged, cached)
+                result = cached
+            else:
+                logger.warning(
+                    "cleaned CSV for %r (%s %s) hashes to %s but its manifest "
+                    "records %s; serving it uncached",
+                    key.stem,
+                    key.tool_class,
+                    key.version_id,
+                    actual,
+                    key.sha256,
+                )
+        self._evict_disk(keep=result)
+        return result
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict_disk(self, *, keep: Path) -> None:
+        """Delete least-recently-used files until the root fits its byte limit."""
+        files = []
+        total = 0
+        for path in self.root.rglob("*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if not path.is_file():
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_disk_bytes:
+            return
+        for _mtime, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            self._forget_frame(path)
+            total -= size
+
+    # --- frames ------------------------------------------------------------
+
+    def is_cached_path(self, path: Path) -> bool:
+        """Whether ``path`` is a verified, content-addressed file of this cache."""
+        try:
+            rel = Path(path).relative_to(self.root)
+        except ValueError:
+            return False
+        return len(rel.parts) == 2 and rel.parts[0] != _UNVERIFIED_DIR
+
+    def read_csv(self, path: Path) -> pd.DataFrame:
+        """``pd.read_csv(path)``, memoized for verified cache files.
+
+        Anything else (an unverified download, a legacy or raw CSV) is parsed
+        every time. A memoized frame is returned as a copy.
+        """
+        path = Path(path)
+        if not self.is_cached_path(path):
+            return pd.read_csv(path)
+        with self._lock:
+            hit = self._frames.get(path)
+            if hit is not None:
+                self._frames.move_to_end(path)
+                return hit[0].copy()
+        df = pd.read_csv(path)
+        size = int(df.memory_usage(deep=True).sum())
+        if size <= self.max_frame_bytes and self.max_frames > 0:
+            with self._lock:
+                if path not in self._frames:
+                    self._frames[path] = (df.copy(), size)
+                    self._frame_bytes += size
+                while self._frames and (
+                    len(self._frames) > self.max_frames
+                    or self._frame_bytes > self.max_frame_bytes
+                ):
+                    _, (_, evicted) = self._frames.popitem(last=False)
+                    self._frame_bytes -= evicted
+        return df
+
+    def _forget_frame(self, path: Path) -> None:
+        with self._lock:
+            hit = self._frames.pop(path, None)
+            if hit is not None:
+                self._frame_bytes -= hit[1]
+
+    def clear_frames(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._frame_bytes = 0
+
+
+_cache_lock = threading.Lock()
+_cache: CleanedCsvCache | None = None
+
+
+def get_cache() -> CleanedCsvCache:
+    """The process-wide cache, built from the environment on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CleanedCsvCache(_cache_root(), max_disk_bytes=_max_disk_bytes())
+        return _cache
+
+
+def reset_cache() -> None:
+    """Drop the process-wide cache so the next `get_cache` re-reads the environment.
+
+    Only the in-memory side is dropped; files already on disk stay and are
+    reused (they are content-addressed). Tests call this between cases.
+    """
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def read_cleaned_csv(path: Path) -> pd.DataFrame:
+    """Parse a path returned by `_resolve_versioned_cleaned`, via the frame cache."""
+    return get_cache().read_csv(path)
@@ -3,6 +3,8 @@
 `@as_mcp_tool` gives every granular tool the same guarantees (validated Pydantic
 I/O, structured `BloomMCPError`s, a single stamped `Provenance`) so provenance
 and error handling are guaranteed by the contract, not per-tool boilerplate.
+Tools that declare ``reuse`` also get content-addressed reuse of a prior identical
+run (`contract/reuse.py`).
 """
 
 from __future__ import annotations
@@ -10,6 +12,7 @@ from __future__ import annotations
 from .errors import BloomMCPError
 from .models import OutputLink, RunLinks
 from .provenance import Provenance, resolve_environment, resolve_seed
+from .reuse import ReuseParams, RunReuse, reuse_key, reuse_stats
 from .wrap import as_mcp_tool, register
 
 __all__ = [
@@ -21,4 +24,8 @@ __all__ = [
     "resolve_seed",
     "RunLinks",
     "OutputLink",
+    "ReuseParams",
+    "RunReuse",
+    "reuse_key",
+    "reuse_stats",
 ]
@@ -44,6 +44,10 @@ class BloomMCPError(Exception):
         self.remedy = remedy
         super().__init__(f"[{code}] {message} — {remedy}")
 
+    def __reduce__(self):
+        """Pickle by the structured fields (crosses the compute-pool boundary)."""
+        return (type(self), (self.code, self.message, self.remedy))
+
     def to_dict(self) -> dict[str, str]:
         """Return the serializable structured form (no traceback)."""
         return {"code": self.code, "message": self.message, "remedy": self.remedy}
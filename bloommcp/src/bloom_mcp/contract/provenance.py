@@ -130,6 +130,11 @@ class Provenance(BaseModel):
     # merged in by the caller via model_copy rather than stamped at contract time.
     source_id: Optional[int] = None
     source_name: Optional[str] = None
+    # Result reuse (additive within schema v5): per-artifact byte sizes, filled at
+    # commit like output_sha256, and the run's content address, set by a tool
+    # that looked itself up via `RunReuse` (see contract/reuse.py).
+    output_size_bytes: dict[str, int] = Field(default_factory=dict)
+    reuse_key: Optional[str] = None
 
     @classmethod
     def stamp(
@@ -183,4 +188,6 @@ class Provenance(BaseModel):
             input_validation=self.input_validation,
             source_id=self.source_id,
             source_name=self.source_name,
+            output_size_bytes=self.output_size_bytes,
+            reuse_key=self.reuse_key,
         )
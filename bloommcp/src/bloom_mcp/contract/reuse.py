@@ -0,0 +1,228 @@
+"""Content-addressed reuse of committed runs for deterministic tools.
+
+Agents often re-run ``descriptive_stats`` / ``pca_analysis`` / ``clustering`` /
+``qc_inspect`` with identical inputs on the same cleaned version; each call used
+to recompute and commit a brand-new version. A tool opts in by declaring a
+``reuse`` parameter (the same explicit kwarg-injection contract as
+``random_state``/``provenance``) and taking its inputs as a :class:`ReuseParams`
+subclass. ``@as_mcp_tool`` then injects a per-call :class:`RunReuse`, and the
+tool calls :meth:`RunReuse.lookup` once it has loaded its input frame:
+
+- **Key.** ``reuse_key`` is a sha256 over the tool name, the canonical params
+  (``force`` excluded), the resolved seed, the consumed input (its version
+  label, DB source id, and a content digest of the frame itself — a cleaned
+  version label alone is not an identity once ``remove_outliers`` re-trims), and
+  the provenance ``code_versions``. Any difference recomputes.
+- **Hit.** The newest committed run carrying the same key is returned — its
+  stored result with freshly signed ``output_links`` — and nothing is committed.
+- **Miss.** The key is recorded on the new run's ``VersionEntry`` (the tool
+  passes ``reuse.key`` into its provenance), and after the tool returns the
+  wrapper stores the result via ``ResultStore.record_result`` so a later
+  identical call can hit it.
+
+``force=True`` skips the lookup (the fresh run is still recorded, so it becomes
+the one later calls reuse). A call whose seed was freshly drawn — no ``seed``
+given to a stochastic tool — is never served from a prior run: the caller asked
+for a new draw. Reuse is best-effort end to end: a failed lookup or record is
+logged and the tool simply computes. ``BLOOM_MCP_RESULT_REUSE=0`` disables it
+process-wide. Hit/miss counts are exposed by :func:`reuse_stats` (served at
+``/stats/reuse``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from .models import RunLinks
+
+if TYPE_CHECKING:  # avoid an import cycle; only used for typing
+    from bloom_mcp.data_access import ExperimentFrame
+    from bloom_mcp.result_store import ResultStore
+
+    from .provenance import Provenance
+
+logger = logging.getLogger(__name__)
+
+# Set to "0"/"false"/"no"/"off" to turn reuse off for every tool (each call
+# computes and commits, exactly as before reuse existed).
+_REUSE_ENV = "BLOOM_MCP_RESULT_REUSE"
+
+# Result fields that describe *which run* produced the result rather than the
+# result itself — never stored with it; a hit fills them from the reused run.
+_RUN_LINK_FIELDS = frozenset(RunLinks.model_fields)
+
+
+def reuse_enabled() -> bool:
+    """Whether reuse is on for this process (``BLOOM_MCP_RESULT_REUSE``, default on)."""
+    value = os.getenv(_REUSE_ENV, "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+class ReuseParams(BaseModel):
+    """Base input model for a tool that can return a prior identical run."""
+
+    force: bool = Field(
+        default=False,
+        description="Recompute and commit a new run even when an earlier run with "
+        "identical inputs (same params, input data, and code versions) already "
+        "exists. By default that earlier run is returned instead.",
+    )
+
+
+# --- Ops counters ------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, int]] = {}
+
+
+def _count(tool: str, outcome: str) -> None:
+    with _stats_lock:
+        per_tool = _stats.setdefault(tool, {"hits": 0, "misses": 0, "forced": 0})
+        per_tool[outcome] += 1
+
+
+def reuse_stats() -> dict[str, Any]:
+    """Hit/miss/forced counts since process start, in total and per tool."""
+    with _stats_lock:
+        by_tool = {tool: dict(counts) for tool, counts in sorted(_stats.items())}
+    totals = {"hits": 0, "misses": 0, "forced": 0}
+    for counts in by_tool.values():
+        for outcome, n in counts.items():
+            totals[outcome] += n
+    return {**totals, "by_tool": by_tool}
+
+
+def reset_reuse_stats() -> None:
+    """Zero every counter (tests)."""
+    with _stats_lock:
+        _stats.clear()
+
+
+# --- Key ---------------------------------------------------------------------
+
+
+def frame_digest(frame: ExperimentFrame) -> str:
+    """A content digest of the frame a tool consumed: values, index, column roles."""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(frame.df, index=True).to_numpy().tobytes())
+    roles = {
+        "columns": [str(c) for c in frame.df.columns],
+        "dtypes": [str(t) for t in frame.df.dtypes],
+        "trait_cols": [str(c) for c in frame.trait_cols],
+        "metadata_cols": [str(c) for c in frame.metadata_cols],
+        "genotype_col": frame.genotype_col,
+        "replicate_col": frame.replicate_col,
+        "sample_id_col": frame.sample_id_col,
+    }
+    h.update(json.dumps(roles, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def reuse_key(provenance: Provenance, frame: ExperimentFrame) -> str:
+    """The content address of a run: same key ⇔ same tool, inputs, and code."""
+    source = frame.resolved_source
+    payload = {
+        "tool": provenance.tool,
+        "params": provenance.params,
+        "seed": provenance.seed,
+        "input": {
+            "version": frame.source,
+            "source_id": source.source_id if source is not None else None,
+            "sha256": frame_digest(frame),
+        },
+        "code_versions": provenance.code_versions.model_dump(mode="json"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# --- Per-call handle ---------------------------------------------------------
+
+
+class RunReuse:
+    """Injected into a tool declaring ``reuse``: look up, then record, one run.
+
+    ``key`` is ``None`` until :meth:`lookup` computes it; the tool copies it into
+    its provenance (``reuse_key``) so the committed ``VersionEntry`` carries it.
+    """
+
+    def __init__(
+        self, provenance: Provenance, *, force: bool, seed_was_drawn: bool
+    ) -> None:
+        self._provenance = provenance
+        self._force = force
+        self._seed_was_drawn = seed_was_drawn
+        self.key: Optional[str] = None
+        self._target: Optional[tuple[ResultStore, str, str]] = None
+
+    def lookup(
+        self,
+        store: ResultStore,
+        *,
+        experiment: str,
+        tool_class: str,
+        frame: ExperimentFrame,
+    ) -> Optional[dict]:
+        """Return the result of a prior identical run, or ``None`` to compute.
+
+        On ``None`` the computed run is remembered on commit (see
+        :meth:`record`), unless the call's seed was freshly drawn.
+        """
+        tool = self._provenance.tool
+        if not reuse_enabled() or self._seed_was_drawn:
+            return None
+        self.key = reuse_key(self._provenance, frame)
+        self._target = (store, experiment, tool_class)
+        if self._force:
+            _count(tool, "forced")
+            return None
+        try:
+            stored = store.find_reusable(experiment, tool_class, self.key)
+        except Exception:  # reuse is an optimization, never a failure
+            logger.warning(
+                "reuse lookup failed for %s on %s; computing instead",
+                tool,
+                experiment,
+                exc_info=True,
+            )
+            stored = None
+        if stored is None:
+            _count(tool, "misses")
+            return None
+        _count(tool, "hits")
+        logger.info("reusing %s run %s for %s", tool, stored.run_ref, experiment)
+        self._target = None
+        return {
+            **stored.result,
+            "run_ref": stored.run_ref,
+            "version_dir": stored.version_dir,
+            "manifest_path": stored.manifest_path,
+            "outputs": dict(stored.output_keys),
+            "output_links": stored.output_links,
+        }
+
+    def record(self, result: BaseModel) -> None:
+        """Store a freshly committed run's result for later hits (best-effort)."""
+        if self._target is None or self.key is None:
+            return
+        store, experiment, tool_class = self._target
+        self._target = None
+        payload = result.model_dump(mode="json", exclude=set(_RUN_LINK_FIELDS))
+        try:
+            store.record_result(experiment, tool_class, result.run_ref, payload)
+        except Exception:  # the run itself is already committed
+            logger.warning(
+                "could not record %s result for reuse (run %s on %s)",
+                self._provenance.tool,
+                getattr(result, "run_ref", None),
+                experiment,
+                exc_info=True,
+            )
@@ -8,7 +8,8 @@ not replace. On every call it:
 2. resolves the seed and stamps a single contract-time `Provenance`,
 3. invokes the tool, injecting the resolved `random_state` and the `provenance`
    into the call **only** for parameters the tool declares (an explicit
-   kwarg-injection contract — not name inference),
+   kwarg-injection contract — not name inference), and likewise a `RunReuse`
+   handle for tools declaring `reuse` (see `contract/reuse.py`),
 4. maps any raised exception to a structured `BloomMCPError` (never a raw
    traceback, never leaked internals), and
 5. validates the declared Pydantic **output** model (→ `BloomMCPError`).
@@ -36,12 +37,13 @@ from __future__ import annotations
 
 import functools
 import inspect
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from pydantic import BaseModel, ValidationError
 
 from .errors import BloomMCPError
 from .provenance import Provenance, resolve_seed
+from .reuse import ReuseParams, RunReuse
 
 
 def register(mcp: Any, *tools: Callable) -> Any:
@@ -102,6 +104,7 @@ def as_mcp_tool(
         accepted = set(inspect.signature(func).parameters)
         accepts_seed = "random_state" in accepted
         accepts_provenance = "provenance" in accepted
+        accepts_reuse = "reuse" in accepted
 
         @functools.wraps(func)
         def wrapper(params: Any = None, **kwargs: Any) -> BaseModel:
@@ -134,8 +137,13 @@ def as_mcp_tool(
             else:
                 seed = None
 
+            # `force` only chooses whether to reuse a prior run; it is not an
+            # input of the computation, so it stays out of the recorded params.
+            reusable = isinstance(data, ReuseParams)
             provenance = Provenance.stamp(
-                tool=func.__name__, params=data.model_dump(), seed=seed
+                tool=func.__name__,
+                params=data.model_dump(exclude={"force"} if reusable else None),
+                seed=seed,
             )
 
             extra: dict[str, Any] = {}
@@ -143,6 +151,14 @@ def as_mcp_tool(
                 extra["random_state"] = seed
             if accepts_provenance:
                 extra["provenance"] = provenance
+            reuse: Optional[RunReuse] = None
+            if accepts_reuse:
+                reuse = RunReuse(
+                    provenance,
+                    force=reusable and data.force,
+                    seed_was_drawn=accepts_seed and requested is None,
+                )
+                extra["reuse"] = reuse
 
             try:
                 result = func(data, **extra)
@@ -151,12 +167,14 @@ def as_mcp_tool(
             except Exception as exc:  # noqa: BLE001 — mapped, never re-raised raw
                 raise BloomMCPError.from_exception(exc, declared=errors) from None
 
-            if isinstance(result, output_model):
-                return result
-            try:
-                return output_model.model_validate(result)
-            except ValidationError as exc:
-                raise BloomMCPError.from_output_validation(exc) from None
+            if not isinstance(result, output_model):
+                try:
+                    result = output_model.model_validate(result)
+                except ValidationError as exc:
+                    raise BloomMCPError.from_output_validation(exc) from None
+            if reuse is not None:
+                reuse.record(result)
+            return result
 
         # Present a clean single-`params` signature to FastMCP (hides the
         # injected kwargs). `functools.wraps` preserves identity + `__wrapped__`
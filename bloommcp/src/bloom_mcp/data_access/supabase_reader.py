@@ -18,18 +18,28 @@ source's identity for provenance in place of the file-hash content-address a
 DB-backed read no longer has (Decision D3). A long→wide pivot that would
 collide two plants under one ``sample_id`` is a structured error, not a
 silent merge (Decision D5).
+
+The raw read has two wire formats. ``BLOOM_TRAITS_TRANSPORT=columnar`` opts into
+``get_experiment_traits_columnar``, which ships one array per column instead of
+one JSON object per plant x trait reading. It falls back to the default
+row-per-reading ``get_experiment_traits`` when a database predates that function.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from bloom_mcp import experiment_utils as _eu
 from bloom_mcp import supabase_client as _sc
+from bloom_mcp.cleaned_cache import read_cleaned_csv
 from bloom_mcp.experiment_utils import detect_columns
 
 from .ports import (
@@ -60,12 +70,67 @@ _FIXED_COLUMN_COUNT = 2 + len(_METADATA_COLS)
 # RPC/table names, named once so a rename or typo is a single-line fix.
 _RPC_GET_EXPERIMENT_TRAITS = "get_experiment_traits"
 _RPC_LIST_EXPERIMENT_TRAIT_SOURCES = "list_experiment_trait_sources"
+_RPC_LIST_EXPERIMENT_TRAIT_SUMMARIES = "list_experiment_trait_summaries"
+_RPC_GET_EXPERIMENT_TRAITS_COLUMNAR = "get_experiment_traits_columnar"
 _TABLE_CYL_EXPERIMENTS = "cyl_experiments"
 
+# Experiment ids per list_experiment_trait_summaries call: each response has at
+# most this many rows, well under any PostgREST max-rows cap.
+_SUMMARY_CHUNK_EXPERIMENTS = 500
+
+# How long list_experiments() reuses a successful listing.
+LIST_EXPERIMENTS_TTL_SECONDS = 60.0
+
+# get_experiment_traits's result columns, the shape `_pivot_wide` consumes.
+_TRAIT_ROW_COLUMNS = (
+    "scan_id",
+    "date_scanned",
+    "plant_age_days",
+    "wave_number",
+    "plant_id",
+    "germ_day",
+    "plant_qr_code",
+    "accession_name",
+    "trait_name",
+    "source_id",
+    "trait_value",
+)
+
+# Raw-tier wire formats, chosen by BLOOM_TRAITS_TRANSPORT (or the
+# `traits_transport` constructor argument). "rows" is one JSON object per
+# reading; "columnar" is opt-in until every deployment has the
+# get_experiment_traits_columnar migration.
+_TRANSPORT_ROWS = "rows"
+_TRANSPORT_COLUMNAR = "columnar"
+_TRAITS_TRANSPORTS = (_TRANSPORT_ROWS, _TRANSPORT_COLUMNAR)
+
+
+def _resolve_traits_transport(explicit: Optional[str]) -> str:
+    value = explicit or os.environ.get("BLOOM_TRAITS_TRANSPORT") or _TRANSPORT_ROWS
+    if value not in _TRAITS_TRANSPORTS:
+        logger.warning(
+            "ignoring unknown BLOOM_TRAITS_TRANSPORT=%r; expected one of %s",
+            value,
+            ", ".join(_TRAITS_TRANSPORTS),
+        )
+        return _TRANSPORT_ROWS
+    return value
+
 
 class SupabaseReader:
     """Reads experiment inputs via versioned-cleaned Storage + a DB-direct raw tier."""
 
+    def __init__(
+        self,
+        *,
+        list_ttl_seconds: float = LIST_EXPERIMENTS_TTL_SECONDS,
+        traits_transport: Optional[str] = None,
+    ):
+        self._traits_transport = _resolve_traits_transport(traits_transport)
+        self._list_ttl_seconds = list_ttl_seconds
+        self._list_lock = threading.Lock()
+        self._listed: Optional[tuple[float, list[ExperimentSummary]]] = None
+
     def load_experiment(
         self,
         name: str,
@@ -103,7 +168,7 @@ class SupabaseReader:
                         "before any database read; pass version='raw' to "
                         "force the raw tier instead."
                     )
-                df = pd.read_csv(cleaned_path)
+                df = read_cleaned_csv(cleaned_path)
                 config = detect_columns(df)
                 return ExperimentFrame(
                     df=df,
@@ -140,12 +205,37 @@ class SupabaseReader:
         }
         if source is not None:
             rpc_params["source_id_"] = source.source_id
-        rows = _safe_rpc(_RPC_GET_EXPERIMENT_TRAITS, rpc_params, name=name)
+        columns = self._fetch_trait_columns(rpc_params, name=name)
 
-        if not rows and not self._experiment_exists(experiment_id):
+        if not columns["plant_id"] and not self._experiment_exists(experiment_id):
             raise ExperimentNotFoundError(f"Experiment {name!r} could not be resolved.")
 
-        return _pivot_wide(rows, name, source)
+        return _pivot_wide(columns, name, source)
+
+    def _fetch_trait_columns(self, rpc_params: dict, *, name: str) -> dict[str, list]:
+        """One experiment's trait readings as ``{column: values}``.
+
+        With the columnar transport the database ships one array per column
+        (`get_experiment_traits_columnar`); otherwise -- or when that function
+        is missing -- the row-per-reading `get_experiment_traits` result is
+        transposed here. Either way `_pivot_wide` sees the same shape.
+        """
+        if self._traits_transport == _TRANSPORT_COLUMNAR:
+            try:
+                result = _sc.call_rpc(_RPC_GET_EXPERIMENT_TRAITS_COLUMNAR, rpc_params)
+            except Exception:
+                logger.warning(
+                    "load_experiment: %s failed for %r; falling back to %s.",
+                    _RPC_GET_EXPERIMENT_TRAITS_COLUMNAR,
+                    name,
+                    _RPC_GET_EXPERIMENT_TRAITS,
+                    exc_info=True,
+                )
+            else:
+                record = result[0] if result else {}
+                return {c: list(record.get(c) or []) for c in _TRAIT_ROW_COLUMNS}
+        rows = _safe_rpc(_RPC_GET_EXPERIMENT_TRAITS, rpc_params, name=name)
+        return {c: [r.get(c) for r in rows] for c in _TRAIT_ROW_COLUMNS}
 
     def list_sources(self, name: str) -> list[SourceInfo]:
         experiment_id = _parse_experiment_id(name)
@@ -244,6 +334,24 @@ class SupabaseReader:
         return bool(response.data)
 
     def list_experiments(self) -> list[ExperimentSummary]:
+        """Every ``cyl_experiments`` row, with its plant and trait counts.
+
+        Served from a per-reader cache for ``list_ttl_seconds`` after a
+        successful listing -- agents tend to list, pick, and list again within
+        seconds -- so a new experiment may take that long to appear. A failed
+        listing is never cached.
+        """
+        with self._list_lock:
+            if (
+                self._listed is not None
+                and time.monotonic() - self._listed[0] < self._list_ttl_seconds
+            ):
+                return list(self._listed[1])
+            summaries = self._list_experiments_uncached()
+            self._listed = (time.monotonic(), summaries)
+            return list(summaries)
+
+    def _list_experiments_uncached(self) -> list[ExperimentSummary]:
         try:
             client = _sc.get_postgrest_client()
             response = client.table(_TABLE_CYL_EXPERIMENTS).select("id,name").execute()
@@ -252,6 +360,9 @@ class SupabaseReader:
                 "Could not list experiments: the database read failed."
             ) from exc
 
+        counts = _trait_counts(
+            [row["id"] for row in response.data if row.get("id") is not None]
+        )
         summaries: list[ExperimentSummary] = []
         for row in response.data:
             # The whole per-row body is one try/except -- a malformed row (a
@@ -261,28 +372,18 @@ class SupabaseReader:
             try:
                 experiment_id = row["id"]
                 filename = str(experiment_id)
-                # A per-experiment bulk fetch — the same call load_experiment
-                # itself makes — is the only way to get an accurate trait
-                # count; there is no per-experiment distinct-trait-name view
-                # (see design.md's Decision D4). Reused here to also derive
-                # `rows` (distinct plant count) from the same round trip
-                # rather than a second, separately-guessed join query.
-                rows = _sc.call_rpc(
-                    _RPC_GET_EXPERIMENT_TRAITS,
-                    {
-                        "experiment_id_": experiment_id,
-                        "source_id_": None,
-                        "run_id_": None,
-                    },
-                )
-                plant_ids = {r["plant_id"] for r in rows}
-                trait_names = {r["trait_name"] for r in rows}
+                if counts is not None:
+                    # Absent from the aggregate means no latest readings at
+                    # all -- what an empty bulk read below reports as 0/0.
+                    plants, traits = counts.get(experiment_id, (0, 0))
+                else:
+                    plants, traits = _trait_counts_from_bulk_read(experiment_id)
                 summary = ExperimentSummary(
                     filename=filename,
                     stem=filename,
-                    rows=len(plant_ids),
-                    total_columns=len(trait_names) + _FIXED_COLUMN_COUNT,
-                    trait_columns=len(trait_names),
+                    rows=plants,
+                    total_columns=traits + _FIXED_COLUMN_COUNT,
+                    trait_columns=traits,
                     experiment_name=str(row.get("name") or filename),
                     genotype_col=_GENOTYPE_COL,
                     sample_id_col=_SAMPLE_ID_COL,
@@ -300,6 +401,60 @@ class SupabaseReader:
         return summaries
 
 
+def _trait_counts(experiment_ids: list) -> Optional[dict[int, tuple[int, int]]]:
+    """``{experiment_id: (plant_count, trait_count)}`` from the aggregate RPC.
+
+    One ``list_experiment_trait_summaries`` call per
+    ``_SUMMARY_CHUNK_EXPERIMENTS`` ids instead of a full bulk read per
+    experiment. ``None`` when the aggregate is unavailable (e.g. a database
+    that predates its migration) or returns something malformed -- the caller
+    then falls back to counting each experiment's bulk read, the pre-aggregate
+    behavior, rather than failing the listing.
+    """
+    counts: dict[int, tuple[int, int]] = {}
+    try:
+        for start in range(0, len(experiment_ids), _SUMMARY_CHUNK_EXPERIMENTS):
+            chunk = experiment_ids[start : start + _SUMMARY_CHUNK_EXPERIMENTS]
+            for r in _sc.call_rpc(
+                _RPC_LIST_EXPERIMENT_TRAIT_SUMMARIES, {"experiment_ids_": chunk}
+            ):
+                counts[r["experiment_id"]] = (
+                    int(r["plant_count"]),
+                    int(r["trait_count"]),
+                )
+    except Exception:
+        logger.warning(
+            "list_experiments: %s unavailable; falling back to one %s call "
+            "per experiment.",
+            _RPC_LIST_EXPERIMENT_TRAIT_SUMMARIES,
+            _RPC_GET_EXPERIMENT_TRAITS,
+            exc_info=True,
+        )
+        return None
+    return counts
+
+
+def _trait_counts_from_bulk_read(experiment_id: int) -> tuple[int, int]:
+    """``(plant_count, trait_count)`` from one experiment's full bulk read.
+
+    The fallback when the aggregate RPC is missing: the same call
+    load_experiment itself makes, with ``rows`` (distinct plant count) derived
+    from the same round trip rather than a second, separately-guessed join
+    query.
+    """
+    rows = _sc.call_rpc(
+        _RPC_GET_EXPERIMENT_TRAITS,
+        {
+            "experiment_id_": experiment_id,
+            "source_id_": None,
+            "run_id_": None,
+        },
+    )
+    plant_ids = {r["plant_id"] for r in rows}
+    trait_names = {r["trait_name"] for r in rows}
+    return len(plant_ids), len(trait_names)
+
+
 def _safe_rpc(function_name: str, params: dict, *, name: str) -> list[dict]:
     """Call ``supabase_client.call_rpc``, translating any failure into a
     caller-safe :class:`ExperimentReadError`.
@@ -330,12 +485,15 @@ def _parse_experiment_id(name: str) -> int:
 
 
 def _pivot_wide(
-    rows: list[dict], name: str, source: Optional[SourceInfo]
+    columns: dict[str, list], name: str, source: Optional[SourceInfo]
 ) -> ExperimentFrame:
-    """Pivot `get_experiment_traits`'s long-format rows into a wide frame.
+    """Pivot `get_experiment_traits`'s long-format readings into a wide frame.
+
+    ``columns`` maps each of `_TRAIT_ROW_COLUMNS` to its values, element ``i``
+    of every list being reading ``i`` (see `SupabaseReader._fetch_trait_columns`).
 
     Keys one output row per ``plant_id`` within the single resolved source
-    `rows` was fetched for (cylinder data's "the replicate unit" semantics —
+    the readings were fetched for (cylinder data's "the replicate unit" semantics —
     see the module docstring). More than one ``scan_id`` for the same plant in
     that source is an explicit, structured error (`MultipleScansPerPlantError`)
     rather than a silent `(scan_id, plant_id)`-keyed pivot: supporting a real
@@ -348,8 +506,14 @@ def _pivot_wide(
     reported — an intentional ordering choice (the read still fails loudly
     either way), not a guarantee about which violation a caller sees first
     when several co-occur.
+
+    Plants and trait names are integer-coded (`pd.factorize`, first-seen
+    order) and every value is scattered straight into a plants x traits
+    array — no per-reading Python objects and no `pivot_table` groupby.
+    Output rows are in first-seen plant order, trait columns sorted by name.
     """
-    if not rows:
+    plant_ids = columns["plant_id"]
+    if not len(plant_ids):
         return ExperimentFrame(
             df=pd.DataFrame(),
             trait_cols=[],
@@ -361,75 +525,76 @@ def _pivot_wide(
             resolved_source=source,
         )
 
-    long_df = pd.DataFrame(rows)
-
-    scans_per_plant = long_df.groupby("plant_id")["scan_id"].nunique()
-    ambiguous = scans_per_plant[scans_per_plant > 1]
-    if not ambiguous.empty:
+    plant_codes, plants = pd.factorize(pd.Series(plant_ids), use_na_sentinel=False)
+    trait_codes, traits = pd.factorize(
+        pd.Series(columns["trait_name"]), use_na_sentinel=False
+    )
+    scan_codes, scans = pd.factorize(
+        pd.Series(columns["scan_id"]), use_na_sentinel=False
+    )
+    n_plants, n_traits = len(plants), len(traits)
+    # Row index of each plant's first reading: codes are assigned in first-seen
+    # order, so np.unique's sorted codes line up with `plants`.
+    _, first_reading = np.unique(plant_codes, return_index=True)
+
+    scan_pairs = np.unique(plant_codes.astype(np.int64) * len(scans) + scan_codes)
+    scans_per_plant = np.bincount(scan_pairs // len(scans), minlength=n_plants)
+    ambiguous = np.flatnonzero(scans_per_plant > 1)
+    if ambiguous.size:
+        # Report the lowest plant_id, as a plant_id-sorted groupby would.
         # Name the plant by its qr_code (sample_id), not the internal plant_id
         # -- consistent with AmbiguousSampleIdentityError's policy of never
         # leaking an internal DB id into an agent-facing message.
-        bad_plant_id = ambiguous.index[0]
-        bad_qr_code = long_df.loc[
-            long_df["plant_id"] == bad_plant_id, "plant_qr_code"
-        ].iloc[0]
+        bad = ambiguous[np.argmin(np.asarray(plants)[ambiguous])]
+        bad_qr_code = columns["plant_qr_code"][first_reading[bad]]
         raise MultipleScansPerPlantError(
             f"plant {bad_qr_code!r} in experiment {name!r} has "
-            f"{int(ambiguous.iloc[0])} distinct scans in the resolved source; "
+            f"{int(scans_per_plant[bad])} distinct scans in the resolved source; "
             "multi-scan pivoting is not supported."
         )
 
     # A duplicate (plant_id, trait_name) pair within the single resolved source
     # has no DB constraint preventing it (cyl_scan_traits carries none). Refuse
-    # to silently keep an arbitrary one via pivot_table's aggfunc -- the same
-    # "fail loudly, don't guess" treatment this function already gives
-    # multi-scan and cross-wave sample_id collisions two lines above/below.
-    dup_trait_mask = long_df.duplicated(subset=["plant_id", "trait_name"], keep=False)
-    if dup_trait_mask.any():
-        dup_row = long_df.loc[dup_trait_mask].iloc[0]
+    # to silently keep an arbitrary one -- the scatter below would keep the
+    # last -- the same "fail loudly, don't guess" treatment this function
+    # already gives multi-scan and cross-wave sample_id collisions.
+    cells = plant_codes.astype(np.int64) * n_traits + trait_codes
+    readings_per_cell = np.bincount(cells, minlength=n_plants * n_traits)
+    duplicated = readings_per_cell[cells] > 1
+    if duplicated.any():
+        i = int(np.argmax(duplicated))
         raise DuplicateTraitReadingError(
-            f"trait {dup_row['trait_name']!r} has more than one value for "
-            f"plant {dup_row['plant_qr_code']!r} in experiment {name!r} "
+            f"trait {columns['trait_name'][i]!r} has more than one value for "
+            f"plant {columns['plant_qr_code'][i]!r} in experiment {name!r} "
             "within the resolved source; the raw tier does not silently "
             "pick one."
         )
 
-    meta = (
-        long_df.drop_duplicates("plant_id")
-        .set_index("plant_id")[
-            [
-                "accession_name",
-                "plant_qr_code",
-                "wave_number",
-                "plant_age_days",
-                "date_scanned",
-                "scan_id",
-            ]
-        ]
-        .rename(
-            columns={
-                "accession_name": _GENOTYPE_COL,
-                "plant_qr_code": _SAMPLE_ID_COL,
-                "wave_number": "wave",
-            }
-        )
+    values = np.full((n_plants, n_traits), np.nan)
+    # A NULL trait_value (non-finite upstream) scatters as NaN. A trait with no
+    # value for any plant still gets its (all-NaN) column -- the caller never
+    # asked for it to be dropped from trait_cols.
+    values[plant_codes, trait_codes] = np.asarray(columns["trait_value"], dtype=float)
+    order = np.argsort(np.asarray(traits, dtype=object), kind="stable")
+    trait_cols = [traits[j] for j in order]
+
+    meta = {"plant_id": pd.Series(plant_ids).iloc[first_reading].to_numpy()}
+    for column, renamed in (
+        ("accession_name", _GENOTYPE_COL),
+        ("plant_qr_code", _SAMPLE_ID_COL),
+        ("wave_number", "wave"),
+        ("plant_age_days", "plant_age_days"),
+        ("date_scanned", "date_scanned"),
+        ("scan_id", "scan_id"),
+    ):
+        meta[renamed] = pd.Series(columns[column]).iloc[first_reading].to_numpy()
+    df = pd.concat(
+        [
+            pd.DataFrame(meta),
+            pd.DataFrame(values[:, order], columns=trait_cols),
+        ],
+        axis=1,
     )
-    trait_wide = long_df.pivot_table(
-        index="plant_id",
-        columns="trait_name",
-        values="trait_value",
-        aggfunc="first",
-        # pivot_table's default dropna=True silently drops a trait column
-        # whose value is NaN/None for every plant in this fetch (e.g. a trait
-        # not yet measured for anyone in the resolved source) -- the caller
-        # never asked for that exclusion, so it must survive as an all-NaN
-        # column instead of vanishing from trait_cols entirely.
-        dropna=False,
-    )
-    trait_cols = sorted(trait_wide.columns.tolist())
-    trait_wide = trait_wide[trait_cols]
-
-    df = meta.join(trait_wide).reset_index()
 
     dupes = df[_SAMPLE_ID_COL][df[_SAMPLE_ID_COL].duplicated(keep=False)]
     if not dupes.empty:
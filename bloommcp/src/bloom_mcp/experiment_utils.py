@@ -438,8 +438,7 @@ def _resolve_one_class(
     entry — reproducing the exact silent-revert hazard this module exists to
     prevent, just triggered by infrastructure instead of a `qc_clean` re-run.
     """
-    import tempfile
-
+    from bloom_mcp.cleaned_cache import CleanedKey, get_cache
     from bloom_mcp.manifest import AnalysisDir, ManifestSchemaError
     from bloom_mcp.supabase_client import download_file, list_prefix
 
@@ -502,11 +501,13 @@ def _resolve_one_class(
 
     key = analysis_dir.key(f"{version_dir}/{rel}")
     suffix = Path(rel).suffix or ".csv"
-    tmp = Path(tempfile.NamedTemporaryFile(delete=False, suffix=suffix).name)
+    sha256 = entry.output_sha256.get(CLEANED_CSV_NAME)
+    cache_key = CleanedKey(stem, tool_class, entry.id, sha256) if sha256 else None
     try:
-        download_file(key, tmp)
+        path = get_cache().fetch(
+            cache_key, lambda dest: download_file(key, dest), suffix=suffix
+        )
     except Exception as e:
-        tmp.unlink(missing_ok=True)
         return (
             None,
             None,
@@ -515,7 +516,7 @@ def _resolve_one_class(
                 f"download from storage failed: {e}"
             ),
         )
-    return tmp, f"{entry.id}_cleaned", None
+    return path, f"{entry.id}_cleaned", None
 
 
 def _resolve_versioned_cleaned(
@@ -526,10 +527,12 @@ def _resolve_versioned_cleaned(
     """Resolve a versioned cleaned CSV via the QC/outliers manifests.
 
     The manifest lives in the bloommcp-data bucket at
-    `bloommcp_output/<tool_class>_<stem>/manifest.json`; the cleaned CSV is
-    downloaded to a tmp Path so callers can `pd.read_csv(path)` unchanged.
-    Caller is responsible for the tmp file's lifetime (OS tmp cleanup
-    handles it on process exit).
+    `bloommcp_output/<tool_class>_<stem>/manifest.json` and is read on every
+    call; the cleaned CSV itself comes through `bloom_mcp.cleaned_cache`, keyed
+    by the entry's recorded sha256, so repeat resolutions of the same version
+    reuse one download. Read the returned path with
+    `cleaned_cache.read_cleaned_csv` to reuse the parsed frame too. The file is
+    owned by the cache (bounded, LRU-evicted) — callers must not delete it.
 
     `version` behavior:
       - `"latest"` checks every class in `_CLEANED_TOOL_CLASSES_BY_PRIORITY`,
@@ -565,7 +568,7 @@ def _resolve_versioned_cleaned(
     `bloommcp_output`.
 
     Returns (path, source_label, error). On success, error is None and
-    path points at the downloaded tmp CSV. On miss with version="latest" or
+    path points at the locally cached CSV. On miss with version="latest" or
     "latest_qc", returns (None, None, None) so the caller falls back. On
     explicit version="v<N>" miss, returns (None, None, error_string).
     """
@@ -764,7 +767,9 @@ def load_experiment_data(
         if error:
             return None, None, None, error
         if cleaned_path is not None:
-            df = pd.read_csv(cleaned_path)
+            from bloom_mcp.cleaned_cache import read_cleaned_csv
+
+            df = read_cleaned_csv(cleaned_path)
             config = detect_columns(df)
             return df, config["trait_cols"], config, source_label
 
@@ -10,7 +10,7 @@ deployment topology bloommcp runs in.
 from typing import Optional
 
 from bloom_mcp.storage_backend import active_backend_name
-from bloom_mcp.supabase_client import list_prefix, read_json, write_json
+from bloom_mcp.supabase_client import read_json_if_exists, write_json
 
 from .schema import CURRENT_SCHEMA_VERSION, Manifest
 
@@ -43,10 +43,14 @@ def _manifest_key(prefix: str) -> str:
 
 
 def read_manifest(prefix: str) -> Optional[Manifest]:
-    """Return the manifest at `<prefix>/manifest.json`, or None if absent."""
-    if _MANIFEST_BASENAME not in list_prefix(prefix):
+    """Return the manifest at `<prefix>/manifest.json`, or None if absent.
+
+    A single conditional read — absence is answered by the download itself —
+    so `commit()`'s pre-upload and pre-write checks each cost one round trip.
+    """
+    raw = read_json_if_exists(_manifest_key(prefix))
+    if raw is None:
         return None
-    raw = read_json(_manifest_key(prefix))
     validate_schema(raw)
     return Manifest.model_validate(raw)
 
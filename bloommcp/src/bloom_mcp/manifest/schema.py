@@ -24,6 +24,11 @@ backend most recently wrote a given catalog, making a mixed-backend history
 split observable by inspecting the file directly (see
 `bloommcp/docs/storage-backends.md`).
 
+Also within v5 (additive, no bump — as `input_validation` was within v3):
+`VersionEntry.output_size_bytes` and `VersionEntry.reuse_key`, which let a
+deterministic tool return an identical earlier run instead of recomputing it
+(see `bloom_mcp.contract.reuse`).
+
 Every new field across all three bumps is optional, so previously-written v2,
 v3, and v4 manifests still validate and read without error (see
 `tests/contract/test_v2_backcompat.py`).
@@ -111,6 +116,13 @@ class VersionEntry(_StrictModel):
     # with no tracked source_id.
     source_id: Optional[int] = None
     source_name: Optional[str] = None
+    # --- Result reuse (additive within schema v5, like input_validation in v3) ---
+    # Per-artifact byte sizes, keyed like `outputs`, so a reused run's download
+    # links can be rebuilt without re-reading the objects; and the run's content
+    # address (`bloom_mcp.contract.reuse.reuse_key`), set only by tools that opt
+    # into reuse. Absent on older entries, which are simply never reused.
+    output_size_bytes: dict[str, int] = Field(default_factory=dict)
+    reuse_key: Optional[str] = None
 
 
 class Manifest(_StrictModel):
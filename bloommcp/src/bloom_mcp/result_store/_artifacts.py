@@ -11,7 +11,7 @@ from __future__ import annotations
 import hashlib
 from pathlib import PurePosixPath
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from bloom_mcp.contract.models import OutputLink
 
@@ -80,21 +80,24 @@ def build_output_links(
     output_keys: dict[str, str],
     output_sha256: dict[str, str],
     output_size_bytes: dict[str, int],
-    url_for: Callable[[str], str],
+    url_for: Optional[Callable[[str], str]] = None,
     *,
     expected_prefix: str,
+    urls_for: Optional[Callable[[list[str]], dict[str, str]]] = None,
 ) -> dict[str, OutputLink]:
     """Build the per-output ``OutputLink`` dict ``commit()`` attaches to its
-    ``StoredRun`` (bloom#581). ``url_for(key)`` supplies the URL — a real
-    signed call for ``SupabaseResultStore``, a synthesized string for
-    ``FakeResultStore`` — so this one assembly step is shared by both.
+    ``StoredRun`` (bloom#581). ``url_for(key)`` supplies the URL — a
+    synthesized string for ``FakeResultStore`` — or ``urls_for(keys)``
+    supplies every URL at once as ``{key: url}`` — ``SupabaseResultStore``'s
+    single bulk signing call — so this one assembly step is shared by both.
+    Exactly one of the two must be given.
 
     ``expected_prefix`` is the prefix ``commit()`` itself just computed for
     this run (bloom#598) — every key in ``output_keys`` MUST fall under it,
     since a key outside it would mean signing something this run did not
-    itself just upload. Checked before any ``url_for`` call, so a violation
-    never reaches the signing primitive (which performs no ownership check of
-    its own). A mismatch is a structural bug, never a caller-input condition —
+    itself just upload. Checked before any ``url_for``/``urls_for`` call, so
+    a violation never reaches the signing primitive (which performs no
+    ownership check of its own). A mismatch is a structural bug, never a caller-input condition —
     raises :class:`KeyScopeGuardError`, which both adapters' ``commit()``
     already catch via their existing broad ``except Exception`` and convert
     to ``CommitFailedError``, the same fail-closed/cleanup path a signing
@@ -105,6 +108,8 @@ def build_output_links(
     and defeat the guard entirely rather than raising — checked explicitly so
     that misconfiguration fails loudly instead of quietly no-op'ing.
     """
+    if (url_for is None) == (urls_for is None):
+        raise TypeError("build_output_links needs exactly one of url_for/urls_for")
     if not expected_prefix:
         raise KeyScopeGuardError(
             f"expected_prefix must be non-empty; got {expected_prefix!r}"
@@ -115,6 +120,9 @@ def build_output_links(
                 f"output key {key!r} (output {name!r}) is outside the "
                 f"expected run prefix {expected_prefix!r}"
             )
+    if urls_for is not None:
+        urls = urls_for(list(output_keys.values()))
+        url_for = urls.__getitem__
     return {
         name: OutputLink(
             key=output_keys[name],
@@ -109,6 +109,8 @@ class FakeResultStore:
         # documented one-shot contract.
         self._fail_next_read: set[tuple[str, str]] = set()
         self._fail_next_read_lock = threading.Lock()
+        # (experiment, tool_class, run_ref) -> result stored by record_result.
+        self._results: dict[tuple[str, str, str], dict] = {}
 
     def create_run(
         self,
@@ -242,6 +244,7 @@ class FakeResultStore:
                         "outputs": dict(outputs),
                         "output_keys": output_keys,
                         "output_sha256": output_sha256,
+                        "output_size_bytes": output_size_bytes,
                         "version_dir": version_dir,
                         "user_label": state.user_label,
                     }
@@ -321,6 +324,36 @@ class FakeResultStore:
             f"No run {run_ref!r} for {tool_class}/{_stem(experiment)}."
         )
 
+    def find_reusable(
+        self, experiment: str, tool_class: str, reuse_key: str
+    ) -> Optional[StoredRun]:
+        self._maybe_fail_read(experiment, tool_class)
+        for stored in reversed(self._runs.get((experiment, tool_class), [])):
+            result = self._results.get((experiment, tool_class, stored.run_ref))
+            if stored.reuse_key != reuse_key or result is None:
+                continue
+            output_links = build_output_links(
+                stored.output_keys,
+                stored.output_sha256,
+                stored.output_size_bytes,
+                url_for=lambda key: (
+                    f"fake://signed/{key}?expires_in={SIGNED_URL_EXPIRES_SECONDS}"
+                ),
+                expected_prefix=(
+                    f"{self._output_root}/{tool_class}_{_stem(experiment)}/"
+                    f"{stored.version_dir}/"
+                ),
+            )
+            return replace(stored, output_links=output_links, result=dict(result))
+        return None
+
+    def record_result(
+        self, experiment: str, tool_class: str, run_ref: str, result: dict
+    ) -> None:
+        # Resolves (and raises RunNotFoundError) exactly as get_run does.
+        self.get_run(experiment, tool_class, run_ref)
+        self._results[(experiment, tool_class, run_ref)] = dict(result)
+
     # --- Test-only failure/collision injection ------------------------------
 
     def fail_next_read(self, experiment: str, tool_class: str) -> None:
@@ -101,6 +101,12 @@ class StoredRun:
     # those use) leave this `{}`, so listing/resolving a historical run never
     # eagerly signs a URL for it. Never persisted into the manifest.
     output_links: dict[str, "OutputLink"] = field(default_factory=dict)
+    output_size_bytes: dict[str, int] = field(default_factory=dict)
+    reuse_key: Optional[str] = None
+    # The tool result recorded for reuse (see `ResultStore.record_result`).
+    # Populated only by `find_reusable`, which also re-signs `output_links`;
+    # like those links, never loaded by `get_run`/`list_runs`.
+    result: Optional[dict] = None
 
     @classmethod
     def from_version_entry(
@@ -130,6 +136,8 @@ class StoredRun:
             input_validation=entry.input_validation,
             source_id=entry.source_id,
             source_name=entry.source_name,
+            output_size_bytes=dict(entry.output_size_bytes),
+            reuse_key=entry.reuse_key,
         )
 
 
@@ -177,3 +185,20 @@ class ResultStore(Protocol):
     ) -> StoredRun:
         """Resolve a run by reference; ``"latest"`` resolves the most recent."""
         ...
+
+    def find_reusable(
+        self, experiment: str, tool_class: str, reuse_key: str
+    ) -> Optional[StoredRun]:
+        """Return the newest run recorded under ``reuse_key``, or ``None``.
+
+        Only a run whose result was stored via :meth:`record_result` qualifies.
+        The returned run carries that ``result`` and freshly signed
+        ``output_links``, exactly as ``commit`` would have returned them.
+        """
+        ...
+
+    def record_result(
+        self, experiment: str, tool_class: str, run_ref: str, result: dict
+    ) -> None:
+        """Store a committed run's JSON-safe tool result for later reuse."""
+        ...
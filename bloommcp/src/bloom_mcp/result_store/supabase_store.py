@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional, TypeVar
@@ -69,6 +70,16 @@ _MAX_ID_ATTEMPTS = 3
 # hold the caller for as long as a load-bearing call would.
 _CLEANUP_TIMEOUT_SECONDS = 5.0
 
+# Outputs a single commit uploads at once. A PCA/UMAP run stages a handful of
+# plots and CSVs; uploading them concurrently turns that many sequential round
+# trips into about one, while the bound keeps one commit from taking more than
+# a slice of the shared connection pool (`supabase_client.POOL_MAX_CONNECTIONS`).
+_UPLOAD_CONCURRENCY = 4
+
+# Object, alongside a run's outputs, holding the tool result `record_result`
+# stored for reuse. Not an output: never listed in the entry's `outputs`.
+_REUSE_RESULT_NAME = "reuse_result.json"
+
 
 # `commit` is dispatched by FastMCP's Starlette server via a thread pool, so
 # two calls for the same (output_root, experiment, tool_class) can genuinely
@@ -89,6 +100,43 @@ def _commit_lock(output_root: str, experiment: str, tool_class: str) -> KeyedLoc
     return KeyedLock(("supabase", output_root, experiment, tool_class))
 
 
+def _upload_outputs(
+    staging_dir: Path,
+    outputs: dict[str, str],
+    key_for: Callable[[str], str],
+    uploaded_keys: list[str],
+) -> None:
+    """Upload every staged output, up to `_UPLOAD_CONCURRENCY` at a time.
+
+    Appends each key to `uploaded_keys` as its upload succeeds, so the
+    caller's cleanup covers exactly what reached storage. On the first
+    failure, uploads not yet started are cancelled and those already running
+    are waited for (they may still land and must be cleaned up too) before
+    the error is raised.
+    """
+    first_error: Optional[BaseException] = None
+    with ThreadPoolExecutor(
+        max_workers=min(_UPLOAD_CONCURRENCY, len(outputs)),
+        thread_name_prefix="result-store-upload",
+    ) as pool:
+        futures = {
+            pool.submit(_sc.upload_file, key_for(rel), staging_dir / rel): key_for(rel)
+            for rel in outputs.values()
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                uploaded_keys.append(futures[future])
+            elif first_error is None:
+                first_error = error
+                for pending in futures:
+                    pending.cancel()
+    if first_error is not None:
+        raise first_error
+
+
 def _guarded_manifest_read(adir: AnalysisDir, read: Callable[[], T]) -> T:
     """Run a manifest-read callable, converting a raw exception into a
     caller-safe `ResultStore`-port error.
@@ -244,21 +292,18 @@ class SupabaseResultStore:
                     run.staging_dir, outputs, key_for
                 )
                 # Upload the same staged bytes that were just hashed.
-                for _name, rel in outputs.items():
-                    key = key_for(rel)
-                    _sc.upload_file(key, run.staging_dir / rel)
-                    uploaded_keys.append(key)
-
-                # Sign each just-uploaded key before the manifest is written —
-                # a signing failure (bloom#581 Decision 5) leaves `latest`
-                # un-advanced exactly like an upload failure, via the same
-                # except/cleanup block below.
+                _upload_outputs(run.staging_dir, outputs, key_for, uploaded_keys)
+
+                # Sign every just-uploaded key, in one bulk call, before the
+                # manifest is written — a signing failure (bloom#581 Decision
+                # 5) leaves `latest` un-advanced exactly like an upload
+                # failure, via the same except/cleanup block below.
                 output_links = build_output_links(
                     output_keys,
                     output_sha256,
                     output_size_bytes,
-                    url_for=lambda key: _sc.create_signed_url(
-                        key, SIGNED_URL_EXPIRES_SECONDS
+                    urls_for=lambda keys: _sc.create_signed_urls(
+                        keys, SIGNED_URL_EXPIRES_SECONDS
                     ),
                     # key_for("") is the same closure every real key above was
                     # built from — reusing it (rather than a second, separately
@@ -273,6 +318,7 @@ class SupabaseResultStore:
                         "outputs": dict(outputs),
                         "output_keys": output_keys,
                         "output_sha256": output_sha256,
+                        "output_size_bytes": output_size_bytes,
                         "version_dir": version_dir,
                         "user_label": state.user_label,
                     }
@@ -427,3 +473,47 @@ class SupabaseResultStore:
             experiment=experiment,
             manifest_path=f"{adir.path}manifest.json",
         )
+
+    def find_reusable(
+        self, experiment: str, tool_class: str, reuse_key: str
+    ) -> Optional[StoredRun]:
+        adir = AnalysisDir(self._output_root, experiment, tool_class)
+        versions = _guarded_manifest_read(adir, adir.list_versions)
+        for entry in reversed(versions):
+            if entry.reuse_key != reuse_key or set(entry.output_size_bytes) != set(
+                entry.output_keys
+            ):
+                continue
+            # A missing result object means record_result never landed for this
+            # run (it is best-effort); an older match may still have one.
+            result = _sc.read_json_if_exists(
+                adir.key(f"{entry.version_dir}/{_REUSE_RESULT_NAME}")
+            )
+            if result is None:
+                continue
+            output_links = build_output_links(
+                entry.output_keys,
+                entry.output_sha256,
+                entry.output_size_bytes,
+                urls_for=lambda keys: _sc.create_signed_urls(
+                    keys, SIGNED_URL_EXPIRES_SECONDS
+                ),
+                expected_prefix=adir.key(f"{entry.version_dir}/"),
+            )
+            stored = StoredRun.from_version_entry(
+                entry,
+                tool_class=tool_class,
+                experiment=experiment,
+                manifest_path=f"{adir.path}manifest.json",
+            )
+            return replace(stored, output_links=output_links, result=result)
+        return None
+
+    def record_result(
+        self, experiment: str, tool_class: str, run_ref: str, result: dict
+    ) -> None:
+        adir = AnalysisDir(self._output_root, experiment, tool_class)
+        entry = _guarded_manifest_read(adir, lambda: adir.get_version(run_ref))
+        if entry is None:
+            raise RunNotFoundError(f"No run {run_ref!r} for {tool_class}/{adir.stem}.")
+        _sc.write_json(adir.key(f"{entry.version_dir}/{_REUSE_RESULT_NAME}"), result)
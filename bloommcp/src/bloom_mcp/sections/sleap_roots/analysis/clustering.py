@@ -51,13 +51,21 @@ from sleap_roots_analyze import (
     perform_kmeans_clustering,
 )
 
-from bloom_mcp.contract import BloomMCPError, OutputLink, Provenance, as_mcp_tool
+from bloom_mcp.contract import (
+    BloomMCPError,
+    OutputLink,
+    Provenance,
+    ReuseParams,
+    RunReuse,
+    as_mcp_tool,
+)
 from bloom_mcp.data_access import (
     CleanedVersionRequiredError,
     ExperimentFrame,
     ExperimentReadError,
 )
 from bloom_mcp.tools import _ports
+from bloom_mcp.tools._compute import offload
 from bloom_mcp.tools._qc_shared import _finite_or_none, _validate_trait_subset
 
 _TOOL_CLASS = "clustering"
@@ -67,7 +75,7 @@ _RESULT_NAME = "cluster_result.json"
 _INPUT_SNAPSHOT_NAME = "input.csv"
 
 
-class ClusteringParams(BaseModel):
+class ClusteringParams(ReuseParams):
     """Inputs for ``clustering``. Stochastic: the resolved ``seed`` drives the fit."""
 
     experiment: str = Field(
@@ -293,7 +301,11 @@ def _gmm_selected_scores(
     errors=(ExperimentReadError,),
 )
 def clustering(
-    params: ClusteringParams, *, random_state: int, provenance: Provenance
+    params: ClusteringParams,
+    *,
+    random_state: int,
+    provenance: Provenance,
+    reuse: RunReuse,
 ) -> ClusteringResult:
     """Cluster a cleaned ``experiment`` via k-means / GMM and persist a versioned run."""
     reader = _ports.reader()
@@ -363,6 +375,14 @@ def clustering(
                 ),
             )
 
+    # An identical earlier run (same params and seed, same cleaned frame, same code) is
+    # returned as-is rather than refit and committed again; force=True skips this.
+    reused = reuse.lookup(
+        store, experiment=params.experiment, tool_class=_TOOL_CLASS, frame=frame
+    )
+    if reused is not None:
+        return reused
+
     # Delegate ALL clustering, dispatching on method. The delegates *raise* on degenerate
     # input: ValueError (fewer samples than requested clusters / too few for the method) and
     # RuntimeError ("clustering failed: No numeric columns with non-zero variance" when the
@@ -371,7 +391,8 @@ def clustering(
     # the raw exception text (it may carry backend internals — see the no-leak test).
     try:
         if params.method == "kmeans":
-            result_dict = perform_kmeans_clustering(
+            result_dict = offload(
+                perform_kmeans_clustering,
                 selected,
                 n_clusters=params.n_clusters,
                 max_clusters=params.max_clusters or 10,
@@ -382,7 +403,8 @@ def clustering(
                 result_dict, random_state=random_state
             )
         elif params.method == "gmm":
-            result_dict = perform_gmm_clustering(
+            result_dict = offload(
+                perform_gmm_clustering,
                 selected,
                 n_components=params.n_components,
                 max_components=params.max_components or 5,
@@ -392,7 +414,8 @@ def clustering(
             )
             result = GMMResult.from_gmm_dict(result_dict, random_state=random_state)
         else:  # hierarchical
-            result_dict = hierarchical_cluster_labels(
+            result_dict = offload(
+                hierarchical_cluster_labels,
                 selected,
                 n_clusters=params.n_clusters,
                 method=params.linkage_method or "ward",
@@ -483,7 +506,10 @@ def clustering(
 
     # Persist a versioned run. For hierarchical (deterministic, no RNG), override seed=None
     # in the stamped provenance — the contract resolved params.seed but we never consumed it.
-    prov_update: dict[str, object] = {"based_on_version": frame.source}
+    prov_update: dict[str, object] = {
+        "based_on_version": frame.source,
+        "reuse_key": reuse.key,
+    }
     if params.method == "hierarchical":
         prov_update["seed"] = None
     prov = provenance.model_copy(update=prov_update)
@@ -76,7 +76,14 @@ import pandas as pd
 from pydantic import BaseModel, Field
 from sleap_roots_analyze import calculate_trait_statistics
 
-from bloom_mcp.contract import BloomMCPError, Provenance, RunLinks, as_mcp_tool
+from bloom_mcp.contract import (
+    BloomMCPError,
+    Provenance,
+    ReuseParams,
+    RunLinks,
+    RunReuse,
+    as_mcp_tool,
+)
 from bloom_mcp.data_access import CleanedVersionRequiredError, ExperimentReadError
 from bloom_mcp.tools import _ports
 from bloom_mcp.tools._consumer_utils import snapshot_frame
@@ -102,7 +109,7 @@ _STAT_FIELDS = (
 )
 
 
-class DescriptiveStatsParams(BaseModel):
+class DescriptiveStatsParams(ReuseParams):
     """Inputs for ``descriptive_stats``. No ``seed`` — the delegate is deterministic."""
 
     experiment: str = Field(
@@ -191,7 +198,7 @@ class DescriptiveStatsResult(RunLinks):
     errors=(ExperimentReadError,),
 )
 def descriptive_stats(
-    params: DescriptiveStatsParams, *, provenance: Provenance
+    params: DescriptiveStatsParams, *, provenance: Provenance, reuse: RunReuse
 ) -> DescriptiveStatsResult:
     """Summarize ``experiment`` via ``calculate_trait_statistics`` and persist it."""
     reader = _ports.reader()
@@ -224,6 +231,14 @@ def descriptive_stats(
         trait_cols = list(params.trait_columns)
     selected = frame.df[trait_cols]
 
+    # An identical earlier run is returned as-is rather than recomputed and committed
+    # again; force=True skips this.
+    reused = reuse.lookup(
+        store, experiment=params.experiment, tool_class=_TOOL_CLASS, frame=frame
+    )
+    if reused is not None:
+        return reused
+
     # Defense-in-depth, per trait — NOT pca_analysis/clustering's all-or-nothing guard.
     # Nothing but qc_clean's own write-time guard normally enforces finiteness; without
     # this check, a residual NaN would make the delegate's own per-trait dropna()
@@ -278,7 +293,9 @@ def descriptive_stats(
     stats_per_trait = rows[:_SUMMARY_TRAIT_CAP]
     omitted_traits = [row.trait for row in rows[_SUMMARY_TRAIT_CAP:]]
 
-    prov = provenance.model_copy(update={"based_on_version": frame.source})
+    prov = provenance.model_copy(
+        update={"based_on_version": frame.source, "reuse_key": reuse.key}
+    )
     stats_df = pd.DataFrame(
         [
             {
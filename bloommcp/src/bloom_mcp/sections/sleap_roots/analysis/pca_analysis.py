@@ -42,16 +42,24 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import Field
 from sleap_roots_analyze import PCAResult, perform_pca_analysis
 
-from bloom_mcp.contract import BloomMCPError, Provenance, RunLinks, as_mcp_tool
+from bloom_mcp.contract import (
+    BloomMCPError,
+    Provenance,
+    ReuseParams,
+    RunLinks,
+    RunReuse,
+    as_mcp_tool,
+)
 from bloom_mcp.data_access import (
     CleanedVersionRequiredError,
     ExperimentFrame,
     ExperimentReadError,
 )
 from bloom_mcp.tools import _ports
+from bloom_mcp.tools._compute import offload
 from bloom_mcp.tools._consumer_utils import _build_output_frame, snapshot_frame
 from bloom_mcp.tools._plots import close_figures, generate_figures, validate_plot_keys
 from bloom_mcp.tools._qc_shared import _validate_trait_subset
@@ -74,7 +82,7 @@ _PCA_CATALOG_KEYS: frozenset[str] = frozenset(
 )
 
 
-class PCAAnalysisParams(BaseModel):
+class PCAAnalysisParams(ReuseParams):
     """Inputs for ``pca_analysis``. No ``seed`` — PCA here is deterministic."""
 
     experiment: str = Field(
@@ -221,7 +229,7 @@ def _loadings_frame(pca: PCAResult) -> pd.DataFrame:
     errors=(ExperimentReadError,),
 )
 def pca_analysis(
-    params: PCAAnalysisParams, *, provenance: Provenance
+    params: PCAAnalysisParams, *, provenance: Provenance, reuse: RunReuse
 ) -> PCAAnalysisResult:
     """Run PCA on a cleaned ``experiment`` via ``perform_pca_analysis`` and persist it."""
     reader = _ports.reader()
@@ -265,11 +273,20 @@ def pca_analysis(
             remedy="Re-run qc_clean to produce a finite-valued cleaned version, then retry.",
         )
 
+    # An identical earlier run (same params, same cleaned frame, same code) is returned
+    # as-is rather than refit and committed again; force=True skips this.
+    reused = reuse.lookup(
+        store, experiment=params.experiment, tool_class=_TOOL_CLASS, frame=frame
+    )
+    if reused is not None:
+        return reused
+
     # Delegate ALL PCA. The delegate *raises* ValueError on degenerate input (< 2 samples,
     # empty, no non-constant trait) — map it to a self-correctable error rather than letting
     # it fall through to the contract's opaque internal_error.
     try:
-        result_dict = perform_pca_analysis(
+        result_dict = offload(
+            perform_pca_analysis,
             selected,
             standardize=params.standardize,
             explained_variance_threshold=params.explained_variance_threshold,
@@ -315,7 +332,9 @@ def pca_analysis(
     # key fails as invalid_input with no run committed. The try/finally wraps the whole
     # persistence region (including the tempdir) so figures are always closed even when
     # the tempdir entry or store operations fail (see design.md § "Figure/tempdir nesting").
-    prov = provenance.model_copy(update={"based_on_version": frame.source})
+    prov = provenance.model_copy(
+        update={"based_on_version": frame.source, "reuse_key": reuse.key}
+    )
     scores_df = pd.DataFrame(
         pca.scores, columns=[f"PC{i + 1}" for i in range(pca.n_components)]
     )
@@ -58,10 +58,18 @@ from sleap_roots_analyze import (
     inspect_nan_samples,
 )
 
-from bloom_mcp.contract import BloomMCPError, OutputLink, Provenance, as_mcp_tool
+from bloom_mcp.contract import (
+    BloomMCPError,
+    OutputLink,
+    Provenance,
+    ReuseParams,
+    RunReuse,
+    as_mcp_tool,
+)
 from bloom_mcp.data_access import ExperimentReadError
 from sleap_roots_analyze.data_utils import convert_to_json_serializable
 from bloom_mcp.tools import _ports
+from bloom_mcp.tools._compute import offload
 
 # Canonical thresholds + shared helpers are single-sourced in _qc_shared so qc_inspect's
 # overlays/recommendation cannot silently desync from the clean qc_clean would apply.
@@ -83,7 +91,7 @@ _RECOMMENDATION_JSON = "recommendation.json"
 _HEATMAP_PNG = "missing_data_pattern.png"
 
 
-class QCInspectParams(BaseModel):
+class QCInspectParams(ReuseParams):
     """Inputs for ``qc_inspect`` — the same threshold knobs as ``qc_clean`` (no ``seed``)."""
 
     experiment: str = Field(
@@ -413,7 +421,9 @@ def _render_report(
     output_model=QCInspectResult,
     errors=(ExperimentReadError,),
 )
-def qc_inspect(params: QCInspectParams, *, provenance: Provenance) -> QCInspectResult:
+def qc_inspect(
+    params: QCInspectParams, *, provenance: Provenance, reuse: RunReuse
+) -> QCInspectResult:
     """Inspect raw ``experiment`` missingness and recommend a cleanup threshold."""
     reader = _ports.reader()
     store = _ports.store()
@@ -451,6 +461,15 @@ def qc_inspect(params: QCInspectParams, *, provenance: Provenance) -> QCInspectR
             message=f"No numeric trait columns detected in {params.experiment!r}.",
             remedy="Check the experiment has numeric trait columns, or pass trait_columns explicitly.",
         )
+
+    # An identical earlier report on the same raw frame is returned as-is rather than
+    # re-rendered and committed again; force=True skips this.
+    reused = reuse.lookup(
+        store, experiment=params.experiment, tool_class=_TOOL_CLASS, frame=frame
+    )
+    if reused is not None:
+        return reused
+
     role_kwargs = _role_kwargs(frame)
 
     nan_frac = frame.df[trait_cols].isna().mean()
@@ -515,7 +534,7 @@ def qc_inspect(params: QCInspectParams, *, provenance: Provenance) -> QCInspectR
     run = store.create_run(
         experiment=params.experiment,
         tool_class=_TOOL_CLASS,
-        provenance=provenance,
+        provenance=provenance.model_copy(update={"reuse_key": reuse.key}),
         user_label=params.user_label,
         source_csv=_ports.raw_source_for(params.experiment),
         source=frame.resolved_source,
@@ -523,8 +542,14 @@ def qc_inspect(params: QCInspectParams, *, provenance: Provenance) -> QCInspectR
     # Render + persist under the run's staging dir; on any partial failure remove the
     # staging dir so a long-lived server does not leak a half-written temp run.
     try:
-        outputs = _render_report(
-            frame.df, trait_cols, params, current_log, role_kwargs, run.staging_dir
+        outputs = offload(
+            _render_report,
+            frame.df,
+            trait_cols,
+            params,
+            current_log,
+            role_kwargs,
+            run.staging_dir,
         )
         (run.staging_dir / _RECOMMENDATION_JSON).write_text(
             json.dumps(
@@ -104,6 +104,7 @@ from bloom_mcp.experiment_utils import (
     fit_is_trustworthy,
 )
 from bloom_mcp.tools import _ports
+from bloom_mcp.tools._compute import offload
 from bloom_mcp.tools._qc_shared import _role_kwargs, _validate_trait_subset
 
 if TYPE_CHECKING:  # matplotlib stays out of the runtime import graph (Tier-0)
@@ -354,7 +355,8 @@ def remove_outliers(
     # (Cross-method detect kwargs are pre-empted by _detect_kwargs above; the cleaned
     # input is NaN-free, so the NaN precondition path is unreachable here.)
     try:
-        trimmed_df, report = remove_outlier_samples(
+        trimmed_df, report = offload(
+            remove_outlier_samples,
             frame.df,
             trait_cols,
             method=params.method,
@@ -67,6 +67,7 @@ from bloom_mcp.data_access import (
     ExperimentReadError,
 )
 from bloom_mcp.tools import _ports
+from bloom_mcp.tools._compute import offload
 from bloom_mcp.tools._consumer_utils import _build_output_frame, snapshot_frame
 from bloom_mcp.tools._plots import close_figures, generate_figures, validate_plot_keys
 from bloom_mcp.tools._qc_shared import _validate_trait_subset
@@ -203,7 +204,7 @@ def _umap_plot_calls(
         # instead of the actionable assumption_violated every other delegate failure in
         # this tool surfaces.
         try:
-            pca_result_dict = perform_pca_analysis(frame.df[trait_cols])
+            pca_result_dict = offload(perform_pca_analysis, frame.df[trait_cols])
         except (ValueError, KeyError, RuntimeError, TypeError) as exc:
             logger.debug(
                 "internal perform_pca_analysis call for create_umap_colored_by_top_traits "
@@ -312,7 +313,8 @@ def umap_analysis(
     # boundary (verified directly against the installed sleap_roots_analyze/umap-learn) —
     # not just the documented ValueError/KeyError from perform_umap_analysis's own docstring.
     try:
-        result_dict = perform_umap_analysis(
+        result_dict = offload(
+            perform_umap_analysis,
             selected,
             feature_cols=trait_cols,
             n_neighbors=params.n_neighbors,
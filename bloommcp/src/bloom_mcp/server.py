@@ -41,7 +41,7 @@ from fastmcp.utilities.lifespan import combine_lifespans
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 from starlette.routing import Mount
 
 # Env validation is lazy (see supabase_client / experiment_utils validate_env):
@@ -52,6 +52,7 @@ from bloom_mcp.supabase_client import validate_env as validate_supabase_env
 from bloom_mcp.experiment_utils import validate_env as validate_data_env
 
 from bloom_mcp.auth import API_KEY, auth_provider
+from bloom_mcp.contract import reuse_stats
 from bloom_mcp.identity import IdentityMiddleware
 
 from bloom_mcp.sections import SECTIONS
@@ -79,6 +80,14 @@ async def health(_: Request) -> PlainTextResponse:
     return PlainTextResponse("ok")
 
 
+# Result-reuse hit/miss counters (see bloom_mcp.contract.reuse), for ops
+# dashboards. Like /health it carries no data about any experiment, so it is
+# served without the API key.
+@mcp.custom_route("/stats/reuse", methods=["GET"])
+async def reuse_stats_route(_: Request) -> JSONResponse:
+    return JSONResponse(reuse_stats())
+
+
 def build_app() -> Starlette:
     """Compose the combined surface and one path per section into one ASGI app.
 
@@ -169,6 +178,12 @@ def main() -> None:
 
         _ports.configure(reader=SupabaseReader(), store=SupabaseResultStore())
 
+    # Start the CPU-bound compute workers (BLOOM_MCP_COMPUTE_WORKERS; none by
+    # default) now, so their warm imports finish before the first request.
+    from bloom_mcp.tools._compute import warm_pool
+
+    warm_pool()
+
     if API_KEY:
         print("Bloom MCP Server starting with API key authentication")
     else:
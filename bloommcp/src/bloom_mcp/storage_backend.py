@@ -1,9 +1,10 @@
 """Object-storage backend selection for bloommcp.
 
-The seven object-storage helpers in :mod:`bloom_mcp.supabase_client`
+The object-storage helpers in :mod:`bloom_mcp.supabase_client`
 (``upload_file`` / ``download_file`` / ``write_json`` / ``read_json`` /
-``list_prefix`` / ``delete_files`` / ``create_signed_url``) delegate to the
-*active* backend selected here. Two backends exist:
+``read_json_if_exists`` / ``list_prefix`` / ``delete_files`` /
+``create_signed_url`` / ``create_signed_urls``) delegate to the *active*
+backend selected here. Two backends exist:
 
 * :class:`SupabaseStorageBackend` — the deployed default (Supabase Storage in the
   ``bloommcp-data`` bucket). Its method bodies are the pre-backend
@@ -24,7 +25,7 @@ touches no filesystem at import, so ``import bloom_mcp`` stays side-effect-free.
 root fails fast at boot rather than mid-run.
 
 Out of scope: PostgREST/table access (``get_postgrest_client``) and
-``read_input_csv``, which rides that client — neither is one of the seven
+``read_input_csv``, which rides that client — neither is one of the
 swapped helpers, so both are unaffected by the selected backend.
 """
 
@@ -50,7 +51,7 @@ _TMP_PREFIX = ".tmp-"
 
 @runtime_checkable
 class StorageBackend(Protocol):
-    """The seven object-storage operations bloommcp's write/read paths use."""
+    """The object-storage operations bloommcp's write/read paths use."""
 
     def upload_file(self, key: str, local_path: Path) -> None: ...
 
@@ -60,6 +61,11 @@ class StorageBackend(Protocol):
 
     def read_json(self, key: str) -> dict: ...
 
+    def read_json_if_exists(self, key: str) -> Optional[dict]:
+        """``read_json``, but ``None`` for a missing key — in one round trip,
+        with no separate existence check (``list_prefix``) first."""
+        ...
+
     def list_prefix(self, prefix: str) -> list[str]: ...
 
     def delete_files(
@@ -81,6 +87,14 @@ class StorageBackend(Protocol):
         """
         ...
 
+    def create_signed_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        """``create_signed_url`` for every key in ``keys``, as ``{key: url}``.
+
+        Same (absent) ownership contract as ``create_signed_url``; raises if
+        any one key cannot be signed.
+        """
+        ...
+
 
 def _json_bytes(payload: dict) -> bytes:
     """Canonical JSON serialization shared by both backends.
@@ -139,7 +153,8 @@ class SupabaseStorageBackend:
     Method bodies are the pre-backend ``supabase_client`` helpers verbatim
     (they re-use ``get_storage_client`` / ``_guess_content_type`` from that
     module), so selecting ``supabase`` is byte-for-byte the prior behavior.
-    Stateless — each call builds a fresh client via ``get_storage_client``.
+    Holds no state of its own — each call asks ``get_storage_client`` for the
+    process-wide pooled client.
     """
 
     def upload_file(self, key: str, local_path: Path) -> None:
@@ -182,6 +197,16 @@ class SupabaseStorageBackend:
         payload = client.download(key)
         return json.loads(payload.decode("utf-8"))
 
+    def read_json_if_exists(self, key: str) -> Optional[dict]:
+        from storage3.exceptions import StorageApiError
+
+        try:
+            return self.read_json(key)
+        except StorageApiError as exc:
+            if _is_not_found(exc):
+                return None
+            raise
+
     def list_prefix(self, prefix: str) -> list[str]:
         from bloom_mcp.supabase_client import get_storage_client
 
@@ -209,6 +234,42 @@ class SupabaseStorageBackend:
             raise StorageBackendError(f"could not extract a signed URL for key: {key}")
         return _to_public_url(url)
 
+    def create_signed_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        from bloom_mcp.supabase_client import get_storage_client
+
+        if not keys:
+            return {}
+        client = get_storage_client()
+        if not hasattr(client, "create_signed_urls"):
+            # A storage client without the bulk endpoint: one call per key.
+            return {key: self.create_signed_url(key, expires_in) for key in keys}
+        # One `POST /object/sign/<bucket>` for every key; each item reports
+        # its own path and, for a key it could not sign, an error.
+        urls: dict[str, str] = {}
+        for item in client.create_signed_urls(list(keys), expires_in):
+            url = None if item.get("error") else _extract_signed_url(item)
+            if url:
+                urls[item.get("path")] = _to_public_url(url)
+        for key in keys:
+            if key not in urls:
+                raise StorageBackendError(
+                    f"could not extract a signed URL for key: {key}"
+                )
+        return urls
+
+
+def _is_not_found(exc: Exception) -> bool:
+    """Whether a storage3 ``StorageApiError`` means "no such object".
+
+    Supabase Storage has reported a missing object both as an HTTP 404 and as
+    an HTTP 400 whose body carries ``statusCode: "404"`` / ``error:
+    "not_found"``; storage3 surfaces the body's fields either way.
+    """
+    return str(getattr(exc, "status", "")) == "404" or getattr(exc, "code", None) in (
+        "not_found",
+        "NoSuchKey",
+    )
+
 
 def _extract_signed_url(response: object) -> Optional[str]:
     """Best-effort extraction across storage3/supabase-py versions.
@@ -372,6 +433,12 @@ class LocalStorageBackend:
             raise _redacted_io_error(key, exc) from None
         return json.loads(raw.decode("utf-8"))
 
+    def read_json_if_exists(self, key: str) -> Optional[dict]:
+        try:
+            return self.read_json(key)
+        except StorageKeyNotFound:
+            return None
+
     def list_prefix(self, prefix: str) -> list[str]:
         rel = prefix.strip("/")
         directory = self._root if rel == "" else self._resolve(rel)
@@ -419,6 +486,10 @@ class LocalStorageBackend:
             )
         return f"{base.rstrip('/')}/{key}"
 
+    def create_signed_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        # Served URLs are built locally, so there is no round trip to batch.
+        return {key: self.create_signed_url(key, expires_in) for key in keys}
+
 
 # ─── Selection ────────────────────────────────────────────────────────────────
 
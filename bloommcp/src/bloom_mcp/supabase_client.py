@@ -10,8 +10,10 @@ Public surface:
 
     get_postgrest_client()           → supabase.Client authenticated as
                                        bloom_agent. Use for table reads
-                                       via PostgREST. Construct fresh per
-                                       call; do not cache.
+                                       via PostgREST. Shared process-wide
+                                       over one pooled HTTP transport; call
+                                       it per operation rather than holding
+                                       the result.
 
     read_input_csv(name)             → pd.DataFrame loaded from object
                                        `bloommcp_input/{name}` in the
@@ -39,14 +41,27 @@ from __future__ import annotations
 
 import io
 import os
+import threading
 from pathlib import Path
 
+import httpx
 import pandas as pd
 import supabase
+from supabase.lib.client_options import (
+    DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+    DEFAULT_STORAGE_CLIENT_TIMEOUT,
+)
 
 BUCKET = "bloommcp-data"
 INPUT_PREFIX = "bloommcp_input/"
 
+# One connection pool for every Supabase request the process makes. FastMCP runs
+# tools on worker threads; the pool is shared by all of them, so keep it wide
+# enough for a few tools committing at once, but bounded.
+POOL_MAX_CONNECTIONS = 32
+POOL_MAX_KEEPALIVE = 16
+POOL_KEEPALIVE_EXPIRY = 30.0
+
 
 def _require_env() -> tuple[str, str]:
     """Read and validate the Supabase env, returning ``(url, key)``.
@@ -96,8 +111,70 @@ def _validate_name(name: str) -> None:
         )
 
 
+_clients_lock = threading.Lock()
+_transport: httpx.HTTPTransport | None = None
+_clients: dict[tuple[str, str, float], supabase.Client] = {}
+
+
+def _pooled_transport() -> httpx.HTTPTransport:
+    """The process-wide keep-alive connection pool. Caller holds ``_clients_lock``."""
+    global _transport
+    if _transport is None:
+        _transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+                keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _transport
+
+
+def _client(timeout_seconds: float) -> supabase.Client:
+    """A ``supabase.Client`` for the current env whose requests time out after
+    ``timeout_seconds``, built once and then reused.
+
+    Every client rides the same pooled transport, so TLS connections are kept
+    alive across calls and tools instead of being opened per operation. The
+    cache is keyed on the env's URL and key as read *now*: a rotated
+    ``BLOOM_AGENT_KEY`` gets a fresh client on its next call with no reload,
+    the reason clients used to be built per call. bloom_agent authenticates
+    with that static key alone (no user session), so there is no token for a
+    client to refresh on its own.
+    """
+    url, key = _require_env()
+    cache_key = (url, key, float(timeout_seconds))
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            http = httpx.Client(
+                transport=_pooled_transport(),
+                timeout=timeout_seconds,
+                follow_redirects=True,
+            )
+            options = supabase.ClientOptions(httpx_client=http)
+            client = supabase.create_client(url, key, options=options)
+            _clients[cache_key] = client
+    return client
+
+
+def reset_clients() -> None:
+    """Drop every cached client and close the shared connection pool.
+
+    The next accessor call starts afresh. For tests, which swap the env and
+    ``supabase.create_client`` between cases, and for an orderly shutdown.
+    """
+    global _transport
+    with _clients_lock:
+        _clients.clear()
+        if _transport is not None:
+            _transport.close()
+            _transport = None
+
+
 def get_postgrest_client() -> supabase.Client:
-    """Return a fresh Supabase client authenticated as bloom_agent.
+    """Return the Supabase client authenticated as bloom_agent.
 
     PostgREST and Storage access flow through the same client. The
     bloom_agent role's existing `agent_read_*` policies on the public
@@ -105,11 +182,10 @@ def get_postgrest_client() -> supabase.Client:
     `agent_insert_bloommcp_data` / `agent_update_bloommcp_data` policies
     introduced by 20260605000000 cover storage writes.
 
-    A new client is constructed per call so the JWT does not live as
-    module-level state and rotation requires no in-process reload.
+    The client is shared across calls and threads (see `_client`); requests
+    through it use PostgREST's default timeout.
     """
-    url, key = _require_env()
-    return supabase.create_client(url, key)
+    return _client(DEFAULT_POSTGREST_CLIENT_TIMEOUT)
 
 
 def read_input_csv(name: str) -> pd.DataFrame:
@@ -177,28 +253,21 @@ def _guess_content_type(path: Path) -> str:
 
 
 def get_storage_client(*, timeout_seconds: float | None = None):
-    """Return a fresh Supabase storage client with access to `bloommcp-data`.
+    """Return a Supabase storage client with access to `bloommcp-data`.
 
     `timeout_seconds`, when given, overrides the client's default network
     timeout (storage3's `DEFAULT_TIMEOUT`, 20s) for every request made
     through the returned client. Used by the best-effort cleanup path (see
     `delete_files`) so a hung delete can't hold up surfacing the commit
     failure that triggered it for as long as a real upload might reasonably
-    wait.
+    wait. The override gets a client of its own, on the same connection pool.
     """
-    url, key = _require_env()
     if timeout_seconds is None:
-        # No override: call create_client exactly as every other accessor in
-        # this module does (positional url/key, no options kwarg) — several
-        # tests monkeypatch `supabase.create_client` with a 2-arg stub, so an
-        # unconditional `options=` kwarg here would break them for no benefit
-        # on the common path.
-        return supabase.create_client(url, key).storage.from_(BUCKET)
-    options = supabase.ClientOptions(storage_client_timeout=timeout_seconds)
-    return supabase.create_client(url, key, options=options).storage.from_(BUCKET)
+        timeout_seconds = DEFAULT_STORAGE_CLIENT_TIMEOUT
+    return _client(timeout_seconds).storage.from_(BUCKET)
 
 
-# The six helpers below delegate to the process's active storage backend
+# The helpers below delegate to the process's active storage backend
 # (`bloom_mcp.storage_backend`), selected by `BLOOM_STORAGE_BACKEND` (default
 # `supabase`). Their names + signatures are unchanged, so every caller and the
 # `fake_supabase_storage` test fixture (which monkeypatches these module-level
@@ -221,14 +290,25 @@ def read_json(key: str) -> dict:
     """Download `key` and parse as JSON.
 
     Raises if the key does not exist; callers that treat absence as a normal
-    state should check with `list_prefix()` first (this is what
-    `AnalysisDir.read_manifest` does).
+    state should use `read_json_if_exists()` instead.
     """
     from bloom_mcp.storage_backend import active_backend
 
     return active_backend().read_json(key)
 
 
+def read_json_if_exists(key: str) -> dict | None:
+    """Download `key` and parse as JSON, or return None if it does not exist.
+
+    One round trip: the download itself answers whether the key exists, so
+    there is no `list_prefix()` check first (this is what
+    `AnalysisDir.read_manifest` uses).
+    """
+    from bloom_mcp.storage_backend import active_backend
+
+    return active_backend().read_json_if_exists(key)
+
+
 def write_json(key: str, payload: dict) -> None:
     """Save `payload` as a JSON file at `key`. Overwrites if it exists."""
     from bloom_mcp.storage_backend import active_backend
@@ -280,3 +360,15 @@ def create_signed_url(key: str, expires_in: int) -> str:
     from bloom_mcp.storage_backend import active_backend
 
     return active_backend().create_signed_url(key, expires_in)
+
+
+def create_signed_urls(keys: list[str], expires_in: int) -> dict[str, str]:
+    """`create_signed_url` for several keys at once, returned as `{key: url}`.
+
+    The Supabase backend signs them all with Storage's bulk-sign endpoint in
+    a single request (one call per key on a client without it). Raises if
+    any key cannot be signed.
+    """
+    from bloom_mcp.storage_backend import active_backend
+
+    return active_backend().create_signed_urls(keys, expires_in)
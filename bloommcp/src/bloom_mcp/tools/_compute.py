@@ -0,0 +1,369 @@
+"""Process-pool offload for the CPU-bound analysis delegates.
+
+FastMCP runs sync tool handlers on a thread pool, so a UMAP fit or a
+hierarchical clustering holding the GIL stalls every other session on the same
+container — even cheap calls like ``list_existing_analyses``. Tools route their
+heavy ``sleap_roots_analyze`` delegate calls (and ``qc_inspect``'s figure
+rendering) through :func:`offload`, which runs them in a separate worker
+process when a pool is configured:
+
+- **Workers.** ``BLOOM_MCP_COMPUTE_WORKERS`` sets the pool size; ``0`` (the
+  default) runs every job inline in the calling thread, exactly as before.
+  Workers are started from a forkserver that has already imported
+  ``sleap_roots_analyze``/numba/umap/sklearn, so neither startup nor a
+  replacement worker pays those imports again. Each worker runs one job at a
+  time; a caller waits for an idle worker.
+- **Timeout.** ``BLOOM_MCP_COMPUTE_TIMEOUT_SECONDS`` (default 600) bounds each
+  job. An overrunning worker is killed and replaced — only its own job is lost —
+  and the call fails with a ``tool_error``.
+- **Memory cap.** ``BLOOM_MCP_COMPUTE_MEMORY_MB`` (default 0, no cap) limits
+  each worker's address space to that many MB on top of its warm baseline. A
+  job that hits it fails with a ``tool_error`` and its worker is replaced.
+- **Errors.** An exception raised by the job is re-raised in the caller with
+  its original type (the worker traceback attached as ``__cause__``), so the
+  tools' own ``except ValueError``/``RuntimeError`` mapping and
+  ``@as_mcp_tool``'s ``errors=`` mapping behave as they do inline.
+
+Jobs must be picklable: a module-level function and plain data arguments.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import resource
+import threading
+import traceback
+from typing import Any, Callable, Optional, TypeVar
+
+from bloom_mcp.contract import BloomMCPError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_WORKERS_ENV = "BLOOM_MCP_COMPUTE_WORKERS"
+_TIMEOUT_ENV = "BLOOM_MCP_COMPUTE_TIMEOUT_SECONDS"
+_MEMORY_ENV = "BLOOM_MCP_COMPUTE_MEMORY_MB"
+DEFAULT_TIMEOUT_SECONDS = 600
+
+# Imported once in the forkserver (and again, as a no-op, in each worker) so a
+# job never pays the numba/umap import cost. A module missing from the image is
+# skipped, never fatal.
+WARM_MODULES = (
+    "numpy",
+    "pandas",
+    "scipy",
+    "sklearn",
+    "matplotlib",
+    "numba",
+    "umap",
+    "sleap_roots_analyze",
+)
+
+# A fresh worker's warm imports are not part of any job's time budget.
+_STARTUP_TIMEOUT_SECONDS = 300
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("ignoring non-integer %s=%r; using %d", name, raw, default)
+        return default
+
+
+# --- Worker side ---------------------------------------------------------------
+
+
+def _warm(modules: tuple[str, ...]) -> None:
+    import importlib
+
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.debug("compute worker: %s not importable; skipped", name)
+    if "matplotlib" in modules:
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+        except ImportError:
+            pass
+
+
+def _cap_memory(memory_mb: int) -> None:
+    """Limit this process's address space to its current size + ``memory_mb``."""
+    with open("/proc/self/statm") as fh:
+        baseline = int(fh.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    limit = baseline + memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _portable_exception(exc: BaseException) -> BaseException:
+    """``exc`` if it survives a pickle round trip, else a same-message RuntimeError."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+        return exc
+    except Exception:  # noqa: BLE001 — any unpicklable exception is replaced
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+
+
+def _worker_main(conn, warm_modules: tuple[str, ...], memory_mb: int) -> None:
+    _warm(warm_modules)
+    if memory_mb:
+        _cap_memory(memory_mb)
+    conn.send(("ready", None))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        fn, args, kwargs = job
+        try:
+            reply = ("ok", fn(*args, **kwargs))
+        except BaseException as exc:  # noqa: BLE001 — returned to the caller
+            reply = ("error", _portable_exception(exc), traceback.format_exc())
+        try:
+            conn.send(reply)
+        except Exception as exc:  # noqa: BLE001 — an unpicklable return value
+            conn.send(
+                (
+                    "error",
+                    RuntimeError(f"compute job result could not be returned: {exc}"),
+                    traceback.format_exc(),
+                )
+            )
+
+
+# --- Caller side ---------------------------------------------------------------
+
+
+class _RemoteTraceback(Exception):
+    """Carries a worker's formatted traceback as the re-raised exception's cause."""
+
+    def __init__(self, tb: str) -> None:
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+class _WorkerLost(Exception):
+    """The worker died or stopped answering; it must be replaced."""
+
+
+class _JobTimeout(Exception):
+    """The job overran its time limit (not ``TimeoutError``: that is an OSError)."""
+
+
+class _Worker:
+    """One worker process and the pipe it takes jobs on."""
+
+    def __init__(self, ctx, warm_modules: tuple[str, ...], memory_mb: int) -> None:
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child, warm_modules, memory_mb),
+            name="bloom-mcp-compute",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self._ready = False
+
+    def run(self, job: tuple, timeout: float) -> tuple:
+        """Send ``job``; return the worker's reply or raise on timeout/death."""
+        if not self._ready:
+            self._receive(_STARTUP_TIMEOUT_SECONDS)
+            self._ready = True
+        try:
+            self.conn.send(job)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            raise  # the job itself is not picklable — a caller bug, worker is fine
+        except OSError as exc:
+            raise _WorkerLost("worker pipe closed") from exc
+        return self._receive(timeout)
+
+    def _receive(self, timeout: float) -> tuple:
+        try:
+            if not self.conn.poll(timeout):
+                raise _JobTimeout
+            return self.conn.recv()
+        except (EOFError, OSError) as exc:
+            raise _WorkerLost("worker exited") from exc
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _context(warm_modules: tuple[str, ...]):
+    try:
+        ctx = multiprocessing.get_context("forkserver")
+    except ValueError:  # pragma: no cover - no forkserver on this platform
+        return multiprocessing.get_context("spawn")
+    if warm_modules:
+        ctx.set_forkserver_preload(list(warm_modules))
+    return ctx
+
+
+class ComputePool:
+    """A fixed set of warm worker processes running one job each at a time."""
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        memory_mb: int = 0,
+        warm_modules: tuple[str, ...] = WARM_MODULES,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"ComputePool needs at least one worker; got {workers}")
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self._warm_modules = warm_modules
+        self._ctx = _context(warm_modules)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._all: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(workers):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self._warm_modules, self.memory_mb)
+        with self._lock:
+            self._all.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        with self._lock:
+            self._all.discard(worker)
+        worker.kill()
+
+    def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` in a worker and return its result."""
+        if self._closed:
+            raise RuntimeError("ComputePool is shut down")
+        name = getattr(fn, "__name__", repr(fn))
+        worker = self._idle.get()
+        replace = False
+        try:
+            try:
+                reply = worker.run((fn, args, kwargs), self.timeout)
+            except _JobTimeout:
+                replace = True
+                raise BloomMCPError(
+                    code="tool_error",
+                    message=f"{name} exceeded the {self.timeout:g}s compute time limit "
+                    "and was stopped.",
+                    remedy="Narrow the input (fewer traits or samples, smaller "
+                    "parameter ranges) and retry.",
+                ) from None
+            except _WorkerLost:
+                replace = True
+                raise BloomMCPError(
+                    code="tool_error",
+                    message=f"The compute worker running {name} exited unexpectedly "
+                    "(most often it ran out of memory).",
+                    remedy="Narrow the input (fewer traits or samples) and retry.",
+                ) from None
+            if reply[0] == "ok":
+                return reply[1]
+            _, exc, tb = reply
+            if isinstance(exc, MemoryError):
+                replace = True
+                raise BloomMCPError(
+                    code="tool_error",
+                    message=f"{name} exceeded the {self.memory_mb} MB compute memory "
+                    "limit and was stopped.",
+                    remedy="Narrow the input (fewer traits or samples) and retry.",
+                ) from None
+            raise exc from _RemoteTraceback(tb)
+        finally:
+            if replace:
+                logger.warning("replacing compute worker after %s", name)
+                self._retire(worker)
+                worker = self._spawn()
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        """Stop every worker (idle ones cleanly, busy ones by kill)."""
+        self._closed = True
+        with self._lock:
+            workers, self._all = list(self._all), set()
+        for worker in workers:
+            worker.stop()
+
+
+# --- Process-wide pool ---------------------------------------------------------
+
+_pool: Optional[ComputePool] = None
+_pool_lock = threading.Lock()
+_pool_configured = False
+
+
+def warm_pool() -> Optional[ComputePool]:
+    """Create the process-wide pool from the environment (``None`` when inline).
+
+    Called at server boot so workers finish their imports before the first
+    request; otherwise the first :func:`offload` creates it.
+    """
+    global _pool, _pool_configured
+    with _pool_lock:
+        if not _pool_configured:
+            workers = _env_int(_WORKERS_ENV, 0)
+            if workers:
+                _pool = ComputePool(
+                    workers,
+                    timeout=_env_int(_TIMEOUT_ENV, DEFAULT_TIMEOUT_SECONDS)
+                    or DEFAULT_TIMEOUT_SECONDS,
+                    memory_mb=_env_int(_MEMORY_ENV, 0),
+                    warm_modules=WARM_MODULES,
+                )
+                atexit.register(_pool.shutdown)
+                logger.info("compute pool started with %d worker(s)", workers)
+            _pool_configured = True
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the process-wide pool; the next :func:`offload` re-reads the environment."""
+    global _pool, _pool_configured
+    with _pool_lock:
+        pool, _pool, _pool_configured = _pool, None, False
+    if pool is not None:
+        atexit.unregister(pool.shutdown)
+        pool.shutdown()
+
+
+def offload(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` on the compute pool, or inline without one."""
+    pool = warm_pool()
+    if pool is None:
+        return fn(*args, **kwargs)
+    return pool.run(fn, *args, **kwargs)
@@ -27,7 +27,7 @@ os.environ.setdefault("BLOOM_PLOTS_URL", "http://localhost/plots")
 
 # --- In-memory Supabase Storage boundary (Tier 2 adapter tests) ---------------
 #
-# The storage stack funnels every read/write through the six bloom_mcp.supabase_client
+# The storage stack funnels every read/write through the bloom_mcp.supabase_client
 # helpers (+ the names re-bound into bloom_mcp.manifest.manifest). This fixture
 # fakes that boundary in memory so SupabaseReader / SupabaseResultStore run with
 # no live Supabase and no `supabase.create_client` call.
@@ -39,6 +39,39 @@ from typing import Optional  # noqa: E402
 import pytest  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _fresh_supabase_clients():
+    """Start and end every test with no cached Supabase client.
+
+    ``supabase_client`` reuses one client per env for the life of the process;
+    without this, a client cached by one test would slip past the next test's
+    ``create_client`` stub or network guard.
+    """
+    from bloom_mcp import supabase_client as _sc
+
+    _sc.reset_clients()
+    yield
+    _sc.reset_clients()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cleaned_cache(monkeypatch, tmp_path_factory):
+    """Give every test its own empty cleaned-CSV cache.
+
+    ``cleaned_cache`` keeps one cache per process, rooted in the OS tmp dir by
+    default; a per-test root keeps tests from reusing each other's downloads or
+    parsed frames.
+    """
+    from bloom_mcp import cleaned_cache
+
+    monkeypatch.setenv(
+        "BLOOM_CLEANED_CACHE_DIR", str(tmp_path_factory.mktemp("cleaned_cache"))
+    )
+    cleaned_cache.reset_cache()
+    yield
+    cleaned_cache.reset_cache()
+
+
 class _InMemoryObjectStore:
     """A dict-backed stand-in for the bloommcp-data bucket."""
 
@@ -58,6 +91,11 @@ class _InMemoryObjectStore:
             raise KeyError(f"object not found: {key}")
         return json.loads(self.objects[key].decode("utf-8"))
 
+    def read_json_if_exists(self, key: str) -> Optional[dict]:
+        if key not in self.objects:
+            return None
+        return self.read_json(key)
+
     def write_json(self, key: str, payload: dict) -> None:
         self.objects[key] = json.dumps(payload, indent=2, sort_keys=True).encode(
             "utf-8"
@@ -85,6 +123,9 @@ class _InMemoryObjectStore:
         # real backend, so there is nothing to sign against (bloom#581).
         return f"fake://signed/{key}?expires_in={expires_in}"
 
+    def create_signed_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        return {key: self.create_signed_url(key, expires_in) for key in keys}
+
 
 @pytest.fixture
 def fake_supabase_storage(monkeypatch):
@@ -99,14 +140,16 @@ def fake_supabase_storage(monkeypatch):
     for name in (
         "list_prefix",
         "read_json",
+        "read_json_if_exists",
         "write_json",
         "upload_file",
         "download_file",
         "delete_files",
         "create_signed_url",
+        "create_signed_urls",
     ):
         monkeypatch.setattr(_sc, name, getattr(store, name))
-    for name in ("list_prefix", "read_json", "write_json"):
+    for name in ("read_json_if_exists", "write_json"):
         monkeypatch.setattr(_manifest, name, getattr(store, name))
 
     def _no_network(*_a, **_k):  # pragma: no cover - guard
@@ -119,8 +162,8 @@ def fake_supabase_storage(monkeypatch):
 # --- In-memory Postgres/PostgREST boundary (Tier 2 DB-direct raw tier) -------
 #
 # SupabaseReader's raw tier calls two module-level bloom_mcp.supabase_client
-# functions: `call_rpc` (get_experiment_traits / list_experiment_trait_sources)
-# and `get_postgrest_client` (a direct `cyl_experiments` table read for
+# functions: `call_rpc` (get_experiment_traits[_columnar] /
+# list_experiment_trait_sources / list_experiment_trait_summaries) and `get_postgrest_client` (a direct `cyl_experiments` table read for
 # list_experiments()). This fake monkeypatches both so the DB-direct raw tier
 # runs with no live Supabase/Postgres — a distinct boundary from
 # `fake_supabase_storage` above (that one fakes object storage; this one fakes
@@ -172,6 +215,8 @@ class FakeSupabaseDB:
         # Keyed by (function_name, experiment_id); experiment_id=None fails
         # every call to that function regardless of experiment.
         self.rpc_errors: dict[tuple[str, Optional[int]], Exception] = {}
+        # Every RPC function name called, in order.
+        self.rpc_calls: list[str] = []
 
     def seed_experiment(self, experiment_id: int, name: str) -> None:
         self.tables["cyl_experiments"].append({"id": experiment_id, "name": name})
@@ -192,6 +237,7 @@ class FakeSupabaseDB:
         self.rpc_errors[(function_name, experiment_id)] = exc
 
     def call_rpc(self, function_name: str, params: dict) -> list[dict]:
+        self.rpc_calls.append(function_name)
         experiment_id = params.get("experiment_id_")
         for key in ((function_name, experiment_id), (function_name, None)):
             if key in self.rpc_errors:
@@ -199,7 +245,20 @@ class FakeSupabaseDB:
 
         if function_name == "list_experiment_trait_sources":
             return list(self._sources.get(experiment_id, []))
-        if function_name == "get_experiment_traits":
+        if function_name == "list_experiment_trait_summaries":
+            summaries = []
+            for eid in params["experiment_ids_"]:
+                rows = self._traits.get(eid, [])
+                if rows:
+                    summaries.append(
+                        {
+                            "experiment_id": eid,
+                            "plant_count": len({r["plant_id"] for r in rows}),
+                            "trait_count": len({r["trait_name"] for r in rows}),
+                        }
+                    )
+            return summaries
+        if function_name in ("get_experiment_traits", "get_experiment_traits_columnar"):
             rows = list(self._traits.get(experiment_id, []))
             source_id = params.get("source_id_")
             if source_id is not None:
@@ -207,7 +266,11 @@ class FakeSupabaseDB:
             run_id = params.get("run_id_")
             if run_id is not None:
                 rows = [r for r in rows if r.get("pipeline_run_id") == run_id]
-            return rows
+            if function_name == "get_experiment_traits":
+                return rows
+            # One row of per-column arrays; array_agg over no rows is NULL.
+            keys = rows[0].keys() if rows else ("plant_id", "trait_name")
+            return [{k: [r[k] for r in rows] if rows else None for k in keys}]
         raise AssertionError(f"unfaked RPC function: {function_name!r}")
 
     def get_postgrest_client(self) -> _FakePostgrestClient:
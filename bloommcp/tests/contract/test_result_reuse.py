@@ -0,0 +1,231 @@
+"""@as_mcp_tool's content-addressed result reuse (``contract/reuse.py``).
+
+A stub tool that opts in (declares ``reuse``) reads a small frame, looks itself
+up, and otherwise commits a run to a ``FakeResultStore``. The tests pin when an
+identical call is served from the earlier run, when it must recompute, and that
+reuse failures never fail the call.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from bloom_mcp.contract import (
+    ReuseParams,
+    RunLinks,
+    as_mcp_tool,
+    reuse_key,
+    reuse_stats,
+)
+from bloom_mcp.contract.reuse import reset_reuse_stats
+from bloom_mcp.data_access import ExperimentFrame
+from bloom_mcp.result_store import FakeResultStore, ManifestReadError
+from pydantic import BaseModel, Field
+
+
+class ReuseInput(ReuseParams):
+    experiment: str = "exp.csv"
+    scale: float = 1.0
+    seed: int | None = Field(default=None, ge=0)
+
+
+class ReuseOutput(RunLinks):
+    total: float
+
+
+def _frame(values=(1.0, 2.0, 3.0)) -> ExperimentFrame:
+    return ExperimentFrame(
+        df=pd.DataFrame({"plant": ["a", "b", "c"], "trait": list(values)}),
+        trait_cols=["trait"],
+        metadata_cols=["plant"],
+        genotype_col=None,
+        replicate_col=None,
+        sample_id_col="plant",
+        source="v1_cleaned",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    reset_reuse_stats()
+    yield
+    reset_reuse_stats()
+
+
+@pytest.fixture
+def harness():
+    """A reusable stub tool over a FakeResultStore; counts real computations."""
+    state = {"store": FakeResultStore(), "frame": _frame(), "computed": 0}
+
+    def build(*, stochastic: bool = False):
+        def body(params, provenance, reuse):
+            store = state["store"]
+            cached = reuse.lookup(
+                store,
+                experiment=params.experiment,
+                tool_class="stub",
+                frame=state["frame"],
+            )
+            if cached is not None:
+                return cached
+            state["computed"] += 1
+            run = store.create_run(
+                experiment=params.experiment,
+                tool_class="stub",
+                provenance=provenance.model_copy(update={"reuse_key": reuse.key}),
+            )
+            (run.staging_dir / "out.csv").write_text("x\n1\n")
+            stored = store.commit(run, {"out.csv": "out.csv"})
+            return ReuseOutput(
+                total=float(state["frame"].df["trait"].sum()) * params.scale,
+                run_ref=stored.run_ref,
+                version_dir=stored.version_dir,
+                manifest_path=stored.manifest_path,
+                outputs=dict(stored.output_keys),
+                output_links=stored.output_links,
+            )
+
+        if stochastic:
+
+            @as_mcp_tool(input_model=ReuseInput, output_model=ReuseOutput)
+            def stub_tool(params, *, random_state, provenance, reuse):
+                return body(params, provenance, reuse)
+
+        else:
+
+            @as_mcp_tool(input_model=ReuseInput, output_model=ReuseOutput)
+            def stub_tool(params, *, provenance, reuse):
+                return body(params, provenance, reuse)
+
+        return stub_tool
+
+    state["build"] = build
+    return state
+
+
+def test_identical_call_returns_the_earlier_run(harness):
+    tool = harness["build"]()
+    first = tool({"scale": 2.0})
+    second = tool({"scale": 2.0})
+
+    assert harness["computed"] == 1
+    assert second.run_ref == first.run_ref == "v1"
+    assert second.total == first.total == 12.0
+    assert second.outputs == first.outputs
+    # Links are re-signed for the hit, not carried over as empty.
+    assert second.output_links["out.csv"].sha256 == (
+        first.output_links["out.csv"].sha256
+    )
+    assert [r.run_ref for r in harness["store"].list_runs("exp.csv", "stub")] == ["v1"]
+    stats = reuse_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["by_tool"]["stub_tool"]["hits"] == 1
+
+
+def test_force_recomputes_and_becomes_the_reused_run(harness):
+    tool = harness["build"]()
+    tool({})
+    forced = tool({"force": True})
+    again = tool({})
+
+    assert harness["computed"] == 2
+    assert forced.run_ref == again.run_ref == "v2"
+    assert reuse_stats()["forced"] == 1
+    # `force` is a reuse control, not an input: both runs share one key.
+    store = harness["store"]
+    keys = {store.get_run("exp.csv", "stub", ref).reuse_key for ref in ("v1", "v2")}
+    assert len(keys) == 1 and None not in keys
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["params", "frame", "code_versions"],
+)
+def test_any_input_change_recomputes(harness, monkeypatch, change):
+    tool = harness["build"]()
+    tool({})
+    if change == "params":
+        tool({"scale": 3.0})
+    elif change == "frame":
+        harness["frame"] = _frame(values=(1.0, 2.0, 4.0))
+        tool({})
+    else:
+        import bloom_mcp.contract.provenance as prov_mod
+        from bloom_mcp.manifest.schema import CodeVersions
+
+        monkeypatch.setattr(
+            prov_mod, "get_code_versions", lambda: CodeVersions(bloommcp="99.0")
+        )
+        tool({})
+    assert harness["computed"] == 2
+
+
+def test_stochastic_call_reuses_only_an_explicit_seed(harness):
+    tool = harness["build"](stochastic=True)
+    tool({"seed": 7})
+    tool({"seed": 7})
+    assert harness["computed"] == 1
+    # No seed: the contract draws a fresh one — a new draw was asked for.
+    tool({})
+    tool({})
+    assert harness["computed"] == 3
+    tool({"seed": 8})
+    assert harness["computed"] == 4
+
+
+def test_key_covers_seed():
+    from bloom_mcp.contract import Provenance
+
+    frame = _frame()
+    base = Provenance.stamp(tool="t", params={"a": 1}, seed=1)
+    assert reuse_key(base, frame) == reuse_key(base.model_copy(), frame)
+    assert reuse_key(base, frame) != reuse_key(
+        base.model_copy(update={"seed": 2}), frame
+    )
+    assert reuse_key(base, frame).startswith("sha256:")
+
+
+def test_lookup_failure_computes_instead(harness):
+    tool = harness["build"]()
+    tool({})
+    harness["store"].fail_next_read("exp.csv", "stub")
+    result = tool({})
+    assert harness["computed"] == 2
+    assert result.run_ref == "v2"
+
+
+def test_record_failure_still_returns_the_committed_run(harness, monkeypatch):
+    tool = harness["build"]()
+
+    def _boom(*args, **kwargs):
+        raise ManifestReadError("storage down")
+
+    monkeypatch.setattr(harness["store"], "record_result", _boom)
+    result = tool({})
+    assert result.run_ref == "v1"
+    # Nothing was recorded, so the next identical call cannot reuse it.
+    monkeypatch.undo()
+    tool({})
+    assert harness["computed"] == 2
+
+
+def test_disabled_by_env(harness, monkeypatch):
+    monkeypatch.setenv("BLOOM_MCP_RESULT_REUSE", "0")
+    tool = harness["build"]()
+    tool({})
+    tool({})
+    assert harness["computed"] == 2
+    assert harness["store"].get_run("exp.csv", "stub", "v2").reuse_key is None
+
+
+def test_non_reusable_params_keep_every_field_in_provenance(recorder):
+    class Plain(BaseModel):
+        force: bool = False
+
+    @as_mcp_tool(input_model=Plain, output_model=Plain)
+    def plain_tool(params, *, provenance):
+        recorder["params"] = provenance.params
+        return params
+
+    plain_tool({"force": True})
+    assert recorder["params"] == {"force": True}
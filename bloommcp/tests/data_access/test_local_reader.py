@@ -127,10 +127,10 @@ def test_manifest_read_failure_is_caller_safe_not_raw(local_env, monkeypatch):
     (inp / "exp.csv").write_text(_RAW)
     _seed_cleaned("exp.csv", pd.read_csv(io.StringIO(_RAW)))
 
-    def _boom(prefix: str):
+    def _boom(key: str):
         raise RuntimeError("connection reset by peer at 10.0.0.5:5432")
 
-    monkeypatch.setattr(manifest_mod, "list_prefix", _boom)
+    monkeypatch.setattr(manifest_mod, "read_json_if_exists", _boom)
 
     with pytest.raises(ExperimentReadError) as exc:
         LocalReader().load_experiment("exp.csv")
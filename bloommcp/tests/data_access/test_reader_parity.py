@@ -33,7 +33,7 @@ def _seed_cleaned_supabase(experiment: str) -> None:
 
 
 class _SupabaseFailureScope:
-    """Scopes the injected `list_prefix` failure to one `with` block via its
+    """Scopes the injected `read_json_if_exists` failure to one `with` block via its
     own `monkeypatch.context()` -- an independent `MonkeyPatch` instance, so
     it reverts automatically on exit without disturbing `fake_supabase_storage`'s
     own patches, which share the outer `monkeypatch` fixture instance. Avoids
@@ -46,10 +46,10 @@ class _SupabaseFailureScope:
         mp = self._ctx.__enter__()
         import bloom_mcp.manifest.manifest as manifest_mod
 
-        def _boom(prefix):
+        def _boom(key):
             raise RuntimeError("connection reset by peer at 10.0.0.5:5432")
 
-        mp.setattr(manifest_mod, "list_prefix", _boom)
+        mp.setattr(manifest_mod, "read_json_if_exists", _boom)
 
     def __exit__(self, *exc_info) -> None:
         self._ctx.__exit__(*exc_info)
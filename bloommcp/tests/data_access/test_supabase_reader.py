@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import logging
+import random
+
 import pandas as pd
 import pytest
 
@@ -286,6 +289,10 @@ def test_list_experiments_excludes_a_failing_experiment(
 ):
     _seed_two_plant_experiment(fake_supabase_db, experiment_id=42)
     fake_supabase_db.seed_experiment(43, "broken experiment")
+    # Per-experiment bulk reads only happen on the fallback path.
+    fake_supabase_db.fail_rpc(
+        "list_experiment_trait_summaries", RuntimeError("function does not exist")
+    )
     fake_supabase_db.fail_rpc(
         "get_experiment_traits", RuntimeError("boom"), experiment_id=43
     )
@@ -293,6 +300,82 @@ def test_list_experiments_excludes_a_failing_experiment(
     assert {s.filename for s in summaries} == {"42"}
 
 
+def test_list_experiments_counts_come_from_one_aggregate_call(
+    fake_supabase_storage, fake_supabase_db
+):
+    """No per-experiment bulk read: listing N experiments must not pull every
+    trait reading of every plant just to count them."""
+    for experiment_id in (42, 43, 44):
+        _seed_two_plant_experiment(fake_supabase_db, experiment_id=experiment_id)
+    fake_supabase_db.seed_experiment(45, "not yet phenotyped")
+
+    summaries = SupabaseReader().list_experiments()
+
+    assert fake_supabase_db.rpc_calls == ["list_experiment_trait_summaries"]
+    by_name = {s.filename: s for s in summaries}
+    assert (by_name["42"].rows, by_name["42"].trait_columns) == (2, 2)
+    assert (by_name["45"].rows, by_name["45"].trait_columns) == (0, 0)
+
+
+def test_list_experiments_falls_back_to_bulk_reads_with_the_same_counts(
+    fake_supabase_storage, fake_supabase_db
+):
+    _seed_two_plant_experiment(fake_supabase_db, experiment_id=42)
+    fake_supabase_db.seed_experiment(45, "not yet phenotyped")
+    aggregated = SupabaseReader().list_experiments()
+    fake_supabase_db.fail_rpc(
+        "list_experiment_trait_summaries", RuntimeError("function does not exist")
+    )
+
+    fallback = SupabaseReader().list_experiments()
+
+    assert fallback == aggregated
+    assert fake_supabase_db.rpc_calls.count("get_experiment_traits") == 2
+
+
+def test_list_experiments_is_reused_within_its_ttl(
+    fake_supabase_storage, fake_supabase_db, monkeypatch
+):
+    import bloom_mcp.data_access.supabase_reader as sr
+
+    _seed_two_plant_experiment(fake_supabase_db, experiment_id=42)
+    now = [1000.0]
+    monkeypatch.setattr(sr.time, "monotonic", lambda: now[0])
+    reader = SupabaseReader(list_ttl_seconds=30)
+
+    first = reader.list_experiments()
+    _seed_two_plant_experiment(fake_supabase_db, experiment_id=43)
+    now[0] += 29
+    cached = reader.list_experiments()
+    now[0] += 2
+    refreshed = reader.list_experiments()
+
+    assert cached == first and {s.filename for s in cached} == {"42"}
+    assert {s.filename for s in refreshed} == {"42", "43"}
+    assert fake_supabase_db.rpc_calls.count("list_experiment_trait_summaries") == 2
+
+
+def test_a_failed_listing_is_not_cached(
+    fake_supabase_storage, fake_supabase_db, monkeypatch
+):
+    import bloom_mcp.supabase_client as _sc
+
+    _seed_two_plant_experiment(fake_supabase_db, experiment_id=42)
+    reader = SupabaseReader()
+
+    def _down():
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(_sc, "get_postgrest_client", _down)
+    with pytest.raises(ExperimentReadError):
+        reader.list_experiments()
+    monkeypatch.setattr(
+        _sc, "get_postgrest_client", fake_supabase_db.get_postgrest_client
+    )
+
+    assert {s.filename for s in reader.list_experiments()} == {"42"}
+
+
 def test_supabase_reader_no_longer_satisfies_raw_sourced(
     fake_supabase_storage, fake_supabase_db
 ):
@@ -452,8 +535,8 @@ def test_duplicate_trait_value_for_same_plant_raises(
     fake_supabase_storage, fake_supabase_db
 ):
     """A duplicate (plant_id, trait_name) pair within one resolved source has
-    no DB constraint preventing it. pivot_table's aggfunc='first' would
-    silently keep an arbitrary one and drop the rest -- the same class of risk
+    no DB constraint preventing it. The pivot's scatter would silently keep
+    an arbitrary one and drop the rest -- the same class of risk
     this module already guards against for sample_id/multi-scan collisions."""
     experiment_id = 70
     fake_supabase_db.seed_experiment(experiment_id, "duplicate trait row")
@@ -640,6 +723,193 @@ def test_list_experiments_excludes_a_malformed_row(
     assert {s.filename for s in summaries} == {"42"}
 
 
+# --- Columnar transport + vectorized pivot ------------------------------------
+
+
+def _reference_pivot(rows: list[dict]) -> pd.DataFrame:
+    """The pre-vectorization pandas pivot, kept as the oracle for `_pivot_wide`."""
+    long_df = pd.DataFrame(rows)
+    meta = (
+        long_df.drop_duplicates("plant_id")
+        .set_index("plant_id")[
+            [
+                "accession_name",
+                "plant_qr_code",
+                "wave_number",
+                "plant_age_days",
+                "date_scanned",
+                "scan_id",
+            ]
+        ]
+        .rename(
+            columns={
+                "accession_name": "genotype",
+                "plant_qr_code": "sample_id",
+                "wave_number": "wave",
+            }
+        )
+    )
+    wide = long_df.pivot_table(
+        index="plant_id",
+        columns="trait_name",
+        values="trait_value",
+        aggfunc="first",
+        dropna=False,
+    )
+    wide = wide[sorted(wide.columns.tolist())]
+    return meta.join(wide).reset_index()
+
+
+def _seed_shuffled_experiment(fake_supabase_db, experiment_id=80) -> list[dict]:
+    rng = random.Random(7)
+    rows = []
+    for plant_id in rng.sample(range(1000, 1200), 60):
+        for trait in ("tip_count", "root_length", "area", "never_measured"):
+            if trait != "never_measured" and rng.random() < 0.2:
+                continue  # not every trait is measured for every plant
+            value = None if trait == "never_measured" else rng.uniform(0, 10)
+            rows.append(
+                _trait_row(
+                    plant_id=plant_id,
+                    scan_id=plant_id + 50_000,
+                    qr_code=f"QR{plant_id}",
+                    accession=f"acc-{plant_id % 7}",
+                    wave=plant_id % 3,
+                    trait_name=trait,
+                    trait_value=value,
+                    source_id=9,
+                    plant_age_days=plant_id % 20,
+                )
+            )
+    rng.shuffle(rows)
+    fake_supabase_db.seed_experiment(experiment_id, "shuffled")
+    fake_supabase_db.seed_traits(experiment_id, rows)
+    fake_supabase_db.seed_sources(
+        experiment_id,
+        [{"source_id": 9, "source_name": "run-a", "pipeline_run_id": "p9"}],
+    )
+    return rows
+
+
+def test_vectorized_pivot_matches_the_pandas_pivot(
+    fake_supabase_storage, fake_supabase_db
+):
+    rows = _seed_shuffled_experiment(fake_supabase_db)
+
+    frame = SupabaseReader().load_experiment("80")
+
+    pd.testing.assert_frame_equal(frame.df, _reference_pivot(rows))
+    assert frame.trait_cols == ["area", "never_measured", "root_length", "tip_count"]
+    assert frame.df["never_measured"].isna().all()
+
+
+@pytest.mark.parametrize("transport", ["rows", "columnar"])
+def test_both_transports_give_the_same_frame(
+    fake_supabase_storage, fake_supabase_db, transport
+):
+    _seed_shuffled_experiment(fake_supabase_db)
+    expected = SupabaseReader(traits_transport="rows").load_experiment("80").df
+
+    frame = SupabaseReader(traits_transport=transport).load_experiment("80")
+
+    pd.testing.assert_frame_equal(frame.df, expected)
+    rpc = {
+        "rows": "get_experiment_traits",
+        "columnar": "get_experiment_traits_columnar",
+    }
+    assert fake_supabase_db.rpc_calls[-1] == rpc[transport]
+
+
+def test_columnar_transport_falls_back_when_the_function_is_missing(
+    fake_supabase_storage, fake_supabase_db, caplog
+):
+    _seed_two_plant_experiment(fake_supabase_db, experiment_id=42)
+    fake_supabase_db.fail_rpc(
+        "get_experiment_traits_columnar", RuntimeError("function does not exist")
+    )
+
+    frame = SupabaseReader(traits_transport="columnar").load_experiment("42")
+
+    assert frame.trait_cols == ["root_angle", "root_length"]
+    assert "falling back to get_experiment_traits" in caplog.text
+
+
+def test_columnar_transport_empty_experiment_is_valid(
+    fake_supabase_storage, fake_supabase_db
+):
+    fake_supabase_db.seed_experiment(77, "no readings yet")
+
+    frame = SupabaseReader(traits_transport="columnar").load_experiment("77")
+
+    assert frame.df.empty and frame.trait_cols == []
+
+
+def test_columnar_transport_keeps_the_integrity_errors(
+    fake_supabase_storage, fake_supabase_db
+):
+    experiment_id = 71
+    fake_supabase_db.seed_experiment(experiment_id, "rescanned, duplicated")
+    row = {
+        "plant_id": 1,
+        "qr_code": "QRZ",
+        "accession": "acc-a",
+        "wave": 1,
+        "trait_name": "root_length",
+    }
+    fake_supabase_db.seed_traits(
+        experiment_id,
+        [
+            _trait_row(scan_id=1, trait_value=1.0, **row),
+            _trait_row(scan_id=1, trait_value=2.0, **row),
+        ],
+    )
+    reader = SupabaseReader(traits_transport="columnar")
+    with pytest.raises(DuplicateTraitReadingError, match="QRZ"):
+        reader.load_experiment(str(experiment_id))
+
+    fake_supabase_db.seed_traits(
+        experiment_id, [_trait_row(scan_id=2, trait_value=3.0, **row)]
+    )
+    with pytest.raises(MultipleScansPerPlantError, match="2 distinct scans"):
+        reader.load_experiment(str(experiment_id))
+
+
+def test_multi_scan_error_names_the_lowest_plant_id(
+    fake_supabase_storage, fake_supabase_db
+):
+    """Row order must not change which plant the error names."""
+    experiment_id = 72
+    fake_supabase_db.seed_experiment(experiment_id, "two rescanned plants")
+    rows = []
+    for plant_id, qr in ((9, "QR9"), (3, "QR3")):
+        for scan_id in (plant_id * 10, plant_id * 10 + 1):
+            rows.append(
+                _trait_row(
+                    plant_id=plant_id,
+                    scan_id=scan_id,
+                    qr_code=qr,
+                    accession="acc-a",
+                    wave=1,
+                    trait_name="root_length",
+                    trait_value=1.0,
+                )
+            )
+    fake_supabase_db.seed_traits(experiment_id, rows)
+
+    with pytest.raises(MultipleScansPerPlantError, match="QR3"):
+        SupabaseReader().load_experiment(str(experiment_id))
+
+
+def test_transport_comes_from_the_environment(monkeypatch, caplog):
+    monkeypatch.setenv("BLOOM_TRAITS_TRANSPORT", "columnar")
+    assert SupabaseReader()._traits_transport == "columnar"
+
+    monkeypatch.setenv("BLOOM_TRAITS_TRANSPORT", "arrow")
+    with caplog.at_level(logging.WARNING):
+        assert SupabaseReader()._traits_transport == "rows"
+    assert "BLOOM_TRAITS_TRANSPORT" in caplog.text
+
+
 def test_fake_reader_is_not_source_selectable():
     """FakeReader has no source-versioned substrate; it must not satisfy
     SourceSelectable (unlike SupabaseReader)."""
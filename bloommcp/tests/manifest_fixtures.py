@@ -13,6 +13,7 @@ these plain helper functions need an unambiguous, explicitly-imported home.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from typing import Optional
 
@@ -70,6 +71,7 @@ def write_cleaned_manifest(
         based_on_version=resolved_based_on,
         code_versions=get_code_versions(),
         outputs={"_cleaned.csv": "_cleaned.csv"},
+        output_sha256={"_cleaned.csv": hashlib.sha256(content).hexdigest()},
         version_dir=version_dir,
     )
     manifest = Manifest(
@@ -127,6 +129,7 @@ def append_cleaned_version(
         based_on_version=based_on_version,
         code_versions=get_code_versions(),
         outputs={"_cleaned.csv": "_cleaned.csv"},
+        output_sha256={"_cleaned.csv": hashlib.sha256(content).hexdigest()},
         version_dir=version_dir,
     )
     manifest.versions.append(entry)
@@ -96,13 +96,10 @@ def _inject_wrong_expected_prefix(kind, monkeypatch):
 
     module = sstore if kind == "supabase" else fstore
 
-    def _wrong_prefix(output_keys, output_sha256, output_size_bytes, url_for, **_):
+    def _wrong_prefix(output_keys, output_sha256, output_size_bytes, **kwargs):
+        kwargs["expected_prefix"] = "bloommcp_output/qc_someone_else/v1/"
         return _real_build_output_links(
-            output_keys,
-            output_sha256,
-            output_size_bytes,
-            url_for,
-            expected_prefix="bloommcp_output/qc_someone_else/v1/",
+            output_keys, output_sha256, output_size_bytes, **kwargs
         )
 
     monkeypatch.setattr(module, "build_output_links", _wrong_prefix)
@@ -515,3 +512,60 @@ def test_manifest_read_failure_parity(kind, call_site, stores, monkeypatch):
     )
     with pytest.raises(ManifestReadError):
         _READ_CALL_SITES[call_site](store, "read-fail.csv", "qc")
+
+
+def _commit_reusable(store, key, payload=b"aaa"):
+    prov = _prov().model_copy(update={"reuse_key": key})
+    run = store.create_run(experiment="reuse.csv", tool_class="pca", provenance=prov)
+    (run.staging_dir / "a.csv").write_bytes(payload)
+    return store.commit(run, {"a": "a.csv"})
+
+
+@pytest.mark.parametrize("kind", ["fake", "supabase"])
+def test_find_reusable_returns_recorded_run_with_fresh_links_parity(kind, stores):
+    """A run committed under a reuse key and given a recorded result is found
+    again by that key — newest first — with its result and re-signed links
+    matching what commit() returned."""
+    store = stores[kind]
+    first = _commit_reusable(store, "sha256:k")
+    store.record_result("reuse.csv", "pca", first.run_ref, {"n": 1})
+    newer = _commit_reusable(store, "sha256:k", payload=b"bbbb")
+    store.record_result("reuse.csv", "pca", newer.run_ref, {"n": 2})
+
+    found = store.find_reusable("reuse.csv", "pca", "sha256:k")
+
+    assert found.run_ref == newer.run_ref == "v2"
+    assert found.result == {"n": 2}
+    assert found.reuse_key == "sha256:k"
+    assert found.output_size_bytes == {"a": 4}
+    link = found.output_links["a"]
+    assert (link.key, link.sha256, link.size_bytes) == (
+        newer.output_links["a"].key,
+        newer.output_links["a"].sha256,
+        4,
+    )
+    assert link.key in link.url
+    # Reuse data never leaks into the plain read paths.
+    assert store.get_run("reuse.csv", "pca", "v2").result is None
+    assert store.get_run("reuse.csv", "pca", "v2").output_links == {}
+
+
+@pytest.mark.parametrize("kind", ["fake", "supabase"])
+def test_find_reusable_misses_parity(kind, stores):
+    """Another key, a run whose result was never recorded, or no runs at
+    all: nothing to reuse."""
+    store = stores[kind]
+    assert store.find_reusable("reuse.csv", "pca", "sha256:k") is None
+    _commit_reusable(store, "sha256:k")  # result never recorded
+    assert store.find_reusable("reuse.csv", "pca", "sha256:k") is None
+    other = _commit_reusable(store, "sha256:other")
+    store.record_result("reuse.csv", "pca", other.run_ref, {"n": 1})
+    assert store.find_reusable("reuse.csv", "pca", "sha256:k") is None
+
+
+@pytest.mark.parametrize("kind", ["fake", "supabase"])
+def test_record_result_unknown_run_parity(kind, stores):
+    store = stores[kind]
+    _commit_reusable(store, "sha256:k")
+    with pytest.raises(RunNotFoundError):
+        store.record_result("reuse.csv", "pca", "v9", {"n": 1})
@@ -246,12 +246,10 @@ def test_signing_failure_fails_commit_and_cleans_up_orphans(
 ):
     """bloom#581 Decision 5: a signed-url generation failure fails the whole
     commit, same as an upload failure — even though every output already
-    uploaded successfully before the signing step runs. Two outputs, failing
-    on the *second* signing call, mirrors
-    test_commit_failure_cleans_up_orphaned_objects_from_partial_upload above:
-    both objects are already uploaded by the time any signing call runs, so a
-    signing failure on "b" must still clean up "a"'s already-uploaded bytes
-    too, not just leave the failed one."""
+    uploaded successfully before the signing step runs. Two outputs, both
+    already uploaded by the time the (single, bulk) signing call runs, so a
+    signing failure must clean up every already-uploaded object, mirroring
+    test_commit_failure_cleans_up_orphaned_objects_from_partial_upload above."""
     import bloom_mcp.supabase_client as sc
 
     store = SupabaseResultStore()
@@ -259,22 +257,15 @@ def test_signing_failure_fails_commit_and_cleans_up_orphans(
     (run.staging_dir / "a.csv").write_bytes(b"a")
     (run.staging_dir / "b.csv").write_bytes(b"b")
 
-    calls = {"n": 0}
+    def _fail_sign(keys, expires_in):
+        raise RuntimeError("signing service unavailable")
 
-    def _fail_second_sign(key, expires_in):
-        calls["n"] += 1
-        if calls["n"] == 2:
-            raise RuntimeError("signing service unavailable")
-        return f"http://signed/{key}"
-
-    monkeypatch.setattr(sc, "create_signed_url", _fail_second_sign)
+    monkeypatch.setattr(sc, "create_signed_urls", _fail_sign)
 
     with pytest.raises(CommitFailedError):
         store.commit(run, {"a": "a.csv", "b": "b.csv"})
 
     assert store.list_runs("exp.csv", "qc") == []  # latest un-advanced
-    # Both already-uploaded objects are cleaned up — not just the one whose
-    # signing call failed.
     assert not any(k.endswith("a.csv") for k in fake_supabase_storage.objects)
     assert not any(k.endswith("b.csv") for k in fake_supabase_storage.objects)
 
@@ -282,16 +273,19 @@ def test_signing_failure_fails_commit_and_cleans_up_orphans(
 def test_signing_call_returning_no_url_fails_commit_not_silently_none(
     fake_supabase_storage, monkeypatch
 ):
-    """bloom#581: if create_signed_url ever yields no usable URL (e.g. the dict
-    extraction inside SupabaseStorageBackend found nothing to extract), commit
-    must fail loudly rather than build an OutputLink with a None/empty url."""
+    """bloom#581: if signing ever yields no usable URL for a key (e.g. the
+    dict extraction inside SupabaseStorageBackend found nothing to extract),
+    commit must fail loudly rather than build an OutputLink with a None/empty
+    url."""
     import bloom_mcp.supabase_client as sc
 
     store = SupabaseResultStore()
     run = store.create_run(experiment="exp.csv", tool_class="qc", provenance=_prov())
     (run.staging_dir / "a.csv").write_bytes(b"a")
 
-    monkeypatch.setattr(sc, "create_signed_url", lambda key, expires_in: None)
+    monkeypatch.setattr(
+        sc, "create_signed_urls", lambda keys, expires_in: dict.fromkeys(keys)
+    )
 
     with pytest.raises(Exception):
         store.commit(run, {"a": "a.csv"})
@@ -299,6 +293,54 @@ def test_signing_call_returning_no_url_fails_commit_not_silently_none(
     assert store.list_runs("exp.csv", "qc") == []
 
 
+def test_outputs_upload_concurrently_and_sign_in_one_call(
+    fake_supabase_storage, monkeypatch
+):
+    """A multi-output commit overlaps its uploads (bounded by
+    `_UPLOAD_CONCURRENCY`) and signs every key with a single bulk call."""
+    import threading
+    import time
+
+    import bloom_mcp.result_store.supabase_store as _store_mod
+    import bloom_mcp.supabase_client as sc
+
+    store = SupabaseResultStore()
+    run = store.create_run(experiment="exp.csv", tool_class="qc", provenance=_prov())
+    names = [f"o{i}.csv" for i in range(_store_mod._UPLOAD_CONCURRENCY + 2)]
+    for name in names:
+        (run.staging_dir / name).write_bytes(name.encode())
+
+    real_upload = sc.upload_file
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def _slow_upload(key, path):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.05)
+        real_upload(key, path)
+        with lock:
+            in_flight["now"] -= 1
+
+    real_sign = sc.create_signed_urls
+    sign_calls = []
+
+    def _counting_sign(keys, expires_in):
+        sign_calls.append(list(keys))
+        return real_sign(keys, expires_in)
+
+    monkeypatch.setattr(sc, "upload_file", _slow_upload)
+    monkeypatch.setattr(sc, "create_signed_urls", _counting_sign)
+
+    stored = store.commit(run, {name: name for name in names})
+
+    assert in_flight["peak"] == _store_mod._UPLOAD_CONCURRENCY
+    assert len(sign_calls) == 1
+    assert sorted(sign_calls[0]) == sorted(stored.output_keys.values())
+    assert set(stored.output_links) == set(names)
+
+
 def test_cleanup_failure_does_not_mask_original_error(
     fake_supabase_storage, monkeypatch, caplog
 ):
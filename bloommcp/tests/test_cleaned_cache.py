@@ -0,0 +1,215 @@
+"""`cleaned_cache` — resolved cleaned-CSV versions are downloaded and parsed once.
+
+Every analysis tool resolves the same experiment's cleaned CSV; before the cache
+each call downloaded it into a never-deleted temp file and re-parsed it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+from bloom_mcp import cleaned_cache
+from bloom_mcp.cleaned_cache import CleanedCsvCache, CleanedKey
+from manifest_fixtures import append_cleaned_version, write_cleaned_manifest
+
+CSV = b"plant_id,genotype,root_length\n1,A,1.5\n2,B,2.5\n"
+
+
+def _key(content: bytes, version_id: str = "v1") -> CleanedKey:
+    return CleanedKey("exp", "qc", version_id, hashlib.sha256(content).hexdigest())
+
+
+def _writer(content: bytes, calls: list):
+    def _download(dest: Path) -> None:
+        calls.append(dest)
+        dest.write_bytes(content)
+
+    return _download
+
+
+def test_a_verified_download_is_reused(tmp_path):
+    cache = CleanedCsvCache(tmp_path)
+    calls: list = []
+
+    first = cache.fetch(_key(CSV), _writer(CSV, calls))
+    second = cache.fetch(_key(CSV), _writer(CSV, calls))
+
+    assert first == second == cache.path_for(_key(CSV))
+    assert first.read_bytes() == CSV
+    assert len(calls) == 1
+
+
+def test_a_checksum_mismatch_is_served_but_never_reused(tmp_path, caplog):
+    cache = CleanedCsvCache(tmp_path)
+    calls: list = []
+    key = _key(b"what the manifest recorded")
+
+    first = cache.fetch(key, _writer(CSV, calls))
+    second = cache.fetch(key, _writer(CSV, calls))
+
+    assert first.read_bytes() == CSV and first != second
+    assert not cache.path_for(key).exists()
+    assert not cache.is_cached_path(first)
+    assert len(calls) == 2
+    assert "serving it uncached" in caplog.text
+
+
+def test_no_recorded_sha_always_downloads(tmp_path):
+    cache = CleanedCsvCache(tmp_path)
+    calls: list = []
+
+    cache.fetch(None, _writer(CSV, calls))
+    cache.fetch(None, _writer(CSV, calls))
+
+    assert len(calls) == 2
+
+
+def test_a_failed_download_leaves_no_partial_file(tmp_path):
+    cache = CleanedCsvCache(tmp_path)
+
+    def _boom(dest: Path) -> None:
+        dest.write_bytes(b"half")
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        cache.fetch(_key(CSV), _boom)
+
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+def test_disk_is_bounded_least_recently_used_first(tmp_path):
+    blobs = [CSV + bytes(f"{i},C,0\n", "ascii") for i in range(3)]
+    keys = [_key(b, f"v{i}") for i, b in enumerate(blobs)]
+    cache = CleanedCsvCache(tmp_path, max_disk_bytes=sum(map(len, blobs[:2])))
+
+    a = cache.fetch(keys[0], _writer(blobs[0], []))
+    b = cache.fetch(keys[1], _writer(blobs[1], []))
+    os.utime(b, (1, 1))  # b is now the least recently used
+    os.utime(a, (2, 2))
+    cache.fetch(keys[2], _writer(blobs[2], []))
+
+    assert a.exists() and not b.exists()
+    assert cache.path_for(keys[2]).exists()
+
+
+def test_parsed_frames_are_memoized_as_copies(tmp_path, monkeypatch):
+    cache = CleanedCsvCache(tmp_path)
+    path = cache.fetch(_key(CSV), _writer(CSV, []))
+    parses: list = []
+    real = cleaned_cache.pd.read_csv
+    monkeypatch.setattr(
+        cleaned_cache.pd, "read_csv", lambda p: parses.append(p) or real(p)
+    )
+
+    first = cache.read_csv(path)
+    first.loc[0, "root_length"] = -1.0
+    second = cache.read_csv(path)
+
+    assert len(parses) == 1
+    assert second.loc[0, "root_length"] == 1.5
+
+
+def test_frame_memory_is_bounded_by_count(tmp_path):
+    cache = CleanedCsvCache(tmp_path, max_frames=1)
+    a = cache.fetch(_key(CSV, "v1"), _writer(CSV, []))
+    b = cache.fetch(_key(CSV, "v2"), _writer(CSV, []))
+
+    cache.read_csv(a)
+    cache.read_csv(b)
+
+    assert list(cache._frames) == [b]
+
+
+def test_unverified_files_are_parsed_every_time(tmp_path, monkeypatch):
+    cache = CleanedCsvCache(tmp_path)
+    path = cache.fetch(None, _writer(CSV, []))
+    parses: list = []
+    real = cleaned_cache.pd.read_csv
+    monkeypatch.setattr(
+        cleaned_cache.pd, "read_csv", lambda p: parses.append(p) or real(p)
+    )
+
+    cache.read_csv(path)
+    cache.read_csv(path)
+
+    assert len(parses) == 2
+
+
+# ─── through `_resolve_versioned_cleaned` ─────────────────────────────────────
+
+
+def _count_downloads(monkeypatch) -> list:
+    import bloom_mcp.supabase_client as sc
+
+    calls: list = []
+    real = sc.download_file
+    monkeypatch.setattr(
+        sc, "download_file", lambda key, dest: calls.append(key) or real(key, dest)
+    )
+    return calls
+
+
+def test_repeat_resolution_downloads_once(local_manifest_backend, monkeypatch):
+    from bloom_mcp import experiment_utils as eu
+
+    write_cleaned_manifest(
+        local_manifest_backend, "exp", "qc", "v1", "2026-07-06T00:00:00Z", CSV
+    )
+    downloads = _count_downloads(monkeypatch)
+
+    results = [
+        eu._resolve_versioned_cleaned(eu.OUTPUT_DIR, "exp", "latest") for _ in range(3)
+    ]
+
+    assert len(downloads) == 1
+    assert {r[0] for r in results} == {results[0][0]}
+    assert all(label == "v1_cleaned" and err is None for _, label, err in results)
+
+
+def test_moving_latest_resolves_the_new_version(local_manifest_backend):
+    from bloom_mcp import experiment_utils as eu
+
+    write_cleaned_manifest(
+        local_manifest_backend, "exp", "qc", "v1", "2026-07-06T00:00:00Z", CSV
+    )
+    eu._resolve_versioned_cleaned(eu.OUTPUT_DIR, "exp", "latest")
+    append_cleaned_version(
+        local_manifest_backend,
+        "exp",
+        "qc",
+        "v2",
+        "2026-07-06T00:01:00Z",
+        b"plant_id,root_length\n9,9.5\n",
+        tool="qc_clean",
+        based_on_version="raw",
+    )
+
+    path, label, err = eu._resolve_versioned_cleaned(eu.OUTPUT_DIR, "exp", "latest")
+
+    assert err is None and label == "v2_cleaned"
+    assert path.read_bytes() == b"plant_id,root_length\n9,9.5\n"
+
+
+def test_load_experiment_data_reuses_the_parsed_frame(
+    local_manifest_backend, monkeypatch
+):
+    from bloom_mcp import experiment_utils as eu
+
+    write_cleaned_manifest(
+        local_manifest_backend, "exp", "qc", "v1", "2026-07-06T00:00:00Z", CSV
+    )
+    parses: list = []
+    real = cleaned_cache.pd.read_csv
+    monkeypatch.setattr(
+        cleaned_cache.pd, "read_csv", lambda p: parses.append(p) or real(p)
+    )
+
+    first = eu.load_experiment_data("exp.csv")
+    second = eu.load_experiment_data("exp.csv")
+
+    assert first[3] == second[3] == "v1_cleaned"
+    assert first[0].equals(second[0]) and first[0] is not second[0]
+    assert len(parses) == 1
@@ -21,6 +21,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from storage3.exceptions import StorageApiError
 
 from bloom_mcp import storage_backend as sb
 from manifest_fixtures import write_cleaned_manifest, write_invalid_schema_manifest
@@ -397,38 +398,89 @@ class _FakeSbClient:
             return "bucket-proxy"
 
 
-def test_get_storage_client_default_passes_no_options_override(monkeypatch):
+def _capture_create_client(monkeypatch, captured):
     import bloom_mcp.supabase_client as sc
 
-    captured = {}
-
     def _fake_create_client(url, key, options=None):
-        captured["options"] = options
+        captured.append(options)
         return _FakeSbClient()
 
     monkeypatch.setenv("SUPABASE_URL", "http://x")
     monkeypatch.setenv("BLOOM_AGENT_KEY", "k")
     monkeypatch.setattr(sc.supabase, "create_client", _fake_create_client)
+    return sc
+
+
+def test_get_storage_client_default_uses_the_storage_timeout(monkeypatch):
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
 
     sc.get_storage_client()
-    assert captured["options"] is None
+    assert captured[0].httpx_client.timeout.read == sc.DEFAULT_STORAGE_CLIENT_TIMEOUT
 
 
 def test_get_storage_client_timeout_override_builds_client_options(monkeypatch):
-    import bloom_mcp.supabase_client as sc
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
 
-    captured = {}
+    sc.get_storage_client(timeout_seconds=5.0)
+    assert captured[0].httpx_client.timeout.read == 5.0
 
-    def _fake_create_client(url, key, options=None):
-        captured["options"] = options
-        return _FakeSbClient()
 
-    monkeypatch.setenv("SUPABASE_URL", "http://x")
-    monkeypatch.setenv("BLOOM_AGENT_KEY", "k")
-    monkeypatch.setattr(sc.supabase, "create_client", _fake_create_client)
+def test_storage_clients_are_built_once_per_timeout(monkeypatch):
+    """A qc_clean commit makes a dozen storage calls; they must not each build a client."""
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
 
+    for _ in range(12):
+        sc.get_storage_client()
     sc.get_storage_client(timeout_seconds=5.0)
-    assert captured["options"].storage_client_timeout == 5.0
+    sc.get_storage_client(timeout_seconds=5.0)
+
+    assert len(captured) == 2
+
+
+def test_every_client_shares_one_connection_pool(monkeypatch):
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
+
+    sc.get_storage_client()
+    sc.get_storage_client(timeout_seconds=5.0)
+    sc.get_postgrest_client()
+
+    transports = {id(options.httpx_client._transport) for options in captured}
+    assert len(transports) == 1
+
+
+def test_a_rotated_key_gets_a_fresh_client(monkeypatch):
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
+
+    sc.get_storage_client()
+    monkeypatch.setenv("BLOOM_AGENT_KEY", "rotated")
+    sc.get_storage_client()
+
+    assert len(captured) == 2
+
+
+def test_concurrent_callers_share_one_client(monkeypatch):
+    import threading
+
+    captured = []
+    sc = _capture_create_client(monkeypatch, captured)
+    barrier = threading.Barrier(8)
+
+    def _call():
+        barrier.wait()
+        sc.get_postgrest_client()
+
+    threads = [threading.Thread(target=_call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(captured) == 1
 
 
 # ─── 3. Root resolution + startup validation ──────────────────────────────────
@@ -595,7 +647,7 @@ class _FakeSbStorageClient:
     `SupabaseStorageBackend`'s methods call via `get_storage_client()`.
 
     Unlike the `fake_supabase_storage` fixture (which monkeypatches
-    `bloom_mcp.manifest.manifest`'s module-level `list_prefix`/`read_json`/
+    `bloom_mcp.manifest.manifest`'s module-level `read_json_if_exists`/
     `write_json` directly, bypassing `storage_backend.active_backend()`
     dispatch entirely), patching only `get_storage_client` lets the real
     `SupabaseStorageBackend` class run through the real dispatch path — so a
@@ -612,7 +664,8 @@ class _FakeSbStorageClient:
 
     def download(self, path):
         if path not in self.objects:
-            raise KeyError(f"object not found: {path}")
+            # What storage3 raises for Supabase Storage's missing-object reply.
+            raise StorageApiError("Object not found", "not_found", 404)
         return self.objects[path]
 
     def list(self, prefix):
@@ -1091,7 +1144,7 @@ def test_latest_outliers_manifest_read_fails_is_a_hard_error(
     local_manifest_backend, monkeypatch
 ):
     """A storage/network failure during the manifest *lookup itself* (`get_version`'s
-    `read_manifest()` call, via its own unguarded `list_prefix`) must propagate as a
+    `read_manifest()` call, via its own unguarded read) must propagate as a
     caller-safe hard error -- not an uncaught raw exception, and not a silent
     fall-through to `qc`'s otherwise-valid entry. Before this fix, `_resolve_one_class`
     only caught `ManifestSchemaError` around this call, so this exact failure escaped
@@ -1102,16 +1155,16 @@ def test_latest_outliers_manifest_read_fails_is_a_hard_error(
     write_cleaned_manifest(
         local_manifest_backend, "exp", "qc", "v1", "2026-07-06T00:00:00Z", b"a,b\n1,2\n"
     )
-    real_list_prefix = manifest_mod.list_prefix
+    real_read = manifest_mod.read_json_if_exists
 
-    def _boom(prefix: str):
-        if prefix.startswith("bloommcp_output/outliers_"):
+    def _boom(key: str):
+        if key.startswith("bloommcp_output/outliers_"):
             raise RuntimeError("connection reset by peer at 10.0.0.5:5432")
-        return real_list_prefix(prefix)
+        return real_read(key)
 
-    monkeypatch.setattr(manifest_mod, "list_prefix", _boom)
+    monkeypatch.setattr(manifest_mod, "read_json_if_exists", _boom)
     # A schema-valid `outliers` manifest that would otherwise resolve cleanly --
-    # the failure is injected purely via the monkeypatched list_prefix above, not
+    # the failure is injected purely via the monkeypatched read above, not
     # via a malformed manifest, so this isolates the manifest-*read* hazard from
     # the already-covered manifest-*schema* hazard.
     write_cleaned_manifest(
@@ -1782,3 +1835,140 @@ def test_supabase_client_reexports_create_signed_url(monkeypatch):
     monkeypatch.setattr(sb_module, "active_backend", lambda: _FakeBackend())
     assert sc.create_signed_url("k", 3600) == "http://x/signed"
     assert captured["args"] == ("k", 3600)
+
+
+# ─── 9. Single-read manifest lookup + bulk signing ──────────────────────────────
+
+
+class _FakeReadClient:
+    """Stand-in for the storage3 bucket client's download, raising ``error``."""
+
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+
+    def download(self, path):
+        raise self._error
+
+
+# Supabase Storage has answered a missing object both as a real 404 and as a
+# 400 whose body says 404/not_found.
+@pytest.mark.parametrize("status", [404, "404"])
+def test_supabase_read_json_if_exists_maps_not_found_to_none(monkeypatch, status):
+    client = _FakeReadClient(StorageApiError("Object not found", "not_found", status))
+    monkeypatch.setattr(
+        "bloom_mcp.supabase_client.get_storage_client", lambda **_k: client
+    )
+    assert sb.SupabaseStorageBackend().read_json_if_exists("m.json") is None
+
+
+def test_supabase_read_json_if_exists_raises_other_failures(monkeypatch):
+    client = _FakeReadClient(StorageApiError("denied", "AccessDenied", 403))
+    monkeypatch.setattr(
+        "bloom_mcp.supabase_client.get_storage_client", lambda **_k: client
+    )
+    with pytest.raises(StorageApiError):
+        sb.SupabaseStorageBackend().read_json_if_exists("m.json")
+
+
+def test_local_read_json_if_exists(tmp_path):
+    b = sb.LocalStorageBackend(tmp_path)
+    assert b.read_json_if_exists("p/manifest.json") is None
+    b.write_json("p/manifest.json", {"a": 1})
+    assert b.read_json_if_exists("p/manifest.json") == {"a": 1}
+
+
+def test_read_manifest_is_one_storage_read(
+    fake_supabase_storage, monkeypatch, tmp_path
+):
+    """The manifest lookup costs one read whether or not the manifest exists —
+    no `list_prefix` existence check first."""
+    import bloom_mcp.manifest.manifest as manifest_mod
+    from bloom_mcp.manifest import AnalysisDir
+
+    reads = []
+    real_read = manifest_mod.read_json_if_exists
+
+    def _counting_read(key):
+        reads.append(key)
+        return real_read(key)
+
+    monkeypatch.setattr(manifest_mod, "read_json_if_exists", _counting_read)
+    adir = AnalysisDir("bloommcp_output", "exp.csv", "qc")
+
+    assert adir.read_manifest() is None
+    write_cleaned_manifest(tmp_path, "exp", "qc", "v1", "2026-07-06T00:00:00Z", b"a\n")
+    assert adir.read_manifest() is not None
+    assert reads == ["bloommcp_output/qc_exp/manifest.json"] * 2
+
+
+class _FakeBulkSignClient(_FakeSignClient):
+    """Adds storage3's bulk ``create_signed_urls`` to ``_FakeSignClient``."""
+
+    def __init__(self, items):
+        super().__init__(None)
+        self._items = items
+        self.bulk_calls: list[tuple[list[str], int]] = []
+
+    def create_signed_urls(self, paths, expires_in):
+        self.bulk_calls.append((list(paths), expires_in))
+        return self._items
+
+
+def test_supabase_create_signed_urls_uses_the_bulk_endpoint(monkeypatch):
+    client = _FakeBulkSignClient(
+        [
+            {"path": "a", "error": None, "signedURL": "http://kong:8000/sign/a?t=1"},
+            {"path": "b", "error": None, "signedURL": "http://kong:8000/sign/b?t=2"},
+        ]
+    )
+    monkeypatch.setattr(
+        "bloom_mcp.supabase_client.get_storage_client", lambda **_k: client
+    )
+    monkeypatch.setenv("SUPABASE_URL", "http://kong:8000")
+    monkeypatch.setenv("BLOOM_PUBLIC_SUPABASE_URL", "https://pub.example")
+
+    urls = sb.SupabaseStorageBackend().create_signed_urls(["a", "b"], 3600)
+
+    assert urls == {
+        "a": "https://pub.example/sign/a?t=1",
+        "b": "https://pub.example/sign/b?t=2",
+    }
+    assert client.bulk_calls == [(["a", "b"], 3600)]
+    assert client.calls == []  # no per-key signing round trips
+
+
+def test_supabase_create_signed_urls_fails_on_any_unsigned_key(monkeypatch):
+    client = _FakeBulkSignClient(
+        [
+            {"path": "a", "error": None, "signedURL": "http://x/sign/a"},
+            {
+                "path": "b",
+                "error": "Either the object does not exist",
+                "signedURL": None,
+            },
+        ]
+    )
+    monkeypatch.setattr(
+        "bloom_mcp.supabase_client.get_storage_client", lambda **_k: client
+    )
+    with pytest.raises(sb.StorageBackendError, match="key: b"):
+        sb.SupabaseStorageBackend().create_signed_urls(["a", "b"], 3600)
+
+
+def test_supabase_create_signed_urls_falls_back_to_per_key_signing(monkeypatch):
+    client = _FakeSignClient({"signedURL": "http://x/signed"})
+    monkeypatch.setattr(
+        "bloom_mcp.supabase_client.get_storage_client", lambda **_k: client
+    )
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+
+    urls = sb.SupabaseStorageBackend().create_signed_urls(["a", "b"], 60)
+
+    assert urls == {"a": "http://x/signed", "b": "http://x/signed"}
+    assert client.calls == [("a", 60), ("b", 60)]
+
+
+def test_local_create_signed_urls(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOOM_STORAGE_URL", "http://localhost/storage/")
+    urls = sb.LocalStorageBackend(tmp_path).create_signed_urls(["k/a.csv"], 60)
+    assert urls == {"k/a.csv": "http://localhost/storage/k/a.csv"}
@@ -2,9 +2,8 @@
 add-bloommcp-caller-identity design.md Decision 8: this function did not
 exist on this change's base branch; it is not a reuse of anything).
 
-Follows `get_postgrest_client()`'s existing per-call-fresh-client convention:
-construct a client, call `.rpc(function_name, params).execute()`, return the
-rows. Runs with no live Supabase (see conftest) — the client itself is
+Asks `get_postgrest_client()` for the (pooled) client on every call, calls
+`.rpc(function_name, params).execute()`, and returns the rows. Runs with no live Supabase (see conftest) — the client itself is
 monkeypatched here; `fake_bloommcp_rpc` (conftest.py) monkeypatches
 `call_rpc` directly for tests of code that merely *calls* it.
 """
@@ -48,9 +47,9 @@ def test_call_rpc_delegates_to_postgrest_client_and_returns_rows(monkeypatch):
     assert calls == [("record_bloommcp_usage", {"p_identity": "x", "p_action": "y"})]
 
 
-def test_call_rpc_uses_a_fresh_client_per_call(monkeypatch):
-    """Matches `get_postgrest_client()`'s own per-call-fresh-client convention
-    — no caching of the client across calls."""
+def test_call_rpc_resolves_the_client_per_call(monkeypatch):
+    """`call_rpc` holds no client of its own — it asks `get_postgrest_client()`
+    every time, so the pooled client (and a rotated key) is picked up."""
     client_build_count = {"n": 0}
 
     def _build():
@@ -103,7 +103,7 @@ def test_same_seed_identical_labels(injected_ports, monkeypatch, overrides):
     """Same seed + inputs → element-wise identical cluster_labels (NOT a tolerance compare)."""
     _reader, store = injected_ports
     first = _labels_of(store, monkeypatch, seed=_SEED, **overrides)
-    second = _labels_of(store, monkeypatch, seed=_SEED, **overrides)
+    second = _labels_of(store, monkeypatch, seed=_SEED, force=True, **overrides)
     assert first == second  # element-wise identical
 
 
@@ -624,7 +624,8 @@ def test_labels_csv_carries_sample_identity(injected_ports, monkeypatch):
 def test_second_run_increments_version(injected_ports):
     _reader, store = injected_ports
     _run(method="kmeans", n_clusters=3)
-    _run(method="kmeans", n_clusters=3)
+    # force: an identical run is otherwise reused, not recomputed
+    _run(method="kmeans", n_clusters=3, force=True)
     assert [r.run_ref for r in store.list_runs(_EXPERIMENT, "clustering")] == [
         "v1",
         "v2",
@@ -680,7 +681,9 @@ def test_hierarchical_deterministic_without_seed(injected_ports, monkeypatch):
     """Two hierarchical runs on the same input produce element-wise identical labels."""
     _reader, store = injected_ports
     first = _labels_of(store, monkeypatch, method="hierarchical", n_clusters=3)
-    second = _labels_of(store, monkeypatch, method="hierarchical", n_clusters=3)
+    second = _labels_of(
+        store, monkeypatch, method="hierarchical", n_clusters=3, force=True
+    )
     assert first == second
 
 
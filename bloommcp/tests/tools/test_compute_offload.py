@@ -0,0 +1,135 @@
+"""The compute-pool offload (``bloom_mcp.tools._compute``).
+
+Runs a real one-worker pool (no warm imports, so each test starts fast) over
+stdlib jobs and pins what the tools rely on: results come back, a job's
+exception is re-raised with its original type, and a timeout, a memory-cap hit,
+or a dead worker each become a ``tool_error`` and leave the pool usable.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bloom_mcp.contract import BloomMCPError
+from bloom_mcp.tools import _compute
+from bloom_mcp.tools._compute import ComputePool, offload
+
+
+def _raise_structured() -> None:
+    raise BloomMCPError(code="assumption_violated", message="too few", remedy="add")
+
+
+def _allocate(n_bytes: int) -> int:
+    return len(bytearray(n_bytes))
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _die() -> None:
+    os._exit(3)
+
+
+@pytest.fixture
+def pool():
+    pool = ComputePool(1, timeout=5, warm_modules=())
+    yield pool
+    pool.shutdown()
+
+
+def test_runs_job_in_a_worker_process(pool):
+    assert pool.run(math.factorial, 10) == 3628800
+    assert pool.run(_pid) != os.getpid()
+
+
+def test_exception_type_survives_the_boundary(pool):
+    with pytest.raises(ValueError, match="invalid literal") as info:
+        pool.run(int, "x")
+    # The worker traceback is kept for the server-side log.
+    assert "invalid literal" in str(info.value.__cause__)
+
+    with pytest.raises(BloomMCPError) as info:
+        pool.run(_raise_structured)
+    assert info.value.to_dict() == {
+        "code": "assumption_violated",
+        "message": "too few",
+        "remedy": "add",
+    }
+
+
+def test_timeout_kills_only_that_job(pool):
+    pool.timeout = 0.5
+    first = pool.run(_pid)
+    with pytest.raises(BloomMCPError) as info:
+        pool.run(time.sleep, 30)
+    assert info.value.code == "tool_error"
+    assert "time limit" in info.value.message
+    pool.timeout = 5
+    assert pool.run(_pid) != first
+
+
+def test_dead_worker_is_replaced(pool):
+    with pytest.raises(BloomMCPError) as info:
+        pool.run(_die)
+    assert info.value.code == "tool_error"
+    assert pool.run(math.factorial, 5) == 120
+
+
+def test_memory_cap_becomes_tool_error():
+    pool = ComputePool(1, timeout=10, memory_mb=64, warm_modules=())
+    try:
+        assert pool.run(_allocate, 1024) == 1024
+        with pytest.raises(BloomMCPError) as info:
+            pool.run(_allocate, 2 * 1024**3)
+        assert info.value.code == "tool_error"
+        assert "memory limit" in info.value.message
+        assert pool.run(_allocate, 1024) == 1024
+    finally:
+        pool.shutdown()
+
+
+def test_delegate_result_matches_inline():
+    from sleap_roots_analyze import perform_pca_analysis
+
+    # Warmed, as in production: the import is paid at startup, not by the job.
+    pool = ComputePool(1, timeout=60, warm_modules=("sleap_roots_analyze",))
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(20, 4)), columns=list("abcd"))
+    try:
+        remote = pool.run(perform_pca_analysis, df, n_components=2)
+    finally:
+        pool.shutdown()
+    inline = perform_pca_analysis(df, n_components=2)
+    np.testing.assert_allclose(
+        np.asarray(remote["explained_variance_ratio"]),
+        np.asarray(inline["explained_variance_ratio"]),
+    )
+
+
+def test_offload_is_inline_without_workers(monkeypatch):
+    monkeypatch.delenv("BLOOM_MCP_COMPUTE_WORKERS", raising=False)
+    _compute.shutdown_pool()
+    try:
+        assert offload(_pid) == os.getpid()
+        assert _compute.warm_pool() is None
+    finally:
+        _compute.shutdown_pool()
+
+
+def test_offload_uses_the_configured_pool(monkeypatch):
+    monkeypatch.setenv("BLOOM_MCP_COMPUTE_WORKERS", "1")
+    monkeypatch.setattr(_compute, "WARM_MODULES", ())
+    _compute.shutdown_pool()
+    try:
+        assert offload(_pid) != os.getpid()
+        assert _compute.warm_pool().workers == 1
+    finally:
+        _compute.shutdown_pool()
@@ -672,7 +672,7 @@ def test_committed_stats_run_composes_over_real_ports(fake_supabase_storage):
 def test_second_run_increments_version(injected_ports):
     _reader, store = injected_ports
     _run()
-    _run()
+    _run(force=True)  # an identical run is otherwise reused, not recomputed
     assert [r.run_ref for r in store.list_runs(_EXPERIMENT, "stats")] == ["v1", "v2"]
     assert store.get_run(_EXPERIMENT, "stats", "latest").run_ref == "v2"
 
@@ -316,11 +316,24 @@ def test_persists_artifacts_and_returns_links_not_matrices(injected_ports):
 def test_second_run_increments_version(injected_ports):
     _reader, store = injected_ports
     _run()
-    _run()
+    _run(force=True)  # an identical run is otherwise reused, not recomputed
     assert [r.run_ref for r in store.list_runs(_EXPERIMENT, "pca")] == ["v1", "v2"]
     assert store.get_run(_EXPERIMENT, "pca", "latest").run_ref == "v2"
 
 
+def test_identical_rerun_reuses_the_committed_run(injected_ports):
+    """Same params on the same cleaned frame: the earlier run comes back, with
+    fresh links, and nothing new is committed."""
+    _reader, store = injected_ports
+    first = _run()
+    second = _run()
+    assert [r.run_ref for r in store.list_runs(_EXPERIMENT, "pca")] == ["v1"]
+    assert second.model_dump(exclude={"output_links"}) == first.model_dump(
+        exclude={"output_links"}
+    )
+    assert set(second.output_links) == set(first.output_links)
+
+
 # ── 9. Review hardening — silent-inconsistency + provenance gaps (PR #377) ───
 
 
@@ -519,7 +519,7 @@ def test_persisted_figures_round_trip_as_real_bytes(fake_supabase_storage):
 def test_second_run_increments_version(injected_ports):
     _reader, store = injected_ports
     _run()
-    _run()
+    _run(force=True)  # an identical run is otherwise reused, not recomputed
     assert [r.run_ref for r in store.list_runs(_EXPERIMENT, "qc_inspect")] == [
         "v1",
         "v2",
@@ -0,0 +1,161 @@
+"""Packed per-dataset scRNA count matrix: one storage object, one block per gene.
+
+`scripts/upload_scrna.py` writes a dataset's whole genes x cells matrix as a
+single object (`counts/{dataset_name}.csr` in the `scrna` bucket) instead of
+one JSON object per gene, and the agent's scRNA tools read a gene back with
+one ranged GET of just that gene's block. Layout (all little-endian):
+
+    offset 0            magic  b"BLMCSR01"
+    offset 8            uint32 n_genes, uint32 n_cells
+    offset 16           uint64 block_offsets[n_genes + 1]   (absolute, in bytes)
+    block_offsets[i]    gene i's block, block_offsets[i+1] - block_offsets[i] bytes
+
+A block is the zlib-compressed concatenation of the gene's nonzero cells as
+uint32 cell numbers (ascending) followed by their values as float32; an
+all-zero gene has an empty (zero-length) block. The offsets index lives in the
+header so the object is self-describing, and is also stored per gene in
+`scrna_counts.counts_byte_offset` / `counts_byte_length` (next to the object's
+path, `counts_packed_path`) so a reader needs no extra round trip to find a
+block.
+
+The per-cluster summary helpers at the bottom are shared the same way: the
+uploader aggregates a whole matrix with them, the cluster tool one gene.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+MAGIC = b"BLMCSR01"
+_HEADER = struct.Struct("<8sII")
+
+# Ranged reads for several genes are merged into one GET when the bytes
+# between their blocks are no more than this; blocks are written in gene
+# order, so neighbouring genes usually coalesce.
+COALESCE_GAP_BYTES = 64 * 1024
+
+
+def pack_counts(matrix) -> tuple[bytes, np.ndarray]:
+    """Pack a genes x cells sparse matrix; return (object bytes, block offsets).
+
+    `block_offsets` has n_genes + 1 entries: gene i's block is
+    `data[block_offsets[i]:block_offsets[i + 1]]`.
+    """
+    csr = csr_matrix(matrix)
+    csr.sort_indices()
+    n_genes, n_cells = csr.shape
+    blocks = []
+    for gene in range(n_genes):
+        start, end = csr.indptr[gene], csr.indptr[gene + 1]
+        if start == end:
+            blocks.append(b"")
+            continue
+        cells = csr.indices[start:end].astype("<u4")
+        values = csr.data[start:end].astype("<f4")
+        blocks.append(zlib.compress(cells.tobytes() + values.tobytes()))
+
+    index_size = 8 * (n_genes + 1)
+    offsets = np.empty(n_genes + 1, dtype="<u8")
+    offsets[0] = _HEADER.size + index_size
+    offsets[1:] = offsets[0] + np.cumsum([len(b) for b in blocks], dtype=np.uint64)
+    data = b"".join([_HEADER.pack(MAGIC, n_genes, n_cells), offsets.tobytes(), *blocks])
+    return data, offsets
+
+
+def read_index(data: bytes) -> tuple[int, np.ndarray]:
+    """Parse a packed object's header; return (n_cells, block offsets)."""
+    magic, n_genes, n_cells = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"not a packed count matrix (magic {magic!r})")
+    offsets = np.frombuffer(data, dtype="<u8", count=n_genes + 1, offset=_HEADER.size)
+    return n_cells, offsets
+
+
+def unpack_block(block: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Decode one gene's block into (cell numbers, values)."""
+    if not block:
+        return np.empty(0, dtype="<u4"), np.empty(0, dtype="<f4")
+    raw = zlib.decompress(block)
+    nnz = len(raw) // 8
+    cells = np.frombuffer(raw, dtype="<u4", count=nnz)
+    values = np.frombuffer(raw, dtype="<f4", count=nnz, offset=4 * nnz)
+    return cells, values
+
+
+def coalesce_ranges(
+    ranges: list[tuple[int, int]], gap: int = COALESCE_GAP_BYTES
+) -> list[tuple[int, int]]:
+    """Merge (offset, length) block ranges into as few spans as `gap` allows.
+
+    Returns (offset, length) spans covering every input range, in offset order.
+    """
+    spans: list[list[int]] = []
+    for offset, length in sorted(ranges):
+        end = offset + length
+        if spans and offset - spans[-1][1] <= gap:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([offset, end])
+    return [(start, end - start) for start, end in spans]
+
+
+# ─── Per-cluster expression summaries ────────────────────────────────────────
+#
+# A dataset's cell -> cluster assignment is held as `codes`, an int array
+# indexed by cell number giving the cell's position in the dataset's list of
+# cluster ids (-1 for a cell with no cluster).
+
+
+def cluster_codes(cell_numbers, cluster_ids) -> tuple[np.ndarray, list]:
+    """Encode (cell number, cluster id) pairs as (codes, distinct cluster ids)."""
+    cell_numbers = np.asarray(cell_numbers, dtype=np.int64)
+    labels, uniques = pd.factorize(pd.Series(cluster_ids, dtype=object), sort=True)
+    size = int(cell_numbers.max()) + 1 if len(cell_numbers) else 0
+    codes = np.full(size, -1, dtype=np.int32)
+    codes[cell_numbers] = labels
+    return codes, list(uniques)
+
+
+def summarize_gene(cells, values, codes, n_clusters) -> tuple[np.ndarray, np.ndarray]:
+    """Expressing-cell counts and summed expression per cluster for one gene.
+
+    Both results have n_clusters + 1 slots; the last collects cells with no
+    cluster (code -1, or a cell number past the end of `codes`).
+    """
+    idx = np.full(len(cells), n_clusters, dtype=np.int64)
+    known = cells < len(codes)
+    idx[known] = codes[cells[known]]
+    idx[idx < 0] = n_clusters
+    expressed = values > 0
+    expressing = np.bincount(idx[expressed], minlength=n_clusters + 1)
+    sums = np.bincount(
+        idx[expressed], weights=values[expressed], minlength=n_clusters + 1
+    )
+    return expressing, sums
+
+
+def summarize_matrix(matrix, codes, n_clusters) -> tuple[np.ndarray, np.ndarray]:
+    """`summarize_gene` for every gene of a genes x cells matrix at once.
+
+    Returns genes x (n_clusters + 1) arrays, the last column collecting cells
+    with no cluster, as in `summarize_gene`.
+    """
+    csr = csr_matrix(matrix)
+    positive = csr.multiply(csr > 0).tocsr()
+    n_cells = csr.shape[1]
+    idx = np.full(n_cells, n_clusters, dtype=np.int64)
+    known = min(n_cells, len(codes))
+    idx[:known] = codes[:known]
+    idx[idx < 0] = n_clusters
+    membership = csr_matrix(
+        (np.ones(n_cells), (np.arange(n_cells), idx)),
+        shape=(n_cells, n_clusters + 1),
+    )
+    expressing = (positive > 0).astype(np.int64) @ membership
+    sums = positive @ membership
+    return np.asarray(expressing.todense()).astype(np.int64), np.asarray(sums.todense())
@@ -33,6 +33,7 @@ from mcp_config import MCP_SERVERS
 from routes import chat as chat_routes
 from schemas import CreateThreadRequest, ModelsResponse, MCPToolsResponse
 from helpers.foundational_tools import is_foundational_tool
+from tools.rest_client import aclose_clients
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,7 @@ async def lifespan(app: FastAPI):
     yield
 
     deps.clear_runtime_state()
+    await aclose_clients()
     if hasattr(app.state, 'checkpointer') and app.state.checkpointer:
         try:
             await app.state.checkpointer.conn.close()
@@ -10,6 +10,9 @@ does that, so no real Postgres/Supabase/vLLM network call ever happens —
 only the module-level presence checks need satisfying.
 """
 
+from types import SimpleNamespace
+
+import httpx
 import pytest
 
 
@@ -49,3 +52,27 @@ def client(_required_env):
         yield TestClient(server.app)
     finally:
         server.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Route the pooled clients through a MockTransport whose handler each test
+    installs via `transport.handler`; drop any client (and any cached trait
+    counts or cluster assignments) left from a prior test."""
+    from tools import rest_client
+    from tools.cyl_tools import _trait_counts_cache
+    from tools.scrna_tools import _cluster_assignments
+
+    state = SimpleNamespace(handler=None)
+    mock = httpx.MockTransport(lambda request: state.handler(request))
+    real_kwargs = rest_client._client_kwargs
+    monkeypatch.setattr(
+        rest_client, "_client_kwargs", lambda: {**real_kwargs(), "transport": mock}
+    )
+    monkeypatch.setattr(rest_client, "_sync_client", None)
+    monkeypatch.setattr(
+        rest_client, "_async_clients", rest_client.weakref.WeakKeyDictionary()
+    )
+    _trait_counts_cache.clear()
+    _cluster_assignments.clear()
+    return state
@@ -0,0 +1,138 @@
+"""The compare_* tools ask PostgREST for only the resolved trait's values on
+the scans their age mode uses (embedded-resource filters on the nested
+`cyl_scans`/`cyl_scan_traits` select) and aggregate what comes back.
+
+The fake PostgREST below answers each table from fixed rows and records the
+query parameters, so the tests pin both the filters sent and the result."""
+
+import importlib
+
+import httpx
+import pytest
+
+TRAIT_ID = 7
+
+
+def _postgrest(rows_by_table, seen):
+    def handler(request):
+        table = request.url.path.rsplit("/", 1)[-1]
+        seen.setdefault(table, []).append(dict(request.url.params))
+        return httpx.Response(200, json=rows_by_table.get(table, []))
+
+    return handler
+
+
+def _scan(age, value):
+    """A nested scan as PostgREST returns it once the trait filter applied."""
+    traits = [] if value is None else [{"value": value, "trait_id": TRAIT_ID}]
+    return {"plant_age_days": age, "cyl_scan_traits": traits}
+
+
+@pytest.fixture
+def no_plots(monkeypatch):
+    cyl_module = importlib.import_module("tools.cyl_tools")
+    monkeypatch.setattr(cyl_module, "render_and_save", lambda fig, **kw: "plot.png")
+
+
+def _wave_rows(plants):
+    return {
+        "cyl_trait_by_experiment_wave": [{"trait_name": "root_length"}],
+        "cyl_traits": [{"id": TRAIT_ID}],
+        "cyl_plants": plants,
+    }
+
+
+def test_compare_accessions_filters_to_trait_and_latest_aged_scans(transport, no_plots):
+    from tools import compare_accessions_in_wave_tool
+
+    seen: dict = {}
+    transport.handler = _postgrest(
+        _wave_rows(
+            [
+                # Latest scan (day 21) carries no value for the trait: the
+                # plant contributes nothing rather than falling back to day 14.
+                {
+                    "id": 1,
+                    "accessions": {"name": "A"},
+                    "cyl_scans": [_scan(14, 5.0), _scan(21, None)],
+                },
+                {
+                    "id": 2,
+                    "accessions": {"name": "A"},
+                    "cyl_scans": [_scan(14, 1.0), _scan(21, 3.0)],
+                },
+                {"id": 3, "accessions": {"name": "B"}, "cyl_scans": [_scan(21, 9.0)]},
+            ]
+        ),
+        seen,
+    )
+
+    result = compare_accessions_in_wave_tool.invoke(
+        {"trait_name": "root_length", "wave_id": 4}
+    )
+
+    (params,) = seen["cyl_plants"]
+    assert params["cyl_scans.cyl_scan_traits.trait_id"] == f"eq.{TRAIT_ID}"
+    assert params["cyl_scans.plant_age_days"] == "not.is.null"
+    assert params["wave_id"] == "eq.4"
+    assert {r["accession_name"]: r["n"] for r in result["rankings"]} == {"A": 1, "B": 1}
+    assert result["rankings"][0]["accession_name"] == "B"
+
+
+def test_compare_accessions_specific_age_is_filtered_server_side(transport, no_plots):
+    from tools import compare_accessions_in_wave_tool
+
+    seen: dict = {}
+    transport.handler = _postgrest(
+        _wave_rows(
+            [{"id": 1, "accessions": {"name": "A"}, "cyl_scans": [_scan(14, 2.0)]}]
+        ),
+        seen,
+    )
+
+    result = compare_accessions_in_wave_tool.invoke(
+        {"trait_name": "root_length", "wave_id": 4, "plant_age_days": 14}
+    )
+
+    (params,) = seen["cyl_plants"]
+    assert params["cyl_scans.plant_age_days"] == "eq.14"
+    assert result["rankings"][0]["mean"] == 2.0
+
+
+def test_compare_waves_keeps_plants_without_matching_scans_for_coverage(
+    transport, no_plots
+):
+    from tools import compare_waves_for_accession_tool
+
+    seen: dict = {}
+    transport.handler = _postgrest(
+        {
+            "cyl_waves": [
+                {"id": 10, "number": 1, "name": "w1"},
+                {"id": 11, "number": 2, "name": "w2"},
+            ],
+            "cyl_trait_by_experiment_wave": [{"trait_name": "root_length"}],
+            "cyl_traits": [{"id": TRAIT_ID}],
+            "accessions": [{"id": 3}],
+            "cyl_plants": [
+                {"id": 1, "wave_id": 10, "cyl_scans": [_scan(21, 4.0)]},
+                {"id": 2, "wave_id": 11, "cyl_scans": []},  # no scan at that age
+            ],
+        },
+        seen,
+    )
+
+    result = compare_waves_for_accession_tool.invoke(
+        {
+            "trait_name": "root_length",
+            "accession_name": "A",
+            "experiment_id": 2,
+            "plant_age_days": 21,
+        }
+    )
+
+    (params,) = seen["cyl_plants"]
+    assert params["cyl_scans.cyl_scan_traits.trait_id"] == f"eq.{TRAIT_ID}"
+    assert params["cyl_scans.plant_age_days"] == "eq.21"
+    assert "missing_waves" not in result
+    assert [w["wave_id"] for w in result["per_wave"]] == [10]
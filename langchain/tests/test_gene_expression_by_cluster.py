@@ -0,0 +1,176 @@
+"""get_gene_expression_by_cluster_tool: per-cluster summaries aggregated with
+NumPy over a cached per-dataset cell -> cluster assignment, or read as stored
+at upload time when the dataset has them."""
+
+import httpx
+import numpy as np
+from helpers.scrna_counts_pack import (
+    cluster_codes,
+    pack_counts,
+    summarize_gene,
+    summarize_matrix,
+)
+from scipy.sparse import csr_matrix
+
+rng = np.random.default_rng(7)
+N_CELLS = 60
+LABELS = [f"c{n % 4}" for n in range(N_CELLS)]
+COUNTS = rng.poisson(0.6, size=(2, N_CELLS + 3)).astype(
+    np.float32
+)  # 3 cells unassigned
+GENES = [{"id": 10, "gene_name": "G0"}, {"id": 11, "gene_name": "G1"}]
+OBJECT = "counts/ds.csr"
+
+
+def _reference(gene):
+    """The tool's summary, computed cell by cell."""
+    counts = COUNTS[gene]
+    out = {}
+    for label in sorted(set(LABELS)):
+        members = [n for n in range(N_CELLS) if LABELS[n] == label]
+        expr = [counts[n] for n in members if counts[n] > 0]
+        out[label] = (len(expr), len(members), sum(expr))
+    unknown = [c for c in counts[N_CELLS:] if c > 0]
+    if unknown:
+        out["unknown"] = (len(unknown), 0, sum(unknown))
+    return out
+
+
+def _server(seen, *, version="2026-01-01", stored=()):
+    data, offsets = pack_counts(csr_matrix(COUNTS))
+
+    def handler(request):
+        table = request.url.path.rsplit("/", 1)[-1]
+        seen.append(table)
+        if table == "scrna_genes":
+            name = request.url.params["gene_name"].removeprefix("eq.")
+            return httpx.Response(
+                200, json=[g for g in GENES if g["gene_name"] == name]
+            )
+        if table == "scrna_datasets":
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "ingested_at": version,
+                        "n_cells": N_CELLS,
+                        "source_checksum": None,
+                    }
+                ],
+            )
+        if table == "scrna_gene_cluster_stats":
+            return httpx.Response(200, json=list(stored))
+        if table == "scrna_cells":
+            return httpx.Response(
+                200,
+                json=[
+                    {"cell_number": n, "cluster_id": LABELS[n]} for n in range(N_CELLS)
+                ],
+            )
+        if table == "scrna_counts":
+            gene = int(request.url.params["gene_id"].strip("in.()")) - 10
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "gene_id": 10 + gene,
+                        "counts_object_path": f"counts/ds/G{gene}.json",
+                        "counts_packed_path": OBJECT,
+                        "counts_byte_offset": int(offsets[gene]),
+                        "counts_byte_length": int(offsets[gene + 1] - offsets[gene]),
+                    }
+                ],
+            )
+        if table == "ds.csr":
+            start, end = map(int, request.headers["range"][6:].split("-"))
+            return httpx.Response(206, content=data[start : end + 1])
+        return httpx.Response(404, text="unexpected")
+
+    return handler
+
+
+def _by_cluster(result):
+    return {
+        c["cluster_id"]: (c["expressing_cells"], c["total_cells"], c["mean_expression"])
+        for c in result["clusters"]
+    }
+
+
+def test_summary_matches_cell_by_cell_aggregation(transport):
+    from tools import get_gene_expression_by_cluster_tool
+
+    transport.handler = _server([])
+    for gene in (0, 1):
+        result = get_gene_expression_by_cluster_tool.invoke(
+            {"dataset_id": 1, "gene_name": f"G{gene}"}
+        )
+        expected = {
+            label: (e, t, round(s / e, 2) if e else 0)
+            for label, (e, t, s) in _reference(gene).items()
+        }
+        assert _by_cluster(result) == expected
+        pcts = [c["percent_expressing"] for c in result["clusters"]]
+        assert pcts == sorted(pcts, reverse=True)
+
+
+def test_cluster_assignment_is_cached_until_the_dataset_changes(transport):
+    from tools import get_gene_expression_by_cluster_tool
+
+    seen: list = []
+    transport.handler = _server(seen)
+    get_gene_expression_by_cluster_tool.invoke({"dataset_id": 1, "gene_name": "G0"})
+    get_gene_expression_by_cluster_tool.invoke({"dataset_id": 1, "gene_name": "G1"})
+    assert seen.count("scrna_cells") == 1
+
+    transport.handler = _server(seen, version="2026-02-01")  # re-ingested
+    get_gene_expression_by_cluster_tool.invoke({"dataset_id": 1, "gene_name": "G0"})
+    assert seen.count("scrna_cells") == 2
+
+
+def test_stored_summaries_skip_cells_and_counts(transport):
+    from tools import get_gene_expression_by_cluster_tool
+
+    seen: list = []
+    stored = [
+        {
+            "cluster_id": "c1",
+            "expressing_cells": 2,
+            "total_cells": 10,
+            "sum_expression": 5.0,
+        },
+        {
+            "cluster_id": "c0",
+            "expressing_cells": 5,
+            "total_cells": 10,
+            "sum_expression": 6.0,
+        },
+        {
+            "cluster_id": "unknown",
+            "expressing_cells": 1,
+            "total_cells": 0,
+            "sum_expression": 3.0,
+        },
+    ]
+    transport.handler = _server(seen, stored=stored)
+
+    result = get_gene_expression_by_cluster_tool.invoke(
+        {"dataset_id": 1, "gene_name": "G0"}
+    )
+
+    assert not {"scrna_cells", "scrna_counts", "ds.csr"} & set(seen)
+    assert [c["cluster_id"] for c in result["clusters"]] == ["c0", "c1", "unknown"]
+    assert result["clusters"][0]["percent_expressing"] == 50.0
+    assert result["clusters"][0]["mean_expression"] == 1.2
+    assert result["total_expressing_cells"] == 8
+
+
+def test_matrix_summary_matches_per_gene_summary():
+    codes, cluster_ids = cluster_codes(range(N_CELLS), LABELS)
+    expressing, sums = summarize_matrix(COUNTS, codes, len(cluster_ids))
+    for gene in (0, 1):
+        cells = np.flatnonzero(COUNTS[gene])
+        e, s = summarize_gene(cells, COUNTS[gene, cells], codes, len(cluster_ids))
+        assert list(expressing[gene]) == list(e)
+        assert np.allclose(sums[gene], s)
+    # The unassigned cells land in the last column, the tool's "unknown" row.
+    assert expressing[0, -1] == _reference(0)["unknown"][0]
@@ -0,0 +1,87 @@
+"""list_experiments_tool reads per-experiment trait counts pre-aggregated by
+the `cyl_trait_counts_by_experiment` view, for only the experiments it
+returns, and reuses them for `TRAIT_COUNTS_TTL_SECONDS`."""
+
+import importlib
+
+import httpx
+
+EXPERIMENTS = [{"id": 1, "name": "exp-a"}, {"id": 2, "name": "exp-b"}]
+
+
+def _postgrest(seen, counts_status=200):
+    def handler(request):
+        table = request.url.path.rsplit("/", 1)[-1]
+        seen.append((table, dict(request.url.params)))
+        if table == "cyl_experiments":
+            return httpx.Response(200, json=EXPERIMENTS)
+        if table == "cyl_trait_counts_by_experiment":
+            if counts_status != 200:
+                return httpx.Response(counts_status, text="unavailable")
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "experiment_id": 1,
+                        "trait_measurement_count": 7,
+                        "distinct_traits_count": 2,
+                    }
+                ],
+            )
+        return httpx.Response(404, text="unexpected")
+
+    return handler
+
+
+def _tables(seen):
+    return [table for table, _ in seen]
+
+
+def test_counts_are_read_for_the_listed_experiments_only(transport):
+    from tools import list_experiments_tool
+
+    seen: list = []
+    transport.handler = _postgrest(seen)
+
+    result = list_experiments_tool.invoke({"limit": 10})
+
+    assert _tables(seen) == ["cyl_experiments", "cyl_trait_counts_by_experiment"]
+    assert seen[1][1]["experiment_id"] == "in.(1,2)"
+    by_id = {e["id"]: e for e in result["experiments"]}
+    assert by_id[1]["trait_measurement_count"] == 7
+    assert by_id[1]["distinct_traits_count"] == 2
+    assert by_id[2]["trait_measurement_count"] == 0
+    assert by_id[2]["distinct_traits_count"] == 0
+
+
+def test_counts_are_reused_until_they_expire(transport, monkeypatch):
+    from tools import list_experiments_tool
+
+    cyl_module = importlib.import_module("tools.cyl_tools")
+    clock = [1000.0]
+    monkeypatch.setattr(cyl_module.time, "monotonic", lambda: clock[0])
+    seen: list = []
+    transport.handler = _postgrest(seen)
+
+    first = list_experiments_tool.invoke({"limit": 10})
+    clock[0] += cyl_module.TRAIT_COUNTS_TTL_SECONDS - 1
+    second = list_experiments_tool.invoke({"limit": 10})
+    assert _tables(seen).count("cyl_trait_counts_by_experiment") == 1
+    assert second["experiments"] == first["experiments"]
+
+    clock[0] += 2
+    list_experiments_tool.invoke({"limit": 10})
+    assert _tables(seen).count("cyl_trait_counts_by_experiment") == 2
+
+
+def test_failed_counts_read_reports_zero_and_is_not_cached(transport):
+    from tools import list_experiments_tool
+
+    seen: list = []
+    transport.handler = _postgrest(seen, counts_status=503)
+    result = list_experiments_tool.invoke({"limit": 10})
+    assert {e["trait_measurement_count"] for e in result["experiments"]} == {0}
+
+    transport.handler = _postgrest(seen)
+    result = list_experiments_tool.invoke({"limit": 10})
+    assert result["experiments"][0]["trait_measurement_count"] == 7
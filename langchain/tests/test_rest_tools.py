@@ -0,0 +1,117 @@
+"""The PostgREST tools run on pooled clients through `tools.rest_client`: the
+same tool body serves `invoke` (blocking) and `ainvoke` (event loop), the
+independent look-ups inside a tool go out concurrently on the async path, and
+an error from a yielded step surfaces inside the tool at its `yield`.
+
+No network: the pooled clients are built over an `httpx.MockTransport` (the
+`transport` fixture in conftest.py)."""
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+
+def _clusters_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/scrna_clusters"):
+        return httpx.Response(
+            200,
+            json=[
+                {"cluster_id": "c1", "name": "Cortex", "color": "#f00", "ordinal": 0},
+                {"cluster_id": "c2", "name": "Stele", "color": "#0f0", "ordinal": 1},
+            ],
+        )
+    if request.url.path.endswith("/scrna_cluster_stats"):
+        return httpx.Response(200, json=[{"cluster_id": "c1", "cell_count": 40}])
+    return httpx.Response(404, text="unexpected")
+
+
+def _assert_cluster_counts(result):
+    by_id = {c["cluster_id"]: c for c in result}
+    assert by_id["c1"]["cell_count"] == 40
+    assert by_id["c2"]["cell_count"] is None
+
+
+def test_sync_invoke_uses_one_pooled_client(transport):
+    from tools import get_clusters_by_dataset_tool, rest_client
+
+    transport.handler = _clusters_handler
+    _assert_cluster_counts(get_clusters_by_dataset_tool.invoke({"dataset_id": 1}))
+    client = rest_client.sync_client()
+    get_clusters_by_dataset_tool.invoke({"dataset_id": 1})
+    assert rest_client.sync_client() is client
+
+
+def test_async_invoke_issues_independent_lookups_concurrently(transport):
+    from tools import get_clusters_by_dataset_tool, rest_client
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return _clusters_handler(request)
+
+    transport.handler = handler
+
+    async def main():
+        result = await get_clusters_by_dataset_tool.ainvoke({"dataset_id": 1})
+        client = rest_client.async_client()
+        await get_clusters_by_dataset_tool.ainvoke({"dataset_id": 1})
+        assert rest_client.async_client() is client
+        await rest_client.aclose_clients()
+        return result
+
+    _assert_cluster_counts(asyncio.run(main()))
+    assert peak == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+def test_offloaded_failure_is_raised_at_the_tools_yield(
+    transport, monkeypatch, use_async
+):
+    from tools import get_top_de_genes_tool
+
+    # `tools.scrna_tools` the attribute is the tool list; the module is needed here.
+    scrna_module = importlib.import_module("tools.scrna_tools")
+    transport.handler = lambda request: httpx.Response(
+        200, json=[{"file_path": "de/x.json"}]
+    )
+
+    def download(path):
+        raise RuntimeError("storage down")
+
+    bucket = SimpleNamespace(download=download)
+    fake_client = SimpleNamespace(storage=SimpleNamespace(from_=lambda name: bucket))
+    monkeypatch.setattr(scrna_module, "get_supabase_client", lambda: fake_client)
+
+    args = {"dataset_id": 1, "cluster_id": "Cortex"}
+    with pytest.raises(
+        Exception, match="Failed to download DE results from storage: storage down"
+    ):
+        if use_async:
+            asyncio.run(get_top_de_genes_tool.ainvoke(args))
+        else:
+            get_top_de_genes_tool.invoke(args)
+
+
+def test_rest_tools_keep_their_tool_schema():
+    from tools import compare_waves_for_accession_tool, query_database
+
+    assert query_database.coroutine is not None
+    assert set(query_database.args) == {"table", "select", "filters", "limit", "order"}
+    assert set(compare_waves_for_accession_tool.args) == {
+        "trait_name",
+        "accession_name",
+        "experiment_id",
+        "plant_age_days",
+    }
+    assert compare_waves_for_accession_tool.description.startswith(
+        "Within ONE accession, compare a trait's distribution"
+    )
@@ -0,0 +1,184 @@
+"""The packed per-dataset count matrix (`helpers.scrna_counts_pack`) and the
+scRNA tools that read genes from it with ranged GETs, falling back to whole
+per-gene JSON objects for datasets uploaded before it."""
+
+import importlib
+import json
+import re
+from types import SimpleNamespace
+
+import httpx
+import numpy as np
+import pytest
+from helpers.scrna_counts_pack import (
+    coalesce_ranges,
+    pack_counts,
+    read_index,
+    unpack_block,
+)
+from scipy.sparse import csr_matrix
+
+OBJECT = "counts/ds.csr"
+# genes x cells; gene 1 has no counts at all.
+DENSE = np.array(
+    [
+        [0, 3, 0, 0, 1.5],
+        [0, 0, 0, 0, 0],
+        [7, 0, 0, 2, 0],
+        [0, 0, 4, 0, 0],
+    ],
+    dtype=np.float32,
+)
+GENES = [{"id": 100 + i, "gene_name": f"G{i}"} for i in range(len(DENSE))]
+
+
+def test_pack_round_trips_every_gene():
+    data, offsets = pack_counts(csr_matrix(DENSE))
+    n_cells, index = read_index(data)
+    assert n_cells == DENSE.shape[1]
+    assert list(index) == list(offsets)
+    assert offsets[1] == offsets[2]  # the all-zero gene has an empty block
+    for gene, row in enumerate(DENSE):
+        cells, values = unpack_block(data[offsets[gene] : offsets[gene + 1]])
+        assert list(cells) == list(np.flatnonzero(row))
+        assert list(values) == list(row[row != 0])
+
+
+def test_read_index_rejects_other_objects():
+    with pytest.raises(ValueError, match="not a packed count matrix"):
+        read_index(json.dumps({"1": 2.0}).encode().ljust(16))
+
+
+def test_coalesce_ranges_merges_neighbours_only():
+    assert coalesce_ranges([(200, 10), (100, 50), (150, 20)], gap=30) == [(100, 110)]
+    assert coalesce_ranges([(0, 10), (100, 10)], gap=30) == [(0, 10), (100, 10)]
+
+
+def _counts_rows(offsets, genes):
+    return [
+        {
+            "gene_id": g["id"],
+            "counts_object_path": f"counts/ds/{g['gene_name']}.json",
+            "counts_packed_path": OBJECT,
+            "counts_byte_offset": int(offsets[i]),
+            "counts_byte_length": int(offsets[i + 1] - offsets[i]),
+        }
+        for i, g in enumerate(GENES)
+        if g in genes
+    ]
+
+
+def _server(seen, *, honour_range=True, legacy=False):
+    data, offsets = pack_counts(csr_matrix(DENSE))
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/scrna_genes"):
+            wanted = request.url.params["gene_name"]
+            if wanted.startswith("in."):
+                names = json.loads(f"[{wanted[4:-1]}]")
+            else:
+                names = [wanted.removeprefix("eq.")]
+            return httpx.Response(
+                200, json=[g for g in GENES if g["gene_name"] in names]
+            )
+        if path.endswith("/scrna_counts"):
+            ids = re.findall(r"\d+", request.url.params["gene_id"])
+            genes = [g for g in GENES if str(g["id"]) in ids]
+            if legacy:
+                return httpx.Response(
+                    200,
+                    json=[
+                        {
+                            "gene_id": g["id"],
+                            "counts_object_path": f"counts/ds/{g['gene_name']}.json",
+                            "counts_packed_path": None,
+                            "counts_byte_offset": None,
+                            "counts_byte_length": None,
+                        }
+                        for g in genes
+                    ],
+                )
+            return httpx.Response(200, json=_counts_rows(offsets, genes))
+        if path.endswith(f"/storage/v1/object/scrna/{OBJECT}"):
+            seen.append(request.headers.get("range"))
+            start, end = map(int, re.findall(r"\d+", request.headers["range"]))
+            if not honour_range:
+                return httpx.Response(200, content=data)
+            return httpx.Response(206, content=data[start : end + 1])
+        return httpx.Response(404, text="unexpected")
+
+    return handler
+
+
+@pytest.mark.parametrize("honour_range", [True, False], ids=["206", "200-full"])
+def test_gene_counts_read_one_block(transport, honour_range):
+    from tools import get_gene_counts_tool
+
+    seen: list = []
+    transport.handler = _server(seen, honour_range=honour_range)
+
+    result = get_gene_counts_tool.invoke({"dataset_id": 1, "gene_name": "G2"})
+
+    assert result["counts"] == {"0": 7.0, "3": 2.0}
+    assert len(seen) == 1
+    _, offsets = pack_counts(csr_matrix(DENSE))
+    assert seen[0] == f"bytes={offsets[2]}-{offsets[3] - 1}"
+
+
+def test_multi_gene_counts_coalesce_into_one_ranged_get(transport):
+    from tools import get_multi_gene_counts_tool
+
+    seen: list = []
+    transport.handler = _server(seen)
+
+    result = get_multi_gene_counts_tool.invoke(
+        {"dataset_id": 1, "gene_names": ["G0", "G1", "G3", "nope"]}
+    )
+
+    assert len(seen) == 1
+    assert result["genes"]["G0"]["counts"] == {"1": 3.0, "4": 1.5}
+    assert result["genes"]["G1"]["counts"] == {}
+    assert result["genes"]["G3"]["counts"] == {"2": 4.0}
+    assert result["missing_genes"] == ["nope"]
+
+
+def test_legacy_per_gene_json_objects_still_read(transport, monkeypatch):
+    from tools import get_gene_expression_by_cluster_tool
+
+    scrna_module = importlib.import_module("tools.scrna_tools")
+    downloaded = []
+
+    def download(path):
+        downloaded.append(path)
+        return json.dumps({"0": 7.0, "3": 2.0}).encode()
+
+    bucket = SimpleNamespace(download=download)
+    fake_client = SimpleNamespace(storage=SimpleNamespace(from_=lambda name: bucket))
+    monkeypatch.setattr(scrna_module, "get_supabase_client", lambda: fake_client)
+    seen: list = []
+    server = _server(seen, legacy=True)
+
+    def handler(request):
+        if request.url.path.endswith("/scrna_cells"):
+            return httpx.Response(
+                200,
+                json=[
+                    {"cell_number": n, "cluster_id": "A" if n < 2 else "B"}
+                    for n in range(5)
+                ],
+            )
+        return server(request)
+
+    transport.handler = handler
+
+    result = get_gene_expression_by_cluster_tool.invoke(
+        {"dataset_id": 1, "gene_name": "G2"}
+    )
+
+    assert downloaded == ["counts/ds/G2.json"]
+    assert seen == []
+    by_cluster = {c["cluster_id"]: c for c in result["clusters"]}
+    assert by_cluster["A"]["expressing_cells"] == 1
+    assert by_cluster["B"]["expressing_cells"] == 1
+    assert by_cluster["B"]["total_cells"] == 3
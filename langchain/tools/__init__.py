@@ -32,6 +32,7 @@ from .scrna_tools import (
     get_top_de_genes_tool,
     get_cells_by_cluster_tool,
     get_gene_counts_tool,
+    get_multi_gene_counts_tool,
     get_gene_expression_by_cluster_tool,
 )
 
@@ -85,6 +86,7 @@ __all__ = [
     "get_top_de_genes_tool",
     "get_cells_by_cluster_tool",
     "get_gene_counts_tool",
+    "get_multi_gene_counts_tool",
     "get_gene_expression_by_cluster_tool",
     # Cylinder tools
     "list_experiments_tool",
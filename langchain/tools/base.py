@@ -3,8 +3,8 @@ Base utilities and generic database tools for LangChain agent.
 """
 import os
 from typing import Optional
-import httpx
 from langchain_core.tools import tool
+from .rest_client import rest_get, rest_tool
 
 # PostgREST Configuration (Supabase) — uses bloom_agent key (read-only)
 from config import SUPABASE_URL, BLOOM_AGENT_KEY as SUPABASE_KEY
@@ -50,7 +50,7 @@ def _reject_sql(table: str, select: str, filters) -> str | None:
     return None
 
 
-@tool
+@rest_tool
 def query_database(table: str, select: str = "*", filters: Optional[dict] = None, limit: int = 100, order: Optional[str] = None) -> list:
     """
     Query a database table using PostgREST REST filters (GET-only, read-only).
@@ -84,13 +84,13 @@ def query_database(table: str, select: str = "*", filters: Optional[dict] = None
     if order:
         params["order"] = order
 
-    response = httpx.get(f"{REST_URL}/{table}", headers=get_headers(), params=params)
+    response = yield rest_get(f"{REST_URL}/{table}", headers=get_headers(), params=params)
     if response.status_code != 200:
         raise Exception(f"Query failed ({response.status_code}): {response.text}")
     return response.json()
 
 
-@tool
+@rest_tool
 def count_rows(table: str, filters: Optional[dict] = None) -> dict:
     """
     Count rows in a table (GET-only, read-only). Use this instead of SQL COUNT().
@@ -111,7 +111,7 @@ def count_rows(table: str, filters: Optional[dict] = None) -> dict:
     if filters:
         params.update(filters)
 
-    response = httpx.get(f"{REST_URL}/{table}", headers=headers, params=params)
+    response = yield rest_get(f"{REST_URL}/{table}", headers=headers, params=params)
     if response.status_code != 200 and response.status_code != 206:
         raise Exception(f"Count failed ({response.status_code}): {response.text}")
 
@@ -124,7 +124,7 @@ def count_rows(table: str, filters: Optional[dict] = None) -> dict:
     return {"table": table, "count": count, "filters": filters}
 
 
-@tool
+@rest_tool
 def get_table_columns(table: str) -> dict:
     """
     Get column names for a table by inspecting one row (GET-only, read-only).
@@ -135,7 +135,7 @@ def get_table_columns(table: str) -> dict:
     Returns:
         Dict with table info including available columns and a sample row
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/{table}",
         headers=get_headers(),
         params={"limit": 1}
@@ -184,10 +184,10 @@ def list_tables() -> list:
     ]
 
 
-@tool
+@rest_tool
 def list_species_tool() -> list:
     """List all available species in the database."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/species",
         headers=get_headers(),
         params={"select": "id,common_name,genus,species"}
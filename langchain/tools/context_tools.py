@@ -29,6 +29,7 @@ CONTEXT_SCRNA = """## scRNA-seq Data (Supabase/PostgREST)
 - get_top_de_genes_tool: Top differentially expressed genes per cluster
 - get_cells_by_cluster_tool: Cells with coordinates per cluster
 - get_gene_counts_tool: Expression counts per cell
+- get_multi_gene_counts_tool: Expression counts per cell for several genes
 - get_gene_expression_by_cluster_tool: Expression summary per cluster
 
 ### UI Links
@@ -1,11 +1,12 @@
 """
 Cylinder phenotyping tools for querying experiments, plants, scans, and traits.
 """
+import os
 import statistics
+import time
 from typing import Optional
-import httpx
-from langchain_core.tools import tool
 from .base import REST_URL, get_headers
+from .rest_client import offload, rest_get, rest_tool
 from .cyl_viz_tools import _accession_boxplot, _accession_ranked_profile, _wave_boxplot
 from helpers.plot_renderer import render_and_save
 from helpers.trait_name_resolver import _resolve_trait_name
@@ -19,8 +20,29 @@ _BASELINE_EXPERIMENT_ACTIONS = [
     {"label": "Compare across waves", "prompt": "Compare a trait across waves"},
 ]
 
+# Per-experiment trait counts change only when a pipeline run delivers new
+# traits, and agents ask for the experiment list at the start of most
+# conversations, so counts are reused for this long before being re-read.
+TRAIT_COUNTS_TTL_SECONDS = float(os.getenv("AGENT_TRAIT_COUNTS_TTL", "60"))
 
-@tool
+# experiment_id -> (monotonic expiry, trait_measurement_count, distinct_traits_count)
+_trait_counts_cache: dict[int, tuple[float, int, int]] = {}
+
+
+def _cached_trait_counts(experiment_ids: list) -> tuple[dict, list]:
+    """Split `experiment_ids` into unexpired cached counts and ids to fetch."""
+    now = time.monotonic()
+    cached, missing = {}, []
+    for exp_id in experiment_ids:
+        entry = _trait_counts_cache.get(exp_id)
+        if entry is not None and entry[0] > now:
+            cached[exp_id] = entry[1:]
+        else:
+            missing.append(exp_id)
+    return cached, missing
+
+
+@rest_tool
 def list_experiments_tool(limit: int = 50) -> dict:
     """List all cylinder phenotyping experiments with species info.
 
@@ -32,7 +54,7 @@ def list_experiments_tool(limit: int = 50) -> dict:
     measurements, narrate that no trait data has been computed yet rather
     than calling an analysis tool against them.
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_experiments",
         headers=get_headers(),
         params={
@@ -44,30 +66,38 @@ def list_experiments_tool(limit: int = 50) -> dict:
         raise Exception(f"Failed to list experiments: {response.text}")
     experiments = response.json()
 
-    # Fetch aggregate counts per experiment from the view in one call.
-    # PostgREST can't GROUP BY directly, so we pull rows and aggregate in Python.
-    counts_response = httpx.get(
-        f"{REST_URL}/cyl_trait_by_experiment_wave",
-        headers=get_headers(),
-        params={"select": "experiment_id,trait_name,n"},
+    # Counts come pre-aggregated per experiment from the database, for just
+    # the experiments on this page that aren't already cached. An experiment
+    # the view has no row for has no trait values yet.
+    counts, missing = _cached_trait_counts(
+        [exp["id"] for exp in experiments if exp.get("id") is not None]
     )
-    counts_by_exp: dict[int, dict] = {}
-    if counts_response.status_code == 200:
-        for row in counts_response.json():
-            exp_id = row.get("experiment_id")
-            if exp_id is None:
-                continue
-            bucket = counts_by_exp.setdefault(
-                exp_id, {"total_n": 0, "traits": set()}
-            )
-            bucket["total_n"] += row.get("n") or 0
-            if row.get("trait_name"):
-                bucket["traits"].add(row["trait_name"])
+    if missing:
+        counts_response = yield rest_get(
+            f"{REST_URL}/cyl_trait_counts_by_experiment",
+            headers=get_headers(),
+            params={
+                "select": "experiment_id,trait_measurement_count,distinct_traits_count",
+                "experiment_id": f"in.({','.join(str(i) for i in missing)})",
+            },
+        )
+        if counts_response.status_code == 200:
+            fetched = {exp_id: (0, 0) for exp_id in missing}
+            for row in counts_response.json():
+                if row.get("experiment_id") in fetched:
+                    fetched[row["experiment_id"]] = (
+                        row.get("trait_measurement_count") or 0,
+                        row.get("distinct_traits_count") or 0,
+                    )
+            expires = time.monotonic() + TRAIT_COUNTS_TTL_SECONDS
+            for exp_id, (total, distinct) in fetched.items():
+                _trait_counts_cache[exp_id] = (expires, total, distinct)
+            counts.update(fetched)
 
     for exp in experiments:
-        bucket = counts_by_exp.get(exp.get("id"))
-        exp["trait_measurement_count"] = bucket["total_n"] if bucket else 0
-        exp["distinct_traits_count"] = len(bucket["traits"]) if bucket else 0
+        total, distinct = counts.get(exp.get("id"), (0, 0))
+        exp["trait_measurement_count"] = total
+        exp["distinct_traits_count"] = distinct
 
     experiment_chips = [
         {"label": exp["name"], "prompt": f"Show waves for {exp['name']}"}
@@ -81,10 +111,10 @@ def list_experiments_tool(limit: int = 50) -> dict:
     }
 
 
-@tool
+@rest_tool
 def get_experiment_by_id_tool(experiment_id: int) -> dict:
     """Get a cylinder experiment by ID with full details."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_experiments",
         headers=get_headers(),
         params={
@@ -98,10 +128,10 @@ def get_experiment_by_id_tool(experiment_id: int) -> dict:
     return data[0] if data else {}
 
 
-@tool
+@rest_tool
 def list_waves_by_experiment_tool(experiment_id: int) -> list:
     """List all planting waves for a given experiment."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_waves",
         headers=get_headers(),
         params={
@@ -114,7 +144,7 @@ def list_waves_by_experiment_tool(experiment_id: int) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def list_plants_tool(experiment_id: Optional[int] = None, wave_id: Optional[int] = None, limit: int = 100) -> list:
     """List plants with optional experiment or wave filter."""
     params = {
@@ -126,7 +156,7 @@ def list_plants_tool(experiment_id: Optional[int] = None, wave_id: Optional[int]
     if wave_id is not None:
         params["wave_id"] = f"eq.{wave_id}"
 
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params=params
@@ -136,10 +166,10 @@ def list_plants_tool(experiment_id: Optional[int] = None, wave_id: Optional[int]
     return response.json()
 
 
-@tool
+@rest_tool
 def get_plant_by_qr_tool(qr_code: str) -> dict:
     """Get a plant by its QR code."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params={
@@ -153,14 +183,14 @@ def get_plant_by_qr_tool(qr_code: str) -> dict:
     return data[0] if data else {}
 
 
-@tool
+@rest_tool
 def list_scans_tool(limit: int = 50, plant_id: Optional[int] = None) -> list:
     """List cylinder plant scans with optional plant_id filter."""
     params = {"select": "*", "limit": limit}
     if plant_id is not None:
         params["plant_id"] = f"eq.{plant_id}"
 
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_scans",
         headers=get_headers(),
         params=params
@@ -170,10 +200,10 @@ def list_scans_tool(limit: int = 50, plant_id: Optional[int] = None) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_scan_tool(scan_id: int) -> dict:
     """Get a cylinder scan by ID with its images."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_scans",
         headers=get_headers(),
         params={
@@ -187,10 +217,10 @@ def get_scan_tool(scan_id: int) -> dict:
     return data[0] if data else {}
 
 
-@tool
+@rest_tool
 def get_scan_traits_tool(scan_id: int) -> list:
     """Get all measured traits for a specific scan."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_scan_traits",
         headers=get_headers(),
         params={
@@ -203,10 +233,10 @@ def get_scan_traits_tool(scan_id: int) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def list_scanners_tool() -> list:
     """List all scanner devices."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_scanners",
         headers=get_headers(),
         params={"select": "id,name,location"}
@@ -216,10 +246,10 @@ def list_scanners_tool() -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def list_phenotypers_tool(limit: int = 50) -> list:
     """List all phenotypers (imaging devices)."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/phenotypers",
         headers=get_headers(),
         params={"select": "*", "limit": limit}
@@ -229,10 +259,10 @@ def list_phenotypers_tool(limit: int = 50) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_plant_scan_history_tool(plant_id: int) -> list:
     """Get all scans for a plant with traits and image counts."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/cyl_scans",
         headers=get_headers(),
         params={
@@ -248,7 +278,7 @@ def get_plant_scan_history_tool(plant_id: int) -> list:
 ########################## Analytics Tools ###########################
 
 
-@tool
+@rest_tool
 def get_plant_growth_timeline_tool(qr_code: str) -> dict:
     """
     Get the growth timeline for a plant showing how traits change over time.
@@ -261,7 +291,7 @@ def get_plant_growth_timeline_tool(qr_code: str) -> dict:
         ordered chronologically to show growth progression.
     """
     # First, get the plant info by QR code
-    plant_response = httpx.get(
+    plant_response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params={
@@ -280,7 +310,7 @@ def get_plant_growth_timeline_tool(qr_code: str) -> dict:
     plant_id = plant["id"]
 
     # Get all scans for this plant with traits
-    scans_response = httpx.get(
+    scans_response = yield rest_get(
         f"{REST_URL}/cyl_scans",
         headers=get_headers(),
         params={
@@ -322,7 +352,7 @@ def get_plant_growth_timeline_tool(qr_code: str) -> dict:
     }
 
 
-@tool
+@rest_tool
 def get_plants_by_accession_tool(accession_name: str, experiment_id: Optional[int] = None) -> dict:
     """
     Find all plants of a specific accession (plant variety/genotype).
@@ -338,7 +368,7 @@ def get_plants_by_accession_tool(accession_name: str, experiment_id: Optional[in
         wave info, and scan counts.
     """
     # First, find the accession(s) matching the name
-    accession_response = httpx.get(
+    accession_response = yield rest_get(
         f"{REST_URL}/accessions",
         headers=get_headers(),
         params={
@@ -366,7 +396,7 @@ def get_plants_by_accession_tool(accession_name: str, experiment_id: Optional[in
         # Need to filter through wave -> experiment relationship
         params["cyl_waves.experiment_id"] = f"eq.{experiment_id}"
 
-    plants_response = httpx.get(
+    plants_response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params=params
@@ -397,7 +427,7 @@ def get_plants_by_accession_tool(accession_name: str, experiment_id: Optional[in
     }
 
 
-@tool
+@rest_tool
 def list_accessions_tool(limit: int = 50) -> list:
     """
     List all available accessions (plant varieties/genotypes).
@@ -406,7 +436,7 @@ def list_accessions_tool(limit: int = 50) -> list:
     Returns:
         List of accession names available in the database.
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/accessions",
         headers=get_headers(),
         params={
@@ -429,7 +459,7 @@ def list_accessions_tool(limit: int = 50) -> list:
 _TRAIT_CHIPS_LIMIT = 20
 
 
-@tool
+@rest_tool
 def list_traits_tool(
     experiment_id: Optional[int] = None,
     wave_ids: Optional[list[int]] = None,
@@ -474,7 +504,7 @@ def list_traits_tool(
         else:
             ids_csv = ",".join(str(w) for w in wave_ids or [])
             params["wave_id"] = f"in.({ids_csv})"
-        view_response = httpx.get(
+        view_response = yield rest_get(
             f"{REST_URL}/cyl_trait_by_experiment_wave",
             headers=get_headers(),
             params=params,
@@ -484,7 +514,7 @@ def list_traits_tool(
         names = sorted({row["trait_name"] for row in view_response.json() if row.get("trait_name")})
     else:
         # Global trait registry — current default behavior
-        registry_response = httpx.get(
+        registry_response = yield rest_get(
             f"{REST_URL}/cyl_traits",
             headers=get_headers(),
             params={"select": "id,name", "order": "name.asc"},
@@ -520,7 +550,25 @@ def list_traits_tool(
 _ACCESSION_BOXPLOT_N_THRESHOLD = 10
 
 
-@tool
+def _scan_trait_filters(trait_id: int, plant_age_days: Optional[int]) -> dict:
+    """PostgREST embedded-resource filters for the compare tools' nested
+    `cyl_scans(plant_age_days,cyl_scan_traits(...))` select.
+
+    They trim each plant's scans to the ones the age mode can use (the exact
+    age, or any aged scan for latest-per-plant — a scan without the trait
+    still counts toward "latest") and each scan's traits to `trait_id`, so a
+    wave comes back with one value per scan instead of every trait measured.
+    Top-level plant rows are not filtered.
+    """
+    filters = {"cyl_scans.cyl_scan_traits.trait_id": f"eq.{trait_id}"}
+    if plant_age_days is not None:
+        filters["cyl_scans.plant_age_days"] = f"eq.{plant_age_days}"
+    else:
+        filters["cyl_scans.plant_age_days"] = "not.is.null"
+    return filters
+
+
+@rest_tool
 def compare_accessions_in_wave_tool(
     trait_name: str,
     wave_id: int,
@@ -583,7 +631,7 @@ def compare_accessions_in_wave_tool(
         N days") so users see the assumption
     """
     # 1. Get distinct trait names actually measured in scope (for fuzzy match candidates)
-    candidates_response = httpx.get(
+    candidates_response = yield rest_get(
         f"{REST_URL}/cyl_trait_by_experiment_wave",
         headers=get_headers(),
         params={"wave_id": f"eq.{wave_id}", "select": "trait_name"},
@@ -604,7 +652,7 @@ def compare_accessions_in_wave_tool(
     canonical_name = resolved["name"]
 
     # 3. Resolve trait_id from canonical name
-    trait_response = httpx.get(
+    trait_response = yield rest_get(
         f"{REST_URL}/cyl_traits",
         headers=get_headers(),
         params={"name": f"eq.{canonical_name}", "select": "id"},
@@ -622,13 +670,16 @@ def compare_accessions_in_wave_tool(
         }
     trait_id = trait_rows[0]["id"]
 
-    # 4. Fetch raw trait values per plant, scoped to the wave
-    plants_response = httpx.get(
+    # 4. Fetch raw trait values per plant, scoped to the wave — only the
+    #    resolved trait's values on the scans the age mode can use
+    plants_response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params={
             "wave_id": f"eq.{wave_id}",
+            "accession_id": "not.is.null",
             "select": "id,accessions(name),cyl_scans(plant_age_days,cyl_scan_traits(value,trait_id))",
+            **_scan_trait_filters(trait_id, plant_age_days),
         },
     )
     if plants_response.status_code != 200:
@@ -713,7 +764,9 @@ def compare_accessions_in_wave_tool(
         fig = _accession_ranked_profile(rankings, values_by_accession, canonical_name)
         plot_layout = "ranked_profile"
 
-    plot_url = render_and_save(fig, prefix="accession_rank", namespace="cyl_supabase")
+    plot_url = yield offload(
+        render_and_save, fig, prefix="accession_rank", namespace="cyl_supabase"
+    )
 
     result: dict = {
         "trait_name": canonical_name,
@@ -737,7 +790,7 @@ def compare_accessions_in_wave_tool(
     return result
 
 
-@tool
+@rest_tool
 def compare_waves_for_accession_tool(
     trait_name: str,
     accession_name: str,
@@ -785,16 +838,32 @@ def compare_waves_for_accession_tool(
         wave-dependent. State which scan_mode produced the numbers
       - Describe the rendered chart in one sentence
     """
-    # 1. Fetch experiment waves
-    waves_response = httpx.get(
-        f"{REST_URL}/cyl_waves",
-        headers=get_headers(),
-        params={
-            "experiment_id": f"eq.{experiment_id}",
-            "select": "id,number,name",
-            "order": "number.asc",
-        },
-    )
+    # The waves (1), trait-candidate (2) and accession (4) look-ups key off the
+    # caller's arguments alone, so they're issued together; their results are
+    # still checked in step order.
+    waves_response, candidates_response, accession_response = yield [
+        rest_get(
+            f"{REST_URL}/cyl_waves",
+            headers=get_headers(),
+            params={
+                "experiment_id": f"eq.{experiment_id}",
+                "select": "id,number,name",
+                "order": "number.asc",
+            },
+        ),
+        rest_get(
+            f"{REST_URL}/cyl_trait_by_experiment_wave",
+            headers=get_headers(),
+            params={"experiment_id": f"eq.{experiment_id}", "select": "trait_name"},
+        ),
+        rest_get(
+            f"{REST_URL}/accessions",
+            headers=get_headers(),
+            params={"name": f"eq.{accession_name}", "select": "id"},
+        ),
+    ]
+
+    # 1. Experiment waves
     if waves_response.status_code != 200:
         raise Exception(f"Failed to fetch experiment waves: {waves_response.text}")
     experiment_waves = waves_response.json()
@@ -806,12 +875,7 @@ def compare_waves_for_accession_tool(
     experiment_wave_ids = sorted(w["id"] for w in experiment_waves)
     wave_meta = {w["id"]: w for w in experiment_waves}
 
-    # 2. Get trait name candidates from view (scoped to this experiment)
-    candidates_response = httpx.get(
-        f"{REST_URL}/cyl_trait_by_experiment_wave",
-        headers=get_headers(),
-        params={"experiment_id": f"eq.{experiment_id}", "select": "trait_name"},
-    )
+    # 2. Trait name candidates from view (scoped to this experiment)
     if candidates_response.status_code != 200:
         raise Exception(f"Failed to fetch trait candidates: {candidates_response.text}")
     candidates = sorted({row["trait_name"] for row in candidates_response.json()})
@@ -827,7 +891,7 @@ def compare_waves_for_accession_tool(
     canonical_name = resolved["name"]
 
     # 3. Resolve trait_id
-    trait_response = httpx.get(
+    trait_response = yield rest_get(
         f"{REST_URL}/cyl_traits",
         headers=get_headers(),
         params={"name": f"eq.{canonical_name}", "select": "id"},
@@ -842,18 +906,13 @@ def compare_waves_for_accession_tool(
         }
     trait_id = trait_rows[0]["id"]
 
-    # 4. Resolve accession_id
-    accession_response = httpx.get(
-        f"{REST_URL}/accessions",
-        headers=get_headers(),
-        params={"name": f"eq.{accession_name}", "select": "id"},
-    )
+    # 4. Accession id
     if accession_response.status_code != 200:
         raise Exception(f"Failed to resolve accession: {accession_response.text}")
     accession_rows = accession_response.json()
     if not accession_rows:
         # Surface a sample of accessions in this experiment so the LLM can hint
-        sample_resp = httpx.get(
+        sample_resp = yield rest_get(
             f"{REST_URL}/cyl_plants",
             headers=get_headers(),
             params={
@@ -877,15 +936,18 @@ def compare_waves_for_accession_tool(
         }
     accession_id = accession_rows[0]["id"]
 
-    # 5. Fetch plants of this accession in this experiment's waves
+    # 5. Fetch plants of this accession in this experiment's waves. The scan
+    #    filters trim nested rows only, so every plant still comes back for the
+    #    coverage check below.
     ids_csv = ",".join(str(w) for w in experiment_wave_ids)
-    plants_response = httpx.get(
+    plants_response = yield rest_get(
         f"{REST_URL}/cyl_plants",
         headers=get_headers(),
         params={
             "accession_id": f"eq.{accession_id}",
             "wave_id": f"in.({ids_csv})",
             "select": "id,wave_id,cyl_scans(plant_age_days,cyl_scan_traits(value,trait_id))",
+            **_scan_trait_filters(trait_id, plant_age_days),
         },
     )
     if plants_response.status_code != 200:
@@ -1003,7 +1065,9 @@ def compare_waves_for_accession_tool(
 
     # 10. Render chart
     fig = _wave_boxplot(per_wave, values_by_wave, canonical_name, accession_name)
-    plot_url = render_and_save(fig, prefix="wave_for_accession", namespace="cyl_supabase")
+    plot_url = yield offload(
+        render_and_save, fig, prefix="wave_for_accession", namespace="cyl_supabase"
+    )
 
     return {
         "trait_name": canonical_name,
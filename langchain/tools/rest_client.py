@@ -0,0 +1,195 @@
+"""
+Pooled HTTP clients and the sync/async plumbing shared by the PostgREST tools.
+
+Each data tool is written once, as a generator that *yields* what it needs
+instead of doing I/O itself:
+
+    response = yield rest_get(f"{REST_URL}/cyl_waves", headers=..., params=...)
+    waves, counts = yield [rest_get(...), rest_get(...)]   # issued concurrently
+    data = yield offload(client.storage.from_("scrna").download, path)
+
+`rest_tool` turns such a generator into a LangChain tool with both a sync
+implementation (driven on a process-wide pooled `httpx.Client`) and an async
+one (driven on a pooled `httpx.AsyncClient` on the running event loop, with a
+yielded list gathered concurrently and blocking `offload` calls moved to a
+worker thread). The LangGraph agent awaits tools, so it takes the async path
+and a tool turn no longer ties up a worker thread or opens a fresh connection
+(and TLS handshake) per request.
+"""
+
+import asyncio
+import functools
+import importlib.util
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import httpx
+from langchain_core.tools import StructuredTool
+
+# Pool sizing and timeouts for every PostgREST call the tools make. One agent
+# turn issues a handful of requests, a few of them concurrently, so a small
+# keep-alive pool covers it; the read timeout is generous because the compare
+# tools pull whole waves of nested scan/trait rows.
+HTTP_MAX_CONNECTIONS = int(os.getenv("AGENT_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("AGENT_HTTP_MAX_KEEPALIVE", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("AGENT_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("AGENT_HTTP_READ_TIMEOUT", "60"))
+
+# HTTP/2 is negotiated (ALPN) only when the h2 package is importable; plain
+# http:// upstreams such as local Supabase stay on HTTP/1.1 either way.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class RestRequest(NamedTuple):
+    """A GET a tool generator yields; see `rest_get`."""
+
+    url: str
+    headers: dict
+    params: dict | None
+
+
+class Offload(NamedTuple):
+    """A blocking call a tool generator yields; see `offload`."""
+
+    fn: Callable
+    args: tuple
+    kwargs: dict
+
+
+def rest_get(url: str, *, headers: dict, params: dict | None = None) -> RestRequest:
+    """Describe a GET for the driver to issue — same arguments as `httpx.get`."""
+    return RestRequest(url, headers, params)
+
+
+def offload(fn: Callable, *args, **kwargs) -> Offload:
+    """Describe a blocking call (storage download, chart render) for the driver.
+
+    The sync driver calls it inline; the async driver runs it in a worker
+    thread so it doesn't stall the event loop.
+    """
+    return Offload(fn, args, kwargs)
+
+
+def _client_kwargs() -> dict:
+    return {
+        "http2": _HTTP2,
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        ),
+        "timeout": httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    }
+
+
+_sync_client: httpx.Client | None = None
+_sync_client_lock = threading.Lock()
+
+# An AsyncClient's connections belong to the loop that opened them, so there
+# is one per event loop (in the server that's exactly one).
+_async_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+) = weakref.WeakKeyDictionary()
+
+
+def sync_client() -> httpx.Client:
+    """The process-wide pooled client, created on first use."""
+    global _sync_client
+    if _sync_client is None:
+        with _sync_client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(**_client_kwargs())
+    return _sync_client
+
+
+def async_client() -> httpx.AsyncClient:
+    """The pooled async client for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(**_client_kwargs())
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the pooled clients. Called on server shutdown."""
+    global _sync_client
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+    with _sync_client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+def _perform(step):
+    if isinstance(step, list):
+        return [_perform(s) for s in step]
+    if isinstance(step, RestRequest):
+        return sync_client().get(step.url, headers=step.headers, params=step.params)
+    if isinstance(step, Offload):
+        return step.fn(*step.args, **step.kwargs)
+    raise TypeError(f"tool yielded an unsupported step: {step!r}")
+
+
+async def _aperform(step):
+    if isinstance(step, list):
+        return await asyncio.gather(*(_aperform(s) for s in step))
+    if isinstance(step, RestRequest):
+        return await async_client().get(
+            step.url, headers=step.headers, params=step.params
+        )
+    if isinstance(step, Offload):
+        return await asyncio.to_thread(step.fn, *step.args, **step.kwargs)
+    raise TypeError(f"tool yielded an unsupported step: {step!r}")
+
+
+def _run(gen) -> Any:
+    """Drive a tool generator to completion with blocking I/O."""
+    value, error = None, None
+    while True:
+        try:
+            step = gen.send(value) if error is None else gen.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            value = _perform(step)
+        except Exception as exc:  # noqa: BLE001 — re-raised in the tool, at its yield
+            error = exc
+
+
+async def _arun(gen) -> Any:
+    """Drive a tool generator to completion on the running event loop."""
+    value, error = None, None
+    while True:
+        try:
+            step = gen.send(value) if error is None else gen.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            value = await _aperform(step)
+        except Exception as exc:  # noqa: BLE001 — re-raised in the tool, at its yield
+            error = exc
+
+
+def rest_tool(fn: Callable) -> StructuredTool:
+    """Like `@tool`, for a generator that yields `rest_get`/`offload` steps.
+
+    The tool's name, description and argument schema come from `fn` exactly
+    as `@tool` would derive them; it gets both a sync and an async body.
+    """
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        return _run(fn(*args, **kwargs))
+
+    @functools.wraps(fn)
+    async def arun(*args, **kwargs):
+        return await _arun(fn(*args, **kwargs))
+
+    return StructuredTool.from_function(func=run, coroutine=arun, name=fn.__name__)
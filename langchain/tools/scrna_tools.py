@@ -2,18 +2,34 @@
 scRNA-seq (Single-cell RNA sequencing) tools for querying datasets, genes, cells, and expression data.
 """
 import json
-import httpx
-from langchain_core.tools import tool
+from typing import NamedTuple
+
+import numpy as np
+
 from .base import REST_URL, get_headers
-from config import get_supabase_client
+from .rest_client import offload, rest_get, rest_tool
+from config import SUPABASE_URL, get_supabase_client
+from helpers.scrna_counts_pack import (
+    cluster_codes,
+    coalesce_ranges,
+    summarize_gene,
+    unpack_block,
+)
+
+# Objects in the `scrna` bucket, fetched directly so a read can carry a Range
+# header (the storage client's download() always returns the whole object).
+SCRNA_OBJECT_URL = f"{SUPABASE_URL}/storage/v1/object/scrna"
 
+# Upper bound on genes per get_multi_gene_counts_tool call.
+_MULTI_GENE_LIMIT = 50
 
-@tool
+
+@rest_tool
 def get_all_datasets_tool() -> list:
     """Fetch all single-cell RNA-seq datasets with species info.
     Returns dataset id, name, species common_name, genus, species.
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_datasets",
         headers=get_headers(),
         params={"select": "id,name,strain,assembly,annotation,species(id,common_name,genus,species)"}
@@ -23,10 +39,10 @@ def get_all_datasets_tool() -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_dataset_by_id_tool(dataset_id: int) -> dict:
     """Fetch a single-cell dataset by its ID with species info."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_datasets",
         headers=get_headers(),
         params={
@@ -40,13 +56,13 @@ def get_dataset_by_id_tool(dataset_id: int) -> dict:
     return data[0] if data else {}
 
 
-@tool
+@rest_tool
 def search_datasets_by_species_tool(species_name: str) -> list:
     """Search datasets by species common name (e.g., 'Soybean', 'Rice').
     First finds the species, then returns datasets for that species.
     """
     # First find the species
-    species_resp = httpx.get(
+    species_resp = yield rest_get(
         f"{REST_URL}/species",
         headers=get_headers(),
         params={"common_name": f"ilike.*{species_name}*", "select": "id,common_name"}
@@ -60,7 +76,7 @@ def search_datasets_by_species_tool(species_name: str) -> list:
 
     # Get datasets for these species
     species_ids = [s["id"] for s in species_list]
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_datasets",
         headers=get_headers(),
         params={
@@ -73,34 +89,38 @@ def search_datasets_by_species_tool(species_name: str) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_clusters_by_dataset_tool(dataset_id: int) -> list | str:
     """Fetch all clusters for a given dataset else return "No clusters found for dataset {dataset_id}."
 
     Returns cluster_id, name, color, ordinal, and cell_count per cluster.
     """
-    clusters_resp = httpx.get(
-        f"{REST_URL}/scrna_clusters",
-        headers=get_headers(),
-        params={
-            "dataset_id": f"eq.{dataset_id}",
-            "select": "cluster_id,name,color,ordinal",
-            "order": "ordinal.asc",
-        },
-    )
-    if clusters_resp.status_code != 200:
-        raise Exception(f"Failed to fetch clusters: {clusters_resp.text}")
-    clusters = clusters_resp.json()
-
-    if clusters:
-        stats_resp = httpx.get(
+    # Cluster stats are only used when there are clusters, but fetching them
+    # alongside saves a round trip in the common case.
+    clusters_resp, stats_resp = yield [
+        rest_get(
+            f"{REST_URL}/scrna_clusters",
+            headers=get_headers(),
+            params={
+                "dataset_id": f"eq.{dataset_id}",
+                "select": "cluster_id,name,color,ordinal",
+                "order": "ordinal.asc",
+            },
+        ),
+        rest_get(
             f"{REST_URL}/scrna_cluster_stats",
             headers=get_headers(),
             params={
                 "dataset_id": f"eq.{dataset_id}",
                 "select": "cluster_id,cell_count",
             },
-        )
+        ),
+    ]
+    if clusters_resp.status_code != 200:
+        raise Exception(f"Failed to fetch clusters: {clusters_resp.text}")
+    clusters = clusters_resp.json()
+
+    if clusters:
         counts = {}
         if stats_resp.status_code == 200:
             for row in stats_resp.json():
@@ -119,10 +139,10 @@ def get_clusters_by_dataset_tool(dataset_id: int) -> list | str:
         return f"No clusters found for dataset {dataset_id}."
 
 
-@tool
+@rest_tool
 def get_genes_by_dataset_tool(dataset_id: int, limit: int = 50) -> list:
     """Fetch genes for a dataset. Returns gene id, gene_number, gene_name."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_genes",
         headers=get_headers(),
         params={
@@ -136,10 +156,10 @@ def get_genes_by_dataset_tool(dataset_id: int, limit: int = 50) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def search_gene_tool(dataset_id: int, gene_name: str) -> list:
     """Search for a gene by name in a dataset."""
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_genes",
         headers=get_headers(),
         params={
@@ -153,12 +173,12 @@ def search_gene_tool(dataset_id: int, gene_name: str) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_differential_expression_files_tool(dataset_id: int) -> list:
     """Get differential expression file paths for a dataset.
     The DE data is stored in files, this returns the file paths and cluster info.
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_de",
         headers=get_headers(),
         params={
@@ -171,7 +191,7 @@ def get_differential_expression_files_tool(dataset_id: int) -> list:
     return response.json()
 
 
-@tool
+@rest_tool
 def get_top_de_genes_tool(dataset_id: int, cluster_id: str, top_n: int = 20) -> list:
     """Get top differentially expressed genes for a specific cluster.
 
@@ -184,7 +204,7 @@ def get_top_de_genes_tool(dataset_id: int, cluster_id: str, top_n: int = 20) ->
         List of top DE genes with gene name, log2 fold change, p-value, and expression percentages.
     """
     # Get the file path from scrna_de
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_de",
         headers=get_headers(),
         params={
@@ -206,7 +226,7 @@ def get_top_de_genes_tool(dataset_id: int, cluster_id: str, top_n: int = 20) ->
     client = get_supabase_client()
 
     try:
-        file_content = client.storage.from_("scrna").download(file_path)
+        file_content = yield offload(client.storage.from_("scrna").download, file_path)
         de_results = json.loads(file_content.decode("utf-8"))
     except Exception as e:
         raise Exception(f"Failed to download DE results from storage: {e}")
@@ -215,12 +235,12 @@ def get_top_de_genes_tool(dataset_id: int, cluster_id: str, top_n: int = 20) ->
     return de_results[:top_n]
 
 
-@tool
+@rest_tool
 def get_cells_by_cluster_tool(dataset_id: int, cluster_id: str, limit: int = 100) -> list:
     """Get cells for a specific cluster in a dataset.
     Returns cell info including coordinates and barcode.
     """
-    response = httpx.get(
+    response = yield rest_get(
         f"{REST_URL}/scrna_cells",
         headers=get_headers(),
         params={
@@ -235,11 +255,105 @@ def get_cells_by_cluster_tool(dataset_id: int, cluster_id: str, limit: int = 100
     return response.json()
 
 
-@tool
+def _ranged_get(object_path: str, offset: int, length: int):
+    """A GET for bytes [offset, offset + length) of an `scrna` bucket object."""
+    headers = {**get_headers(), "Range": f"bytes={offset}-{offset + length - 1}"}
+    return rest_get(f"{SCRNA_OBJECT_URL}/{object_path}", headers=headers)
+
+
+def _load_gene_counts(dataset_id: int, genes: list[dict]):
+    """Fetch counts for `genes` (scrna_genes rows with id, gene_name).
+
+    A sub-generator for the tools below (`yield from`): returns
+    {gene_id: (cell numbers, counts)} as NumPy arrays. Genes whose row names a
+    packed count matrix (counts_packed_path) are read with ranged GETs of just
+    their blocks (neighbouring blocks merged into one request); genes from
+    datasets stored only as one JSON object per gene are downloaded whole.
+    """
+    ids = ",".join(str(g["id"]) for g in genes)
+    counts_resp = yield rest_get(
+        f"{REST_URL}/scrna_counts",
+        headers=get_headers(),
+        params={
+            "dataset_id": f"eq.{dataset_id}",
+            "gene_id": f"in.({ids})",
+            "select": (
+                "gene_id,counts_object_path,counts_packed_path,"
+                "counts_byte_offset,counts_byte_length"
+            )
+        }
+    )
+    rows = {}
+    if counts_resp.status_code == 200:
+        rows = {row["gene_id"]: row for row in counts_resp.json()}
+    for gene in genes:
+        if gene["id"] not in rows:
+            raise Exception(
+                f"No counts file found for gene '{gene['gene_name']}' in dataset {dataset_id}"
+            )
+
+    packed = [r for r in rows.values() if r.get("counts_packed_path")]
+    legacy = [r for r in rows.values() if not r.get("counts_packed_path")]
+    spans = []
+    for path in {r["counts_packed_path"] for r in packed}:
+        ranges = [
+            (r["counts_byte_offset"], r["counts_byte_length"])
+            for r in packed
+            if r["counts_packed_path"] == path and r["counts_byte_length"]
+        ]
+        spans += [(path, offset, length) for offset, length in coalesce_ranges(ranges)]
+
+    client = get_supabase_client()
+    try:
+        span_resps, legacy_files = yield [
+            [_ranged_get(path, offset, length) for path, offset, length in spans],
+            [
+                offload(client.storage.from_("scrna").download, r["counts_object_path"])
+                for r in legacy
+            ],
+        ]
+    except Exception as e:
+        raise Exception(f"Failed to download counts from storage: {e}")
+
+    span_bytes = {}
+    for (path, offset, length), resp in zip(spans, span_resps):
+        if resp.status_code == 206:
+            span_bytes[(path, offset)] = resp.content
+        elif resp.status_code == 200:
+            # The server ignored the Range header and sent the whole object.
+            span_bytes[(path, offset)] = resp.content[offset:offset + length]
+        else:
+            raise Exception(f"Failed to download counts from storage: {resp.text}")
+
+    counts = {}
+    for row in packed:
+        length = row["counts_byte_length"]
+        block = b""
+        for (path, offset), data in span_bytes.items():
+            start = row["counts_byte_offset"] - offset
+            if path == row["counts_packed_path"] and 0 <= start < len(data):
+                block = data[start:start + length]
+                break
+        counts[row["gene_id"]] = unpack_block(block)
+    for row, file_content in zip(legacy, legacy_files):
+        data = json.loads(file_content.decode("utf-8"))
+        counts[row["gene_id"]] = (
+            np.fromiter(map(int, data.keys()), dtype=np.int64, count=len(data)),
+            np.fromiter(data.values(), dtype=np.float64, count=len(data)),
+        )
+    return counts
+
+
+def _counts_dict(cells, values) -> dict:
+    """A gene's counts as the tools return them: {cell_number (str): count}."""
+    return dict(zip(map(str, cells.tolist()), values.tolist()))
+
+
+@rest_tool
 def get_gene_counts_tool(dataset_id: int, gene_name: str) -> dict:
     """Get expression counts for a specific gene across cells.
 
-    Fetches count data from storage (JSON file) for the specified gene.
+    Fetches count data from storage for the specified gene.
     Returns dict with cell_number as key and count as value.
 
     Args:
@@ -250,7 +364,7 @@ def get_gene_counts_tool(dataset_id: int, gene_name: str) -> dict:
         Dictionary with gene info and counts per cell.
     """
     # First get gene_id and counts file path
-    gene_resp = httpx.get(
+    gene_resp = yield rest_get(
         f"{REST_URL}/scrna_genes",
         headers=get_headers(),
         params={
@@ -265,29 +379,8 @@ def get_gene_counts_tool(dataset_id: int, gene_name: str) -> dict:
     gene_data = gene_resp.json()[0]
     gene_id = gene_data["id"]
 
-    # Get the counts file path from scrna_counts table
-    counts_resp = httpx.get(
-        f"{REST_URL}/scrna_counts",
-        headers=get_headers(),
-        params={
-            "dataset_id": f"eq.{dataset_id}",
-            "gene_id": f"eq.{gene_id}",
-            "select": "counts_object_path"
-        }
-    )
-    if counts_resp.status_code != 200 or not counts_resp.json():
-        raise Exception(f"No counts file found for gene '{gene_name}' in dataset {dataset_id}")
-
-    file_path = counts_resp.json()[0]["counts_object_path"]
-
-    # Fetch the JSON file from storage
-    client = get_supabase_client()
-
-    try:
-        file_content = client.storage.from_("scrna").download(file_path)
-        counts_data = json.loads(file_content.decode("utf-8"))
-    except Exception as e:
-        raise Exception(f"Failed to download counts from storage: {e}")
+    counts = yield from _load_gene_counts(dataset_id, [gene_data])
+    counts_data = _counts_dict(*counts[gene_id])
 
     return {
         "gene_name": gene_name,
@@ -297,64 +390,82 @@ def get_gene_counts_tool(dataset_id: int, gene_name: str) -> dict:
     }
 
 
-@tool
-def get_gene_expression_by_cluster_tool(dataset_id: int, gene_name: str) -> dict:
-    """Find which cell types/clusters express a specific gene.
+@rest_tool
+def get_multi_gene_counts_tool(dataset_id: int, gene_names: list[str]) -> dict:
+    """Get expression counts across cells for several genes at once.
 
-    This tool answers questions like "In which cell types is gene X expressed?"
-    It fetches gene expression counts and maps them to clusters.
+    Same per-gene counts as get_gene_counts_tool, for up to 50 genes in one
+    call. Use this instead of calling get_gene_counts_tool once per gene.
 
     Args:
         dataset_id: The dataset ID
-        gene_name: The gene name (e.g., 'Glyma.01G000100')
+        gene_names: Gene names (e.g., ['Glyma.01G000100', 'Glyma.01G000200'])
 
     Returns:
-        Dictionary with cluster expression summary:
-        - clusters: list of {cluster_id, expressing_cells, total_cells, percent_expressing, mean_expression}
-        - gene_name: the queried gene
-        - total_expressing_cells: cells with non-zero expression
+        Dictionary with counts per cell for each gene found, and the names of
+        any genes not in the dataset under `missing_genes`.
     """
-    # First get gene counts
-    gene_resp = httpx.get(
+    names = list(dict.fromkeys(gene_names))
+    if not names:
+        raise Exception("gene_names must list at least one gene")
+    if len(names) > _MULTI_GENE_LIMIT:
+        raise Exception(
+            f"At most {_MULTI_GENE_LIMIT} genes per call; got {len(names)}"
+        )
+    quoted = ",".join(json.dumps(name) for name in names)
+    gene_resp = yield rest_get(
         f"{REST_URL}/scrna_genes",
         headers=get_headers(),
         params={
             "dataset_id": f"eq.{dataset_id}",
-            "gene_name": f"eq.{gene_name}",
+            "gene_name": f"in.({quoted})",
             "select": "id,gene_name"
         }
     )
-    if gene_resp.status_code != 200 or not gene_resp.json():
-        raise Exception(f"Gene '{gene_name}' not found in dataset {dataset_id}")
+    if gene_resp.status_code != 200:
+        raise Exception(f"Failed to fetch genes: {gene_resp.text}")
+    genes = {g["gene_name"]: g for g in gene_resp.json()}
+    found = [genes[name] for name in names if name in genes]
+    if not found:
+        raise Exception(f"None of the genes {names} found in dataset {dataset_id}")
 
-    gene_data = gene_resp.json()[0]
-    gene_id = gene_data["id"]
+    counts = yield from _load_gene_counts(dataset_id, found)
 
-    # Get the counts file path
-    counts_resp = httpx.get(
-        f"{REST_URL}/scrna_counts",
-        headers=get_headers(),
-        params={
-            "dataset_id": f"eq.{dataset_id}",
-            "gene_id": f"eq.{gene_id}",
-            "select": "counts_object_path"
-        }
-    )
-    if counts_resp.status_code != 200 or not counts_resp.json():
-        raise Exception(f"No counts file found for gene '{gene_name}' in dataset {dataset_id}")
+    return {
+        "dataset_id": dataset_id,
+        "genes": {
+            g["gene_name"]: {"gene_id": g["id"], "counts": _counts_dict(*counts[g["id"]])}
+            for g in found
+        },
+        "missing_genes": [name for name in names if name not in genes],
+    }
 
-    file_path = counts_resp.json()[0]["counts_object_path"]
 
-    # Fetch counts from storage
-    client = get_supabase_client()
-    try:
-        file_content = client.storage.from_("scrna").download(file_path)
-        counts_data = json.loads(file_content.decode("utf-8"))
-    except Exception as e:
-        raise Exception(f"Failed to download counts from storage: {e}")
+class _ClusterAssignment(NamedTuple):
+    """A dataset's cell -> cluster assignment, as `cluster_codes` encodes it."""
+
+    version: tuple
+    codes: np.ndarray
+    cluster_ids: list
+    sizes: np.ndarray
+
+
+# dataset_id -> its assignment, reused while the dataset row's version
+# (ingest time, cell count, source checksum) is unchanged. Evicts oldest.
+_cluster_assignments: dict[int, _ClusterAssignment] = {}
+_CLUSTER_ASSIGNMENTS_MAX = 8
+
 
-    # Get all cells with their cluster assignments
-    cells_resp = httpx.get(
+def _cluster_assignment(dataset_id: int, version: tuple | None):
+    """The dataset's cached assignment, re-read from scrna_cells if it changed.
+
+    A sub-generator (`yield from`) returning a `_ClusterAssignment`.
+    """
+    cached = _cluster_assignments.get(dataset_id)
+    if cached is not None and version is not None and cached.version == version:
+        return cached
+
+    cells_resp = yield rest_get(
         f"{REST_URL}/scrna_cells",
         headers=get_headers(),
         params={
@@ -364,46 +475,117 @@ def get_gene_expression_by_cluster_tool(dataset_id: int, gene_name: str) -> dict
     )
     if cells_resp.status_code != 200:
         raise Exception(f"Failed to fetch cells: {cells_resp.text}")
-
     cells = cells_resp.json()
+    codes, cluster_ids = cluster_codes(
+        [c["cell_number"] for c in cells], [c["cluster_id"] for c in cells]
+    )
+    assignment = _ClusterAssignment(
+        version, codes, cluster_ids,
+        np.bincount(codes[codes >= 0], minlength=len(cluster_ids)),
+    )
+    if version is not None:
+        if dataset_id not in _cluster_assignments and len(_cluster_assignments) >= _CLUSTER_ASSIGNMENTS_MAX:
+            del _cluster_assignments[next(iter(_cluster_assignments))]
+        _cluster_assignments[dataset_id] = assignment
+    return assignment
+
+
+def _cluster_row(cluster_id, expressing: int, total: int, sum_expression: float) -> dict:
+    return {
+        "cluster_id": cluster_id,
+        "expressing_cells": expressing,
+        "total_cells": total,
+        "percent_expressing": round(100 * expressing / total, 1) if total > 0 else 0,
+        "mean_expression": round(sum_expression / expressing, 2) if expressing > 0 else 0
+    }
 
-    # Build cell_number -> cluster_id mapping
-    cell_to_cluster = {str(c["cell_number"]): c["cluster_id"] for c in cells}
-
-    # Count expression per cluster
-    cluster_stats = {}
-    for cell_num, count in counts_data.items():
-        cluster_id = cell_to_cluster.get(str(cell_num), "unknown")
-        if cluster_id not in cluster_stats:
-            cluster_stats[cluster_id] = {"expressing": 0, "total": 0, "sum_expression": 0}
-        cluster_stats[cluster_id]["total"] += 1
-        if count > 0:
-            cluster_stats[cluster_id]["expressing"] += 1
-            cluster_stats[cluster_id]["sum_expression"] += count
-
-    # Also count total cells per cluster (including non-expressing)
-    for cell in cells:
-        cluster_id = cell["cluster_id"]
-        if cluster_id not in cluster_stats:
-            cluster_stats[cluster_id] = {"expressing": 0, "total": 0, "sum_expression": 0}
-
-    # Calculate stats per cluster
-    result_clusters = []
-    for cluster_id, stats in sorted(cluster_stats.items()):
-        total_in_cluster = sum(1 for c in cells if c["cluster_id"] == cluster_id)
-        expressing = stats["expressing"]
-        pct = round(100 * expressing / total_in_cluster, 1) if total_in_cluster > 0 else 0
-        mean_expr = round(stats["sum_expression"] / expressing, 2) if expressing > 0 else 0
-
-        result_clusters.append({
-            "cluster_id": cluster_id,
-            "expressing_cells": expressing,
-            "total_cells": total_in_cluster,
-            "percent_expressing": pct,
-            "mean_expression": mean_expr
-        })
-
-    # Sort by percent expressing (descending)
+
+@rest_tool
+def get_gene_expression_by_cluster_tool(dataset_id: int, gene_name: str) -> dict:
+    """Find which cell types/clusters express a specific gene.
+
+    This tool answers questions like "In which cell types is gene X expressed?"
+    It fetches gene expression counts and maps them to clusters.
+
+    Args:
+        dataset_id: The dataset ID
+        gene_name: The gene name (e.g., 'Glyma.01G000100')
+
+    Returns:
+        Dictionary with cluster expression summary:
+        - clusters: list of {cluster_id, expressing_cells, total_cells, percent_expressing, mean_expression};
+          expressing cells with no cluster are reported as cluster_id "unknown" (total_cells 0)
+        - gene_name: the queried gene
+        - total_expressing_cells: cells with non-zero expression
+    """
+    # The gene, the dataset's version (for the cached cluster assignment) and
+    # any per-cluster summaries stored for the gene at upload time are
+    # independent look-ups, so they're fetched together.
+    gene_resp, dataset_resp, stored_resp = yield [
+        rest_get(
+            f"{REST_URL}/scrna_genes",
+            headers=get_headers(),
+            params={
+                "dataset_id": f"eq.{dataset_id}",
+                "gene_name": f"eq.{gene_name}",
+                "select": "id,gene_name"
+            }
+        ),
+        rest_get(
+            f"{REST_URL}/scrna_datasets",
+            headers=get_headers(),
+            params={
+                "id": f"eq.{dataset_id}",
+                "select": "ingested_at,n_cells,source_checksum"
+            }
+        ),
+        rest_get(
+            f"{REST_URL}/scrna_gene_cluster_stats",
+            headers=get_headers(),
+            params={
+                "dataset_id": f"eq.{dataset_id}",
+                "scrna_genes.gene_name": f"eq.{gene_name}",
+                "select": "cluster_id,expressing_cells,total_cells,sum_expression,scrna_genes!inner(gene_name)"
+            }
+        ),
+    ]
+    if gene_resp.status_code != 200 or not gene_resp.json():
+        raise Exception(f"Gene '{gene_name}' not found in dataset {dataset_id}")
+
+    gene_data = gene_resp.json()[0]
+    gene_id = gene_data["id"]
+
+    stored = stored_resp.json() if stored_resp.status_code == 200 else []
+    if stored:
+        result_clusters = [
+            _cluster_row(
+                r["cluster_id"], r["expressing_cells"], r["total_cells"], r["sum_expression"]
+            )
+            for r in stored
+        ]
+    else:
+        version = None
+        if dataset_resp.status_code == 200 and dataset_resp.json():
+            version = tuple(sorted(dataset_resp.json()[0].items()))
+        assignment = yield from _cluster_assignment(dataset_id, version)
+        counts = yield from _load_gene_counts(dataset_id, [gene_data])
+        cells, values = counts[gene_id]
+        n_clusters = len(assignment.cluster_ids)
+        expressing, sums = summarize_gene(cells, values, assignment.codes, n_clusters)
+        result_clusters = [
+            _cluster_row(
+                cluster_id, int(expressing[k]), int(assignment.sizes[k]), float(sums[k])
+            )
+            for k, cluster_id in enumerate(assignment.cluster_ids)
+        ]
+        if expressing[n_clusters]:
+            # Expressing cells with no cluster in scrna_cells.
+            result_clusters.append(
+                _cluster_row("unknown", int(expressing[n_clusters]), 0, float(sums[n_clusters]))
+            )
+
+    # Sort by percent expressing (descending), ties by cluster id
+    result_clusters.sort(key=lambda c: str(c["cluster_id"]))
     result_clusters.sort(key=lambda x: x["percent_expressing"], reverse=True)
 
     total_expressing = sum(c["expressing_cells"] for c in result_clusters)
@@ -428,5 +610,6 @@ scrna_tools = [
     get_top_de_genes_tool,
     get_cells_by_cluster_tool,
     get_gene_counts_tool,
+    get_multi_gene_counts_tool,
     get_gene_expression_by_cluster_tool,
 ]
@@ -6,6 +6,8 @@
 #   "httpx>=0.27",
 #   "python-dotenv>=1.0",
 #   "imageio-ffmpeg>=0.5",
+#   "pillow>=11",
+#   "numpy>=1.26",
 # ]
 # ///
 """
@@ -48,14 +50,27 @@ Then:
     # force re-render even if gravi_plate_videos already has a row
     uv run scripts/render_plate_videos.py --experiment 1 --force
 
+    # full-experiment backfill: 4 plates at once, 8 frame downloads per plate
+    uv run scripts/render_plate_videos.py --experiment 1 --jobs 4 --download-workers 8
+
 DESIGN NOTES
 ------------
 - Idempotent by default: skips a plate whose `gravi_plate_videos.frame_count`
   matches the current count of `gravi_images` rows for that plate.
 - Conservative on errors: a failure on one plate logs and continues; the
   process exits non-zero if any plate failed so cron can detect it.
-- TIFF → MP4: ffmpeg reads each TIFF as a frame; framerate is configurable
-  via --framerate (default 4 fps).
+- TIFF → MP4: frames download concurrently (--download-workers) and each
+  TIFF is downscaled to --max-width with Pillow as soon as it lands, while
+  later frames are still downloading; ffmpeg then encodes the small PNGs
+  instead of decoding every 4960x6850 TIFF at scale time. Framerate is
+  configurable via --framerate (default 4 fps).
+- Parallelism: --jobs N renders N plates at once, each on its own DB
+  connection; the storage client (and its connection pool) is shared. Each
+  plate logs download (incl. downscale), encode and upload seconds and the
+  bytes moved.
+- Upload: the MP4 streams from disk in 6 MiB chunks; files of 50 MiB or
+  more use the storage-api's resumable (TUS) endpoint and resume from the
+  server's offset after a dropped chunk.
 - Auth: uses SERVICE_ROLE_KEY for both DB queries and storage I/O. Never
   bake this script into a request path; it's a back-office job.
 """
@@ -63,19 +78,24 @@ DESIGN NOTES
 from __future__ import annotations
 
 import argparse
+import base64
 import logging
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
 import httpx
+import numpy as np
 import psycopg
 from dotenv import load_dotenv
+from PIL import Image
 
 logger = logging.getLogger("render_plate_videos")
 
@@ -92,9 +112,12 @@ class Config:
     target_bucket: str = "graviscan-videos"
     framerate: int = 4
     max_width: int = 720
+    download_workers: int = 8
 
     @classmethod
-    def from_env(cls, framerate: int, max_width: int) -> "Config":
+    def from_env(
+        cls, framerate: int, max_width: int, download_workers: int = 8
+    ) -> "Config":
         missing = [
             k
             for k in ("SUPABASE_URL", "SERVICE_ROLE_KEY", "POSTGRES_DSN")
@@ -111,6 +134,7 @@ class Config:
             postgres_dsn=os.environ["POSTGRES_DSN"],
             framerate=framerate,
             max_width=max_width,
+            download_workers=download_workers,
         )
 
 
@@ -239,7 +263,9 @@ def upsert_video_row(
 # ─── Storage helpers ─────────────────────────────────────────────────────────
 
 
-def storage_client(cfg: Config) -> httpx.Client:
+def storage_client(cfg: Config, jobs: int = 1) -> httpx.Client:
+    # Shared by every plate thread; pool sized for all of their downloads.
+    connections = max(10, jobs * cfg.download_workers + jobs)
     return httpx.Client(
         base_url=cfg.supabase_url,
         headers={
@@ -248,19 +274,44 @@ def storage_client(cfg: Config) -> httpx.Client:
         },
         timeout=60.0,
         verify=False,  # staging uses tls internal; in prod swap for verify=True
+        limits=httpx.Limits(
+            max_connections=connections, max_keepalive_connections=connections
+        ),
     )
 
 
 def download_frame(
     client: httpx.Client, bucket: str, object_path: str, dest: Path
-) -> None:
-    """Pull a single object's raw bytes via the storage-api authenticated endpoint."""
+) -> int:
+    """Pull a single object's raw bytes via the storage-api authenticated endpoint.
+
+    Returns the number of bytes written.
+    """
     url = f"/storage/v1/object/{bucket}/{object_path}"
+    written = 0
     with client.stream("GET", url) as r:
         r.raise_for_status()
         with dest.open("wb") as fh:
             for chunk in r.iter_bytes():
                 fh.write(chunk)
+                written += len(chunk)
+    return written
+
+
+# Upload bodies are streamed from disk in chunks of this size, so memory per
+# upload is bounded no matter how large the MP4 is. Supabase's resumable (TUS)
+# endpoint requires exactly this chunk size for every chunk but the last.
+UPLOAD_CHUNK_BYTES = 6 * 1024 * 1024
+# Files at least this large go through the resumable endpoint, which survives a
+# dropped connection by resuming from the server's offset instead of restarting.
+RESUMABLE_THRESHOLD_BYTES = 50 * 1024 * 1024
+RESUMABLE_MAX_RETRIES = 3
+
+
+def _iter_file(source: Path, chunk_bytes: int = UPLOAD_CHUNK_BYTES) -> Iterable[bytes]:
+    with source.open("rb") as fh:
+        while chunk := fh.read(chunk_bytes):
+            yield chunk
 
 
 def upload_video(
@@ -269,24 +320,162 @@ def upload_video(
     object_path: str,
     source: Path,
     overwrite: bool,
+    resumable_threshold: int = RESUMABLE_THRESHOLD_BYTES,
 ) -> None:
-    """Upload (or overwrite) an MP4 to the storage bucket."""
+    """Upload (or overwrite) an MP4 to the storage bucket, streaming from disk."""
+    size = source.stat().st_size
+    if size >= resumable_threshold:
+        upload_video_resumable(client, bucket, object_path, source, overwrite)
+        return
     url = f"/storage/v1/object/{bucket}/{object_path}"
     method = "PUT" if overwrite else "POST"
-    headers = {"Content-Type": "video/mp4"}
+    headers = {"Content-Type": "video/mp4", "Content-Length": str(size)}
     if overwrite:
         headers["x-upsert"] = "true"
-    with source.open("rb") as fh:
-        r = client.request(method, url, headers=headers, content=fh.read())
+    r = client.request(method, url, headers=headers, content=_iter_file(source))
     if r.status_code >= 400:
         raise RuntimeError(
             f"Upload failed {r.status_code} for {object_path}: {r.text[:300]}"
         )
 
 
+def _tus_metadata(**fields: str) -> str:
+    return ",".join(
+        f"{k} {base64.b64encode(v.encode()).decode()}" for k, v in fields.items()
+    )
+
+
+def upload_video_resumable(
+    client: httpx.Client,
+    bucket: str,
+    object_path: str,
+    source: Path,
+    overwrite: bool,
+) -> None:
+    """Upload via Supabase Storage's TUS endpoint, one chunk per PATCH.
+
+    A failed PATCH asks the server for its current offset (HEAD) and resumes
+    from there; if the HEAD fails too, the next PATCH retries from the last
+    offset the server acknowledged. Either failure counts against
+    RESUMABLE_MAX_RETRIES consecutive retries.
+    """
+    size = source.stat().st_size
+    tus = {"Tus-Resumable": "1.0.0"}
+    create_headers = {
+        **tus,
+        "Upload-Length": str(size),
+        "Upload-Metadata": _tus_metadata(
+            bucketName=bucket,
+            objectName=object_path,
+            contentType="video/mp4",
+        ),
+    }
+    if overwrite:
+        create_headers["x-upsert"] = "true"
+    r = client.post("/storage/v1/upload/resumable", headers=create_headers)
+    if r.status_code >= 400:
+        raise RuntimeError(
+            f"Resumable upload create failed {r.status_code} for {object_path}: "
+            f"{r.text[:300]}"
+        )
+    location = r.headers["Location"]
+
+    offset = 0
+    failures = 0
+    resync = False
+    with source.open("rb") as fh:
+        while offset < size:
+            syncing, resync = resync, False
+            try:
+                if syncing:
+                    head = client.head(location, headers=tus)
+                    head.raise_for_status()
+                    offset = int(head.headers["Upload-Offset"])
+                    continue
+                fh.seek(offset)
+                chunk = fh.read(UPLOAD_CHUNK_BYTES)
+                r = client.patch(
+                    location,
+                    headers={
+                        **tus,
+                        "Upload-Offset": str(offset),
+                        "Content-Type": "application/offset+octet-stream",
+                    },
+                    content=chunk,
+                )
+                r.raise_for_status()
+                offset = int(r.headers["Upload-Offset"])
+                failures = 0
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                failures += 1
+                if failures > RESUMABLE_MAX_RETRIES:
+                    raise RuntimeError(
+                        f"Resumable upload failed for {object_path} "
+                        f"at byte {offset}: {e}"
+                    ) from e
+                logger.warning(
+                    "  resumable upload of %s interrupted at byte %d (%s); resuming",
+                    object_path,
+                    offset,
+                    e,
+                )
+                resync = not syncing
+
+
 # ─── Encoding ────────────────────────────────────────────────────────────────
 
 
+def downscale_frame(source: Path, dest: Path, max_width: int) -> None:
+    """Write `source` to `dest` (PNG) no wider than max_width, aspect preserved.
+
+    `Image.reduce` box-averages by an integer factor in one pass over the
+    decoded TIFF, and the small remainder is resampled with LANCZOS; the
+    result is what ffmpeg's `scale='min(max_width,iw)':-2` would have
+    produced from the full frame, at a fraction of the encode-time work.
+    """
+    with Image.open(source) as img:
+        if img.mode.startswith("I;16"):
+            # 16-bit greyscale: keep the high byte, as ffmpeg's gray16→yuv does.
+            # Through numpy: Image.point rejects the I;16B/I;16L variants.
+            img = Image.fromarray((np.asarray(img) >> 8).astype(np.uint8))
+        elif img.mode not in ("L", "RGB"):
+            img = img.convert("RGB")
+        width, height = img.size
+        if width > max_width:
+            factor = width // max_width
+            if factor >= 2:
+                img = img.reduce(factor)
+            target_height = max(1, round(height * max_width / width))
+            if img.size != (max_width, target_height):
+                img = img.resize((max_width, target_height), Image.Resampling.LANCZOS)
+        img.save(dest, format="PNG", compress_level=1)
+
+
+def prepare_frame(
+    client: httpx.Client,
+    bucket: str,
+    object_path: str,
+    frames_dir: Path,
+    idx: int,
+    max_width: int,
+) -> int:
+    """Download one frame and replace it with its downscaled PNG.
+
+    Returns the bytes downloaded. The full-size original is deleted as soon
+    as it has been reduced, so at most one TIFF per download worker is on
+    disk at a time.
+    """
+    suffix = Path(object_path).suffix or ".tif"
+    raw = frames_dir / f"raw_{idx:04d}{suffix}"
+    logger.debug("  download %s → %s", object_path, raw.name)
+    size = download_frame(client, bucket, object_path, raw)
+    try:
+        downscale_frame(raw, frames_dir / f"frame_{idx:04d}.png", max_width)
+    finally:
+        raw.unlink(missing_ok=True)
+    return size
+
+
 def encode_mp4(
     frames_dir: Path, out_path: Path, framerate: int, max_width: int
 ) -> None:
@@ -301,7 +490,7 @@ def encode_mp4(
 
     ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
 
-    frames = sorted(frames_dir.iterdir())
+    frames = sorted(frames_dir.glob("frame_*"))
     if not frames:
         raise RuntimeError("encode_mp4: no frames found in {frames_dir}")
     ext = frames[0].suffix or ".bin"
@@ -347,6 +536,56 @@ def estimate_duration_seconds(frame_count: int, framerate: int) -> int:
 # ─── Orchestration ───────────────────────────────────────────────────────────
 
 
+@dataclass
+class PlateStats:
+    """Per-plate timings (seconds) and bytes moved, for tuning the parallelism flags."""
+
+    frames: int = 0
+    bytes_downloaded: int = 0
+    bytes_uploaded: int = 0
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        timings = " ".join(f"{k}={v:.1f}s" for k, v in self.seconds.items())
+        return (
+            f"{self.frames} frames, "
+            f"{self.bytes_downloaded / (1024 * 1024):.1f} MiB in, "
+            f"{self.bytes_uploaded / (1024 * 1024):.1f} MiB out, {timings}"
+        )
+
+
+def download_frames(
+    cfg: Config, client: httpx.Client, job: PlateJob, frames_dir: Path
+) -> int:
+    """Fetch + downscale every frame of a plate concurrently; returns bytes downloaded.
+
+    Frames are named by their capture-order index, so completion order doesn't
+    matter. The first failure cancels the frames not yet started and re-raises.
+    """
+    total = 0
+    with ThreadPoolExecutor(max_workers=max(1, cfg.download_workers)) as pool:
+        futures = [
+            pool.submit(
+                prepare_frame,
+                client,
+                cfg.source_bucket,
+                object_path,
+                frames_dir,
+                idx,
+                cfg.max_width,
+            )
+            for idx, object_path in enumerate(job.frame_paths)
+        ]
+        try:
+            for future in as_completed(futures):
+                total += future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return total
+
+
 def render_one(
     cfg: Config,
     conn: psycopg.Connection,
@@ -354,7 +593,8 @@ def render_one(
     job: PlateJob,
     force: bool,
     dry_run: bool,
-) -> None:
+) -> PlateStats | None:
+    """Render one plate; returns its stats, or None when skipped / dry-run."""
     # Wave in the path so each wave's video is a distinct object (a plate_id
     # reused across waves would otherwise overwrite the previous wave's file).
     wave_seg = f"wave-{job.wave_number}" if job.wave_number is not None else "wave-none"
@@ -365,18 +605,23 @@ def render_one(
     )
     if existing and existing["frame_count"] == len(job.frame_paths) and not force:
         logger.info(
-            "  skip — gravi_plate_videos already at %d frames; use --force to redo",
+            "  [%s] skip — gravi_plate_videos already at %d frames; "
+            "use --force to redo",
+            job.plate_id,
             existing["frame_count"],
         )
-        return
+        return None
     if dry_run:
         logger.info(
-            "  DRY-RUN would render %d frames → %s/%s",
+            "  [%s] DRY-RUN would render %d frames → %s/%s",
+            job.plate_id,
             len(job.frame_paths),
             cfg.target_bucket,
             target_path,
         )
-        return
+        return None
+
+    stats = PlateStats(frames=len(job.frame_paths))
 
     with tempfile.TemporaryDirectory(prefix="gravi-render-") as tmp:
         tmp_dir = Path(tmp)
@@ -384,29 +629,33 @@ def render_one(
         frames_dir.mkdir()
         out_path = tmp_dir / "out.mp4"
 
-        # 1. Download frames in order
-        for idx, object_path in enumerate(job.frame_paths):
-            suffix = Path(object_path).suffix or ".tif"
-            local = frames_dir / f"frame_{idx:04d}{suffix}"
-            logger.debug("  download %s → %s", object_path, local.name)
-            download_frame(client, cfg.source_bucket, object_path, local)
+        # 1. Download + downscale frames (concurrently; named by capture order)
+        started = time.monotonic()
+        stats.bytes_downloaded = download_frames(cfg, client, job, frames_dir)
+        stats.seconds["download"] = time.monotonic() - started
 
         # 2. Encode MP4
         logger.info(
-            "  encode %d frames @ %d fps → %s",
+            "  [%s] encode %d frames @ %d fps → %s",
+            job.plate_id,
             len(job.frame_paths),
             cfg.framerate,
             out_path.name,
         )
+        started = time.monotonic()
         encode_mp4(frames_dir, out_path, cfg.framerate, cfg.max_width)
+        stats.seconds["encode"] = time.monotonic() - started
 
         # 3. Upload
+        stats.bytes_uploaded = out_path.stat().st_size
         logger.info(
-            "  upload → %s/%s (%.1f MiB)",
+            "  [%s] upload → %s/%s (%.1f MiB)",
+            job.plate_id,
             cfg.target_bucket,
             target_path,
-            out_path.stat().st_size / (1024 * 1024),
+            stats.bytes_uploaded / (1024 * 1024),
         )
+        started = time.monotonic()
         upload_video(
             client,
             cfg.target_bucket,
@@ -414,6 +663,7 @@ def render_one(
             out_path,
             overwrite=bool(existing),
         )
+        stats.seconds["upload"] = time.monotonic() - started
 
         # 4. Upsert DB row
         upsert_video_row(
@@ -427,10 +677,35 @@ def render_one(
                 len(job.frame_paths), cfg.framerate
             ),
             frame_count=len(job.frame_paths),
-            file_size_bytes=out_path.stat().st_size,
+            file_size_bytes=stats.bytes_uploaded,
         )
         conn.commit()
-        logger.info("  ✓ committed gravi_plate_videos row")
+        logger.info("  [%s] ✓ committed gravi_plate_videos row", job.plate_id)
+    return stats
+
+
+def render_plate(
+    cfg: Config,
+    client: httpx.Client,
+    job: PlateJob,
+    force: bool,
+    dry_run: bool,
+) -> PlateStats | None:
+    """`render_one` on a connection of its own, so plates can run in parallel.
+
+    psycopg connections carry one transaction at a time; sharing one across
+    plate threads would interleave their commits and rollbacks.
+    """
+    started = time.monotonic()
+    with psycopg.connect(cfg.postgres_dsn) as conn:
+        try:
+            stats = render_one(cfg, conn, client, job, force=force, dry_run=dry_run)
+        except Exception:
+            conn.rollback()
+            raise
+    if stats is not None:
+        stats.seconds["total"] = time.monotonic() - started
+    return stats
 
 
 def main(argv: list[str]) -> int:
@@ -444,6 +719,18 @@ def main(argv: list[str]) -> int:
         default=720,
         help="cap output width in px; height scales to preserve aspect (default 720)",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="plates rendered in parallel (default 1)",
+    )
+    ap.add_argument(
+        "--download-workers",
+        type=int,
+        default=8,
+        help="concurrent frame downloads per plate (default 8)",
+    )
     ap.add_argument(
         "--force", action="store_true", help="re-render even if row already matches"
     )
@@ -475,12 +762,24 @@ def main(argv: list[str]) -> int:
         logger.error("imageio-ffmpeg not installed (`pip install imageio-ffmpeg`)")
         return 2
 
-    cfg = Config.from_env(framerate=args.framerate, max_width=args.max_width)
+    cfg = Config.from_env(
+        framerate=args.framerate,
+        max_width=args.max_width,
+        download_workers=args.download_workers,
+    )
 
-    failures: list[str] = []
-    with psycopg.connect(cfg.postgres_dsn) as conn, storage_client(cfg) as client:
+    with psycopg.connect(cfg.postgres_dsn) as conn:
         jobs = list_plate_jobs(conn, args.experiment, args.plate)
-        logger.info("Found %d plate(s) to consider for experiment %d", len(jobs), args.experiment)
+    logger.info("Found %d plate(s) to consider for experiment %d", len(jobs), args.experiment)
+
+    failures: list[str] = []
+    rendered: list[PlateStats] = []
+    started = time.monotonic()
+    with (
+        storage_client(cfg, jobs=max(1, args.jobs)) as client,
+        ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool,
+    ):
+        futures = {}
         for job in jobs:
             logger.info(
                 "[%s wave=%s] %d frames%s",
@@ -489,13 +788,35 @@ def main(argv: list[str]) -> int:
                 len(job.frame_paths),
                 " (DRY-RUN)" if args.dry_run else "",
             )
+            future = pool.submit(
+                render_plate, cfg, client, job, args.force, args.dry_run
+            )
+            futures[future] = job
+        for future in as_completed(futures):
+            job = futures[future]
             try:
-                render_one(cfg, conn, client, job, force=args.force, dry_run=args.dry_run)
+                stats = future.result()
             except Exception as e:  # noqa: BLE001 — keep going on a single-plate failure
                 logger.error("[%s] FAILED: %s", job.plate_id, e)
-                conn.rollback()
                 failures.append(job.plate_id)
-
+                continue
+            if stats is not None:
+                rendered.append(stats)
+                logger.info(
+                    "[%s wave=%s] done: %s",
+                    job.plate_id,
+                    job.wave_number,
+                    stats.summary(),
+                )
+
+    if rendered:
+        logger.info(
+            "rendered %d plate(s) in %.1fs: %.1f MiB downloaded, %.1f MiB uploaded",
+            len(rendered),
+            time.monotonic() - started,
+            sum(s.bytes_downloaded for s in rendered) / (1024 * 1024),
+            sum(s.bytes_uploaded for s in rendered) / (1024 * 1024),
+        )
     if failures:
         logger.error("%d plate(s) failed: %s", len(failures), ", ".join(failures))
         return 1
@@ -1,9 +1,10 @@
 import concurrent.futures
+import json
 import os
 import sys
-import json
 
 
+import numpy as np
 import pandas as pd
 from scipy.io import mmread
 from scipy.sparse import csr_matrix
@@ -11,7 +12,10 @@ from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 import supabase
 
-n_workers = 8
+# The packed count-matrix layout is defined next to its reader, the agent's
+# scRNA tools (langchain/helpers/scrna_counts_pack.py).
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "langchain"))
+from helpers.scrna_counts_pack import cluster_codes, pack_counts, summarize_matrix  # noqa: E402
 
 default_env_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env.dev"))
 dotenv_path = os.environ.get("DOTENV_PATH", default_env_path)
@@ -21,36 +25,114 @@ SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 DATABASE_STRING = os.getenv("DATABASE_STRING")
 
+n_workers = 8
 
-def process_gene(gene_idx, csr, dataset_id, dataset_name, gene_ids, supabase_url, supabase_key, engine):
-    # Creating a new database connection inside the function for thread safety
-    with engine.connect() as conn:
-        gene_id = conn.execute(text(f'SELECT id FROM scrna_genes WHERE dataset_id = {dataset_id} AND gene_number = {gene_idx}')).fetchone()[0]
-
-    print(f"dumping gene {gene_idx}")
-    row = csr[gene_idx, :]
-    nonzero = row.nonzero()
-    values = row[nonzero]
-    d = dict(zip(map(str, nonzero[1]), values.A.flatten()))
-
-    gene_name = gene_ids[gene_idx]
-    storage_path = f'counts/{dataset_name}/{gene_name}.json'
 
-    bucket_name = 'scrna'
-    json_string = json.dumps(d)
-    buffer = json_string.encode('utf-8')
-    # Creating a new Supabase client instance inside the function
-    supabase_client = supabase.create_client(supabase_url, supabase_key)
-    data = supabase_client.storage.from_(bucket_name).upload(storage_path, buffer, {"content-type": "application/json"})
+def upload_gene_json(csr, gene_idx, storage_path, supabase_client):
+    """Write one gene's counts as a {cell_number: count} JSON object (read by the web app)."""
+    start, end = csr.indptr[gene_idx], csr.indptr[gene_idx + 1]
+    cells, values = csr.indices[start:end], csr.data[start:end]
+    nonzero = values != 0
+    d = dict(zip(map(str, cells[nonzero].tolist()), values[nonzero].tolist()))
+    buffer = json.dumps(d).encode('utf-8')
+    supabase_client.storage.from_('scrna').upload(storage_path, buffer, {"content-type": "application/json"})
+
+
+def upload_counts(csr, dataset_id, dataset_name, gene_names, supabase_client, engine):
+    """Write the dataset's counts and index them in scrna_counts.
+
+    Each gene keeps its own JSON object at counts_object_path
+    (counts/{dataset}/{gene}.json), which the web app's expression views
+    download. The whole genes x cells matrix is also written as one packed
+    object, recorded in counts_packed_path with the gene's block (byte offset +
+    length), so the agent reads a gene with a single ranged GET. The packed
+    object can be large; the `scrna` bucket's file size limit must allow it.
+    """
+    csr = csr_matrix(csr)
+    csr.sort_indices()
+    json_paths = [f'counts/{dataset_name}/{gene_name}.json' for gene_name in gene_names]
+    print(f"uploading {len(json_paths)} per-gene count objects")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(upload_gene_json, csr, i, path, supabase_client)
+            for i, path in enumerate(json_paths)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
-    # Database operation for inserting row into scrna_counts table
-    count_info = {'dataset_id': dataset_id, 'gene_id': gene_id, 'counts_object_path': storage_path}
-    df = pd.DataFrame([count_info])
-    with engine.begin() as conn:  # Using a transaction for the insert operation
-        df.to_sql('scrna_counts', conn, if_exists='append', index=False)
+    data, offsets = pack_counts(csr)
+    packed_path = f'counts/{dataset_name}.csr'
+    print(f"uploading packed counts ({len(data)} bytes) to {packed_path}")
+    supabase_client.storage.from_('scrna').upload(
+        packed_path, data, {"content-type": "application/octet-stream"}
+    )
 
+    with engine.connect() as conn:
+        gene_rows = conn.execute(
+            text('SELECT gene_number, id FROM scrna_genes WHERE dataset_id = :dataset_id'),
+            {'dataset_id': dataset_id},
+        ).fetchall()
+    gene_id_by_number = dict(gene_rows)
+    df = pd.DataFrame({
+        'dataset_id': dataset_id,
+        'gene_id': [gene_id_by_number[i] for i in range(csr.shape[0])],
+        'counts_object_path': json_paths,
+        'counts_packed_path': packed_path,
+        'counts_byte_offset': offsets[:-1].astype('int64'),
+        'counts_byte_length': (offsets[1:] - offsets[:-1]).astype('int64'),
+    })
+    with engine.begin() as conn:
+        df.to_sql('scrna_counts', conn, if_exists='append', index=False, chunksize=5000, method='multi')
+
+
+def upload_cluster_summaries(csr, dataset_id, cluster_labels, engine):
+    """Store per-gene x cluster expression summaries (scrna_gene_cluster_stats).
+
+    Aggregates the whole matrix once so the agent's cluster tool can read a
+    gene's summary as a handful of rows instead of aggregating its counts.
+    `cluster_labels[i]` is cell i's cluster id. Expressing cells with no
+    cluster are stored as an 'unknown' row (total_cells 0) for each gene that
+    has any, the same row the tool reports when it aggregates counts itself.
+    """
+    codes, cluster_ids = cluster_codes(range(len(cluster_labels)), cluster_labels)
+    expressing, sums = summarize_matrix(csr, codes, len(cluster_ids))
+    sizes = np.bincount(codes[codes >= 0], minlength=len(cluster_ids))
 
-def upload_scrna(dataset_dir, dataset_name, species_name):
+    with engine.connect() as conn:
+        gene_rows = conn.execute(
+            text('SELECT gene_number, id FROM scrna_genes WHERE dataset_id = :dataset_id'),
+            {'dataset_id': dataset_id},
+        ).fetchall()
+    gene_id_by_number = dict(gene_rows)
+    gene_ids = np.array([gene_id_by_number[i] for i in range(expressing.shape[0])])
+    n_clusters = len(cluster_ids)
+    df = pd.DataFrame({
+        'dataset_id': dataset_id,
+        'gene_id': np.repeat(gene_ids, n_clusters),
+        'cluster_id': np.tile([str(c) for c in cluster_ids], len(gene_ids)),
+        'expressing_cells': expressing[:, :n_clusters].ravel(),
+        'total_cells': np.tile(sizes, len(gene_ids)),
+        'sum_expression': sums[:, :n_clusters].ravel(),
+    })
+    unclustered = np.flatnonzero(expressing[:, n_clusters])
+    if 'unknown' in df['cluster_id'].values:
+        # A real cluster already holds the label; the primary key allows one row per label.
+        print("a cluster is labelled 'unknown'; not storing the unclustered-cell rows")
+    elif len(unclustered):
+        df = pd.concat([df, pd.DataFrame({
+            'dataset_id': dataset_id,
+            'gene_id': gene_ids[unclustered],
+            'cluster_id': 'unknown',
+            'expressing_cells': expressing[unclustered, n_clusters],
+            'total_cells': 0,
+            'sum_expression': sums[unclustered, n_clusters],
+        })], ignore_index=True)
+    print(f"storing {len(df)} gene x cluster summaries")
+    with engine.begin() as conn:
+        df.to_sql('scrna_gene_cluster_stats', conn, if_exists='append', index=False, chunksize=5000, method='multi')
+
+
+def upload_scrna(dataset_dir, dataset_name, species_name, cluster_summaries=False):
 
     print(f'Uploading single-cell RNA-seq dataset {dataset_name} from {dataset_dir}...')
 
@@ -93,22 +175,25 @@ def upload_scrna(dataset_dir, dataset_name, species_name):
     coo = mmread(mtx_file)
     csr = csr_matrix(coo)
 
-    # Usage of ThreadPoolExecutor
-    with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
-        futures = [
-            executor.submit(process_gene, gene_idx, csr, dataset_id, dataset_name, gene_ids, supabase_url, supabase_key, engine)
-            for gene_idx in range(csr.shape[0])
-        ]
-        concurrent.futures.wait(futures)
+    upload_counts(csr, dataset_id, dataset_name, gene_ids, supabase.create_client(SUPABASE_URL, SUPABASE_KEY), engine)
+
+    if cluster_summaries:
+        upload_cluster_summaries(csr, dataset_id, list(cell_embeddings.label), engine)
 
 if __name__ == '__main__':
     print(f"Total number of arguments: {len(sys.argv)}")
     print(f"Arguments received: {sys.argv}")
 
+    # Optional --cluster-summaries: also precompute per-gene x cluster summaries.
+    cluster_summaries = '--cluster-summaries' in sys.argv
+    if cluster_summaries:
+        sys.argv.remove('--cluster-summaries')
+
     dataset_dir = sys.argv[1]
     print("Directory :"+dataset_dir+"\n")
     dataset_name = sys.argv[2]
     print("dataset_name :"+dataset_name+"\n")
     species_name = sys.argv[3]
     print("species_name :"+species_name+"\n")
-    upload_scrna(dataset_dir, dataset_name, species_name)
+    engine = create_engine(DATABASE_STRING)
+    upload_scrna(dataset_dir, dataset_name, species_name, cluster_summaries)
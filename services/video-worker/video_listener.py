@@ -2,8 +2,10 @@
 """
 Video Generation Listener Service
 
-Listens for PostgreSQL notifications and processes video generation jobs.
-Connects directly to PostgreSQL and uses pg_notify for real-time job processing.
+Claims and processes video generation jobs from the video_jobs table.
+Connects directly to PostgreSQL; pg_notify only wakes the worker up. Jobs are
+claimed atomically (FOR UPDATE SKIP LOCKED), so one process runs several job
+slots and several processes can run side by side.
 
 Usage:
     python video_listener.py
@@ -14,21 +16,33 @@ Environment Variables:
     S3_BUCKET_NAME: S3 bucket name
     AWS_ACCESS_KEY_ID: S3 access key
     AWS_SECRET_ACCESS_KEY: S3 secret key
+    VIDEO_WORKER_CONCURRENCY: concurrent job slots in this process (default 2)
+    VIDEO_WORKER_STALE_SECONDS: heartbeat age after which a 'processing' job
+        is reclaimed (default 600)
+    VIDEO_WORKER_SWEEP_SECONDS: heartbeat/sweep interval (default 60)
+    VIDEO_WORKER_MAX_ATTEMPTS: claims before a repeatedly stuck job is failed
+        (default 3)
+    VIDEO_WORKER_PREFETCH_FRAMES: frames downloaded + decoded ahead of the
+        encoder, per job (default 8)
 """
 
 import os
 import sys
-import json
 import time
 import select
 import tempfile
 import io
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import psycopg2
 import psycopg2.extensions
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import numpy as np
 from PIL import Image
 
@@ -62,6 +76,20 @@ AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 
 # Video processing settings
 DECIMATE_FACTOR = 4 
+IMAGES_PATH = "storage-single-tenant/images"
+PREFETCH_FRAMES = int(os.environ.get('VIDEO_WORKER_PREFETCH_FRAMES', '8'))
+# Job progress is written at most this often, however fast frames arrive.
+PROGRESS_INTERVAL_SECONDS = 2.0
+
+# Job queue settings
+WORKER_CONCURRENCY = int(os.environ.get('VIDEO_WORKER_CONCURRENCY', '2'))
+STALE_JOB_SECONDS = int(os.environ.get('VIDEO_WORKER_STALE_SECONDS', '600'))
+SWEEP_INTERVAL_SECONDS = int(os.environ.get('VIDEO_WORKER_SWEEP_SECONDS', '60'))
+MAX_ATTEMPTS = int(os.environ.get('VIDEO_WORKER_MAX_ATTEMPTS', '3'))
+# Idle slots re-check the queue this often even without a notification, so a
+# notification sent while every slot was busy (or the LISTEN connection was
+# down) is never lost.
+IDLE_POLL_SECONDS = 5
 
 
 def get_db_connection():
@@ -72,13 +100,18 @@ def get_db_connection():
 
 
 def get_s3_client():
-    """Create S3/MinIO client."""
+    """Create S3/MinIO client.
+
+    One client per job slot, shared by that slot's prefetch threads (boto3
+    clients are thread-safe), so its connection pool must cover them all.
+    """
     return boto3.client(
         's3',
         endpoint_url=S3_ENDPOINT,
         aws_access_key_id=AWS_ACCESS_KEY_ID,
         aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(max_pool_connections=max(10, PREFETCH_FRAMES + 2))
     )
 
 
@@ -106,8 +139,9 @@ def update_job_status(conn, job_id: int, status: str, **kwargs):
         values.append(kwargs['download_url'])
 
     if status == 'processing':
-        set_clauses.append("started_at = %s")
-        values.append(datetime.now())
+        # Progress updates double as heartbeats; started_at is set at claim time.
+        set_clauses.append("started_at = COALESCE(started_at, now())")
+        set_clauses.append("heartbeat_at = now()")
 
     if status in ('complete', 'failed'):
         set_clauses.append("completed_at = %s")
@@ -136,13 +170,147 @@ def get_scan_images(conn, scan_id: int):
     return images
 
 
+def claim_job(conn):
+    """Atomically claim the oldest pending job; returns (job_id, scan_id) or None.
+
+    SKIP LOCKED lets concurrent claimers (other slots, other worker processes)
+    pass over a row someone else is claiming instead of blocking on it, so each
+    pending job is handed to exactly one slot.
+    """
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE video_jobs
+        SET status = 'processing',
+            progress = 0,
+            error_message = NULL,
+            started_at = now(),
+            heartbeat_at = now(),
+            attempts = attempts + 1
+        WHERE id = (
+            SELECT id FROM video_jobs
+            WHERE status = 'pending'
+            ORDER BY created_at, id
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        RETURNING id, scan_id
+    """)
+    row = cur.fetchone()
+    cur.close()
+    return row
+
+
+def heartbeat_jobs(conn, job_ids):
+    """Refresh heartbeat_at for jobs this process is running."""
+    if not job_ids:
+        return
+    cur = conn.cursor()
+    cur.execute(
+        "UPDATE video_jobs SET heartbeat_at = now() "
+        "WHERE id = ANY(%s) AND status = 'processing'",
+        (list(job_ids),)
+    )
+    cur.close()
+
+
+def sweep_stale_jobs(conn):
+    """Return 'processing' jobs whose worker stopped heartbeating to the queue.
+
+    A job that has already been claimed MAX_ATTEMPTS times is failed instead,
+    so a frame set that crashes the worker can't cycle forever. Returns the
+    number of jobs put back to 'pending'.
+    """
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE video_jobs
+        SET status = CASE WHEN attempts >= %(max)s THEN 'failed' ELSE 'pending' END,
+            error_message = CASE
+                WHEN attempts >= %(max)s
+                THEN 'Worker stopped responding after ' || attempts || ' attempts'
+                ELSE error_message
+            END,
+            completed_at = CASE WHEN attempts >= %(max)s THEN now() ELSE completed_at END
+        WHERE status = 'processing'
+          AND COALESCE(heartbeat_at, started_at, created_at)
+              < now() - make_interval(secs => %(stale)s)
+        RETURNING id, status
+    """, {'max': MAX_ATTEMPTS, 'stale': STALE_JOB_SECONDS})
+    swept = cur.fetchall()
+    cur.close()
+    for job_id, status in swept:
+        logger.warning(f"Reclaimed stale job {job_id} -> {status}")
+    return sum(1 for _, status in swept if status == 'pending')
+
+
+class ScanKeyIndex:
+    """Fallback key lookup for frames whose stored key isn't `object_path` verbatim.
+
+    Keys normally resolve straight from `cyl_images.object_path`. When a direct
+    GET misses, the scan's directory is listed ONCE (paginated) and every
+    remaining frame of the scan is matched against that listing by prefix, the
+    same unique-prefix rule the per-frame listing used to apply. A store that
+    keeps objects under versioned keys (`STORAGE_BACKEND: s3`) misses every
+    direct GET, so after the first miss `listing_only` tells `fetch_frame` to
+    skip them rather than pay a failed GET per frame.
+    """
+
+    def __init__(self, s3, keys):
+        self._s3 = s3
+        prefix = os.path.commonprefix(list(keys))
+        self._prefix = prefix[:prefix.rfind('/') + 1]
+        self._lock = threading.Lock()
+        self._listed = None
+        self.listing_only = False
+
+    def _listing(self):
+        with self._lock:
+            if self._listed is None:
+                logger.info(f"Direct GET missed; listing {self._prefix} once for this scan")
+                paginator = self._s3.get_paginator('list_objects_v2')
+                self._listed = sorted(
+                    item['Key']
+                    for page in paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix=self._prefix)
+                    for item in page.get('Contents', [])
+                )
+            return self._listed
+
+    def resolve(self, key):
+        """The one listed key starting with `key`, or None if zero or several do."""
+        self.listing_only = True
+        matches = [k for k in self._listing() if k.startswith(key)]
+        return matches[0] if len(matches) == 1 else None
+
+
+def _is_missing(error: ClientError) -> bool:
+    return error.response.get('Error', {}).get('Code') in ('NoSuchKey', '404', 'NotFound')
+
+
+def fetch_frame(s3, key: str, index: ScanKeyIndex):
+    """Download and decimate one frame; None if it can't be found or is empty."""
+    obj = None
+    if not index.listing_only:
+        try:
+            obj = s3.get_object(Bucket=S3_BUCKET_NAME, Key=key)
+        except ClientError as e:
+            if not _is_missing(e):
+                raise
+    if obj is None:
+        resolved = index.resolve(key)
+        if resolved is None:
+            logger.warning(f"Image not found: {key}")
+            return None
+        obj = s3.get_object(Bucket=S3_BUCKET_NAME, Key=resolved)
+    image_bytes = obj['Body'].read()
+
+    # Convert to numpy array and decimate
+    image_array = np.array(Image.open(io.BytesIO(image_bytes)))
+    return image_array[::DECIMATE_FACTOR, ::DECIMATE_FACTOR]
+
+
 def generate_video(conn, s3, job_id: int, scan_id: int):
-    """Generate video from scan images."""
+    """Generate video from scan images for a job already claimed as 'processing'."""
     logger.info(f"Starting video generation for job {job_id}, scan {scan_id}")
 
-    # Update status to processing
-    update_job_status(conn, job_id, 'processing')
-
     try:
         # Get images for this scan
         images = get_scan_images(conn, scan_id)
@@ -159,43 +327,51 @@ def generate_video(conn, s3, job_id: int, scan_id: int):
             video_writer = VideoWriter(filename=video_path)
 
             frames_added = 0
-            images_path = "storage-single-tenant/images"
-
-            for idx, (image_id, object_path, frame_number) in enumerate(images):
-                try:
-                    # Find the image in S3
-                    object_prefix = f"{images_path}/{object_path}"
-                    response = s3.list_objects_v2(Bucket=S3_BUCKET_NAME, Prefix=object_prefix)
-
-                    if "Contents" not in response or len(response["Contents"]) != 1:
-                        logger.warning(f"Image not found: {object_prefix}")
-                        continue
-
-                    # Download and process image
-                    object_key = response["Contents"][0]["Key"]
-                    obj = s3.get_object(Bucket=S3_BUCKET_NAME, Key=object_key)
-                    image_bytes = obj['Body'].read()
-
-                    # Convert to numpy array and decimate
-                    image_array = np.array(Image.open(io.BytesIO(image_bytes)))
-                    image_array = image_array[::DECIMATE_FACTOR, ::DECIMATE_FACTOR]
-
-                    if image_array.size == 0:
+            last_progress = time.monotonic()
+            keys = [
+                (frame_number, f"{IMAGES_PATH}/{object_path}")
+                for _, object_path, frame_number in images
+            ]
+            index = ScanKeyIndex(s3, [key for _, key in keys])
+
+            # Frames download + decode up to PREFETCH_FRAMES ahead of the
+            # encoder; results are consumed in frame order, so only that window
+            # of decoded frames is ever held in memory.
+            with ThreadPoolExecutor(max_workers=max(1, PREFETCH_FRAMES)) as pool:
+                pending = deque()
+                queued = iter(keys)
+
+                def _submit_next():
+                    for frame_number, key in queued:
+                        pending.append((frame_number, pool.submit(fetch_frame, s3, key, index)))
+                        return
+
+                for _ in range(max(1, PREFETCH_FRAMES)):
+                    _submit_next()
+
+                while pending:
+                    frame_number, future = pending.popleft()
+                    _submit_next()
+                    try:
+                        image_array = future.result()
+
+                        if image_array is None or image_array.size == 0:
+                            continue
+
+                        video_writer.add(image_array)
+                        frames_added += 1
+
+                        now = time.monotonic()
+                        if now - last_progress >= PROGRESS_INTERVAL_SECONDS:
+                            last_progress = now
+                            progress = int((frames_added / total_frames) * 100)
+                            update_job_status(conn, job_id, 'processing', progress=progress)
+                            logger.info(f"Progress: {progress}% ({frames_added}/{total_frames})")
+
+                    except Exception as e:
+                        logger.warning(f"Error processing frame {frame_number}: {e}")
                         continue
 
-                    video_writer.add(image_array)
-                    frames_added += 1
-
-                    # Update progress every 10 frames
-                    if frames_added % 10 == 0:
-                        progress = int((frames_added / total_frames) * 100)
-                        update_job_status(conn, job_id, 'processing', progress=progress)
-                        logger.info(f"Progress: {progress}% ({frames_added}/{total_frames})")
-
-                except Exception as e:
-                    logger.warning(f"Error processing frame {frame_number}: {e}")
-                    continue
-
             video_writer.close()
 
             if not os.path.exists(video_path):
@@ -234,41 +410,113 @@ def generate_video(conn, s3, job_id: int, scan_id: int):
         update_job_status(conn, job_id, 'failed', error_message=str(e))
 
 
-def process_pending_jobs(conn, s3):
-    """Process any pending jobs that might have been missed."""
+class JobWorker:
+    """N job slots fed by a shared wake-up event.
+
+    Each slot owns its own DB connection and claims jobs until the queue is
+    empty, then waits for a notification (or IDLE_POLL_SECONDS). The LISTEN
+    connection and the heartbeat/sweep connection are separate from the slot
+    connections, so a long job never delays notifications or heartbeats.
+    """
+
+    def __init__(self, concurrency: int = WORKER_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self.wake = threading.Event()
+        self.stop = threading.Event()
+        self._active = set()
+        self._active_lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        for slot in range(self.concurrency):
+            self._spawn(self._run_slot, f"video-slot-{slot}")
+        self._spawn(self._run_sweeper, "video-sweeper")
+        self.wake.set()  # drain anything already pending
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def shutdown(self, timeout: float = 5.0):
+        self.stop.set()
+        self.wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _run_slot(self):
+        conn = None
+        s3 = get_s3_client()
+        while not self.stop.is_set():
+            try:
+                if conn is None or conn.closed:
+                    conn = get_db_connection()
+                # Clear before claiming: a notification that lands mid-claim
+                # sets the event again and the next wait returns at once.
+                self.wake.clear()
+                job = claim_job(conn)
+                if job is None:
+                    self.wake.wait(IDLE_POLL_SECONDS)
+                    continue
+                job_id, scan_id = job
+                with self._active_lock:
+                    self._active.add(job_id)
+                try:
+                    generate_video(conn, s3, job_id, scan_id)
+                finally:
+                    with self._active_lock:
+                        self._active.discard(job_id)
+            except psycopg2.OperationalError as e:
+                logger.error(f"Job slot lost its database connection: {e}")
+                conn = None
+                self.stop.wait(5)
+            except Exception as e:
+                logger.error(f"Unexpected error in job slot: {e}")
+                self.stop.wait(1)
+        if conn is not None and not conn.closed:
+            conn.close()
+
+    def _run_sweeper(self):
+        conn = None
+        while not self.stop.wait(SWEEP_INTERVAL_SECONDS):
+            try:
+                if conn is None or conn.closed:
+                    conn = get_db_connection()
+                with self._active_lock:
+                    active = list(self._active)
+                heartbeat_jobs(conn, active)
+                if sweep_stale_jobs(conn):
+                    self.wake.set()
+            except psycopg2.OperationalError as e:
+                logger.error(f"Sweeper lost its database connection: {e}")
+                conn = None
+            except Exception as e:
+                logger.error(f"Unexpected error in sweeper: {e}")
+        if conn is not None and not conn.closed:
+            conn.close()
+
+
+def _listen_connection():
+    conn = get_db_connection()
     cur = conn.cursor()
-    cur.execute("""
-        SELECT id, scan_id FROM video_jobs
-        WHERE status = 'pending'
-        ORDER BY created_at ASC
-    """)
-
-    pending_jobs = cur.fetchall()
+    cur.execute("LISTEN video_jobs;")
     cur.close()
-
-    if pending_jobs:
-        logger.info(f"Found {len(pending_jobs)} pending jobs to process")
-        for job_id, scan_id in pending_jobs:
-            generate_video(conn, s3, job_id, scan_id)
+    return conn
 
 
 def listen_for_jobs():
-    """Main listener loop."""
+    """Main listener loop: wakes idle job slots on every video_jobs notification."""
     logger.info("Starting video generation listener...")
     logger.info(f"Database: {DATABASE_URL.split('@')[1] if '@' in DATABASE_URL else DATABASE_URL}")
     logger.info(f"S3 Endpoint: {S3_ENDPOINT}")
 
-    conn = get_db_connection()
-    s3 = get_s3_client()
-
-    # Process any pending jobs first
-    process_pending_jobs(conn, s3)
-
-    # Start listening for notifications
-    cur = conn.cursor()
-    cur.execute("LISTEN video_jobs;")
+    worker = JobWorker()
+    conn = _listen_connection()
     logger.info("Listening for video_jobs notifications...")
 
+    worker.start()
+    logger.info(f"Started {worker.concurrency} job slot(s)")
+
     while True:
         try:
             if select.select([conn], [], [], 5) == ([], [], []):
@@ -279,18 +527,9 @@ def listen_for_jobs():
             while conn.notifies:
                 notify = conn.notifies.pop(0)
                 logger.info(f"Received notification: {notify.payload}")
-
-                try:
-                    payload = json.loads(notify.payload)
-                    job_id = payload['id']
-                    scan_id = payload['scan_id']
-
-                    generate_video(conn, s3, job_id, scan_id)
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid notification payload: {e}")
-                except KeyError as e:
-                    logger.error(f"Missing key in notification: {e}")
+                # The payload is informational only: whichever slot is free
+                # claims the oldest pending job.
+                worker.wake.set()
 
         except psycopg2.OperationalError as e:
             logger.error(f"Database connection lost: {e}")
@@ -298,9 +537,9 @@ def listen_for_jobs():
             time.sleep(5)
 
             try:
-                conn = get_db_connection()
-                cur = conn.cursor()
-                cur.execute("LISTEN video_jobs;")
+                conn = _listen_connection()
+                # Anything inserted while we weren't listening is still pending.
+                worker.wake.set()
                 logger.info("Reconnected to database")
             except Exception as reconnect_error:
                 logger.error(f"Reconnection failed: {reconnect_error}")
@@ -313,6 +552,7 @@ def listen_for_jobs():
             logger.error(f"Unexpected error: {e}")
             time.sleep(1)
 
+    worker.shutdown()
     conn.close()
     logger.info("Listener stopped")
 
@@ -1,9 +1,9 @@
 """
 Trigger an A4 sleap-roots pipeline run for a set of scans (Phase 1 of bloom
 #11/#404): validate the request, enumerate scans, compute an informational dedup
-preview, write `cyl_pipeline_runs`/`cyl_pipeline_run_scans`, chunk into batches,
-and enqueue each batch via `enqueue_cyl_pipeline_batch`. Uses a dedicated
-least-privilege app user (see supabase_client.py) — the app user's grants and RLS
+preview, write `cyl_pipeline_runs`, then write `cyl_pipeline_run_scans` and
+enqueue every batch in one transaction via `enqueue_cyl_pipeline_run`. Uses a
+dedicated least-privilege app user (see supabase_client.py) — the app user's grants and RLS
 policies bound what this can touch.
 
 This phase does NOT submit anything to Argo/Kubernetes — every enumerated scan is
@@ -36,6 +36,12 @@ BATCH_SIZE = 25
 MAX_SCAN_IDS = 5000
 MAX_PARAMS_BYTES = 10_000
 
+# Ids per request for lookups keyed on a scan-id list. An `in.(...)` filter rides
+# in the URL, so it is kept well under the gateway's URL limit; the dedup RPC
+# takes its ids in a POST body, so its chunks can be larger.
+IN_FILTER_CHUNK = 500
+DEDUP_RPC_CHUNK = 2000
+
 
 def _is_positive_int(value) -> bool:
     return isinstance(value, int) and not isinstance(value, bool) and value > 0
@@ -188,15 +194,17 @@ def _enumerate(
         return [r["scan_id"] for r in rows]
 
     # scan_ids
-    found = (
-        client.table("cyl_scans_extended")
-        .select("scan_id")
-        .in_("scan_id", scan_ids)
-        .execute()
-        .data
-        or []
-    )
-    found_ids = {r["scan_id"] for r in found}
+    found_ids = set()
+    for chunk in _chunk(scan_ids, IN_FILTER_CHUNK):
+        found = (
+            client.table("cyl_scans_extended")
+            .select("scan_id")
+            .in_("scan_id", chunk)
+            .execute()
+            .data
+            or []
+        )
+        found_ids.update(r["scan_id"] for r in found)
     missing = [s for s in scan_ids if s not in found_ids]
     if missing:
         raise HTTPException(status_code=404, detail=f"scan_ids not found: {missing}")
@@ -206,40 +214,24 @@ def _enumerate(
 def _dedup_preview(client, scan_ids: list[int], request_hash: str) -> set[int]:
     """Which of `scan_ids` have at least one cyl_trait_sources row whose stored
     param_hash matches the request's params — informational only, see module
-    docstring. One batched query per table, not a per-scan loop. `request_hash` is
-    computed once in `_validate_request` and threaded through here rather than
-    recomputed."""
-    trait_rows = (
-        client.table("cyl_scan_traits")
-        .select("scan_id, source_id")
-        .in_("scan_id", scan_ids)
-        .execute()
-        .data
-        or []
-    )
-    source_ids = sorted(
-        {r["source_id"] for r in trait_rows if r.get("source_id") is not None}
-    )
-    if not source_ids:
-        return set()
-
-    source_rows = (
-        client.table("cyl_trait_sources")
-        .select("id, metadata")
-        .in_("id", source_ids)
-        .execute()
-        .data
-        or []
-    )
-    matching_source_ids = {
-        row["id"]
-        for row in source_rows
-        if ((row.get("metadata") or {}).get("params") or {}).get("param_hash")
-        == request_hash
-    }
-    return {
-        r["scan_id"] for r in trait_rows if r.get("source_id") in matching_source_ids
-    }
+    docstring. The `cyl_pipeline_dedup_matches` RPC filters by hash server-side
+    and returns distinct (scan_id, source_id) pairs, so the response scales with
+    matches rather than with trait rows; one call per DEDUP_RPC_CHUNK scans, not a
+    per-scan loop. `request_hash` is computed once in `_validate_request` and
+    threaded through here rather than recomputed."""
+    matched: set[int] = set()
+    for chunk in _chunk(scan_ids, DEDUP_RPC_CHUNK):
+        rows = (
+            client.rpc(
+                "cyl_pipeline_dedup_matches",
+                {"p_scan_ids": chunk, "p_param_hash": request_hash},
+            )
+            .execute()
+            .data
+            or []
+        )
+        matched.update(r["scan_id"] for r in rows)
+    return matched
 
 
 def _chunk(items: list, size: int) -> list[list]:
@@ -308,24 +300,13 @@ def trigger_pipeline(body: dict, user_id: str) -> dict:
         status="queued",
     )
 
-    batches = _chunk(scan_ids, BATCH_SIZE)
-    scan_rows = [
-        {
-            "run_id": run_id,
-            "scan_id": sid,
-            "batch_index": batch_index,
-            "status": "queued",
-        }
-        for batch_index, batch in enumerate(batches)
-        for sid in batch
-    ]
-    client.table("cyl_pipeline_run_scans").insert(scan_rows).execute()
-
-    for batch_index, batch in enumerate(batches):
-        client.rpc(
-            "enqueue_cyl_pipeline_batch",
-            {"p_run_id": run_id, "p_batch_index": batch_index, "p_scan_ids": batch},
-        ).execute()
+    # One call writes every run-scan row and enqueues every batch in the same
+    # transaction: trigger latency doesn't grow with the batch count, and a
+    # failure can't leave a run with only some of its batches on the queue.
+    client.rpc(
+        "enqueue_cyl_pipeline_run",
+        {"p_run_id": run_id, "p_scan_ids": scan_ids, "p_batch_size": BATCH_SIZE},
+    ).execute()
 
     return {
         "pipeline_run_id": run_id,
@@ -83,13 +83,18 @@ class _Rpc:
 
     def execute(self):
         self._client.rpc_calls.append((self._name, self._params))
+        if self._name == "cyl_pipeline_dedup_matches":
+            return _Result(self._client._dedup_matches(**self._params))
+        if self._name == "enqueue_cyl_pipeline_run":
+            return _Result(self._client._enqueue_run(**self._params))
         return _Result(1)
 
 
 class _FakeClient:
     """Seed via keyword args matching table names. `cyl_pipeline_runs` inserts get
-    an auto-incrementing id; `cyl_pipeline_run_scans` inserts are recorded as-is
-    (bulk insert accepts a list of dicts)."""
+    an auto-incrementing id; `cyl_pipeline_run_scans` rows are recorded as-is
+    whether inserted directly or written by the `enqueue_cyl_pipeline_run` RPC,
+    which also records each batch it would send to the queue."""
 
     def __init__(
         self,
@@ -112,6 +117,7 @@ class _FakeClient:
         self.rpc_calls: list[tuple] = []
         self.inserted_runs: list[dict] = []
         self.inserted_run_scans: list[dict] = []
+        self.enqueued_batches: list[dict] = []
         self._next_run_id = 1
 
     def _table_rows(self, table):
@@ -123,6 +129,45 @@ class _FakeClient:
     def rpc(self, name, params):
         return _Rpc(self, name, params)
 
+    def _dedup_matches(self, p_scan_ids, p_param_hash):
+        """What the SQL function returns: distinct (scan_id, source_id) pairs whose
+        source's metadata.params.param_hash matches, over every source of a scan."""
+        matching = {
+            s["id"]
+            for s in self._data["cyl_trait_sources"]
+            if ((s.get("metadata") or {}).get("params") or {}).get("param_hash")
+            == p_param_hash
+        }
+        wanted = set(p_scan_ids)
+        pairs = {
+            (t["scan_id"], t["source_id"])
+            for t in self._data["cyl_scan_traits"]
+            if t["scan_id"] in wanted and t.get("source_id") in matching
+        }
+        return [{"scan_id": a, "source_id": b} for a, b in sorted(pairs)]
+
+    def _enqueue_run(self, p_run_id, p_scan_ids, p_batch_size):
+        """What the SQL function does: one run-scan row per scan, batch_index by
+        position, and one queue message per batch. Returns the batch count."""
+        for pos, sid in enumerate(p_scan_ids):
+            self.inserted_run_scans.append(
+                {
+                    "run_id": p_run_id,
+                    "scan_id": sid,
+                    "batch_index": pos // p_batch_size,
+                    "status": "queued",
+                }
+            )
+        for start in range(0, len(p_scan_ids), p_batch_size):
+            self.enqueued_batches.append(
+                {
+                    "run_id": p_run_id,
+                    "batch_index": start // p_batch_size,
+                    "scan_ids": p_scan_ids[start : start + p_batch_size],
+                }
+            )
+        return -(-len(p_scan_ids) // p_batch_size)
+
     def _handle_insert(self, table, payload):
         if table == "cyl_pipeline_runs":
             row = dict(payload)
@@ -137,6 +182,14 @@ class _FakeClient:
         raise AssertionError(f"unexpected insert into {table}")
 
 
+def _enqueue_calls(client):
+    return [c for c in client.rpc_calls if c[0] == "enqueue_cyl_pipeline_run"]
+
+
+def _dedup_calls(client):
+    return [c for c in client.rpc_calls if c[0] == "cyl_pipeline_dedup_matches"]
+
+
 def _hash_of(params):
     from sleap_roots_contracts import compute_param_hash
 
@@ -477,7 +530,8 @@ def test_dedup_preview_counts_matching_prior_source_but_still_enqueues_it(monkey
     assert result["reused_count"] == 1
     assert result["scan_count"] == 1
     assert client.inserted_run_scans[0]["status"] == "queued"
-    assert len(client.rpc_calls) == 1  # still enqueued despite the dedup-preview match
+    # Still enqueued despite the dedup-preview match.
+    assert len(_enqueue_calls(client)) == 1
 
 
 def test_dedup_preview_finds_older_matching_source_when_newest_source_has_different_params(
@@ -595,7 +649,7 @@ def test_all_scans_matching_prior_source_still_all_enqueued_not_short_circuited(
     assert result["scan_count"] == 2
     assert client.inserted_runs[0]["status"] == "queued"
     assert len(client.inserted_run_scans) == 2
-    assert len(client.rpc_calls) == 1
+    assert len(_enqueue_calls(client)) == 1
 
 
 def test_dedup_preview_issues_one_batched_query_not_a_per_scan_loop(monkeypatch):
@@ -603,10 +657,6 @@ def test_dedup_preview_issues_one_batched_query_not_a_per_scan_loop(monkeypatch)
 
     def _run_with(n_scans):
         scans = [{"scan_id": i} for i in range(1, n_scans + 1)]
-        # At least one scan has a prior source, so both queries (cyl_scan_traits,
-        # then cyl_trait_sources for the resulting source_ids) actually run —
-        # otherwise the second query is correctly skipped entirely (no candidate
-        # source_ids), which would make this assertion vacuous.
         client = _FakeClient(
             cyl_scans_extended=scans,
             cyl_scan_traits=[{"scan_id": 1, "source_id": 100}],
@@ -620,13 +670,57 @@ def test_dedup_preview_issues_one_batched_query_not_a_per_scan_loop(monkeypatch)
             "params": {},
         }
         pipeline.trigger_pipeline(body, "user-1")
-        return client.calls.count("cyl_scan_traits") + client.calls.count(
-            "cyl_trait_sources"
-        )
+        # The hash filter runs server-side: trait rows are never read directly.
+        assert "cyl_scan_traits" not in client.calls
+        assert "cyl_trait_sources" not in client.calls
+        return len(_dedup_calls(client))
 
     small = _run_with(3)
     large = _run_with(30)
-    assert small == large == 2  # exactly one query per table, regardless of scan count
+    assert small == large == 1  # one lookup regardless of scan count
+
+
+def test_dedup_preview_chunks_large_scan_lists(monkeypatch):
+    monkeypatch.setattr(pipeline, "DEDUP_RPC_CHUNK", 10)
+    h = _hash_of({})
+    scans = [{"scan_id": i} for i in range(1, 26)]
+    client = _FakeClient(
+        cyl_scans_extended=scans,
+        cyl_scan_traits=[
+            {"scan_id": 3, "source_id": 100},
+            {"scan_id": 24, "source_id": 100},
+        ],
+        cyl_trait_sources=[_source(100, h)],
+    )
+    monkeypatch.setattr(pipeline, "app_client", lambda: client)
+    body = {
+        "target_level": "scan_ids",
+        "target_id": None,
+        "scan_ids": [s["scan_id"] for s in scans],
+        "params": {},
+    }
+    result = pipeline.trigger_pipeline(body, "user-1")
+    assert result["reused_count"] == 2  # matches in the first and last chunk
+    assert [len(c[1]["p_scan_ids"]) for c in _dedup_calls(client)] == [10, 10, 5]
+    assert all(c[1]["p_param_hash"] == h for c in _dedup_calls(client))
+
+
+def test_scan_ids_existence_check_is_chunked(monkeypatch):
+    monkeypatch.setattr(pipeline, "IN_FILTER_CHUNK", 4)
+    scans = [{"scan_id": i} for i in range(1, 11)]
+    client = _FakeClient(cyl_scans_extended=scans)
+    monkeypatch.setattr(pipeline, "app_client", lambda: client)
+    body = {
+        "target_level": "scan_ids",
+        "target_id": None,
+        "scan_ids": [s["scan_id"] for s in scans] + [99],
+        "params": {},
+    }
+    with pytest.raises(HTTPException) as ei:
+        pipeline.trigger_pipeline(body, "user-1")
+    assert ei.value.status_code == 404
+    assert "[99]" in ei.value.detail
+    assert client.calls.count("cyl_scans_extended") == 3
 
 
 # --------------------------------------------------------------------------- #
@@ -669,7 +763,7 @@ def test_zero_scan_target_writes_run_row_with_scan_count_zero_and_completes(
     assert client.inserted_runs[0]["scan_count"] == 0
     assert client.inserted_runs[0]["status"] == "complete"
     assert len(client.inserted_run_scans) == 0
-    assert len(client.rpc_calls) == 0
+    assert len(_enqueue_calls(client)) == 0
 
 
 # --------------------------------------------------------------------------- #
@@ -689,7 +783,7 @@ def test_chunks_all_scans_into_batch_size_groups_and_enqueues_each(monkeypatch):
         "params": {},
     }
     pipeline.trigger_pipeline(body, "user-1")
-    assert len(client.rpc_calls) == 4
+    assert len(client.enqueued_batches) == 4
     batch_indices = [row["batch_index"] for row in client.inserted_run_scans]
     counts = {i: batch_indices.count(i) for i in range(4)}
     assert counts == {0: 25, 1: 25, 2: 25, 3: 17}
@@ -707,7 +801,33 @@ def test_exact_multiple_of_batch_size_produces_no_empty_trailing_batch(monkeypat
         "params": {},
     }
     pipeline.trigger_pipeline(body, "user-1")
-    assert len(client.rpc_calls) == 2
+    assert len(client.enqueued_batches) == 2
+
+
+def test_whole_run_is_enqueued_in_one_rpc_not_one_per_batch(monkeypatch):
+    monkeypatch.setattr(pipeline, "BATCH_SIZE", 25)
+    scans = [{"scan_id": i} for i in range(1, 1001)]  # 40 batches
+    client = _FakeClient(cyl_scans_extended=scans)
+    monkeypatch.setattr(pipeline, "app_client", lambda: client)
+    body = {
+        "target_level": "scan_ids",
+        "target_id": None,
+        "scan_ids": [s["scan_id"] for s in scans],
+        "params": {},
+    }
+    result = pipeline.trigger_pipeline(body, "user-1")
+    calls = _enqueue_calls(client)
+    assert len(calls) == 1
+    assert calls[0][1] == {
+        "p_run_id": result["pipeline_run_id"],
+        "p_scan_ids": list(range(1, 1001)),
+        "p_batch_size": 25,
+    }
+    # The run-scan rows are written by the RPC, in the same transaction as the
+    # enqueue — never by a separate insert that could succeed on its own.
+    assert "cyl_pipeline_run_scans" not in client.calls
+    assert len(client.enqueued_batches) == 40
+    assert client.enqueued_batches[-1]["scan_ids"] == list(range(976, 1001))
 
 
 # --------------------------------------------------------------------------- #
@@ -2,7 +2,10 @@
 storage, or supabase client needed — a fake fluent client is used)."""
 
 import io
+import threading
+import time
 
+import numpy as np
 import pytest
 from fastapi import HTTPException
 from PIL import Image
@@ -319,6 +322,25 @@ def test_generate_scan_video_flags_truncation(monkeypatch):
     assert result["frames"] == video.MAX_IMAGES
 
 
+def test_generate_scan_video_streams_the_upload_from_disk(monkeypatch):
+    monkeypatch.setattr(video, "VideoWriter", _FakeWriter)
+    seen = {}
+
+    def _upload(_self, key, file, options):
+        seen["is_file"] = hasattr(file, "read")
+        seen["body"] = file.read()
+        seen["options"] = options
+
+    monkeypatch.setattr(_GenBucket, "upload", _upload)
+    client = _GenClient([{"object_path": "o0", "frame_number": 0}])
+
+    video.generate_scan_video(client, 5)
+
+    assert seen["is_file"] is True  # never read into memory first
+    assert seen["body"] == b"\x00\x01"
+    assert seen["options"]["upsert"] == "true"
+
+
 def test_generate_scan_video_keeps_better_existing(monkeypatch):
     # A prior video has 72 frames; this run manages only 1 -> keep the old one.
     monkeypatch.setattr(video, "VideoWriter", _FakeWriter)
@@ -349,3 +371,94 @@ def test_generate_scan_video_500_on_empty_output(monkeypatch):
     with pytest.raises(HTTPException) as ei:
         video.generate_scan_video(_StorageClient(_png_bytes()), 5)
     assert ei.value.status_code == 500
+
+
+# --- Pooled frame fetch + reduced-resolution decode ------------------------
+
+def _image_bytes(width, height, fmt, value=0):
+    buf = io.BytesIO()
+    Image.new("L", (width, height), color=value).save(buf, format=fmt)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+@pytest.mark.parametrize("size", [(8, 8), (17, 9), (2048, 1537)])
+def test_decode_frame_matches_strided_shape(fmt, size):
+    data = _image_bytes(*size, fmt, value=128)
+    expected = np.array(Image.open(io.BytesIO(data)))[::4, ::4]
+
+    arr = video.decode_frame(data, 4)
+
+    assert arr.shape == expected.shape
+    assert np.allclose(arr, 128, atol=2)  # a box mean of a flat image
+
+
+def test_decode_frame_without_decimation_is_full_size():
+    arr = video.decode_frame(_image_bytes(17, 9, "PNG"), 1)
+    assert arr.shape == (9, 17)
+
+
+class _SlowBucket(_GenBucket):
+    """Frame i encodes value i; earlier frames download slower, and the number of
+    downloads in flight at once is recorded."""
+
+    def __init__(self, outer, fail=()):
+        super().__init__(outer)
+        self._fail = set(fail)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def download(self, path):
+        i = int(path[1:])
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.02 * (6 - i))
+            if i in self._fail:
+                raise RuntimeError("storage hiccup")
+            return _image_bytes(8, 8, "PNG", value=i * 10)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class _RecordingWriter(_FakeWriter):
+    def add(self, arr):
+        _RecordingWriter.added.append(int(arr[0, 0]))
+
+
+def _slow_client(monkeypatch, fail=()):
+    client = _GenClient([{"object_path": f"o{i}", "frame_number": i} for i in range(6)])
+    bucket = _SlowBucket(client, fail=fail)
+
+    class _S:
+        def from_(self, _name):
+            return bucket
+
+    monkeypatch.setattr(_GenClient, "storage", property(lambda _self: _S()))
+    monkeypatch.setattr(video, "VideoWriter", _RecordingWriter)
+    monkeypatch.setattr(_RecordingWriter, "added", [], raising=False)
+    return client, bucket
+
+
+def test_generate_scan_video_fetches_concurrently_writes_in_order(monkeypatch):
+    monkeypatch.setattr(video, "FETCH_WORKERS", 4)
+    client, bucket = _slow_client(monkeypatch)
+
+    result = video.generate_scan_video(client, 5)
+
+    assert result["frames"] == 6
+    assert _RecordingWriter.added == [0, 10, 20, 30, 40, 50]
+    assert 1 < bucket.peak <= 4
+
+
+def test_generate_scan_video_skips_failed_frame_keeps_order(monkeypatch):
+    monkeypatch.setattr(video, "FETCH_WORKERS", 4)
+    client, _ = _slow_client(monkeypatch, fail={2})
+
+    result = video.generate_scan_video(client, 5)
+
+    assert result["frames"] == 5
+    assert _RecordingWriter.added == [0, 10, 30, 40, 50]
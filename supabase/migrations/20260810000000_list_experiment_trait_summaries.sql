@@ -0,0 +1,62 @@
+-- bloommcp list_experiments summary read: per-experiment plant/trait counts in one round trip.
+--
+-- SupabaseReader.list_experiments() only needs, per experiment, how many distinct plants and
+-- how many distinct trait names its latest trait readings cover. The only way to get those
+-- today is get_experiment_traits(experiment_id_) -- every reading of every plant -- once per
+-- experiment, so listing a few hundred experiments moves gigabytes and takes minutes. This adds
+-- an aggregate sibling:
+--
+--   list_experiment_trait_summaries(experiment_ids_)
+--                                       one row per listed experiment with at least one latest
+--                                       trait reading: (experiment_id, plant_count, trait_count),
+--                                       counted over exactly the rows get_experiment_traits's
+--                                       default (no source_id_/run_id_ pin) path returns.
+--
+-- Experiments with no readings are simply absent; the caller already lists them from
+-- cyl_experiments and reports zero counts, as it did when get_experiment_traits came back empty.
+-- The id array (rather than "every experiment") keeps each response bounded by the caller's
+-- chunk size, so a PostgREST max-rows cap can never silently drop an experiment's counts.
+--
+-- Additive/forward-only: creates one new function, touches no existing table, view, or function.
+-- SECURITY INVOKER with EXECUTE granted to the same four read roles as get_experiment_traits, so
+-- it can reveal nothing a caller couldn't already count from that function.
+--
+-- Manual rollback: supabase/rollbacks/20260810000000_list_experiment_trait_summaries_rollback.sql
+
+BEGIN;
+
+-- CREATE OR REPLACE (not bare CREATE) so the migration body is safely re-runnable.
+CREATE OR REPLACE FUNCTION public.list_experiment_trait_summaries(
+    experiment_ids_ bigint[]
+) RETURNS TABLE (
+    experiment_id bigint,
+    plant_count   bigint,
+    trait_count   bigint
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    -- Same joins as get_experiment_traits (including the inner accessions join, which drops
+    -- plants with no accession there too), so the counts agree with a bulk read row-for-row.
+    SELECT
+        cyl_experiments.id::bigint,
+        count(DISTINCT cyl_plants.id)::bigint,
+        count(DISTINCT src.trait_name)::bigint
+    FROM cyl_experiments
+    JOIN cyl_waves       ON cyl_waves.experiment_id = cyl_experiments.id
+    JOIN cyl_plants      ON cyl_plants.wave_id = cyl_waves.id
+    JOIN accessions      ON cyl_plants.accession_id = accessions.id
+    JOIN cyl_scans       ON cyl_scans.plant_id = cyl_plants.id
+    JOIN public.cyl_scan_traits_source src ON src.scan_id = cyl_scans.id
+    WHERE cyl_experiments.id = ANY (experiment_ids_)
+      AND src.is_latest
+    GROUP BY cyl_experiments.id
+    ORDER BY cyl_experiments.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.list_experiment_trait_summaries(bigint[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.list_experiment_trait_summaries(bigint[])
+    TO bloom_agent, bloom_user, bloom_admin, authenticated;
+
+COMMIT;
@@ -0,0 +1,65 @@
+-- bloommcp raw-tier read: get_experiment_traits in a columnar wire format.
+--
+-- get_experiment_traits returns one JSON object per plant x trait reading through PostgREST; a
+-- 5,000-plant x 150-trait experiment is 750k objects, each repeating all eleven key names, which
+-- the reader then turns back into Python dicts before pivoting. This adds a columnar sibling:
+--
+--   get_experiment_traits_columnar(...)  same parameters and same rows as get_experiment_traits,
+--                                         returned as ONE row whose columns are arrays -- element
+--                                         i of every array is reading i. An experiment with no
+--                                         readings comes back as one row of NULL arrays.
+--
+-- It aggregates get_experiment_traits's own output rather than repeating its joins, so the
+-- latest/source_id/run_id selection rule (and the both-pins-set RAISE) has exactly one definition.
+-- Every array_agg consumes the same input rows in the same order within the single aggregate
+-- query, so the arrays stay aligned.
+--
+-- Additive/forward-only: creates one new function, touches no existing table, view, or function.
+-- SECURITY INVOKER with EXECUTE granted to the same four read roles as get_experiment_traits.
+--
+-- Manual rollback: supabase/rollbacks/20260811000000_get_experiment_traits_columnar_rollback.sql
+
+BEGIN;
+
+-- CREATE OR REPLACE (not bare CREATE) so the migration body is safely re-runnable.
+CREATE OR REPLACE FUNCTION public.get_experiment_traits_columnar(
+    experiment_id_ bigint,
+    source_id_     bigint DEFAULT NULL,
+    run_id_        text   DEFAULT NULL
+) RETURNS TABLE (
+    scan_id        bigint[],
+    date_scanned   text[],
+    plant_age_days int[],
+    wave_number    int[],
+    plant_id       bigint[],
+    germ_day       int[],
+    plant_qr_code  text[],
+    accession_name text[],
+    trait_name     text[],
+    source_id      bigint[],
+    trait_value    float[]
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    SELECT
+        array_agg(t.scan_id),
+        array_agg(t.date_scanned),
+        array_agg(t.plant_age_days),
+        array_agg(t.wave_number),
+        array_agg(t.plant_id),
+        array_agg(t.germ_day),
+        array_agg(t.plant_qr_code),
+        array_agg(t.accession_name),
+        array_agg(t.trait_name),
+        array_agg(t.source_id),
+        array_agg(t.trait_value)
+    FROM public.get_experiment_traits(experiment_id_, source_id_, run_id_) AS t;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.get_experiment_traits_columnar(bigint, bigint, text) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.get_experiment_traits_columnar(bigint, bigint, text)
+    TO bloom_agent, bloom_user, bloom_admin, authenticated;
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- video-worker: claim-based job queue on video_jobs.
+--
+-- The worker used to run jobs one at a time straight off pg_notify, so a burst of inserts queued
+-- behind each other and a crashed worker left its job in 'processing' forever. Workers now claim
+-- jobs with `UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED LIMIT 1)`, so several worker
+-- processes (each with several job slots) can drain the queue side by side; pg_notify is only a
+-- wake-up. This adds the bookkeeping that needs:
+--
+--   heartbeat_at  refreshed by the owning worker while a job runs. A 'processing' job whose
+--                 heartbeat is older than the worker's stale threshold is swept back to 'pending'.
+--   attempts      incremented on every claim, so a job that keeps killing its worker is failed
+--                 after a bounded number of reclaims instead of looping.
+--
+-- plus a partial index matching the claim query's ORDER BY over pending rows only.
+--
+-- Additive/forward-only: two nullable/defaulted columns and one index; existing rows get
+-- attempts = 0 and heartbeat_at = NULL (the sweep falls back to started_at). No policy or grant
+-- changes.
+--
+-- Manual rollback: supabase/rollbacks/20260812000000_video_jobs_claim_rollback.sql
+
+BEGIN;
+
+ALTER TABLE public.video_jobs
+    ADD COLUMN IF NOT EXISTS heartbeat_at timestamp with time zone,
+    ADD COLUMN IF NOT EXISTS attempts     int NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_video_jobs_pending_created
+    ON public.video_jobs (created_at, id)
+    WHERE status = 'pending';
+
+COMMIT;
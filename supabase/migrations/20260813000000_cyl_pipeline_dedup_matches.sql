@@ -0,0 +1,56 @@
+-- Pipeline-trigger dedup preview: scan-level (scan_id, source_id) matches for a param_hash.
+--
+-- services/workflows/pipeline.py's _dedup_preview needs, for the scans a POST /pipeline
+-- request enumerated, which of them already have a cyl_trait_sources row whose
+-- metadata.params.param_hash equals the request's hash. It used to select (scan_id, source_id)
+-- from cyl_scan_traits for every requested scan -- one row per scan x trait, hundreds of
+-- thousands of rows for an experiment-level trigger -- and then send every distinct source id
+-- back in a single `in.(...)` URL filter that can outgrow the gateway's URL limit. This adds:
+--
+--   cyl_pipeline_dedup_matches(p_scan_ids, p_param_hash)
+--                                       DISTINCT (scan_id, source_id) pairs among p_scan_ids whose
+--                                       source's stored param_hash equals p_param_hash. Scans with
+--                                       no matching source are absent.
+--
+-- The hash filter is applied to cyl_trait_sources first (one row per pipeline run, small), and
+-- cyl_scan_traits is probed only for (scan_id, source_id) pairs via its UNIQUE
+-- (scan_id, source_id, trait_id) index -- so the cost tracks matching sources, not trait rows. Like
+-- the preview it replaces, this checks ALL of a scan's sources, not just the latest (see the
+-- cyl-pipeline-trigger capability's dedup requirement).
+--
+-- Additive/forward-only: creates one new function. SECURITY INVOKER, so bloom_workflows' existing
+-- column grants + RLS policies on cyl_scan_traits(scan_id, source_id) and cyl_trait_sources(id,
+-- metadata) (20260730120000_create_cyl_pipeline_runs.sql) bound what it can read. EXECUTE is
+-- revoked from PUBLIC, anon and authenticated (Supabase default privileges grant the latter two
+-- directly) and granted to bloom_workflows only.
+--
+-- Manual rollback: supabase/rollbacks/20260813000000_cyl_pipeline_dedup_matches_rollback.sql
+
+BEGIN;
+
+-- CREATE OR REPLACE (not bare CREATE) so the migration body is safely re-runnable.
+CREATE OR REPLACE FUNCTION public.cyl_pipeline_dedup_matches(
+    p_scan_ids   bigint[],
+    p_param_hash text
+) RETURNS TABLE (
+    scan_id   bigint,
+    source_id bigint
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    SELECT DISTINCT st.scan_id::bigint, st.source_id::bigint
+    FROM public.cyl_trait_sources src
+    JOIN public.cyl_scan_traits st ON st.source_id = src.id
+    WHERE src.metadata -> 'params' ->> 'param_hash' = p_param_hash
+      AND st.scan_id = ANY (p_scan_ids)
+    ORDER BY 1, 2;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.cyl_pipeline_dedup_matches(bigint[], text)
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.cyl_pipeline_dedup_matches(bigint[], text)
+    TO bloom_workflows;
+
+COMMIT;
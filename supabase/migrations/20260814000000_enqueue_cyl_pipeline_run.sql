@@ -0,0 +1,93 @@
+-- Pipeline trigger: write a run's scan rows and enqueue all of its batches in one transaction.
+--
+-- services/workflows/pipeline.py's trigger_pipeline used to POST every cyl_pipeline_run_scans row
+-- in one request and then call enqueue_cyl_pipeline_batch once per 25-scan batch -- hundreds of
+-- sequential round trips for an experiment-level trigger, each its own transaction, so a failure
+-- partway left some batches enqueued and others not. This adds one set-based entry point:
+--
+--   enqueue_cyl_pipeline_run(p_run_id, p_scan_ids, p_batch_size)
+--                                       inserts one 'queued' cyl_pipeline_run_scans row per scan
+--                                       (batch_index = position / p_batch_size, in p_scan_ids
+--                                       order) and sends one cyl_pipeline_dispatch message per
+--                                       batch with a single pgmq.send_batch -- message shape
+--                                       unchanged from enqueue_cyl_pipeline_batch. Returns the
+--                                       number of batches enqueued. All or nothing: any error
+--                                       (a duplicate scan, a bad run) rolls back both the rows
+--                                       and the messages.
+--
+-- Guards: p_batch_size >= 1, a non-empty p_scan_ids, and p_run_id must be a 'queued' run with no
+-- scan rows yet -- so a retried or replayed call can't enqueue a run twice.
+--
+-- SECURITY DEFINER (pgmq's queue tables aren't granted to bloom_workflows, as for
+-- enqueue_cyl_pipeline_batch) with a pinned search_path. It writes only the four
+-- cyl_pipeline_run_scans columns bloom_workflows could already INSERT itself. EXECUTE is revoked
+-- from PUBLIC, anon and authenticated and granted to bloom_workflows only.
+--
+-- Additive/forward-only: enqueue_cyl_pipeline_batch stays in place for anything still calling it.
+--
+-- Manual rollback: supabase/rollbacks/20260814000000_enqueue_cyl_pipeline_run_rollback.sql
+
+BEGIN;
+
+-- CREATE OR REPLACE (not bare CREATE) so the migration body is safely re-runnable.
+CREATE OR REPLACE FUNCTION public.enqueue_cyl_pipeline_run(
+    p_run_id BIGINT,
+    p_scan_ids BIGINT[],
+    p_batch_size INTEGER
+) RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, public, pgmq
+AS $$
+DECLARE
+    v_batches INTEGER;
+BEGIN
+    IF p_batch_size IS NULL OR p_batch_size < 1 THEN
+        RAISE EXCEPTION 'p_batch_size must be at least 1, got %', p_batch_size;
+    END IF;
+    IF coalesce(cardinality(p_scan_ids), 0) = 0 THEN
+        RAISE EXCEPTION 'p_scan_ids must be non-empty';
+    END IF;
+    -- Lock the run row so two concurrent calls for the same run serialize on it.
+    PERFORM 1 FROM public.cyl_pipeline_runs
+        WHERE id = p_run_id AND status = 'queued'
+        FOR UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'run % does not exist or is not queued', p_run_id;
+    END IF;
+    IF EXISTS (SELECT 1 FROM public.cyl_pipeline_run_scans WHERE run_id = p_run_id) THEN
+        RAISE EXCEPTION 'run % already has scans enqueued', p_run_id;
+    END IF;
+
+    INSERT INTO public.cyl_pipeline_run_scans (run_id, scan_id, batch_index, status)
+    SELECT p_run_id, s.scan_id, ((s.ord - 1) / p_batch_size)::integer, 'queued'
+    FROM unnest(p_scan_ids) WITH ORDINALITY AS s(scan_id, ord);
+
+    SELECT count(*)::integer INTO v_batches
+    FROM pgmq.send_batch(
+        'cyl_pipeline_dispatch',
+        ARRAY(
+            SELECT jsonb_build_object(
+                'run_id', p_run_id,
+                'batch_index', b.batch_index,
+                'scan_ids', to_jsonb(b.scan_ids)
+            )
+            FROM (
+                SELECT ((s.ord - 1) / p_batch_size)::integer AS batch_index,
+                       array_agg(s.scan_id ORDER BY s.ord) AS scan_ids
+                FROM unnest(p_scan_ids) WITH ORDINALITY AS s(scan_id, ord)
+                GROUP BY 1
+            ) b
+            ORDER BY b.batch_index
+        )
+    );
+    RETURN v_batches;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.enqueue_cyl_pipeline_run(BIGINT, BIGINT[], INTEGER)
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.enqueue_cyl_pipeline_run(BIGINT, BIGINT[], INTEGER)
+    TO bloom_workflows;
+
+COMMIT;
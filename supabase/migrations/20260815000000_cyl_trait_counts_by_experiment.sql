@@ -0,0 +1,44 @@
+-- Per-experiment trait counts for the agent's list_experiments tool.
+--
+-- list_experiments_tool reports, for each experiment it lists, how many scan-trait values exist
+-- (trait_measurement_count) and over how many distinct trait names (distinct_traits_count). It
+-- used to read the whole of cyl_trait_by_experiment_wave -- one row per experiment x wave x trait,
+-- for every experiment -- on each call and add it up in Python, though it only returns a page of
+-- experiments. This adds the same counts pre-aggregated to one row per experiment:
+--
+--   cyl_trait_counts_by_experiment      (experiment_id, trait_measurement_count,
+--                                        distinct_traits_count), over exactly the rows
+--                                        cyl_trait_by_experiment_wave aggregates.
+--
+-- The tool filters it with experiment_id=in.(...) for the page it returns; the filter is on the
+-- grouping column, so the planner pushes it below the aggregate and only those experiments'
+-- trait rows are read. Experiments with no trait values are absent, as they are from the
+-- per-wave view; the tool reports zero for them.
+--
+-- Additive/forward-only: creates one new view, touches no existing table, view, or function.
+-- security_invoker so RLS on the underlying tables applies to the caller, with SELECT granted to
+-- the same roles as cyl_trait_by_experiment_wave.
+--
+-- Manual rollback: supabase/rollbacks/20260815000000_cyl_trait_counts_by_experiment_rollback.sql
+
+BEGIN;
+
+CREATE OR REPLACE VIEW public.cyl_trait_counts_by_experiment
+WITH (security_invoker = on) AS
+SELECT
+    e.id                     AS experiment_id,
+    COUNT(t.value)           AS trait_measurement_count,
+    COUNT(DISTINCT ct.name)  AS distinct_traits_count
+FROM public.cyl_scan_traits t
+JOIN public.cyl_traits      ct ON t.trait_id = ct.id
+JOIN public.cyl_scans       s  ON t.scan_id = s.id
+JOIN public.cyl_plants      p  ON s.plant_id = p.id
+JOIN public.cyl_waves       w  ON p.wave_id = w.id
+JOIN public.cyl_experiments e  ON w.experiment_id = e.id
+WHERE e.deleted_at IS NULL
+GROUP BY e.id;
+
+GRANT SELECT ON public.cyl_trait_counts_by_experiment
+    TO bloom_agent, bloom_user, bloom_admin, authenticated;
+
+COMMIT;
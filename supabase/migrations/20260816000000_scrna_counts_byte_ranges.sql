@@ -0,0 +1,33 @@
+-- scrna_counts: locate a gene's block inside a packed per-dataset count matrix.
+--
+-- scripts/upload_scrna.py used to write one JSON object per gene (counts/{dataset}/{gene}.json,
+-- 30k+ objects per dataset) and the agent downloaded and parsed a whole object per question. It
+-- now writes the dataset's matrix as a single packed object (counts/{dataset}.csr; layout in
+-- langchain/helpers/scrna_counts_pack.py) and records where each gene's block sits in it:
+--
+--   counts_byte_offset    first byte of the gene's block in counts_object_path
+--   counts_byte_length    block length in bytes (0 for a gene with no nonzero counts)
+--
+-- so a gene lookup is one ranged GET of a few KB. Both are NULL for rows written by the old
+-- uploader, whose counts_object_path is still a whole per-gene JSON object; readers handle both.
+--
+-- Additive/forward-only: two nullable columns and a CHECK that they are set together. No policy
+-- or grant changes; the existing scrna_counts SELECT policies cover the new columns.
+--
+-- Manual rollback: supabase/rollbacks/20260816000000_scrna_counts_byte_ranges_rollback.sql
+
+BEGIN;
+
+ALTER TABLE public.scrna_counts
+    ADD COLUMN IF NOT EXISTS counts_byte_offset BIGINT,
+    ADD COLUMN IF NOT EXISTS counts_byte_length BIGINT;
+
+ALTER TABLE public.scrna_counts
+    DROP CONSTRAINT IF EXISTS scrna_counts_byte_range_check;
+ALTER TABLE public.scrna_counts
+    ADD CONSTRAINT scrna_counts_byte_range_check CHECK (
+        (counts_byte_offset IS NULL AND counts_byte_length IS NULL)
+        OR (counts_byte_offset >= 0 AND counts_byte_length >= 0)
+    );
+
+COMMIT;
@@ -0,0 +1,71 @@
+-- scrna_gene_cluster_stats: per-gene x cluster expression summaries precomputed at upload time.
+--
+-- get_gene_expression_by_cluster_tool answers "which clusters express gene X" by downloading the
+-- gene's counts and every cell's cluster assignment and aggregating them. scripts/upload_scrna.py
+-- can now (--cluster-summaries) aggregate the whole matrix once at ingest and store, for every
+-- gene and every cluster of its dataset:
+--
+--   expressing_cells    cells in the cluster with a nonzero count for the gene
+--   total_cells         cells in the cluster
+--   sum_expression      sum of the gene's counts over those cells
+--
+-- The tool reads a gene's rows in the same round trip as its gene look-up and only falls back to
+-- aggregating counts itself when a dataset has none. cluster_id is the scrna_cells label (not an
+-- FK to scrna_clusters, which is backfilled separately and may not list every label), or
+-- 'unknown' (total_cells 0) for a gene's expressing cells that have no cluster.
+--
+-- Additive/forward-only: one new table. Read-only for bloom_user / bloom_agent / authenticated /
+-- anon, like scrna_cluster_stats; rows are written by the uploader's database connection, and
+-- bloom_admin may manage them. Rows go with their gene or dataset (ON DELETE CASCADE).
+--
+-- Manual rollback: supabase/rollbacks/20260817000000_scrna_gene_cluster_stats_rollback.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.scrna_gene_cluster_stats (
+  dataset_id        BIGINT NOT NULL REFERENCES public.scrna_datasets (id) ON DELETE CASCADE,
+  gene_id           BIGINT NOT NULL REFERENCES public.scrna_genes (id) ON DELETE CASCADE,
+  cluster_id        TEXT   NOT NULL,
+  expressing_cells  INT    NOT NULL CHECK (expressing_cells >= 0),
+  total_cells       INT    NOT NULL CHECK (total_cells >= expressing_cells),
+  sum_expression    DOUBLE PRECISION NOT NULL,
+  PRIMARY KEY (dataset_id, gene_id, cluster_id)
+);
+
+-- The tool filters on dataset_id and, through an embedded scrna_genes!inner join, the gene's
+-- name; the join matches rows by gene_id within the dataset, the primary key's prefix. The FK to
+-- scrna_genes needs its own index for cascading deletes.
+CREATE INDEX IF NOT EXISTS idx_scrna_gene_cluster_stats_gene
+  ON public.scrna_gene_cluster_stats (gene_id);
+
+ALTER TABLE public.scrna_gene_cluster_stats ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Authenticated users can select scrna_gene_cluster_stats" ON public.scrna_gene_cluster_stats;
+CREATE POLICY "Authenticated users can select scrna_gene_cluster_stats"
+  ON public.scrna_gene_cluster_stats AS permissive
+  FOR SELECT TO authenticated
+  USING (true);
+
+DROP POLICY IF EXISTS "Anon users can select scrna_gene_cluster_stats" ON public.scrna_gene_cluster_stats;
+CREATE POLICY "Anon users can select scrna_gene_cluster_stats"
+  ON public.scrna_gene_cluster_stats AS permissive
+  FOR SELECT TO anon
+  USING (true);
+
+DROP POLICY IF EXISTS user_read_scrna_gene_cluster_stats ON public.scrna_gene_cluster_stats;
+CREATE POLICY user_read_scrna_gene_cluster_stats
+  ON public.scrna_gene_cluster_stats FOR SELECT TO bloom_user USING (true);
+
+DROP POLICY IF EXISTS admin_all_scrna_gene_cluster_stats ON public.scrna_gene_cluster_stats;
+CREATE POLICY admin_all_scrna_gene_cluster_stats
+  ON public.scrna_gene_cluster_stats FOR ALL TO bloom_admin USING (true) WITH CHECK (true);
+
+DROP POLICY IF EXISTS agent_read_scrna_gene_cluster_stats ON public.scrna_gene_cluster_stats;
+CREATE POLICY agent_read_scrna_gene_cluster_stats
+  ON public.scrna_gene_cluster_stats FOR SELECT TO bloom_agent USING (true);
+
+-- Explicit table grants for bloom_* roles (composite PK, no sequence).
+GRANT SELECT ON public.scrna_gene_cluster_stats TO bloom_user, bloom_agent, authenticated, anon;
+GRANT ALL    ON public.scrna_gene_cluster_stats TO bloom_admin;
+
+COMMIT;
@@ -0,0 +1,46 @@
+-- scrna_counts: name the packed count matrix in its own column.
+--
+-- 20260816000000 pointed counts_object_path at the dataset's packed matrix (counts/{dataset}.csr)
+-- for rows carrying a byte range. The web app's expression views still download
+-- counts_object_path and parse it as a per-gene {cell: count} JSON object, so scripts/upload_scrna.py
+-- keeps writing those objects there and records the packed object separately:
+--
+--   counts_packed_path    the packed matrix holding the gene's block; counts_byte_offset and
+--                         counts_byte_length locate the block inside it
+--
+-- All three are set together, or all NULL for rows from the per-gene-only uploader. The agent
+-- reads the block with a ranged GET when counts_packed_path is set and the whole JSON object
+-- otherwise.
+--
+-- Rows written between 20260816000000 and this migration have only the packed object; they are
+-- backfilled so the agent keeps reading them, but their counts_object_path still names the packed
+-- object, so re-upload those datasets for the web app.
+--
+-- Additive/forward-only: one nullable column, a backfill, and a widened CHECK. No policy or grant
+-- changes; the existing scrna_counts SELECT policies cover the new column.
+--
+-- Manual rollback: supabase/rollbacks/20260818000000_scrna_counts_packed_path_rollback.sql
+
+BEGIN;
+
+ALTER TABLE public.scrna_counts
+    ADD COLUMN IF NOT EXISTS counts_packed_path TEXT;
+
+UPDATE public.scrna_counts
+SET counts_packed_path = counts_object_path
+WHERE counts_byte_offset IS NOT NULL
+  AND counts_packed_path IS NULL;
+
+ALTER TABLE public.scrna_counts
+    DROP CONSTRAINT IF EXISTS scrna_counts_byte_range_check;
+ALTER TABLE public.scrna_counts
+    ADD CONSTRAINT scrna_counts_byte_range_check CHECK (
+        (counts_packed_path IS NULL AND counts_byte_offset IS NULL AND counts_byte_length IS NULL)
+        OR (
+            counts_packed_path IS NOT NULL
+            AND counts_byte_offset >= 0
+            AND counts_byte_length >= 0
+        )
+    );
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Manual rollback for 20260810000000_list_experiment_trait_summaries.sql
+--
+-- Drops the one new function. Purely additive forward migration, so nothing else to restore:
+-- get_experiment_traits and the views it reads are untouched by the forward migration and
+-- remain untouched here. SupabaseReader.list_experiments() falls back to per-experiment
+-- get_experiment_traits calls when the function is missing.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS public.list_experiment_trait_summaries(bigint[]);
+
+COMMIT;
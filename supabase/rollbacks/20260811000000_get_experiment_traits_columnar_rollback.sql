@@ -0,0 +1,12 @@
+-- Manual rollback for 20260811000000_get_experiment_traits_columnar.sql
+--
+-- Drops the one new function. Purely additive forward migration, so nothing else to restore:
+-- get_experiment_traits is untouched by the forward migration and remains untouched here.
+-- A SupabaseReader configured for the columnar transport falls back to get_experiment_traits
+-- when the function is missing.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS public.get_experiment_traits_columnar(bigint, bigint, text);
+
+COMMIT;
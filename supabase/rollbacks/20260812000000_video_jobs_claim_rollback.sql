@@ -0,0 +1,14 @@
+-- Manual rollback for 20260812000000_video_jobs_claim.sql
+--
+-- Drops the claim bookkeeping columns and the pending-jobs index. Run only after stopping or
+-- downgrading every video-worker: the claim-based worker writes both columns.
+
+BEGIN;
+
+DROP INDEX IF EXISTS public.idx_video_jobs_pending_created;
+
+ALTER TABLE public.video_jobs
+    DROP COLUMN IF EXISTS heartbeat_at,
+    DROP COLUMN IF EXISTS attempts;
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Manual rollback for 20260813000000_cyl_pipeline_dedup_matches.sql
+--
+-- Drops the one new function. Purely additive forward migration, so nothing else to restore.
+-- Roll back the workflows service to a build whose _dedup_preview reads cyl_scan_traits directly
+-- first: the newer build calls this function and fails the trigger request without it.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS public.cyl_pipeline_dedup_matches(bigint[], text);
+
+COMMIT;
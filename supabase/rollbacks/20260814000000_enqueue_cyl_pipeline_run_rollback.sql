@@ -0,0 +1,11 @@
+-- Manual rollback for 20260814000000_enqueue_cyl_pipeline_run.sql
+--
+-- Drops the one new function. Purely additive forward migration: enqueue_cyl_pipeline_batch and
+-- the cyl_pipeline_dispatch queue are untouched. Roll the workflows service back to a build that
+-- enqueues per batch first -- the newer build calls this function for every trigger.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS public.enqueue_cyl_pipeline_run(BIGINT, BIGINT[], INTEGER);
+
+COMMIT;
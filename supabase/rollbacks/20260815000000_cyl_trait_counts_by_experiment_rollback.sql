@@ -0,0 +1,12 @@
+-- Manual rollback for 20260815000000_cyl_trait_counts_by_experiment.sql
+--
+-- Drops the one new view. Purely additive forward migration, so nothing else to restore:
+-- cyl_trait_by_experiment_wave and the tables it reads are untouched by the forward migration
+-- and remain untouched here. The agent's list_experiments_tool reads the new view, so roll the
+-- langchain service back to a build that aggregates cyl_trait_by_experiment_wave first.
+
+BEGIN;
+
+DROP VIEW IF EXISTS public.cyl_trait_counts_by_experiment;
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Manual rollback for 20260816000000_scrna_counts_byte_ranges.sql
+--
+-- Drops the two columns and their CHECK. Rows written by the packed uploader lose the location
+-- of their gene's block, and their counts_object_path points at the shared packed object, which
+-- the pre-migration readers cannot parse: re-upload such datasets with the per-gene uploader
+-- before rolling back.
+
+BEGIN;
+
+ALTER TABLE public.scrna_counts
+    DROP CONSTRAINT IF EXISTS scrna_counts_byte_range_check;
+ALTER TABLE public.scrna_counts
+    DROP COLUMN IF EXISTS counts_byte_length,
+    DROP COLUMN IF EXISTS counts_byte_offset;
+
+COMMIT;
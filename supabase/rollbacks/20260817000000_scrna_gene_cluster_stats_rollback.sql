@@ -0,0 +1,11 @@
+-- Manual rollback for 20260817000000_scrna_gene_cluster_stats.sql
+--
+-- Drops the one new table (its policies, grants and index go with it). Purely additive forward
+-- migration, so nothing else to restore. get_gene_expression_by_cluster_tool treats a failed
+-- summaries read like an empty one and aggregates the gene's counts itself.
+
+BEGIN;
+
+DROP TABLE IF EXISTS public.scrna_gene_cluster_stats;
+
+COMMIT;
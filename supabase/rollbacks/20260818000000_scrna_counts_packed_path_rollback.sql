@@ -0,0 +1,22 @@
+-- Manual rollback for 20260818000000_scrna_counts_packed_path.sql
+--
+-- Restores the 20260816000000 CHECK and drops counts_packed_path. Rows written since keep their
+-- byte range, but it then reads as a range of counts_object_path, which is their per-gene JSON
+-- object, not the packed matrix: clear the ranges first so readers fall back to the JSON, e.g.
+--
+--   UPDATE public.scrna_counts SET counts_byte_offset = NULL, counts_byte_length = NULL
+--   WHERE counts_packed_path IS DISTINCT FROM counts_object_path;
+
+BEGIN;
+
+ALTER TABLE public.scrna_counts
+    DROP CONSTRAINT IF EXISTS scrna_counts_byte_range_check;
+ALTER TABLE public.scrna_counts
+    ADD CONSTRAINT scrna_counts_byte_range_check CHECK (
+        (counts_byte_offset IS NULL AND counts_byte_length IS NULL)
+        OR (counts_byte_offset >= 0 AND counts_byte_length >= 0)
+    );
+ALTER TABLE public.scrna_counts
+    DROP COLUMN IF EXISTS counts_packed_path;
+
+COMMIT;
@@ -0,0 +1,152 @@
+"""
+Integration tests for `list_experiment_trait_summaries(experiment_ids_)` — per-experiment plant
+and trait counts in one round trip, so bloommcp's `list_experiments` no longer bulk-reads every
+experiment's traits just to count them.
+
+The counts must agree with what `get_experiment_traits`'s default (unpinned) path returns: the
+reader falls back to counting exactly that when the function is missing.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from `test_cyl_read_path.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_cyl_read_path import (  # noqa: E402
+    _deliver,
+    _seed_experiment,
+    _seed_scan_in,
+    _trait,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260810000000_list_experiment_trait_summaries"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _summaries(cur, experiment_ids):
+    cur.execute(
+        "SELECT experiment_id, plant_count, trait_count "
+        "FROM list_experiment_trait_summaries(%s)",
+        (list(experiment_ids),),
+    )
+    return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+
+
+def _counts_from_bulk_read(cur, experiment_id):
+    cur.execute(
+        "SELECT count(DISTINCT plant_id), count(DISTINCT trait_name) "
+        "FROM get_experiment_traits(%s, NULL, NULL)",
+        (experiment_id,),
+    )
+    return tuple(cur.fetchone())
+
+
+def test_counts_match_the_bulk_read(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, wave = _seed_experiment(cur)
+        _, imgs_a = _seed_scan_in(cur, wave)
+        _, imgs_b = _seed_scan_in(cur, wave)
+        _deliver(cur, imgs_a, "a", traits=[_trait("A", 1.0), _trait("B", 2.0)])
+        _deliver(cur, imgs_b, "b", traits=[_trait("A", 3.0)])
+        assert _summaries(cur, [exp]) == {exp: (2, 2)}
+        assert _summaries(cur, [exp])[exp] == _counts_from_bulk_read(cur, exp)
+    pg_conn.rollback()
+
+
+def test_superseded_readings_are_not_counted(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, wave = _seed_experiment(cur)
+        _, imgs = _seed_scan_in(cur, wave)
+        _deliver(
+            cur, imgs, "old", run="r1", traits=[_trait("A", 1.0), _trait("B", 1.0)]
+        )
+        _deliver(cur, imgs, "new", run="r2", traits=[_trait("A", 2.0)])
+        assert _summaries(cur, [exp])[exp] == _counts_from_bulk_read(cur, exp)
+    pg_conn.rollback()
+
+
+def test_experiment_without_readings_is_absent(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, _ = _seed_experiment(cur)
+        assert _summaries(cur, [exp]) == {}
+    pg_conn.rollback()
+
+
+def test_only_requested_experiments_are_returned(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp1, wave1 = _seed_experiment(cur)
+        exp2, wave2 = _seed_experiment(cur)
+        for wave in (wave1, wave2):
+            _, imgs = _seed_scan_in(cur, wave)
+            _deliver(cur, imgs, "k", traits=[_trait("A", 1.0)])
+        assert set(_summaries(cur, [exp1])) == {exp1}
+        assert set(_summaries(cur, [exp1, exp2])) == {exp1, exp2}
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["bloom_agent", "bloom_user", "bloom_admin"])
+def test_read_roles_can_call_summaries(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        exp, wave = _seed_experiment(cur)
+        _, imgs = _seed_scan_in(cur, wave)
+        _deliver(cur, imgs, "k", traits=[_trait("A", 1.0)])
+        cur.execute(f"SET LOCAL ROLE {role}")
+        cur.execute(
+            "SELECT count(*) FROM list_experiment_trait_summaries(%s)", ([exp],)
+        )
+        assert cur.fetchone()[0] is not None
+        cur.execute("RESET ROLE")
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_migration_body_is_idempotent(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='list_experiment_trait_summaries'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='list_experiment_trait_summaries'"
+        )
+        assert cur.fetchone()[0] == 0
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='get_experiment_traits'"
+        )
+        assert cur.fetchone()[0] == 1
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='list_experiment_trait_summaries'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
@@ -0,0 +1,139 @@
+"""
+Integration tests for `get_experiment_traits_columnar(experiment_id_, source_id_, run_id_)` — the
+same readings as `get_experiment_traits`, shipped as one row of per-column arrays so a large
+experiment isn't hundreds of thousands of JSON objects on the wire.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from `test_cyl_read_path.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_cyl_read_path import (  # noqa: E402
+    _deliver,
+    _seed_experiment,
+    _seed_scan_in,
+    _trait,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260811000000_get_experiment_traits_columnar"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+_COLUMNS = "scan_id, plant_id, trait_name, source_id, trait_value"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _rows(cur, experiment_id, *, source_id=None, run_id=None):
+    cur.execute(
+        f"SELECT {_COLUMNS} FROM get_experiment_traits(%s, %s, %s)",
+        (experiment_id, source_id, run_id),
+    )
+    return sorted(cur.fetchall())
+
+
+def _columnar_as_rows(cur, experiment_id, *, source_id=None, run_id=None):
+    cur.execute(
+        f"SELECT {_COLUMNS} FROM get_experiment_traits_columnar(%s, %s, %s)",
+        (experiment_id, source_id, run_id),
+    )
+    result = cur.fetchall()
+    assert len(result) == 1, "always exactly one row of arrays"
+    arrays = result[0]
+    if arrays[0] is None:
+        return []
+    assert len({len(a) for a in arrays}) == 1, "arrays must be aligned"
+    return sorted(zip(*arrays))
+
+
+def _seed_two_runs(cur):
+    exp, wave = _seed_experiment(cur)
+    _, imgs_a = _seed_scan_in(cur, wave)
+    _, imgs_b = _seed_scan_in(cur, wave)
+    _deliver(cur, imgs_a, "a1", run="r1", traits=[_trait("A", 1.0), _trait("B", 2.0)])
+    _deliver(cur, imgs_a, "a2", run="r2", traits=[_trait("A", 1.5)])
+    _deliver(cur, imgs_b, "b1", run="r1", traits=[_trait("A", 3.0)])
+    return exp
+
+
+def test_columnar_matches_rows_by_default(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp = _seed_two_runs(cur)
+        assert _columnar_as_rows(cur, exp) == _rows(cur, exp)
+    pg_conn.rollback()
+
+
+def test_columnar_matches_rows_when_pinned_to_a_run(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp = _seed_two_runs(cur)
+        pinned = _columnar_as_rows(cur, exp, run_id="r1")
+        assert pinned == _rows(cur, exp, run_id="r1")
+        assert pinned
+    pg_conn.rollback()
+
+
+def test_empty_experiment_returns_one_row_of_nulls(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, _ = _seed_experiment(cur)
+        assert _columnar_as_rows(cur, exp) == []
+    pg_conn.rollback()
+
+
+def test_both_source_and_run_rejected(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp = _seed_two_runs(cur)
+        with pytest.raises(psycopg.errors.RaiseException):
+            _columnar_as_rows(cur, exp, source_id=1, run_id="r1")
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["bloom_agent", "bloom_user", "bloom_admin"])
+def test_read_roles_can_call_columnar(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        exp = _seed_two_runs(cur)
+        cur.execute(f"SET LOCAL ROLE {role}")
+        assert _columnar_as_rows(cur, exp)
+        cur.execute("RESET ROLE")
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='get_experiment_traits_columnar'"
+        )
+        assert cur.fetchone()[0] == 0
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='get_experiment_traits'"
+        )
+        assert cur.fetchone()[0] == 1
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='get_experiment_traits_columnar'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
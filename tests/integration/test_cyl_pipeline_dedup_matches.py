@@ -0,0 +1,120 @@
+"""
+Integration tests for `cyl_pipeline_dedup_matches(p_scan_ids, p_param_hash)` — the scan-level
+lookup behind the pipeline-trigger dedup preview: distinct (scan_id, source_id) pairs whose
+source's stored param_hash matches, over ALL of a scan's sources, callable by bloom_workflows
+only.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from
+`test_cyl_pipeline_dispatch.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_cyl_pipeline_dispatch import (  # noqa: E402
+    _seed_scan,
+    _seed_trait_source,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260813000000_cyl_pipeline_dedup_matches"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _matches(cur, scan_ids, param_hash):
+    cur.execute(
+        "SELECT scan_id, source_id FROM cyl_pipeline_dedup_matches(%s, %s)",
+        (list(scan_ids), param_hash),
+    )
+    return cur.fetchall()
+
+
+def test_matches_any_source_not_just_the_latest(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        older = _seed_trait_source(cur, scan, param_hash="hash-a", name="older")
+        _seed_trait_source(cur, scan, param_hash="hash-b", name="newer")
+        assert _matches(cur, [scan], "hash-a") == [(scan, older)]
+    pg_conn.rollback()
+
+
+def test_one_row_per_pair_however_many_traits(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        source = _seed_trait_source(cur, scan, param_hash="hash-a")
+        for name in ("dedup_t1", "dedup_t2", "dedup_t3"):
+            cur.execute("INSERT INTO cyl_traits (name) VALUES (%s) RETURNING id", (name,))
+            cur.execute(
+                "INSERT INTO cyl_scan_traits (scan_id, source_id, trait_id) "
+                "VALUES (%s, %s, %s)",
+                (scan, source, cur.fetchone()[0]),
+            )
+        assert _matches(cur, [scan], "hash-a") == [(scan, source)]
+    pg_conn.rollback()
+
+
+def test_only_requested_scans_and_hash(pg_conn):
+    with pg_conn.cursor() as cur:
+        wanted, other, differing = (_seed_scan(cur) for _ in range(3))
+        source = _seed_trait_source(cur, wanted, param_hash="hash-a")
+        _seed_trait_source(cur, other, param_hash="hash-a")
+        _seed_trait_source(cur, differing, param_hash="hash-b")
+        assert _matches(cur, [wanted, differing], "hash-a") == [(wanted, source)]
+    pg_conn.rollback()
+
+
+def test_bloom_workflows_can_call(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        _seed_trait_source(cur, scan, param_hash="hash-a")
+        cur.execute("SET LOCAL ROLE bloom_workflows")
+        assert [row[0] for row in _matches(cur, [scan], "hash-a")] == [scan]
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["anon", "authenticated", "bloom_user"])
+def test_other_roles_cannot_call(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        cur.execute(f"SET LOCAL ROLE {role}")
+        with pytest.raises(psycopg.errors.InsufficientPrivilege):
+            _matches(cur, [1], "hash-a")
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='cyl_pipeline_dedup_matches'"
+        )
+        assert cur.fetchone()[0] == 0
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='cyl_pipeline_dedup_matches'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
@@ -0,0 +1,142 @@
+"""
+Integration tests for the `cyl_trait_counts_by_experiment` view — per-experiment trait counts
+pre-aggregated for the agent's `list_experiments_tool`, which used to read all of
+`cyl_trait_by_experiment_wave` and sum it in Python.
+
+The counts must agree with summing `cyl_trait_by_experiment_wave` per experiment: the tool's
+numbers did not change, only where they are computed.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from `test_cyl_read_path.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_cyl_read_path import (  # noqa: E402
+    _register_trait,
+    _seed_experiment,
+    _seed_scan_in,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260815000000_cyl_trait_counts_by_experiment"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _add_values(cur, scan_id, values):
+    for name, value in values:
+        cur.execute(
+            "INSERT INTO cyl_scan_traits (scan_id, source_id, trait_id, value) "
+            "VALUES (%s, NULL, %s, %s)",
+            (scan_id, _register_trait(cur, name), value),
+        )
+
+
+def _counts(cur, experiment_ids):
+    cur.execute(
+        "SELECT experiment_id, trait_measurement_count, distinct_traits_count "
+        "FROM cyl_trait_counts_by_experiment WHERE experiment_id = ANY(%s)",
+        (list(experiment_ids),),
+    )
+    return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+
+
+def _counts_from_wave_view(cur, experiment_id):
+    cur.execute(
+        "SELECT sum(n), count(DISTINCT trait_name) "
+        "FROM cyl_trait_by_experiment_wave WHERE experiment_id = %s",
+        (experiment_id,),
+    )
+    return tuple(cur.fetchone())
+
+
+def test_counts_match_the_per_wave_view(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, wave = _seed_experiment(cur)
+        cur.execute(
+            "INSERT INTO cyl_waves (experiment_id, number) VALUES (%s, 2) RETURNING id",
+            (exp,),
+        )
+        wave_2 = cur.fetchone()[0]
+        scan_a, _ = _seed_scan_in(cur, wave)
+        scan_b, _ = _seed_scan_in(cur, wave_2)
+        _add_values(cur, scan_a, [("tc_len", 1.0), ("tc_width", 2.0)])
+        _add_values(cur, scan_b, [("tc_len", 3.0), ("tc_len", 4.0)])
+        assert _counts(cur, [exp]) == {exp: (4, 2)}
+        assert _counts(cur, [exp])[exp] == _counts_from_wave_view(cur, exp)
+    pg_conn.rollback()
+
+
+def test_null_values_are_not_counted(pg_conn):
+    with pg_conn.cursor() as cur:
+        exp, wave = _seed_experiment(cur)
+        scan, _ = _seed_scan_in(cur, wave)
+        _add_values(cur, scan, [("tc_len", 1.0), ("tc_width", None)])
+        assert _counts(cur, [exp])[exp] == _counts_from_wave_view(cur, exp)
+    pg_conn.rollback()
+
+
+def test_experiment_without_values_or_deleted_is_absent(pg_conn):
+    with pg_conn.cursor() as cur:
+        empty, _ = _seed_experiment(cur)
+        deleted, wave = _seed_experiment(cur)
+        scan, _ = _seed_scan_in(cur, wave)
+        _add_values(cur, scan, [("tc_len", 1.0)])
+        cur.execute(
+            "UPDATE cyl_experiments SET deleted_at = now() WHERE id = %s", (deleted,)
+        )
+        assert _counts(cur, [empty, deleted]) == {}
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["bloom_agent", "bloom_user", "bloom_admin"])
+def test_read_roles_can_select(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        cur.execute(f"SET LOCAL ROLE {role}")
+        cur.execute("SELECT count(*) FROM cyl_trait_counts_by_experiment")
+        assert cur.fetchone()[0] is not None
+        cur.execute("RESET ROLE")
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute(
+            "SELECT count(*) FROM pg_views WHERE viewname='cyl_trait_counts_by_experiment'"
+        )
+        assert cur.fetchone()[0] == 0
+        cur.execute(
+            "SELECT count(*) FROM pg_views WHERE viewname='cyl_trait_by_experiment_wave'"
+        )
+        assert cur.fetchone()[0] == 1
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        cur.execute(
+            "SELECT count(*) FROM pg_views WHERE viewname='cyl_trait_counts_by_experiment'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
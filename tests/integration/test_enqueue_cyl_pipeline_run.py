@@ -0,0 +1,158 @@
+"""
+Integration tests for `enqueue_cyl_pipeline_run(p_run_id, p_scan_ids, p_batch_size)` — the
+pipeline trigger's one-call enqueue: it writes every `cyl_pipeline_run_scans` row and sends one
+`cyl_pipeline_dispatch` message per batch in the caller's transaction, so a run is either fully
+enqueued or not at all. Callable by bloom_workflows only.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from
+`test_cyl_pipeline_dispatch.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_cyl_pipeline_dispatch import (  # noqa: E402
+    QUEUE,
+    _seed_run,
+    _seed_run_scan,
+    _seed_scan,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260814000000_enqueue_cyl_pipeline_run"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _enqueue(cur, run_id, scan_ids, batch_size):
+    cur.execute(
+        "SELECT enqueue_cyl_pipeline_run(%s, %s, %s)", (run_id, scan_ids, batch_size)
+    )
+    return cur.fetchone()[0]
+
+
+def _messages_for(cur, run_id):
+    cur.execute(f"SELECT message FROM pgmq.read('{QUEUE}', 30, 100)")
+    return sorted(
+        (m for (m,) in cur.fetchall() if m.get("run_id") == run_id),
+        key=lambda m: m["batch_index"],
+    )
+
+
+def _run_scans(cur, run_id):
+    cur.execute(
+        "SELECT scan_id, batch_index, status FROM cyl_pipeline_run_scans "
+        "WHERE run_id = %s ORDER BY scan_id",
+        (run_id,),
+    )
+    return cur.fetchall()
+
+
+def test_writes_rows_and_one_message_per_batch(pg_conn):
+    with pg_conn.cursor() as cur:
+        scans = [_seed_scan(cur) for _ in range(5)]
+        run_id = _seed_run(cur)
+        cur.execute("SET LOCAL ROLE bloom_workflows")
+        assert _enqueue(cur, run_id, scans, 2) == 3
+        cur.execute("RESET ROLE")
+        assert _run_scans(cur, run_id) == [
+            (sid, pos // 2, "queued") for pos, sid in enumerate(scans)
+        ]
+        messages = _messages_for(cur, run_id)
+    assert [m["batch_index"] for m in messages] == [0, 1, 2]
+    assert [m["scan_ids"] for m in messages] == [scans[0:2], scans[2:4], scans[4:]]
+    pg_conn.rollback()
+
+
+def test_failure_leaves_no_rows_and_no_messages(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        run_id = _seed_run(cur)
+        cur.execute("SAVEPOINT before_enqueue")
+        with pytest.raises(psycopg.errors.UniqueViolation):
+            _enqueue(cur, run_id, [scan, scan], 1)  # duplicate scan in one run
+        cur.execute("ROLLBACK TO SAVEPOINT before_enqueue")
+        assert _run_scans(cur, run_id) == []
+        assert _messages_for(cur, run_id) == []
+    pg_conn.rollback()
+
+
+def test_run_already_enqueued_is_rejected(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        run_id = _seed_run(cur)
+        _seed_run_scan(cur, run_id, scan)
+        with pytest.raises(psycopg.errors.RaiseException):
+            _enqueue(cur, run_id, [scan], 25)
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize(
+    "scan_ids, batch_size", [([], 25), ([1], 0)], ids=["no-scans", "zero-batch"]
+)
+def test_bad_arguments_rejected(pg_conn, scan_ids, batch_size):
+    with pg_conn.cursor() as cur:
+        run_id = _seed_run(cur)
+        with pytest.raises(psycopg.errors.RaiseException):
+            _enqueue(cur, run_id, scan_ids, batch_size)
+    pg_conn.rollback()
+
+
+def test_only_queued_runs_accepted(pg_conn):
+    with pg_conn.cursor() as cur:
+        scan = _seed_scan(cur)
+        run_id = _seed_run(cur, status="complete")
+        with pytest.raises(psycopg.errors.RaiseException):
+            _enqueue(cur, run_id, [scan], 25)
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["anon", "authenticated", "bloom_user"])
+def test_other_roles_cannot_call(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        cur.execute(f"SET LOCAL ROLE {role}")
+        with pytest.raises(psycopg.errors.InsufficientPrivilege):
+            _enqueue(cur, 1, [1], 25)
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='enqueue_cyl_pipeline_run'"
+        )
+        assert cur.fetchone()[0] == 0
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='enqueue_cyl_pipeline_batch'"
+        )
+        assert cur.fetchone()[0] == 1
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        cur.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname='enqueue_cyl_pipeline_run'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
@@ -0,0 +1,109 @@
+"""
+Integration tests for `scrna_counts.counts_byte_offset` / `counts_byte_length` — where a gene's
+block sits inside its dataset's packed count matrix, so the agent reads one gene with a single
+ranged GET. Rows from the old per-gene JSON uploader leave both NULL.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back.
+"""
+
+import re
+import uuid
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260816000000_scrna_counts_byte_ranges"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _seed_gene(cur):
+    """species → scrna_datasets → scrna_genes. Returns (dataset_id, gene_id)."""
+    cur.execute("INSERT INTO species DEFAULT VALUES RETURNING id")
+    species_id = cur.fetchone()[0]
+    cur.execute(
+        "INSERT INTO scrna_datasets (name, species_id) VALUES (%s, %s) RETURNING id",
+        (f"ds-{uuid.uuid4().hex[:12]}", species_id),
+    )
+    dataset_id = cur.fetchone()[0]
+    cur.execute(
+        "INSERT INTO scrna_genes (dataset_id, gene_name, gene_number) "
+        "VALUES (%s, 'G0', 0) RETURNING id",
+        (dataset_id,),
+    )
+    return dataset_id, cur.fetchone()[0]
+
+
+def _insert_counts(cur, offset, length):
+    dataset_id, gene_id = _seed_gene(cur)
+    # Since 20260818000000 a byte range comes with the packed object's path.
+    packed = None if offset is None else "counts/ds.csr"
+    cur.execute(
+        "INSERT INTO scrna_counts (dataset_id, gene_id, counts_object_path, "
+        "counts_packed_path, counts_byte_offset, counts_byte_length) "
+        "VALUES (%s, %s, 'counts/ds/G0.json', %s, %s, %s)",
+        (dataset_id, gene_id, packed, offset, length),
+    )
+
+
+@pytest.mark.parametrize(
+    "offset, length",
+    [(None, None), (4096, 0), (4096, 812)],
+    ids=["legacy", "empty", "block"],
+)
+def test_valid_ranges_accepted(pg_conn, offset, length):
+    with pg_conn.cursor() as cur:
+        _insert_counts(cur, offset, length)
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize(
+    "offset, length",
+    [(4096, None), (None, 10), (-1, 10)],
+    ids=["no-length", "no-offset", "negative"],
+)
+def test_partial_or_negative_ranges_rejected(pg_conn, offset, length):
+    with pg_conn.cursor() as cur:
+        with pytest.raises(psycopg.errors.CheckViolation):
+            _insert_counts(cur, offset, length)
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def _columns(cur):
+    cur.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = 'scrna_counts'"
+    )
+    return {row[0] for row in cur.fetchall()}
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    new = {"counts_byte_offset", "counts_byte_length"}
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        assert not new & _columns(cur)
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        assert new <= _columns(cur)
+    pg_conn.rollback()
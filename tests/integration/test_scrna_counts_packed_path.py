@@ -0,0 +1,112 @@
+"""
+Integration tests for `scrna_counts.counts_packed_path` — the packed count matrix a row's byte
+range points into, kept apart from `counts_object_path` (the gene's JSON object, which the web app
+reads). Path and range are set together or not at all.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from
+`test_scrna_counts_byte_ranges.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_scrna_counts_byte_ranges import _seed_gene  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260818000000_scrna_counts_packed_path"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _insert_counts(cur, packed, offset, length):
+    dataset_id, gene_id = _seed_gene(cur)
+    cur.execute(
+        "INSERT INTO scrna_counts (dataset_id, gene_id, counts_object_path, "
+        "counts_packed_path, counts_byte_offset, counts_byte_length) "
+        "VALUES (%s, %s, 'counts/ds/G0.json', %s, %s, %s) RETURNING id",
+        (dataset_id, gene_id, packed, offset, length),
+    )
+    return cur.fetchone()[0]
+
+
+@pytest.mark.parametrize(
+    "packed, offset, length",
+    [(None, None, None), ("counts/ds.csr", 4096, 0), ("counts/ds.csr", 4096, 812)],
+    ids=["json-only", "empty", "block"],
+)
+def test_valid_rows_accepted(pg_conn, packed, offset, length):
+    with pg_conn.cursor() as cur:
+        _insert_counts(cur, packed, offset, length)
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize(
+    "packed, offset, length",
+    [("counts/ds.csr", None, None), (None, 4096, 812)],
+    ids=["path-without-range", "range-without-path"],
+)
+def test_path_and_range_set_together(pg_conn, packed, offset, length):
+    with pg_conn.cursor() as cur:
+        with pytest.raises(psycopg.errors.CheckViolation):
+            _insert_counts(cur, packed, offset, length)
+    pg_conn.rollback()
+
+
+def test_migration_backfills_packed_only_rows(pg_conn):
+    # A row written before this migration: byte range into counts_object_path.
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        dataset_id, gene_id = _seed_gene(cur)
+        cur.execute(
+            "INSERT INTO scrna_counts "
+            "(dataset_id, gene_id, counts_object_path, counts_byte_offset, counts_byte_length) "
+            "VALUES (%s, %s, 'counts/ds.csr', 4096, 812) RETURNING id",
+            (dataset_id, gene_id),
+        )
+        row_id = cur.fetchone()[0]
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(
+            "SELECT counts_packed_path FROM scrna_counts WHERE id = %s", (row_id,)
+        )
+        assert cur.fetchone() == ("counts/ds.csr",)
+    pg_conn.rollback()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def _columns(cur):
+    cur.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = 'scrna_counts'"
+    )
+    return {row[0] for row in cur.fetchall()}
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        assert "counts_packed_path" not in _columns(cur)
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        assert "counts_packed_path" in _columns(cur)
+    pg_conn.rollback()
@@ -0,0 +1,98 @@
+"""
+Integration tests for `scrna_gene_cluster_stats` — per-gene x cluster expression summaries the
+scRNA uploader can store at ingest, read by the agent's get_gene_expression_by_cluster_tool.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`
+(BYPASSRLS) and every test rolls back. Seeding helpers are imported from
+`test_scrna_counts_byte_ranges.py`.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from tests.integration.test_scrna_counts_byte_ranges import _seed_gene  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260817000000_scrna_gene_cluster_stats"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _insert(cur, dataset_id, gene_id, expressing=3, total=10):
+    cur.execute(
+        "INSERT INTO scrna_gene_cluster_stats "
+        "(dataset_id, gene_id, cluster_id, expressing_cells, total_cells, sum_expression) "
+        "VALUES (%s, %s, 'c0', %s, %s, 4.5)",
+        (dataset_id, gene_id, expressing, total),
+    )
+
+
+@pytest.mark.parametrize("role", ["bloom_agent", "bloom_user", "authenticated"])
+def test_read_roles_can_select(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        dataset_id, gene_id = _seed_gene(cur)
+        _insert(cur, dataset_id, gene_id)
+        cur.execute(f"SET LOCAL ROLE {role}")
+        cur.execute(
+            "SELECT expressing_cells FROM scrna_gene_cluster_stats WHERE gene_id = %s",
+            (gene_id,),
+        )
+        assert cur.fetchall() == [(3,)]
+        cur.execute("RESET ROLE")
+    pg_conn.rollback()
+
+
+@pytest.mark.parametrize("role", ["bloom_agent", "bloom_user"])
+def test_readers_cannot_write(pg_conn, role):
+    with pg_conn.cursor() as cur:
+        dataset_id, gene_id = _seed_gene(cur)
+        cur.execute(f"SET LOCAL ROLE {role}")
+        with pytest.raises(psycopg.errors.InsufficientPrivilege):
+            _insert(cur, dataset_id, gene_id)
+    pg_conn.rollback()
+
+
+def test_more_expressing_than_total_cells_rejected(pg_conn):
+    with pg_conn.cursor() as cur:
+        dataset_id, gene_id = _seed_gene(cur)
+        with pytest.raises(psycopg.errors.CheckViolation):
+            _insert(cur, dataset_id, gene_id, expressing=11, total=10)
+    pg_conn.rollback()
+
+
+def test_rows_go_with_their_gene(pg_conn):
+    with pg_conn.cursor() as cur:
+        dataset_id, gene_id = _seed_gene(cur)
+        _insert(cur, dataset_id, gene_id)
+        cur.execute("DELETE FROM scrna_genes WHERE id = %s", (gene_id,))
+        cur.execute(
+            "SELECT count(*) FROM scrna_gene_cluster_stats WHERE gene_id = %s",
+            (gene_id,),
+        )
+        assert cur.fetchone()[0] == 0
+    pg_conn.rollback()
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        cur.execute("SELECT to_regclass('public.scrna_gene_cluster_stats')")
+        assert cur.fetchone()[0] is None
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        cur.execute("SELECT to_regclass('public.scrna_gene_cluster_stats')")
+        assert cur.fetchone()[0] is not None
+    pg_conn.rollback()
@@ -0,0 +1,112 @@
+"""
+Integration tests for the video_jobs claim bookkeeping (`heartbeat_at`, `attempts`, pending index)
+and the `FOR UPDATE SKIP LOCKED` claim the video-worker runs against it: two overlapping claimers
+must each get a different pending job rather than the same one or a blocked wait.
+
+LOCAL ONLY: the `pg_conn` fixture connects to 127.0.0.1 on POSTGRES_HOST_PORT as `supabase_admin`.
+The concurrency test commits its seed rows from a separate connection and deletes them afterwards.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+_TS = "20260812000000_video_jobs_claim"
+MIGRATION = REPO_ROOT / "supabase" / "migrations" / f"{_TS}.sql"
+ROLLBACK = REPO_ROOT / "supabase" / "rollbacks" / f"{_TS}_rollback.sql"
+
+# Same shape as video_listener.claim_job, scoped to the test's own rows so a shared dev database
+# with real pending jobs can't interfere.
+_CLAIM = """
+    UPDATE video_jobs
+    SET status = 'processing', started_at = now(), heartbeat_at = now(),
+        attempts = attempts + 1
+    WHERE id = (
+        SELECT id FROM video_jobs
+        WHERE status = 'pending' AND id = ANY(%s)
+        ORDER BY created_at, id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING id
+"""
+
+
+def _sql_body(path: Path) -> str:
+    """Migration/rollback body minus its BEGIN;/COMMIT; wrapper (CRLF-safe)."""
+    return "\n".join(
+        line
+        for line in path.read_text().splitlines()
+        if not re.match(r"^\s*(BEGIN|COMMIT)\s*;\s*$", line, re.IGNORECASE)
+    )
+
+
+def _columns(cur):
+    cur.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = 'video_jobs'"
+    )
+    return {row[0] for row in cur.fetchall()}
+
+
+def test_new_job_defaults(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO video_jobs (scan_id) VALUES (-1) RETURNING attempts, heartbeat_at"
+        )
+        assert cur.fetchone() == (0, None)
+    pg_conn.rollback()
+
+
+def test_overlapping_claims_get_different_jobs(pg_conn, pg_conninfo):
+    with pg_conn.cursor() as cur:
+        cur.execute("INSERT INTO video_jobs (scan_id) VALUES (-1), (-1) RETURNING id")
+        ids = [row[0] for row in cur.fetchall()]
+    pg_conn.commit()
+
+    conn_a = psycopg.connect(pg_conninfo)
+    conn_b = psycopg.connect(pg_conninfo)
+    try:
+        cur_a = conn_a.cursor()
+        cur_b = conn_b.cursor()
+        cur_a.execute(_CLAIM, (ids,))
+        claimed_a = cur_a.fetchone()[0]  # A holds its row lock, uncommitted
+        cur_b.execute(_CLAIM, (ids,))  # must skip A's row, not wait on it
+        claimed_b = cur_b.fetchone()[0]
+        assert {claimed_a, claimed_b} == set(ids)
+        cur_b.execute(_CLAIM, (ids,))
+        assert cur_b.fetchone() is None  # nothing left to claim
+        conn_a.commit()
+        conn_b.commit()
+    finally:
+        conn_a.close()
+        conn_b.close()
+        with pg_conn.cursor() as cur:
+            cur.execute("DELETE FROM video_jobs WHERE id = ANY(%s)", (ids,))
+        pg_conn.commit()
+
+
+def test_migration_adds_no_write_capability():
+    sql = MIGRATION.read_text().lower()
+    assert "create policy" not in sql
+    assert not re.search(
+        r"grant\s+[^;]*\b(insert|update|delete|all)\b", sql
+    ), "migration must not grant any write privilege"
+
+
+def test_rollback_restores_prior_state(pg_conn):
+    with pg_conn.cursor() as cur:
+        cur.execute(_sql_body(ROLLBACK))
+        assert not {"heartbeat_at", "attempts"} & _columns(cur)
+        cur.execute(_sql_body(MIGRATION))
+        cur.execute(_sql_body(MIGRATION))  # re-runnable
+        assert {"heartbeat_at", "attempts"} <= _columns(cur)
+        cur.execute(
+            "SELECT count(*) FROM pg_indexes WHERE indexname = 'idx_video_jobs_pending_created'"
+        )
+        assert cur.fetchone()[0] == 1
+    pg_conn.rollback()
@@ -1,6 +1,7 @@
 """Unit tests for compare_accessions_in_wave_tool.
 
-Mocks httpx.get for the three PostgREST calls the tool makes:
+Mocks the pooled client's get (httpx.Client.get) for the three PostgREST calls
+the tool makes:
   1. /cyl_trait_by_experiment_wave (candidate trait names in scope)
   2. /cyl_traits (resolve canonical name to trait_id)
   3. /cyl_plants (raw values per plant via embedded scans/scan_traits/accessions)
@@ -90,7 +91,7 @@ def _plant_multi_scan(
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/y.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_typo_trait_returns_suggestions_no_plot(mock_get, mock_render):
     mock_get.side_effect = _httpx_side_effect(
         candidates=["primary_length", "total_length", "leaf_count"],
@@ -109,7 +110,7 @@ def test_typo_trait_returns_suggestions_no_plot(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/cyl_supabase_accession_rank_aaaa1111.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_happy_path_small_panel_returns_boxplot_layout(mock_get, mock_render):
     mock_get.side_effect = _httpx_side_effect(
         candidates=["primary_length"],
@@ -141,7 +142,7 @@ def test_happy_path_small_panel_returns_boxplot_layout(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_large_panel_returns_ranked_profile_layout_and_summary(mock_get, mock_render):
     n_accessions = 15
     plants = [_plant(f"indi-{i:02d}", 5, [50 + i + 0.5, 50 + i, 50 + i + 1]) for i in range(n_accessions)]
@@ -168,7 +169,7 @@ def test_large_panel_returns_ranked_profile_layout_and_summary(mock_get, mock_re
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_no_data_returns_empty_rankings_no_plot(mock_get, mock_render):
     mock_get.side_effect = _httpx_side_effect(
         candidates=["primary_length"],
@@ -189,7 +190,7 @@ def test_no_data_returns_empty_rankings_no_plot(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_rankings_sorted_by_median_descending(mock_get, mock_render):
     mock_get.side_effect = _httpx_side_effect(
         candidates=["primary_length"],
@@ -212,7 +213,7 @@ def test_rankings_sorted_by_median_descending(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_default_mode_picks_latest_scan_per_plant(mock_get, mock_render):
     """When no plant_age_days is passed, only the highest-age scan per plant contributes."""
     mock_get.side_effect = _httpx_side_effect(
@@ -238,7 +239,7 @@ def test_default_mode_picks_latest_scan_per_plant(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_specific_age_mode_filters_to_that_age(mock_get, mock_render):
     """When plant_age_days is passed, only scans at that exact age contribute."""
     mock_get.side_effect = _httpx_side_effect(
@@ -264,7 +265,7 @@ def test_specific_age_mode_filters_to_that_age(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_plants_with_null_values_or_wrong_trait_excluded(mock_get, mock_render):
     """Defensive: null trait values and wrong trait_ids are ignored."""
     mock_get.side_effect = _httpx_side_effect(
@@ -74,7 +74,7 @@ def _scan(plant_age_days: int, trait_id: int, values: list[float]) -> dict:
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_happy_path_returns_per_wave_sorted_chronologically(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[
@@ -105,7 +105,7 @@ def test_happy_path_returns_per_wave_sorted_chronologically(mock_get, mock_rende
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_single_wave_sets_cv_to_none(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[{"id": 10, "number": 1, "name": "Wave 1"}],
@@ -124,7 +124,7 @@ def test_single_wave_sets_cv_to_none(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_unknown_accession_returns_error_no_plot(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[{"id": 10, "number": 1, "name": "Wave 1"}],
@@ -145,7 +145,7 @@ def test_unknown_accession_returns_error_no_plot(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_accession_missing_from_some_waves_returns_error_no_plot(mock_get, mock_render):
     """Experiment has 3 waves but accession only appears in 2 → coverage error."""
     mock_get.side_effect = _side_effect(
@@ -177,7 +177,7 @@ def test_accession_missing_from_some_waves_returns_error_no_plot(mock_get, mock_
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_typo_trait_returns_suggestions_no_plot(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[{"id": 10, "number": 1, "name": "Wave 1"}],
@@ -197,7 +197,7 @@ def test_typo_trait_returns_suggestions_no_plot(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_consistency_block_computed_from_wave_medians(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[
@@ -227,7 +227,7 @@ def test_consistency_block_computed_from_wave_medians(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_plot_url_populated_on_happy_path(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[
@@ -252,7 +252,7 @@ def test_plot_url_populated_on_happy_path(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_age_context_single_age_per_wave(mock_get, mock_render):
     mock_get.side_effect = _side_effect(
         waves=[
@@ -279,7 +279,7 @@ def test_age_context_single_age_per_wave(mock_get, mock_render):
 
 
 @patch("tools.cyl_tools.render_and_save", return_value="http://x/plot.png")
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_specific_age_mode_filters_to_that_age(mock_get, mock_render):
     """Wave 1 has scans at ages [14, 21, 28]; with plant_age_days=21 only
     that age contributes (despite default being latest-per-plant)."""
@@ -1,8 +1,8 @@
 """Unit tests for list_experiments_tool.
 
 Verifies the per-experiment chip payload (label + prompt, capped at 20)
-plus the 3 baseline action chips. Mocks httpx.get so the tests are pure
-unit (no live Supabase).
+plus the 3 baseline action chips. Mocks httpx.Client.get (the pooled client
+the tools run on) so the tests are pure unit (no live Supabase).
 """
 from __future__ import annotations
 
@@ -11,13 +11,21 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 os.environ.setdefault("BLOOM_AGENT_KEY", "test-token-not-real")
 os.environ.setdefault("SUPABASE_URL", "http://test-supabase")
 
 REPO_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT / "langchain"))
 
-from tools.cyl_tools import list_experiments_tool  # noqa: E402
+from tools.cyl_tools import _trait_counts_cache, list_experiments_tool  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _no_cached_trait_counts():
+    """Counts are cached per experiment id across calls; start each test cold."""
+    _trait_counts_cache.clear()
 
 
 def _mock_response(experiments: list[dict]):
@@ -34,7 +42,7 @@ def _make_experiment(i: int, name: str | None = None) -> dict:
     }
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_emits_per_experiment_chips(mock_get):
     mock_get.return_value = _mock_response(
         [_make_experiment(1, "alfalfa-2024"), _make_experiment(2, "alfalfa-2025")]
@@ -49,7 +57,7 @@ def test_emits_per_experiment_chips(mock_get):
     assert alfalfa_chip["prompt"] == "Show waves for alfalfa-2024"
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_appends_three_baseline_action_chips(mock_get):
     mock_get.return_value = _mock_response([_make_experiment(1, "alfalfa-2024")])
 
@@ -62,7 +70,7 @@ def test_appends_three_baseline_action_chips(mock_get):
     assert len(result["followup_actions"]) == 1 + 3
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_experiment_chips_capped_at_twenty(mock_get):
     many = [_make_experiment(i) for i in range(50)]
     mock_get.return_value = _mock_response(many)
@@ -77,7 +85,7 @@ def test_experiment_chips_capped_at_twenty(mock_get):
     assert len(result["followup_actions"]) == 20 + 3
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_empty_experiments_still_returns_baseline_chips(mock_get):
     mock_get.return_value = _mock_response([])
 
@@ -90,7 +98,7 @@ def test_empty_experiments_still_returns_baseline_chips(mock_get):
     assert labels == ["List the traits", "Show trait statistics", "Compare across waves"]
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_skips_experiments_with_missing_name(mock_get):
     named = _make_experiment(1, "alfalfa-2024")
     unnamed = _make_experiment(2)
@@ -104,10 +112,10 @@ def test_skips_experiments_with_missing_name(mock_get):
     assert len(result["followup_actions"]) == 1 + 3
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_includes_trait_measurement_count_and_distinct_traits_count(mock_get):
     """Each experiment dict gains trait_measurement_count + distinct_traits_count
-    computed from the cyl_trait_by_experiment_wave view."""
+    read from the cyl_trait_counts_by_experiment view for the listed ids."""
 
     def _side_effect(url, **kwargs):
         if url.endswith("/cyl_experiments"):
@@ -116,18 +124,24 @@ def test_includes_trait_measurement_count_and_distinct_traits_count(mock_get):
                 _make_experiment(2, "alfalfa-2025"),
                 _make_experiment(3, "alfalfa-2026"),
             ])
-        if url.endswith("/cyl_trait_by_experiment_wave"):
+        if url.endswith("/cyl_trait_counts_by_experiment"):
+            assert kwargs["params"]["experiment_id"] == "in.(1,2,3)"
             return MagicMock(
                 status_code=200,
                 json=lambda: [
                     # exp 1: 240 total scan-trait rows across 12 distinct trait names
-                    *[
-                        {"experiment_id": 1, "trait_name": f"trait_{i}", "n": 20}
-                        for i in range(12)
-                    ],
+                    {
+                        "experiment_id": 1,
+                        "trait_measurement_count": 240,
+                        "distinct_traits_count": 12,
+                    },
                     # exp 2: 0 rows (no measurements yet) — absent from view
                     # exp 3: 5 measurements across 1 trait
-                    {"experiment_id": 3, "trait_name": "primary_length", "n": 5},
+                    {
+                        "experiment_id": 3,
+                        "trait_measurement_count": 5,
+                        "distinct_traits_count": 1,
+                    },
                 ],
             )
         raise AssertionError(f"unexpected URL: {url}")
@@ -2,7 +2,8 @@
 
 Verifies the followup_actions chip payload (label + prompt per trait,
 capped at 20) plus preservation of the original count/traits/hint keys.
-Mocks httpx.get so the tests are pure unit (no live Supabase).
+Mocks httpx.Client.get (the pooled client the tools run on) so the tests
+are pure unit (no live Supabase).
 """
 from __future__ import annotations
 
@@ -27,7 +28,7 @@ def _mock_response(trait_names: list[str]):
     )
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_emits_followup_actions_one_per_trait(mock_get):
     mock_get.return_value = _mock_response(["leaf_count", "primary_length", "total_length"])
 
@@ -39,7 +40,7 @@ def test_emits_followup_actions_one_per_trait(mock_get):
     assert labels == ["leaf_count", "primary_length", "total_length"]
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_each_chip_has_label_and_prompt(mock_get):
     mock_get.return_value = _mock_response(["primary_length"])
 
@@ -50,7 +51,7 @@ def test_each_chip_has_label_and_prompt(mock_get):
     assert chip["prompt"] == "Show me stats for primary_length"
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_chips_capped_at_twenty(mock_get):
     many = [f"trait_{i:02d}" for i in range(50)]
     mock_get.return_value = _mock_response(many)
@@ -64,7 +65,7 @@ def test_chips_capped_at_twenty(mock_get):
     assert result["followup_actions"][-1]["label"] == "trait_19"
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_empty_trait_list_returns_empty_followup_actions(mock_get):
     mock_get.return_value = _mock_response([])
 
@@ -75,7 +76,7 @@ def test_empty_trait_list_returns_empty_followup_actions(mock_get):
     assert result["followup_actions"] == []
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_original_keys_preserved_unscoped(mock_get):
     """Unscoped call still returns the global-registry shape (backward compat)."""
     mock_get.return_value = _mock_response(["leaf_count", "primary_length"])
@@ -88,7 +89,7 @@ def test_original_keys_preserved_unscoped(mock_get):
     assert result["scope"] == {"experiment_id": None, "wave_ids": None}
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_unscoped_call_omits_soft_other_chip(mock_get):
     """Soft-other chip only appears when a scope is set."""
     mock_get.return_value = _mock_response(["primary_length", "leaf_count"])
@@ -99,7 +100,7 @@ def test_unscoped_call_omits_soft_other_chip(mock_get):
     assert "Type a different trait" not in labels
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_scoped_to_experiment_returns_filtered_traits_and_soft_other_chip(mock_get):
     """experiment_id scope: chips reflect only traits in scope + 'Type a different trait' soft-other appended."""
     mock_get.return_value = MagicMock(
@@ -124,7 +125,7 @@ def test_scoped_to_experiment_returns_filtered_traits_and_soft_other_chip(mock_g
     assert soft_other["prompt"] == "Show me all available traits"
 
 
-@patch("tools.cyl_tools.httpx.get")
+@patch("tools.rest_client.httpx.Client.get")
 def test_scoped_to_waves_returns_filtered_traits(mock_get):
     """wave_ids scope: queries the view filtered by wave_id IN (...)."""
     captured: dict = {}
@@ -0,0 +1,238 @@
+"""Unit tests for scripts/render_plate_videos.py's frame downscaling and uploads.
+
+The DB/ffmpeg path needs a live stack; here we pin that every 16-bit greyscale
+TIFF variant the scanners write is reduced to 8-bit (high byte) and scaled to
+the requested width, and, against an `httpx.MockTransport` storage server, that
+uploads stream in 6 MiB chunks and a resumable upload resumes from the offset
+the server reports after a failed PATCH.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import numpy as np
+import pytest
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = REPO_ROOT / "scripts" / "render_plate_videos.py"
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location("render_plate_videos", _SCRIPT)
+    assert spec and spec.loader, f"cannot load {_SCRIPT}"
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: the script's dataclasses resolve their module by name.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+render_plate_videos = _load()
+
+
+@pytest.mark.parametrize("mode", ["I;16", "I;16B", "I;16L"])
+def test_16bit_frame_keeps_high_byte(tmp_path, mode):
+    source = tmp_path / "frame.tif"
+    dest = tmp_path / "frame.png"
+    img = Image.new(mode, (40, 20))
+    img.putpixel((0, 0), 0x1234)
+    img.putpixel((39, 19), 0xFFFF)
+    img.save(source)
+
+    render_plate_videos.downscale_frame(source, dest, max_width=40)
+
+    with Image.open(dest) as out:
+        assert out.mode == "L"
+        pixels = np.asarray(out)
+    assert pixels[0, 0] == 0x12
+    assert pixels[19, 39] == 0xFF
+
+
+def test_wide_frame_is_scaled_to_max_width(tmp_path):
+    source = tmp_path / "frame.tif"
+    dest = tmp_path / "frame.png"
+    Image.new("I;16B", (400, 300)).save(source)
+
+    render_plate_videos.downscale_frame(source, dest, max_width=100)
+
+    with Image.open(dest) as out:
+        assert out.size == (100, 75)
+
+
+# ─── Uploads ─────────────────────────────────────────────────────────────────
+
+CHUNK = 6 * 1024 * 1024
+LOCATION = "/storage/v1/upload/resumable/upload-1"
+
+
+def _video(tmp_path, size):
+    source = tmp_path / "plate.mp4"
+    source.write_bytes(np.random.default_rng(0).bytes(size))
+    return source
+
+
+class _TusServer:
+    """A TUS endpoint that stores PATCHed bytes and records every request.
+
+    `fail_patch` maps a PATCH's call number (from 1) to what goes wrong:
+    "error" answers 500 without storing the chunk, "lost" stores it but drops
+    the connection before the reply. `fail_head` call numbers drop the HEAD.
+    """
+
+    def __init__(self, fail_patch=None, fail_head=()):
+        self.fail_patch = fail_patch or {}
+        self.fail_head = set(fail_head)
+        self.received = b""
+        self.requests: list[httpx.Request] = []
+        self.patch_offsets: list[int] = []
+        self.patch_sizes: list[int] = []
+        self.heads = 0
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, headers={"Location": LOCATION})
+        if request.method == "HEAD":
+            self.heads += 1
+            if self.heads in self.fail_head:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(
+                200, headers={"Upload-Offset": str(len(self.received))}
+            )
+        assert request.method == "PATCH"
+        offset = int(request.headers["Upload-Offset"])
+        self.patch_offsets.append(offset)
+        self.patch_sizes.append(len(request.content))
+        failure = self.fail_patch.get(len(self.patch_offsets))
+        if failure == "error":
+            return httpx.Response(500, text="storage unavailable")
+        if offset != len(self.received):
+            return httpx.Response(409, text="offset mismatch")
+        self.received += request.content
+        if failure == "lost":
+            raise httpx.ReadError("connection dropped", request=request)
+        return httpx.Response(204, headers={"Upload-Offset": str(len(self.received))})
+
+
+def _client(handler):
+    return httpx.Client(
+        base_url="http://storage", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.parametrize(
+    "size", [1024, 2 * CHUNK + 5], ids=["one-chunk", "multi-chunk"]
+)
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_upload_video_streams_file(tmp_path, size, overwrite):
+    source = _video(tmp_path, size)
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200)
+
+    with _client(handler) as client:
+        render_plate_videos.upload_video(client, "videos", "p/1.mp4", source, overwrite)
+
+    (request,) = seen
+    assert request.method == ("PUT" if overwrite else "POST")
+    assert request.url.path == "/storage/v1/object/videos/p/1.mp4"
+    assert request.headers["Content-Length"] == str(size)
+    assert (request.headers.get("x-upsert") == "true") is overwrite
+    assert request.content == source.read_bytes()
+    assert [len(c) for c in render_plate_videos._iter_file(source)] == (
+        [size] if size < CHUNK else [CHUNK, CHUNK, 5]
+    )
+
+
+def test_upload_video_raises_on_error_status(tmp_path):
+    source = _video(tmp_path, 1024)
+    with _client(lambda request: httpx.Response(413, text="too large")) as client:
+        with pytest.raises(RuntimeError, match="Upload failed 413"):
+            render_plate_videos.upload_video(client, "videos", "p/1.mp4", source, False)
+
+
+@pytest.mark.parametrize(
+    "size, sizes",
+    [(1024, [1024]), (2 * CHUNK + 5, [CHUNK, CHUNK, 5])],
+    ids=["one-chunk", "multi-chunk"],
+)
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_resumable_upload_patches_in_chunks(tmp_path, size, sizes, overwrite):
+    source = _video(tmp_path, size)
+    server = _TusServer()
+
+    with _client(server) as client:
+        # Above the threshold, upload_video hands off to the TUS endpoint.
+        render_plate_videos.upload_video(
+            client, "videos", "p/1.mp4", source, overwrite, resumable_threshold=size
+        )
+
+    create = server.requests[0]
+    assert create.method == "POST"
+    assert create.url.path == "/storage/v1/upload/resumable"
+    assert create.headers["Upload-Length"] == str(size)
+    assert (create.headers.get("x-upsert") == "true") is overwrite
+    assert all(r.url.path == LOCATION for r in server.requests[1:])
+    assert server.patch_sizes == sizes
+    assert server.patch_offsets == [sum(sizes[:i]) for i in range(len(sizes))]
+    assert server.received == source.read_bytes()
+
+
+def test_resumable_upload_resumes_from_head_offset(tmp_path):
+    source = _video(tmp_path, 3 * CHUNK)
+    # The second chunk lands but its reply is lost; the client must not resend it.
+    server = _TusServer(fail_patch={2: "lost"})
+
+    with _client(server) as client:
+        render_plate_videos.upload_video_resumable(
+            client, "videos", "p/1.mp4", source, False
+        )
+
+    assert server.heads == 1
+    assert server.patch_offsets == [0, CHUNK, 2 * CHUNK]
+    assert server.received == source.read_bytes()
+
+
+def test_resumable_upload_head_failure_retries_last_offset(tmp_path):
+    source = _video(tmp_path, 2 * CHUNK)
+    server = _TusServer(fail_patch={2: "error"}, fail_head={1})
+
+    with _client(server) as client:
+        render_plate_videos.upload_video_resumable(
+            client, "videos", "p/1.mp4", source, False
+        )
+
+    assert server.heads == 1
+    assert server.patch_offsets == [0, CHUNK, CHUNK]
+    assert server.received == source.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "fail_head, patches, heads",
+    # Every PATCH fails: each is followed by a HEAD, which counts only if it fails.
+    [((), 4, 3), ((1, 2, 3), 2, 2)],
+    ids=["patch", "patch-and-head"],
+)
+def test_resumable_upload_gives_up_after_max_retries(
+    tmp_path, fail_head, patches, heads
+):
+    source = _video(tmp_path, 1024)
+    server = _TusServer(
+        fail_patch=dict.fromkeys(range(1, 10), "error"), fail_head=fail_head
+    )
+
+    with _client(server) as client:
+        with pytest.raises(RuntimeError, match="Resumable upload failed for p/1.mp4"):
+            render_plate_videos.upload_video_resumable(
+                client, "videos", "p/1.mp4", source, False
+            )
+
+    assert render_plate_videos.RESUMABLE_MAX_RETRIES == 3
+    assert (len(server.patch_offsets), server.heads) == (patches, heads)
@@ -38,6 +38,15 @@ def _supabase_env(monkeypatch):
     monkeypatch.setenv("BLOOM_AGENT_KEY", "fake-agent-jwt")
 
 
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Start and end every test with no cached client, so each test's
+    `create_client` stub is the one that gets called."""
+    supabase_client.reset_clients()
+    yield
+    supabase_client.reset_clients()
+
+
 # ─── Helper: build a Supabase-client mock whose .storage.from_().download
 #     and .upload return deterministic values. The fixture also yields a
 #     handle to the inner `storage_from` mock so each test can assert on
@@ -59,7 +68,9 @@ def supabase_mock(monkeypatch):
     client.storage = storage
 
     monkeypatch.setattr(
-        supabase_client.supabase, "create_client", lambda url, key: client
+        supabase_client.supabase,
+        "create_client",
+        lambda url, key, options=None: client,
     )
     return storage_from
 
@@ -90,11 +101,11 @@ def test_read_input_csv_rejects_non_basename(bad_name, supabase_mock):
 
 # ─────────────────────── client construction ────────────────────────
 
-def test_get_postgrest_client_returns_a_fresh_client(supabase_mock, monkeypatch):
-    """Each call returns a new client — verifies no module-level cache."""
+def test_get_postgrest_client_reuses_one_client_per_env(supabase_mock, monkeypatch):
+    """Calls share one client until the key changes — a rotated key gets a new one."""
     calls = []
 
-    def fake_create_client(url, key):
+    def fake_create_client(url, key, options=None):
         c = MagicMock(name=f"client-{len(calls)}")
         calls.append(c)
         return c
@@ -102,8 +113,11 @@ def test_get_postgrest_client_returns_a_fresh_client(supabase_mock, monkeypatch)
     monkeypatch.setattr(supabase_client.supabase, "create_client", fake_create_client)
 
     c1 = supabase_client.get_postgrest_client()
-    c2 = supabase_client.get_postgrest_client()
-    assert c1 is not c2
+    assert supabase_client.get_postgrest_client() is c1
+    assert len(calls) == 1
+
+    monkeypatch.setenv("BLOOM_AGENT_KEY", "rotated-agent-jwt")
+    assert supabase_client.get_postgrest_client() is not c1
     assert len(calls) == 2
 
 
@@ -145,7 +159,7 @@ def test_get_storage_client_returns_bucket_bound_handle(supabase_mock, monkeypat
     """`get_storage_client()` pre-binds to the `bloommcp-data` bucket."""
     captured: dict[str, str] = {}
 
-    def fake_create_client(url, key):
+    def fake_create_client(url, key, options=None):
         c = MagicMock()
 
         def from_(bucket):